@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from contextlib import suppress
+from unittest.mock import patch
+
+from streamlink.plugins.youtube import YouTube
+from streamlink.validate import Schema, compile as compile_schema, validate
+
+
+def get_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare validating a large YouTube player response with and without compiled validation schemas",
+    )
+    parser.add_argument(
+        "--formats",
+        metavar="NUMBER",
+        type=int,
+        default=500,
+        help="The number of adaptive formats of the player response\nDefault: %(default)s",
+    )
+    parser.add_argument(
+        "--number",
+        metavar="NUMBER",
+        type=int,
+        default=100,
+        help="The number of validations of each measurement\nDefault: %(default)s",
+    )
+
+    return parser.parse_args()
+
+
+def player_response(num: int) -> dict:
+    # the parts of an ytInitialPlayerResponse object which get validated by the plugin, with unvalidated extra data
+    def fmt(itag: int, mimetype: str, label: str | None = None) -> dict:
+        data = {
+            "itag": itag,
+            "url": f"https://rr1---sn-foo.googlevideo.com/videoplayback?expire=1700000000&itag={itag}&id=o-{itag:08x}",
+            "mimeType": mimetype,
+            "bitrate": 1000 * itag,
+            "width": 1920,
+            "height": 1080,
+            "initRange": {"start": "0", "end": "740"},
+            "indexRange": {"start": "741", "end": "2000"},
+            "lastModified": "1700000000000000",
+            "contentLength": "123456789",
+            "approxDurationMs": "600000",
+        }
+        if label:
+            data["qualityLabel"] = label
+
+        return data
+
+    return {
+        "streamingData": {
+            "expiresInSeconds": "21540",
+            "formats": [fmt(idx, 'video/mp4; codecs="avc1.42001E, mp4a.40.2"', "360p") for idx in range(num // 10)],
+            "adaptiveFormats": [
+                fmt(idx, 'video/webm; codecs="vp9"', "1080p") if idx % 2 else fmt(idx, 'audio/webm; codecs="opus"')
+                for idx in range(num)
+            ],
+        },
+    }
+
+
+def get_schema() -> Schema:
+    # build the same schema as the plugin, but without its compiled validator
+    with patch.object(Schema, "validate", autospec=True, side_effect=StopIteration) as mock:
+        with suppress(StopIteration):
+            YouTube._schema_streamingdata({})
+
+    return mock.call_args[0][0]
+
+
+def main(formats: int, number: int):
+    data = player_response(formats)
+    schema = get_schema()
+    validator = compile_schema(get_schema())
+
+    assert validate(schema, data) == validator(data)
+
+    measurements = {
+        "validate()": lambda: validate(schema, data),
+        "compile(), then validate": lambda: validator(data),
+        # builds and compiles the schema on each call
+        "YouTube._schema_streamingdata()": lambda: YouTube._schema_streamingdata(data),
+    }
+    print(f"Validating {formats} adaptive formats, {number} times each:")  # noqa: T201
+    for name, func in measurements.items():
+        duration = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print(f"  {name:<32} {duration * 1000:8.3f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    args = get_args()
+
+    try:
+        main(args.formats, args.number)
+    except KeyboardInterrupt:
+        sys.exit(130)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import argparse
+import importlib.metadata
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+from warnings import catch_warnings
+
+import pycountry
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+
+ROOT = Path(__file__).parents[1].resolve()
+
+# Indexed country fields which get added to the lookup table (the flag emojis get looked up via pycountry)
+COUNTRY_FIELDS = "alpha_2", "alpha_3", "numeric", "name", "official_name", "common_name"
+# Indexed language fields, in the same order as Streamlink's language lookups
+LANGUAGE_FIELDS = "alpha_2", "alpha_3", "bibliographic", "name"
+
+
+def get_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Update the pre-built ISO 3166 / ISO 639 lookup tables from pycountry's databases",
+    )
+    parser.add_argument(
+        "--file",
+        metavar="FILE",
+        default=ROOT / "src" / "streamlink" / "utils" / "l10n_data.py",
+        type=Path,
+        help="The l10n data module file\nDefault: $GITROOT/src/streamlink/utils/l10n_data.py",
+    )
+
+    return parser.parse_args()
+
+
+def lookup_language(value: str):
+    # the same lookup order as streamlink.utils.l10n.Language.get()
+    return (
+        pycountry.languages.get(alpha_2=value)
+        or pycountry.languages.get(alpha_3=value)
+        or pycountry.languages.get(bibliographic=value)
+        or pycountry.languages.get(name=value)
+    )
+
+
+def build_index(
+    records: Sequence,
+    fields: Iterable[str],
+    lookup: Callable[[str], object],
+) -> dict[str, int]:
+    # only add lookup keys which resolve to a record of the table, so that other keys fall back to pycountry
+    positions = {id(record): idx for idx, record in enumerate(records)}
+    index: dict[str, int] = {}
+    for record in records:
+        for field in fields:
+            value = getattr(record, field, None)
+            if not value or value.lower() in index:
+                continue
+            try:
+                result = lookup(value)
+            except LookupError:
+                continue
+            if (idx := positions.get(id(result))) is not None:
+                index[value.lower()] = idx
+
+    return dict(sorted(index.items()))
+
+
+def dump(value: str) -> str:
+    # JSON strings are valid Python string literals, using the same quotes as the code formatter
+    return json.dumps(value, ensure_ascii=False)
+
+
+def format_table(name: str, annotation: str, rows: Iterable[Sequence[str]]) -> list[str]:
+    lines = [f"{name}: {annotation} = ("]
+    lines.extend(f"    ({', '.join(map(dump, row))}),  # {idx}" for idx, row in enumerate(rows))
+    lines.append(")")
+
+    return lines
+
+
+def format_index(name: str, index: dict[str, int]) -> list[str]:
+    lines = [f"{name}: dict[str, int] = {{"]
+    lines.extend(f"    {dump(key)}: {idx}," for key, idx in index.items())
+    lines.append("}")
+
+    return lines
+
+
+def main(file: Path):
+    countries = list(pycountry.countries)
+    # ISO 639-1 languages: every language with a bibliographic code also has an alpha_2 code
+    languages = [language for language in pycountry.languages if hasattr(language, "alpha_2")]
+    assert all(hasattr(language, "alpha_2") for language in pycountry.languages if hasattr(language, "bibliographic"))
+
+    country_rows = []
+    for country in countries:
+        # changed in pycountry 23.12.11: a UserWarning is emitted when the official_name is missing
+        with catch_warnings(record=True):
+            official_name = getattr(country, "official_name", country.name)
+        country_rows.append((country.alpha_2, country.alpha_3, country.numeric, country.name, official_name))
+
+    language_rows = [
+        (
+            getattr(language, "alpha_2", ""),
+            language.alpha_3,
+            language.name,
+            getattr(language, "bibliographic", ""),
+        )
+        for language in languages
+    ]
+
+    version = importlib.metadata.version("pycountry")
+    lines = [
+        f"# This file was generated by script/update-l10n-data.py from pycountry {version}. Don't edit it manually.",
+        "# Lookup keys are lower-case and map to the index of the resolved table record.",
+        "# Keys which are not part of the lookup tables have to be resolved via pycountry.",
+        "",
+        f"PYCOUNTRY_VERSION = {dump(version)}",
+        "",
+        "# alpha2, alpha3, numeric, name, official_name",
+        *format_table("COUNTRIES", "tuple[tuple[str, str, str, str, str], ...]", country_rows),
+        "",
+        *format_index("COUNTRIES_INDEX", build_index(countries, COUNTRY_FIELDS, pycountry.countries.lookup)),
+        "",
+        "# alpha2, alpha3, name, bibliographic",
+        *format_table("LANGUAGES", "tuple[tuple[str, str, str, str], ...]", language_rows),
+        "",
+        *format_index("LANGUAGES_INDEX", build_index(languages, LANGUAGE_FIELDS, lookup_language)),
+        "",
+    ]
+
+    file.write_text("\n".join(lines), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    args = get_args()
+
+    try:
+        main(args.file)
+    except KeyboardInterrupt:
+        sys.exit(130)
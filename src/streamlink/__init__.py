@@ -9,10 +9,33 @@ An API is also provided that allows direct access to stream data.
 Full documentation is available at https://streamlink.github.io/
 """
 
+from typing import TYPE_CHECKING
+
 from streamlink._version import __version__
-from streamlink.api import streams
 from streamlink.exceptions import StreamlinkError, PluginError, NoStreamsError, NoPluginError, StreamError
-from streamlink.session import Streamlink
+
+
+if TYPE_CHECKING:
+    from streamlink.api import streams
+    from streamlink.session import Streamlink
+
+
+def __getattr__(name: str):
+    # import the session and all of its (HTTP) dependencies on first access only,
+    # so that importing the package or any of its submodules stays cheap
+    if name == "Streamlink":
+        from streamlink.session import Streamlink  # noqa: PLC0415
+
+        globals()[name] = Streamlink
+        return Streamlink
+
+    if name == "streams":
+        from streamlink.api import streams  # noqa: PLC0415
+
+        globals()[name] = streams
+        return streams
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __title__ = "streamlink"
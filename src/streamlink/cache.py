@@ -2,22 +2,22 @@ from __future__ import annotations
 
 import json
 import os
-import shutil
-import tempfile
-from atexit import register as _atexit_register
-from contextlib import suppress
-from copy import deepcopy
+from contextlib import contextmanager
 from functools import wraps
 from pathlib import Path
-from threading import RLock, Timer
-from time import time
+from threading import RLock
+from time import monotonic, sleep, time
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+from weakref import finalize
 
 from streamlink.compat import is_win32
 from streamlink.logger import getLogger
 
 
 if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterator
     from datetime import datetime
 
 
@@ -29,7 +29,33 @@ else:
 # TODO: fix Windows and macOS paths, and deprecate old one (with fallback logic)
 CACHE_DIR = xdg_cache / "streamlink"
 
-WRITE_DEBOUNCE_TIME = 3.0
+#: File extension of cache databases, which replaces the extension of the cache file name
+DATABASE_SUFFIX = ".sqlite3"
+#: Max time in seconds to wait for write transactions of other processes
+BUSY_TIMEOUT = 10.0
+#: Interval in seconds for checking whether a key lock has been released
+LOCK_POLL_INTERVAL = 0.1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires);
+CREATE TABLE IF NOT EXISTS migrations (
+    namespace TEXT NOT NULL PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS locks (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    expires REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+"""
 
 
 log = getLogger(__name__)
@@ -44,11 +70,7 @@ def _atomic(fn):
     return inner
 
 
-# TODO: rewrite data structure
-#  - replace prefix logic with namespaces
-#  - change timestamps from (timezoned) epoch values to ISO8601 strings (UTC)
-#  - add JSON schema information
-#  - add translation logic, to keep backwards compatibility
+# TODO: change timestamps from (timezoned) epoch values to ISO8601 strings (UTC)
 class Cache:
     def __init__(
         self,
@@ -57,99 +79,112 @@ class Cache:
         disabled: bool = False,
     ):
         """
-        Caches Python values as JSON and prunes expired entries.
+        Caches Python values as JSON in an SQLite database and prunes expired entries.
 
-        :param filename: A file name or :class:`Path` object, relative to the cache directory
-        :param key_prefix: Optional prefix for each key to be retrieved from or stored in the cache
+        Entries are stored in namespaces, which are set by the key prefix. Each entry is written individually,
+        and entries of other namespaces or other processes don't get rewritten. Values are always read from the database,
+        so entries written by other processes which share the same cache file are available immediately.
+        Entries of the legacy JSON cache file get migrated once per namespace.
+
+        :param filename: A file name or :class:`Path` object, relative to the cache directory.
+                         The database gets stored with the same name, but with a ``.sqlite3`` file extension.
+        :param key_prefix: Optional namespace of each key to be retrieved from or stored in the cache
+        :param disabled: Only keep entries in memory and don't read from or write to the cache directory
         """
 
         self.key_prefix = key_prefix
         self.filename = CACHE_DIR / Path(filename)
+        self.database = self.filename.with_suffix(DATABASE_SUFFIX)
 
-        self._cache_orig: dict[str, dict[str, Any]] = {}
-        self._cache: dict[str, dict[str, Any]] = {}
-
-        self._loaded = self._disabled = bool(disabled)
+        self._disabled = bool(disabled)
+        self._db: sqlite3.Connection | None = None
+        self._finalizer: finalize | None = None
+        self._migrated: set[str] = set()
         self._lock = RLock()
-        self._timer: Timer | None = None
 
-        _atexit_register(self._save)
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is not None:
+            return self._db
 
-    @property
-    def _dirty(self):
-        return self._cache != self._cache_orig
-
-    def _load(self):
-        if self._loaded:
+        db = None
+        if not self._disabled:
+            log.trace("Opening cache database: %s", self.database)
+            try:
+                self.database.parent.mkdir(exist_ok=True, parents=True)
+                db = self._open(self.database)
+                self._setup(db)
+            except Exception as err:
+                if db is not None:
+                    db.close()
+                    db = None
+                log.warning("Failed opening cache database, continuing without cache: %s", err)
+
+        if db is None:
+            db = self._open(":memory:")
+            self._setup(db)
+
+        self._db = db
+        # close the connection when the cache gets garbage-collected or on exit
+        self._finalizer = finalize(self, db.close)
+
+        return db
+
+    @staticmethod
+    def _open(database: str | Path) -> sqlite3.Connection:
+        # import sqlite3 only if it's needed
+        import sqlite3  # noqa: PLC0415
+
+        # start write transactions immediately, so that concurrent writers wait for each other instead of failing
+        return sqlite3.connect(database, timeout=BUSY_TIMEOUT, isolation_level="IMMEDIATE", check_same_thread=False)
+
+    @staticmethod
+    def _setup(db: sqlite3.Connection) -> None:
+        # entries get written individually, so avoid syncing the database file on each transaction
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(_SCHEMA)
+        with db:
+            db.execute("DELETE FROM entries WHERE expires <= ?", (time(),))
+
+    def _migrate(self, db: sqlite3.Connection, namespace: str) -> None:
+        if namespace in self._migrated:
+            return
+        self._migrated.add(namespace)
+        if self._disabled or db.execute("SELECT 1 FROM migrations WHERE namespace = ?", (namespace,)).fetchone():
             return
 
-        self._loaded = True
-        self._cache_orig.clear()
-        self._cache.clear()
-
-        log.trace("Loading cache file: %s", self.filename)
-
+        rows = []
         try:
             with self.filename.open("r", encoding="utf-8") as fd:
                 data = json.load(fd)
-                self._cache_orig.update(**data)
-                self._cache.update(**data)
         except FileNotFoundError:
             pass
         except Exception as err:
-            log.warning("Failed loading cache file, continuing without cache: %s", err)
-
-    def _prune(self):
-        now = time()
-        pruned = []
-
-        for key, value in self._cache.items():
-            expires = value.get("expires", now)
-            if expires <= now:
-                pruned.append(key)
-
-        for key in pruned:
-            self._cache.pop(key, None)
-
-        return len(pruned) > 0
-
-    def _schedule_save(self):
-        if self._timer:
-            self._timer.cancel()
-        if self._disabled or not self._dirty:
-            return
-
-        log.trace("Scheduling write to cache file: %.1fs", WRITE_DEBOUNCE_TIME)
-        self._timer = Timer(WRITE_DEBOUNCE_TIME, self._save)
-        self._timer.daemon = True
-        self._timer.name = "CacheSaveThread"
-        self._timer.start()
-
-    @_atomic
-    def _save(self):
-        if self._timer:
-            self._timer.cancel()
-        if self._disabled or not self._dirty:
-            return
-
-        log.trace("Writing to cache file: %s", self.filename)
-
-        fd = None
+            log.warning("Failed migrating legacy cache file: %s", err)
+        else:
+            log.debug("Migrating legacy cache file: %s", self.filename)
+            # the legacy cache file stores namespaced keys with a prefix
+            prefix = f"{namespace}:" if namespace else ""
+            now = time()
+            for key, item in data.items() if isinstance(data, dict) else ():
+                if not key.startswith(prefix) or not isinstance(item, dict) or "value" not in item:
+                    continue
+                expires = item.get("expires")
+                if isinstance(expires, int | float) and expires > now:
+                    rows.append((namespace, key[len(prefix) :], json.dumps(item["value"]), expires))
+
+        with db:
+            db.executemany("INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?)", rows)
+            db.execute("INSERT OR IGNORE INTO migrations VALUES (?)", (namespace,))
+
+    def _get_db(self) -> sqlite3.Connection:
+        db = self._connect()
         try:
-            self.filename.parent.mkdir(exist_ok=True, parents=True)
-            # TODO: py311 support end: set delete_on_close=False and move file in the context manager
-            with tempfile.NamedTemporaryFile(mode="w+", encoding="utf-8", delete=False) as fd:
-                json.dump(self._cache, fd, indent=2, separators=(",", ": "))
-                fd.flush()
-            shutil.move(fd.name, self.filename)
+            self._migrate(db, self.key_prefix)
         except Exception as err:
-            if fd:
-                with suppress(OSError):
-                    Path(fd.name).unlink()
-            log.error("Error while writing to cache file: %s", err)
-        else:
-            self._cache_orig.clear()
-            self._cache_orig.update(**deepcopy(self._cache))
+            log.error("Error while migrating legacy cache file: %s", err)
+
+        return db
 
     @_atomic
     def set(
@@ -170,22 +205,27 @@ class Cache:
         :param expires_at: Optional expiration date, which overrides the expiration time
         """
 
-        self._load()
-        self._prune()
-
-        if self.key_prefix:
-            key = f"{self.key_prefix}:{key}"
-
+        now = time()
         if expires_at is None:
-            expires += time()
+            expires += now
         else:
             try:
                 expires = expires_at.timestamp()
             except OverflowError:
                 expires = 0
 
-        self._cache[key] = dict(value=value, expires=expires)
-        self._schedule_save()
+        data = json.dumps(value)
+        db = self._get_db()
+
+        try:
+            with db:
+                db.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+                if expires > now:
+                    db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", (self.key_prefix, key, data, expires))
+                else:
+                    db.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (self.key_prefix, key))
+        except Exception as err:
+            log.error("Error while writing to cache database: %s", err)
 
     @_atomic
     def get(
@@ -196,51 +236,114 @@ class Cache:
         """
         Attempt to retrieve the given key from the cache.
 
-        Prunes the cache of all expired key-value pairs before retrieving the key's value.
+        Expired key-value pairs are ignored.
 
         :param key: A specific key name
         :param default: An optional default value if no key was stored, or if it has expired
         :return: The retrieved value or optional default value
         """
 
-        self._load()
-        self._prune()
-        self._schedule_save()
+        db = self._get_db()
 
-        if self.key_prefix:
-            key = f"{self.key_prefix}:{key}"
+        try:
+            row = db.execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ? AND expires > ?",
+                (self.key_prefix, key, time()),
+            ).fetchone()
+            if row is not None:
+                return json.loads(row[0])
+        except Exception as err:
+            log.error("Error while reading from cache database: %s", err)
 
-        if key in self._cache and "value" in self._cache[key]:
-            return self._cache[key]["value"]
-        else:
-            return default
+        return default
 
     @_atomic
     def get_all(self) -> dict[str, Any]:
         """
-        Retrieve all cached key-value pairs.
+        Retrieve all cached key-value pairs of the namespace.
 
-        Prunes the cache of all expired key-value pairs first.
+        Expired key-value pairs are ignored.
 
         :return: A dictionary of all cached key-value pairs.
         """
 
-        ret = {}
+        db = self._get_db()
+
+        try:
+            rows = db.execute(
+                "SELECT key, value FROM entries WHERE namespace = ? AND expires > ? ORDER BY key",
+                (self.key_prefix, time()),
+            ).fetchall()
+        except Exception as err:
+            log.error("Error while reading from cache database: %s", err)
+            return {}
+
+        return {key: json.loads(value) for key, value in rows}
+
+    @_atomic
+    def _acquire(self, key: str, owner: str, lease: float) -> bool:
+        db = self._get_db()
+        now = time()
+        with db:
+            db.execute("DELETE FROM locks WHERE expires <= ?", (now,))
+            cursor = db.execute(
+                "INSERT OR IGNORE INTO locks VALUES (?, ?, ?, ?)",
+                (self.key_prefix, key, owner, now + lease),
+            )
+
+        return cursor.rowcount == 1
+
+    @_atomic
+    def _release(self, key: str, owner: str) -> None:
+        db = self._get_db()
+        with db:
+            db.execute("DELETE FROM locks WHERE namespace = ? AND key = ? AND owner = ?", (self.key_prefix, key, owner))
+
+    @contextmanager
+    def lock(self, key: str, timeout: float = 60.0, lease: float = 300.0) -> Iterator[bool]:
+        """
+        Hold a lock of the given key, which is shared by all threads and processes using the same cache file.
+
+        This lets other processes wait while a value is being computed, e.g. when acquiring an expensive token,
+        so that they can read the stored value afterwards instead of computing it again.
+
+        :param key: A specific key name
+        :param timeout: Max time in seconds to wait for the lock, before continuing without it
+        :param lease: Time in seconds after which a lock which hasn't been released expires, e.g. after a crash
+        :return: A context manager which yields whether the lock was acquired
+        """
+
+        owner = uuid4().hex
+        deadline = monotonic() + timeout
+        try:
+            while not (acquired := self._acquire(key, owner, lease)) and monotonic() < deadline:
+                sleep(LOCK_POLL_INTERVAL)
+        except Exception as err:
+            log.error("Error while acquiring cache lock: %s", err)
+            acquired = False
+        else:
+            if not acquired:
+                log.warning("Timeout while waiting for cache lock, continuing without it: %s", key)
 
-        self._load()
-        self._prune()
-        self._schedule_save()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                try:
+                    self._release(key, owner)
+                except Exception as err:
+                    log.error("Error while releasing cache lock: %s", err)
 
-        for key, value in self._cache.items():
-            if self.key_prefix:
-                prefix = f"{self.key_prefix}:"
-            else:
-                prefix = ""
-            if key.startswith(prefix):
-                okey = key[len(prefix) :]
-                ret[okey] = value["value"]
+    @_atomic
+    def close(self) -> None:
+        """
+        Close the database connection. It gets re-opened on the next cache access.
+        """
 
-        return ret
+        if self._finalizer is not None:
+            self._finalizer()
+        self._db = self._finalizer = None
+        self._migrated.clear()
 
 
 __all__ = ["Cache"]
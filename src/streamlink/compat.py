@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import importlib
-import inspect
 import os
 import sys
 import warnings
@@ -63,7 +62,8 @@ def deprecated(items: Mapping[str, tuple[str | None, Any, Any]]) -> None:
                   3. a custom warning message
     """
 
-    mod_globals = inspect.stack()[1].frame.f_globals
+    # don't use inspect.stack(), as it reads the source context of every frame, which is slow on import
+    mod_globals = sys._getframe(1).f_globals
     orig_getattr: Callable[[str], Any] | None = mod_globals.get("__getattr__", None)
 
     def __getattr__(name: str) -> Any:
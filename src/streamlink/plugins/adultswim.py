@@ -139,7 +139,7 @@ class AdultSwim(Plugin):
             raise PluginError("Could not determine app_id_js_url")
         log.debug(f"app_id_js_url={app_id_js_url}")
 
-        res = self.session.http.get(app_id_js_url)
+        res = self.session.http.get(app_id_js_url, cache=True)
         m = self.app_id_re.search(res.text)
         app_id = m and m.group(1)
         if not app_id:
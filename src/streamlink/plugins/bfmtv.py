@@ -65,7 +65,7 @@ class BFMTV(Plugin):
         try:
             js_url = schema_brightcove_js.validate(root)
             log.debug(f"JS URL: {js_url}")
-            account_id, video_id = self.session.http.get(js_url, schema=schema_brightcove_js2)
+            account_id, video_id = self.session.http.get(js_url, cache=True, schema=schema_brightcove_js2)
         except PluginError:
             return
 
@@ -97,7 +97,7 @@ class Mjunoon(Plugin):
             log.error("Failed to get main chunk JS URL")
             return
 
-        res = self.session.http.get(urljoin(self.url, m.group(1)))
+        res = self.session.http.get(urljoin(self.url, m.group(1)), cache=True)
 
         m = self.js_credentials_re.search(res.text)
         if not m:
@@ -137,7 +137,7 @@ class N13TV(Plugin):
             raise PluginError("Could not determine main_js_path")
         log.debug(f"Main JS path={main_js_path}")
 
-        res = self.session.http.get(urljoin(self.url, main_js_path))
+        res = self.session.http.get(urljoin(self.url, main_js_path), cache=True)
 
         m = self.user_id_re.search(res.text)
         user_id = m and m.group(1)
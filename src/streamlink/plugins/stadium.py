@@ -40,6 +40,7 @@ class Stadium(Plugin):
         url = self._PLAYER_URL.format(data_account=data_account, data_player=data_player)
         policy_key = self.session.http.get(
             url,
+            cache=True,
             schema=validate.Schema(
                 re.compile(r"""options:\s*{.+policyKey:\s*"([^"]+)""", re.DOTALL),
                 validate.any(None, validate.get(1)),
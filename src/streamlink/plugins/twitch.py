@@ -906,28 +906,44 @@ class Twitch(Plugin):
             log.info("Removing cached client-integrity token...")
             self.cache.set(self._CACHE_KEY_CLIENT_INTEGRITY, None, 0)
 
-        client_integrity = self.cache.get(self._CACHE_KEY_CLIENT_INTEGRITY)
-        if client_integrity and isinstance(client_integrity, list) and len(client_integrity) == 2:
+        client_integrity = self._get_cached_client_integrity()
+        if client_integrity:
             log.info("Using cached client-integrity token")
-            device_id, token = client_integrity
-        else:
+            return client_integrity
+
+        # wait for other Streamlink processes which are currently acquiring a token, and use their token instead
+        with self.cache.lock(self._CACHE_KEY_CLIENT_INTEGRITY):
+            client_integrity = self._get_cached_client_integrity()
+            if client_integrity:
+                log.info("Using cached client-integrity token")
+                return client_integrity
+
             log.info("Acquiring new client-integrity token...")
             device_id = random_token(32, CHOICES_ALPHA_NUM)
-            client_integrity = TwitchClientIntegrity.acquire(
+            acquired = TwitchClientIntegrity.acquire(
                 self.session,
                 channel,
                 self.api.headers,
                 device_id,
             )
-            if not client_integrity:
+            if not acquired:
                 log.warning("No client-integrity token acquired")
                 return None
 
-            token, expiration = client_integrity
+            token, expiration = acquired
             self.cache.set(self._CACHE_KEY_CLIENT_INTEGRITY, [device_id, token], expires_at=fromtimestamp(expiration))
 
         return device_id, token
 
+    def _get_cached_client_integrity(self) -> tuple[str, str] | None:
+        client_integrity = self.cache.get(self._CACHE_KEY_CLIENT_INTEGRITY)
+        if not client_integrity or not isinstance(client_integrity, list) or len(client_integrity) != 2:
+            return None
+
+        device_id, token = client_integrity
+
+        return device_id, token
+
     def _access_token(self, is_live, channel_or_vod):
         response = ""
         data = (None, None)
@@ -84,7 +84,7 @@ class USTVNow(Plugin):
             m = self._main_js_re.search(res.text)
             main_js_path = m and m.group(1)
             if main_js_path:
-                res = self.session.http.get(urljoin(url, main_js_path))
+                res = self.session.http.get(urljoin(url, main_js_path), cache=True)
                 self._encryption_config = dict(self._enc_key_re.findall(res.text))
 
         return self._encryption_config.get("AES_Key"), self._encryption_config.get("AES_IV")
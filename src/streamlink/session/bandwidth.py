@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from threading import Lock
+from time import monotonic
+from weakref import finalize
+
+from streamlink.cache import Cache
+from streamlink.logger import getLogger
+
+
+log = getLogger(__name__)
+
+
+class BandwidthEstimator:
+    """
+    Exponentially weighted moving averages of the download throughput and latency of the session's segment downloads.
+
+    The estimate is shared by all streams of the session and can be queried by plugins and stream implementations,
+    e.g. for selecting an initial stream quality. If persistence is enabled, the estimate gets stored in
+    the cache directory, so that subsequent sessions can start with the estimate of the previous session.
+    The persisted estimate gets updated at most once per :attr:`PERSIST_INTERVAL` and on exit.
+    """
+
+    #: Cache file name, relative to the cache directory
+    FILENAME = "bandwidth.json"
+    #: Time in seconds for which a persisted estimate remains valid
+    EXPIRES = 60 * 60 * 24
+    #: Weight of each new sample in the moving averages
+    WEIGHT: float = 0.3
+    #: Min time in seconds between storing the estimate in the cache directory
+    PERSIST_INTERVAL: float = 10.0
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._cache: Cache | None = None
+        self._bandwidth: float | None = None
+        self._latency: float | None = None
+        self._samples = 0
+        self._pending: dict[str, float | None] = {}
+        self._persisted: float | None = None
+        self._finalizer: finalize | None = None
+
+    @property
+    def bandwidth(self) -> float | None:
+        """The estimated download throughput in kbit/s, or ``None`` if nothing has been measured yet"""
+
+        return self._bandwidth
+
+    @property
+    def latency(self) -> float | None:
+        """The estimated time in seconds until the response headers were received, or ``None`` if unknown"""
+
+        return self._latency
+
+    @property
+    def samples(self) -> int:
+        """The number of samples of the current session"""
+
+        return self._samples
+
+    def _average(self, current: float | None, value: float) -> float:
+        return value if current is None else self.WEIGHT * value + (1.0 - self.WEIGHT) * current
+
+    def update(self, size: int, elapsed: float, latency: float | None = None) -> None:
+        """
+        Add a download sample to the estimate
+
+        :param size: The number of downloaded bytes
+        :param elapsed: The total download time in seconds
+        :param latency: The time in seconds until the response headers were received
+        """
+
+        if elapsed <= 0.0:
+            return
+
+        with self._lock:
+            self._bandwidth = self._average(self._bandwidth, size * 8 / 1000 / elapsed)
+            if latency is not None and latency >= 0.0:
+                self._latency = self._average(self._latency, latency)
+            self._samples += 1
+            cache = self._cache
+            if cache is None:
+                return
+            self._pending.update(bandwidth=self._bandwidth, latency=self._latency)
+            now = monotonic()
+            if self._persisted is not None and now - self._persisted < self.PERSIST_INTERVAL:
+                return
+            self._persisted = now
+            data = self._pending.copy()
+            self._pending.clear()
+
+        self._store(cache, data)
+
+    def flush(self) -> None:
+        """
+        Store the estimate in the cache directory if it has changed since it was last stored and if persistence is enabled
+        """
+
+        with self._lock:
+            cache = self._cache
+            if cache is None or not self._pending:
+                return
+            self._persisted = monotonic()
+            data = self._pending.copy()
+            self._pending.clear()
+
+        self._store(cache, data)
+
+    @classmethod
+    def _store(cls, cache: Cache, data: dict[str, float | None]) -> None:
+        if data:
+            cache.set("estimate", data, expires=cls.EXPIRES)
+
+    @classmethod
+    def _store_pending(cls, cache: Cache, pending: dict[str, float | None]) -> None:
+        data = pending.copy()
+        pending.clear()
+        cls._store(cache, data)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bandwidth = None
+            self._latency = None
+            self._samples = 0
+
+    def persist(self, enable: bool = True, filename: str = FILENAME, disabled: bool = False) -> None:
+        """
+        Enable or disable storing the estimate in the cache directory.
+
+        When enabling persistence and no samples have been added yet, the stored estimate gets loaded.
+        When disabling persistence, the pending estimate gets stored first.
+
+        :param enable: Whether to persist the estimate
+        :param filename: The cache file name, relative to the cache directory
+        :param disabled: Only keep the estimate in memory and don't read from or write to the cache directory
+        """
+
+        self.flush()
+
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer.detach()
+            self._cache = self._finalizer = self._persisted = None
+            self._pending = {}
+            if not enable:
+                return
+
+            self._cache = cache = Cache(filename, disabled=disabled)
+            data = cache.get("estimate")
+            # store the pending estimate on exit, before the cache's database connection gets closed
+            self._finalizer = finalize(self, self._store_pending, cache, self._pending)
+            if self._samples:
+                self._pending.update(bandwidth=self._bandwidth, latency=self._latency)
+                return
+            if not isinstance(data, dict):
+                return
+            try:
+                bandwidth = float(data["bandwidth"])
+                latency = None if data.get("latency") is None else float(data["latency"])
+            except (KeyError, TypeError, ValueError):
+                return
+            self._bandwidth = bandwidth
+            self._latency = latency
+            log.debug(f"Loaded bandwidth estimate: {bandwidth:.0f}k")
+
+
+__all__ = ["BandwidthEstimator"]
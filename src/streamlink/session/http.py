@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+import codecs
 import socket
 import ssl
 import time
 import warnings
+from contextlib import suppress
 from http.cookiejar import MozillaCookieJar
 from ipaddress import ip_address
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from queue import Full
+from threading import Lock
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+from urllib.parse import urlparse
 
 import urllib3
 import urllib3.util.connection as urllib3_util_connection
-from requests import Request, Session
-from requests.adapters import HTTPAdapter
+from requests import PreparedRequest, Request, Session
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.cookies import RequestsCookieJar, merge_cookies
+from requests.hooks import default_hooks
+from requests.sessions import merge_hooks, merge_setting
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_netrc_auth
 from urllib3.connection import HTTPConnection
 from urllib3.util import create_urllib3_context  # type: ignore[attr-defined, ty:unresolved-import]
 
@@ -21,16 +31,23 @@ from streamlink.compat import is_darwin, is_linux, is_win32
 from streamlink.exceptions import PluginError, StreamlinkDeprecationWarning
 from streamlink.logger import getLogger
 from streamlink.packages.requests_file import FileAdapter
-from streamlink.utils.parse import parse_json, parse_xml
+from streamlink.session.http_cache import HTTPCache
+from streamlink.session.http_connection import HAPPY_EYEBALLS_DELAY, Connector, DNSCache
+from streamlink.session.http_retry import CircuitOpenError, RetryCoordinator
+from streamlink.session.http_timings import HTTPTimings, collect_timings, get_pool_classes_by_scheme
+from streamlink.session.http_tls import TLSSessionCache
+from streamlink.utils.parse import _get_json_parser, _validate, parse_json, parse_xml
 
 
 if TYPE_CHECKING:
     import re
-    from collections.abc import Iterator
+    from collections.abc import Callable, Hashable, Iterator, Mapping
     from typing import TypeAlias
 
-    from requests import PreparedRequest
+    from requests import Response
     from requests.adapters import BaseAdapter
+    from urllib3 import PoolManager
+    from urllib3.connectionpool import HTTPConnectionPool
 
     _TYPE_SOCKET_OPTION: TypeAlias = tuple[int, int, int | bytes]
 
@@ -94,12 +111,39 @@ urllib3.util.connection._set_socket_options = urllib3_set_socket_options  # type
 _VALID_REQUEST_ARGS = {"method", "url", "headers", "files", "data", "params", "auth", "cookies", "json"}
 
 
+class ConnectionPoolStats(NamedTuple):
+    scheme: str
+    host: str
+    port: int | None
+    maxsize: int
+    connections: int
+    requests: int
+
+    @property
+    def reused(self) -> int:
+        return max(0, self.requests - self.connections)
+
+
 class HTTPSession(Session):
     params: dict
 
     def __init__(self):
+        # set before initializing the session, which mounts the default adapters
+        self._pool_lock = Lock()
+        self._pool_reserved = 0
+        self._disable_dh = False
+        self._http2 = False
+        self._connector = Connector()
+        self._timings_hooks: list[Callable[[HTTPTimings], Any]] = []
+        self._ssl_contexts: dict[Hashable, ssl.SSLContext] = {}
+        #: TLS sessions and resumption metrics of the connections of mounted :class:`SSLContextAdapter` objects
+        self.tls_sessions = TLSSessionCache()
+
         super().__init__()
 
+        self.retry_coordinator = RetryCoordinator()
+        self.response_cache: HTTPCache | None = None
+
         self.headers["User-Agent"] = useragents.DEFAULT
         self.timeout = 20.0
 
@@ -131,15 +175,32 @@ class HTTPSession(Session):
         else:
             return "UTF-8"
 
+    @staticmethod
+    def _is_utf8(encoding: str) -> bool:
+        try:
+            return codecs.lookup(encoding).name == "utf-8"
+        except LookupError:
+            return False
+
     @classmethod
-    def json(cls, res, *args, **kwargs):
+    def json(cls, res, name="JSON", exception=PluginError, schema=None, *args, **kwargs):
         """Parses JSON from a response."""
         if res.encoding is None:
             # encoding is unknown: let ``json.loads`` figure it out from the bytes data via ``json.detect_encoding``
-            return parse_json(res.content, *args, **kwargs)
-        else:
-            # encoding is explicitly set: get the decoded string value and let ``json.loads`` parse it
-            return parse_json(res.text, *args, **kwargs)
+            return parse_json(res.content, name, exception, schema, *args, **kwargs)
+        elif cls._is_utf8(res.encoding):
+            # encoding is UTF-8: parse the bytes data directly instead of decoding it first,
+            # unless this fails, e.g. due to invalid byte sequences, which get replaced when decoding the string value
+            parser = _get_json_parser(*args, **kwargs)
+            try:
+                parsed = parser(res.content, *args, **kwargs)
+            except (UnicodeDecodeError, ValueError):
+                pass
+            else:
+                return _validate(parsed, name, exception, schema)
+
+        # encoding is explicitly set: get the decoded string value and let ``json.loads`` parse it
+        return parse_json(res.text, name, exception, schema, *args, **kwargs)
 
     @classmethod
     def xml(cls, res, *args, **kwargs):
@@ -201,8 +262,134 @@ class HTTPSession(Session):
                 "source_address": default_adapter_connection_pool_kw.get("source_address"),
                 "socket_options": default_adapter_connection_pool_kw.get("socket_options"),
             })
+        if isinstance(adapter, HTTPAdapter) and self._pool_reserved:
+            self._resize_adapter(adapter, self.pool_maxsize)
+        # create connections with the session's connector and record timings if a timings hook has been added,
+        # but keep custom connection pool classes of the adapter
+        if isinstance(adapter, HTTPAdapter):
+            pool_classes_by_scheme = get_pool_classes_by_scheme(self._connector)
+            adapter.poolmanager.pool_classes_by_scheme = {
+                scheme: pool_classes_by_scheme.get(scheme, cls)
+                if cls is urllib3.poolmanager.pool_classes_by_scheme.get(scheme)
+                else cls
+                for scheme, cls in adapter.poolmanager.pool_classes_by_scheme.items()
+            }
+        if isinstance(adapter, SSLContextAdapter):
+            adapter.connector = self._connector
+            self._share_ssl_context(adapter)
         super().mount(prefix, adapter)
 
+    def _share_ssl_context(self, adapter: SSLContextAdapter) -> None:
+        # Re-use the SSLContext of previously mounted adapters of the same kind, so that its TLS sessions can be resumed
+        adapter.tls_session_cache = self.tls_sessions
+        key = adapter.ssl_context_key
+        ssl_context = None if key is None else self._ssl_contexts.get(key)
+        if ssl_context is None:
+            ssl_context = adapter.poolmanager.connection_pool_kw.get("ssl_context")
+            if ssl_context is None:  # pragma: no cover
+                return
+            self.tls_sessions.attach(ssl_context)
+            if key is not None:
+                self._ssl_contexts[key] = ssl_context
+        adapter.poolmanager.connection_pool_kw["ssl_context"] = ssl_context
+
+    @property
+    def pool_maxsize(self) -> int:
+        """
+        The number of keep-alive connections which get pooled per host
+        """
+
+        return max(DEFAULT_POOLSIZE, self._pool_reserved)
+
+    def reserve_connections(self, num: int) -> None:
+        """
+        Increase the size of the per-host connection pools of all HTTP adapters by the given number of connections,
+        so that concurrent requests, e.g. segment downloads of one or multiple segmented streams,
+        can reuse their keep-alive connections instead of discarding them when the pool is full.
+
+        Pools which already exist get resized as well.
+        Reserved connections need to be released via :meth:`release_connections` when they aren't needed anymore.
+        """
+
+        with self._pool_lock:
+            self._pool_reserved += num
+            self._resize_adapters()
+
+    def release_connections(self, num: int) -> None:
+        """
+        Release connections previously reserved via :meth:`reserve_connections`.
+
+        Existing pools don't get shrunk, only new pools will be created with the reduced size.
+        """
+
+        with self._pool_lock:
+            self._pool_reserved = max(0, self._pool_reserved - num)
+            self._resize_adapters()
+
+    def _resize_adapters(self) -> None:
+        maxsize = self.pool_maxsize
+        for adapter in self.adapters.values():
+            if isinstance(adapter, HTTPAdapter):
+                self._resize_adapter(adapter, maxsize)
+
+    @classmethod
+    def _resize_adapter(cls, adapter: HTTPAdapter, maxsize: int) -> None:
+        for manager in cls._pool_managers(adapter):
+            manager.connection_pool_kw["maxsize"] = maxsize
+            for pool in cls._connection_pools(manager):
+                cls._resize_pool(pool, maxsize)
+
+    @staticmethod
+    def _pool_managers(adapter: HTTPAdapter) -> list[PoolManager]:
+        return [adapter.poolmanager, *adapter.proxy_manager.values()]
+
+    @staticmethod
+    def _connection_pools(manager: PoolManager) -> Iterator[HTTPConnectionPool]:
+        for key in manager.pools.keys():
+            if pool := manager.pools.get(key):
+                yield pool
+
+    @staticmethod
+    def _resize_pool(pool: HTTPConnectionPool, maxsize: int) -> None:
+        queue = pool.pool
+        if queue is None or queue.maxsize >= maxsize:
+            return
+
+        with queue.mutex:
+            growth = maxsize - queue.maxsize
+            queue.maxsize = maxsize
+        # add empty connection slots, which will be filled with new connections on demand
+        for _ in range(growth):
+            try:
+                queue.put_nowait(None)
+            except Full:  # pragma: no cover
+                break
+
+    def get_pool_stats(self) -> list[ConnectionPoolStats]:
+        """
+        Get the usage statistics of all connection pools of all HTTP adapters.
+        The number of reused keep-alive connections is the difference between the number of requests and new connections.
+        """
+
+        stats = []
+        for adapter in self.adapters.values():
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            for manager in self._pool_managers(adapter):
+                for pool in self._connection_pools(manager):
+                    stats.append(
+                        ConnectionPoolStats(
+                            scheme=pool.scheme,
+                            host=pool.host,
+                            port=pool.port,
+                            maxsize=pool.pool.maxsize if pool.pool is not None else 0,
+                            connections=pool.num_connections,
+                            requests=pool.num_requests,
+                        ),
+                    )
+
+        return stats
+
     # noinspection PyMethodMayBeStatic
     def set_address_family(self, family: socket.AddressFamily | None = None) -> None:
         if family is None:
@@ -212,14 +399,108 @@ class HTTPSession(Session):
         elif family == socket.AF_INET6:  # pragma: no branch
             urllib3_util_connection.allowed_gai_family = lambda: socket.AF_INET6  # type: ignore[attr-defined, ty:unresolved-attribute]
 
+    def set_dns_cache(self, ttl: float | None = None) -> None:
+        """
+        Cache resolved addresses of all HTTP connections for the given amount of seconds. ``None`` or ``0`` disables the cache.
+        """
+
+        self._connector.dns_cache = DNSCache(ttl) if ttl else None
+
+    def set_happy_eyeballs(self, enable: bool = True) -> None:
+        """
+        Race delayed connection attempts to all resolved addresses, alternating between IPv6 and IPv4 (RFC 8305),
+        instead of trying each address one after another.
+        """
+
+        self._connector.happy_eyeballs_delay = HAPPY_EYEBALLS_DELAY if enable else None
+
+    def add_timings_hook(self, hook: Callable[[HTTPTimings], Any]) -> None:
+        """
+        Add a function which gets called with the :class:`HTTPTimings <streamlink.session.http_timings.HTTPTimings>`
+        of each request attempt, after the response body has been read, or after the request has failed.
+        Connections of the HTTP/2 adapter and of proxies don't record any connection and request phases.
+        """
+
+        self._timings_hooks.append(hook)
+
+    def remove_timings_hook(self, hook: Callable[[HTTPTimings], Any]) -> None:
+        with suppress(ValueError):
+            self._timings_hooks.remove(hook)
+
+    def _emit_timings(self, timings: HTTPTimings) -> None:
+        for hook in self._timings_hooks:
+            try:
+                hook(timings)
+            except Exception as err:
+                log.error(f"Error in HTTP timings hook: {err}")
+
+    def enable_response_cache(self, enable: bool = True, disabled_file: bool = False) -> None:
+        """
+        Enable the :class:`HTTPCache <streamlink.session.http_cache.HTTPCache>`
+        for requests which have set the ``cache`` keyword.
+
+        :param enable: Enable or disable the response cache
+        :param disabled_file: Only keep responses in memory
+        """
+
+        self.response_cache = HTTPCache(disabled=disabled_file) if enable else None
+
+    def _request_cached(self, method: str, url: str, **kwargs) -> Response:
+        # same as requests.Session.request(), but sending the prepared request through the response cache
+        request = Request(
+            method=method.upper(),
+            url=url,
+            headers=kwargs.pop("headers", None),
+            files=kwargs.pop("files", None),
+            data=kwargs.pop("data", None) or {},
+            json=kwargs.pop("json", None),
+            params=kwargs.pop("params", None) or {},
+            auth=kwargs.pop("auth", None),
+            cookies=kwargs.pop("cookies", None),
+            hooks=kwargs.pop("hooks", None),
+        )
+        prepared = self.prepare_request(request)
+        settings = self.merge_environment_settings(
+            prepared.url,
+            kwargs.pop("proxies", None) or {},
+            kwargs.pop("stream", None),
+            kwargs.pop("verify", None),
+            kwargs.pop("cert", None),
+        )
+        kwargs.setdefault("allow_redirects", True)
+
+        return cast("HTTPCache", self.response_cache).send(prepared, self.send, **kwargs, **settings)
+
     def disable_dh(self, disable: bool = True) -> None:
-        adapter: HTTPAdapter
-        if disable:
-            adapter = TLSNoDHAdapter()
-        else:
-            adapter = HTTPAdapter()
+        self._disable_dh = disable
+        self._mount_https_adapter()
+
+    def enable_http2(self, enable: bool = True) -> None:
+        """
+        Send HTTPS requests via multiplexed HTTP/2 connections if the server supports it.
+        Requires the optional h2 dependency, otherwise HTTP/1.1 will be kept.
+        """
+
+        self._http2 = enable
+        self._mount_https_adapter()
+
+    def _mount_https_adapter(self) -> None:
+        adapter: HTTPAdapter | None = None
+        if self._http2:
+            try:
+                from streamlink.session.http2 import HTTP2Adapter  # noqa: PLC0415
+
+                adapter = HTTP2Adapter(disable_dh=self._disable_dh)
+            except ImportError as err:
+                log.warning(f"HTTP/2 is not supported: {err}")
+                self._http2 = False
+        if adapter is None:
+            adapter = TLSNoDHAdapter() if self._disable_dh else HTTPAdapter()
         previous = cast("HTTPAdapter", self.adapters.get("https://", adapter))
-        adapter.poolmanager.connection_pool_kw.update(previous.poolmanager.connection_pool_kw)
+        # keep the connection pool kwargs of the previous adapter, but not its custom SSLContext
+        adapter.poolmanager.connection_pool_kw.update({
+            key: value for key, value in previous.poolmanager.connection_pool_kw.items() if key != "ssl_context"
+        })
         self.mount("https://", adapter)
 
     def set_cookies_from_file(self, file: Path | str):
@@ -260,28 +541,73 @@ class HTTPSession(Session):
         raise_for_status = kwargs.pop("raise_for_status", True)
         schema = kwargs.pop("schema", None)
         session = kwargs.pop("session", None)
+        template: HTTPRequestTemplate | None = kwargs.pop("template", None)
         timeout = kwargs.pop("timeout", self.timeout)
         total_retries = kwargs.pop("retries", 0)
         retry_backoff = kwargs.pop("retry_backoff", 0.3)
         retry_max_backoff = kwargs.pop("retry_max_backoff", 10.0)
+        retry_jitter = kwargs.pop("retry_jitter", 0.0)
+        circuit_breaker = kwargs.pop("circuit_breaker", False)
+        cache = kwargs.pop("cache", False) and self.response_cache is not None and not args and not kwargs.get("stream")
         retries = 0
+        coordinator = self.retry_coordinator
 
         if session:
             headers.update(session.headers)
             params.update(session.params)
 
         while True:
+            retry_after: float | None = None
             try:
-                res = super().request(
-                    method,
-                    url,
-                    *args,
-                    headers=headers,
-                    params=params,
-                    timeout=timeout,
-                    proxies=proxies,
-                    **kwargs,
-                )
+                if circuit_breaker:
+                    coordinator.acquire(url)
+                timings = HTTPTimings(method=method.upper(), url=url) if self._timings_hooks else None
+                try:
+                    with collect_timings(timings):
+                        if template is not None:
+                            res = template.send(
+                                method,
+                                url,
+                                headers=headers,
+                                timeout=timeout,
+                                **kwargs,
+                            )
+                        elif cache:
+                            res = self._request_cached(
+                                method,
+                                url,
+                                headers=headers,
+                                params=params,
+                                timeout=timeout,
+                                proxies=proxies,
+                                **kwargs,
+                            )
+                        else:
+                            res = super().request(
+                                method,
+                                url,
+                                *args,
+                                headers=headers,
+                                params=params,
+                                timeout=timeout,
+                                proxies=proxies,
+                                **kwargs,
+                            )
+                except Exception as rerr:
+                    if timings is not None:
+                        timings.finish(error=rerr)
+                        self._emit_timings(timings)
+                    if circuit_breaker:
+                        coordinator.report_error(url, rerr)
+                    raise
+                if timings is not None:
+                    timings.finish(status_code=res.status_code, stream=bool(kwargs.get("stream")))
+                    self._emit_timings(timings)
+                failed = coordinator.is_failure_status(res.status_code) and res.status_code not in acceptable_status
+                if failed:
+                    retry_after = coordinator.parse_retry_after(res)
+                if circuit_breaker:
+                    coordinator.report_status(url, failed, retry_after)
                 if raise_for_status and res.status_code not in acceptable_status:
                     res.raise_for_status()
                 break
@@ -293,8 +619,13 @@ class HTTPSession(Session):
                     err.err = rerr
                     raise err from None  # TODO: fix this
                 retries += 1
-                # back off retrying, but only to a maximum sleep time
-                delay = min(retry_max_backoff, retry_backoff * (2 ** (retries - 1)))
+                # back off retrying, but only to a maximum sleep time, unless the server wants us to wait longer,
+                # which is capped by the maximum sleep time as well
+                delay = coordinator.backoff(retries, retry_backoff, retry_max_backoff, retry_jitter)
+                if retry_after is not None:
+                    delay = max(delay, min(retry_max_backoff, retry_after))
+                if isinstance(rerr, CircuitOpenError):
+                    delay = max(delay, min(retry_max_backoff, rerr.remaining))
                 time.sleep(delay)
 
         if encoding is not None:
@@ -306,7 +637,140 @@ class HTTPSession(Session):
         return res
 
 
+class HTTPRequestTemplate:
+    """
+    Pre-built request data for sending lots of similar requests, e.g. when fetching stream segments.
+
+    Headers, params, cookies, auth and the request body get merged with the session's context only once,
+    so only the URL and additional headers need to be prepared for each request.
+    Environment settings (proxies, certificates) get cached per origin.
+
+    Set the ``template`` keyword of :meth:`HTTPSession.request` for sending requests using a template.
+    The ``params`` and ``proxies`` keywords of :meth:`HTTPSession.request` are ignored in this case.
+    """
+
+    def __init__(self, session: HTTPSession, **request_args) -> None:
+        """
+        :param session: The HTTP session
+        :param request_args: Keyword arguments passed to :class:`requests.Request`, except for the method and URL
+        """
+
+        args = session.valid_request_args(**request_args)
+
+        self.session = session
+
+        self._params = merge_setting(args.get("params"), session.params)
+        self._auth = args.get("auth") or session.auth
+
+        cookies = args.get("cookies")
+        self._cookies: RequestsCookieJar | None = merge_cookies(RequestsCookieJar(), cookies) if cookies else None
+
+        self._prepared = PreparedRequest()
+        self._prepared.prepare_headers(
+            merge_setting(args.get("headers"), session.headers, dict_class=CaseInsensitiveDict),
+        )
+        self._prepared.prepare_body(args.get("data"), args.get("files"), args.get("json"))
+        self._prepared.hooks = default_hooks()
+        self._prepared.prepare_hooks(merge_hooks({}, session.hooks))
+
+        self._netrc_auth: dict[str, Any] = {}
+        self._environment_settings: dict[tuple[str, str, bool], dict[str, Any]] = {}
+
+    def _get_cookies(self) -> RequestsCookieJar:
+        jar = RequestsCookieJar()
+        if self.session.cookies:
+            merge_cookies(jar, self.session.cookies)
+        if self._cookies:
+            merge_cookies(jar, self._cookies)
+
+        return jar
+
+    def _get_auth(self, url: str) -> Any:
+        if self._auth or not self.session.trust_env:
+            return self._auth
+
+        netloc = urlparse(url).netloc
+        if netloc not in self._netrc_auth:
+            self._netrc_auth[netloc] = get_netrc_auth(url)
+
+        return self._netrc_auth[netloc]
+
+    def _get_environment_settings(self, url: str, stream: bool) -> dict[str, Any]:
+        urlp = urlparse(url)
+        key = urlp.scheme, urlp.netloc, stream
+        if key not in self._environment_settings:
+            self._environment_settings[key] = self.session.merge_environment_settings(
+                url,
+                self.session.proxies,
+                stream,
+                None,
+                None,
+            )
+
+        return self._environment_settings[key]
+
+    def prepare(self, method: str, url: str, headers: Mapping[str, str] | None = None) -> PreparedRequest:
+        """
+        Prepare a new request from the template.
+
+        :param method: The request method
+        :param url: The request URL
+        :param headers: Additional request headers
+        """
+
+        prepared = self._prepared.copy()
+        prepared.prepare_method(method)
+        prepared.prepare_url(url, self._params)
+        if headers:
+            prepared.headers.update(headers)
+        prepared.prepare_cookies(self._get_cookies())
+        prepared.prepare_auth(self._get_auth(url), url)
+
+        return prepared
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | tuple[float, float] | None = None,
+        stream: bool = False,
+        allow_redirects: bool = True,
+    ) -> Response:
+        """
+        Prepare a new request from the template and send it.
+
+        :param method: The request method
+        :param url: The request URL
+        :param headers: Additional request headers
+        :param timeout: The request timeout
+        :param stream: Whether to immediately download the response content
+        :param allow_redirects: Whether to follow redirects
+        """
+
+        prepared = self.prepare(method, url, headers)
+        settings = self._get_environment_settings(url, stream)
+
+        return self.session.send(prepared, timeout=timeout, allow_redirects=allow_redirects, **settings)
+
+
 class SSLContextAdapter(HTTPAdapter):
+    #: TLS session cache of the :class:`HTTPSession` which the adapter was mounted on
+    tls_session_cache: TLSSessionCache | None = None
+    #: Connector of the :class:`HTTPSession` which the adapter was mounted on
+    connector: Connector | None = None
+
+    @property
+    def ssl_context_key(self) -> Hashable | None:
+        """
+        Adapters with the same key share the same SSLContext when mounted on an :class:`HTTPSession`.
+
+        Each adapter gets its own SSLContext by default. Adapters which build their SSLContext solely from
+        their configuration can opt into sharing it by returning a key of the adapter class and its configuration.
+        """
+
+        return None
+
     # noinspection PyMethodMayBeStatic
     def get_ssl_context(self) -> ssl.SSLContext:
         ctx = create_urllib3_context()
@@ -339,6 +803,11 @@ class SSLContextAdapter(HTTPAdapter):
 
 
 class TLSNoDHAdapter(SSLContextAdapter):
+    @property
+    def ssl_context_key(self) -> Hashable | None:
+        # subclasses may configure the SSLContext differently
+        return TLSNoDHAdapter if type(self) is TLSNoDHAdapter else None
+
     def get_ssl_context(self) -> ssl.SSLContext:
         ctx = super().get_ssl_context()
 
@@ -351,6 +820,11 @@ class TLSNoDHAdapter(SSLContextAdapter):
 
 
 class TLSSecLevel1Adapter(SSLContextAdapter):
+    @property
+    def ssl_context_key(self) -> Hashable | None:
+        # subclasses may configure the SSLContext differently
+        return TLSSecLevel1Adapter if type(self) is TLSSecLevel1Adapter else None
+
     def get_ssl_context(self) -> ssl.SSLContext:
         ctx = super().get_ssl_context()
 
@@ -360,4 +834,11 @@ class TLSSecLevel1Adapter(SSLContextAdapter):
         return ctx
 
 
-__all__ = ["HTTPSession", "SSLContextAdapter", "TLSNoDHAdapter", "TLSSecLevel1Adapter"]
+__all__ = [
+    "ConnectionPoolStats",
+    "HTTPRequestTemplate",
+    "HTTPSession",
+    "SSLContextAdapter",
+    "TLSNoDHAdapter",
+    "TLSSecLevel1Adapter",
+]
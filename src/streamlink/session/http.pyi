@@ -1,8 +1,8 @@
 import socket
 import ssl
-from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Hashable, Iterable, Mapping, MutableMapping, Sequence
 from pathlib import Path
-from typing import Any, TypeAlias
+from typing import Any, NamedTuple, TypeAlias
 
 # noinspection PyUnresolvedReferences
 from _typeshed import SupportsItems, SupportsRead  # noqa: PLC2701
@@ -13,6 +13,11 @@ from requests.cookies import RequestsCookieJar
 
 from streamlink.plugin.api.validate import Schema
 from streamlink.session import Streamlink
+from streamlink.session.http_cache import HTTPCache
+from streamlink.session.http_connection import Connector
+from streamlink.session.http_retry import RetryCoordinator
+from streamlink.session.http_timings import HTTPTimings
+from streamlink.session.http_tls import TLSSessionCache
 
 # START: borrowed from typeshed / types-requests
 # https://github.com/python/typeshed/blob/b3db49abbd563a8543783fcd2b4d6765b32812b0/stubs/requests/requests/sessions.pyi
@@ -74,14 +79,48 @@ _Exception: TypeAlias = type[Exception]
 def urllib3_set_socket_options(sock: socket.socket, options: list[tuple[int, int, int | bytes]] | None) -> None: ...
 
 class SSLContextAdapter(HTTPAdapter):
+    tls_session_cache: TLSSessionCache | None
+    connector: Connector | None
+
+    @property
+    def ssl_context_key(self) -> Hashable | None: ...
     def get_ssl_context(self) -> ssl.SSLContext: ...
 
 class TLSNoDHAdapter(SSLContextAdapter): ...
 class TLSSecLevel1Adapter(SSLContextAdapter): ...
 
+class ConnectionPoolStats(NamedTuple):
+    scheme: str
+    host: str
+    port: int | None
+    maxsize: int
+    connections: int
+    requests: int
+
+    @property
+    def reused(self) -> int: ...
+
+class HTTPRequestTemplate:
+    session: HTTPSession
+
+    def __init__(self, session: HTTPSession, **request_args) -> None: ...
+    def prepare(self, method: str, url: str, headers: Mapping[str, str] | None = None) -> PreparedRequest: ...
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: _Timeout | None = None,
+        stream: bool = False,
+        allow_redirects: bool = True,
+    ) -> Response: ...
+
 class HTTPSession(Session):
     params: dict
     timeout: float
+    retry_coordinator: RetryCoordinator
+    response_cache: HTTPCache | None
+    tls_sessions: TLSSessionCache
 
     @classmethod
     def determine_json_encoding(cls, sample: bytes) -> str: ...
@@ -109,7 +148,17 @@ class HTTPSession(Session):
     ) -> Any: ...
     def set_interface(self, interface: str | None) -> None: ...
     def set_address_family(self, family: socket.AddressFamily | None = None) -> None: ...
+    def set_dns_cache(self, ttl: float | None = None) -> None: ...
+    def set_happy_eyeballs(self, enable: bool = True) -> None: ...
+    def add_timings_hook(self, hook: Callable[[HTTPTimings], Any]) -> None: ...
+    def remove_timings_hook(self, hook: Callable[[HTTPTimings], Any]) -> None: ...
+    def enable_response_cache(self, enable: bool = True, disabled_file: bool = False) -> None: ...
     def disable_dh(self, disable: bool = True) -> None: ...
+    @property
+    def pool_maxsize(self) -> int: ...
+    def reserve_connections(self, num: int) -> None: ...
+    def release_connections(self, num: int) -> None: ...
+    def get_pool_stats(self) -> list[ConnectionPoolStats]: ...
     def set_cookies_from_file(self, path: Path | str) -> None: ...
     def resolve_url(self, url: str) -> str: ...
     @staticmethod
@@ -143,6 +192,10 @@ class HTTPSession(Session):
         retries: float | None = ...,
         retry_backoff: float | None = ...,
         retry_max_backoff: float | None = ...,
+        retry_jitter: float | None = ...,
+        circuit_breaker: bool = ...,
+        cache: bool = ...,
+        template: HTTPRequestTemplate | None = ...,
     ) -> Any: ...
     def get(
         self,
@@ -172,6 +225,10 @@ class HTTPSession(Session):
         retries: float | None = ...,
         retry_backoff: float | None = ...,
         retry_max_backoff: float | None = ...,
+        retry_jitter: float | None = ...,
+        circuit_breaker: bool = ...,
+        cache: bool = ...,
+        template: HTTPRequestTemplate | None = ...,
     ) -> Any: ...
     def options(
         self,
@@ -200,6 +257,10 @@ class HTTPSession(Session):
         retries: float | None = ...,
         retry_backoff: float | None = ...,
         retry_max_backoff: float | None = ...,
+        retry_jitter: float | None = ...,
+        circuit_breaker: bool = ...,
+        cache: bool = ...,
+        template: HTTPRequestTemplate | None = ...,
     ) -> Any: ...
     def head(
         self,
@@ -229,6 +290,10 @@ class HTTPSession(Session):
         retries: float | None = ...,
         retry_backoff: float | None = ...,
         retry_max_backoff: float | None = ...,
+        retry_jitter: float | None = ...,
+        circuit_breaker: bool = ...,
+        cache: bool = ...,
+        template: HTTPRequestTemplate | None = ...,
     ) -> Any: ...
     def post(
         self,
@@ -258,6 +323,10 @@ class HTTPSession(Session):
         retries: float | None = ...,
         retry_backoff: float | None = ...,
         retry_max_backoff: float | None = ...,
+        retry_jitter: float | None = ...,
+        circuit_breaker: bool = ...,
+        cache: bool = ...,
+        template: HTTPRequestTemplate | None = ...,
     ) -> Any: ...
     def put(
         self,
@@ -287,6 +356,10 @@ class HTTPSession(Session):
         retries: float | None = ...,
         retry_backoff: float | None = ...,
         retry_max_backoff: float | None = ...,
+        retry_jitter: float | None = ...,
+        circuit_breaker: bool = ...,
+        cache: bool = ...,
+        template: HTTPRequestTemplate | None = ...,
     ) -> Any: ...
     def patch(
         self,
@@ -316,6 +389,10 @@ class HTTPSession(Session):
         retries: float | None = ...,
         retry_backoff: float | None = ...,
         retry_max_backoff: float | None = ...,
+        retry_jitter: float | None = ...,
+        circuit_breaker: bool = ...,
+        cache: bool = ...,
+        template: HTTPRequestTemplate | None = ...,
     ) -> Any: ...
     def delete(
         self,
@@ -345,4 +422,8 @@ class HTTPSession(Session):
         retries: float | None = ...,
         retry_backoff: float | None = ...,
         retry_max_backoff: float | None = ...,
+        retry_jitter: float | None = ...,
+        circuit_breaker: bool = ...,
+        cache: bool = ...,
+        template: HTTPRequestTemplate | None = ...,
     ) -> Any: ...
@@ -0,0 +1,679 @@
+"""
+Optional HTTP/2 transport adapter for :class:`requests.Session` objects, based on the h2 library.
+
+HTTP/2 connections are negotiated via TLS ALPN and multiplex concurrent requests to the same origin
+over a single connection. Requests fall back to the regular HTTP/1.1 connection pools
+if the server doesn't support HTTP/2, if a proxy or client certificate is used, or if no stream is available.
+"""
+
+from __future__ import annotations
+
+import io
+import selectors
+import socket
+import ssl
+from contextlib import suppress
+from http.client import HTTPMessage
+from pathlib import Path
+from threading import Condition, Lock, RLock, current_thread
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+import urllib3
+import urllib3.util.connection as urllib3_util_connection
+from requests.adapters import DEFAULT_CA_BUNDLE_PATH
+from requests.exceptions import ConnectionError as RequestsConnectionError, ConnectTimeout, ReadTimeout, SSLError
+from requests.utils import extract_zipped_paths, select_proxy
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.errors
+    import h2.events
+    import h2.exceptions
+    import h2.settings
+except ImportError:  # pragma: no cover
+    h2 = None  # type: ignore[assignment]
+
+from streamlink.logger import getLogger
+from streamlink.session.http import SSLContextAdapter
+from streamlink.utils.thread import NamedThread
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from requests import PreparedRequest, Response
+
+
+log = getLogger(__name__)
+
+
+# Connection-specific header fields which are not allowed in HTTP/2
+# https://datatracker.ietf.org/doc/html/rfc9113#section-8.2.2
+_CONNECTION_HEADERS = {b"connection", b"host", b"keep-alive", b"proxy-connection", b"transfer-encoding", b"upgrade"}
+
+# Local flow control window size of each stream, which limits the amount of buffered response data of each stream,
+# as received data only gets acknowledged once it has been read
+_STREAM_WINDOW_SIZE = 2**21
+# Local flow control window size of the connection, which is shared by all streams
+_CONNECTION_WINDOW_SIZE = 2**24
+
+_MAX_STREAM_ID = 2**31 - 1
+
+# Max time in seconds for sending the remaining data of a closed connection
+_CLOSE_TIMEOUT = 1.0
+
+
+class HTTP2NotNegotiated(Exception):
+    """The server didn't negotiate HTTP/2 during the TLS handshake"""
+
+
+class HTTP2StreamNotProcessed(ConnectionError):
+    """
+    The connection was closed before a response was received.
+
+    If ``refused`` is set, the server hasn't processed the request, e.g. after a GOAWAY frame,
+    so it can be safely retried on a new connection.
+    """
+
+    def __init__(self, message: str, refused: bool = False) -> None:
+        super().__init__(message)
+        self.refused = refused
+
+
+class _HTTP2Stream:
+    def __init__(self, stream_id: int) -> None:
+        self.stream_id = stream_id
+        self.headers: list[tuple[bytes, bytes]] | None = None
+        self.chunks: list[bytes] = []
+        # number of bytes which have been read, but which haven't been acknowledged yet
+        self.consumed = 0
+        self.ended = False
+        self.error: Exception | None = None
+
+
+class HTTP2Connection:
+    """
+    A thread-safe HTTP/2 client connection, which multiplexes requests from multiple threads.
+
+    All socket I/O is done by a dedicated thread, which sends the data of the connection's state machine
+    and dispatches the received data to all open streams. Other threads only update the state machine
+    while holding the lock and then wait until their streams have received data.
+    """
+
+    def __init__(self, sock: ssl.SSLSocket | socket.socket) -> None:
+        self.sock = sock
+        self._lock = RLock()
+        self._cond = Condition(self._lock)
+        self._streams: dict[int, _HTTP2Stream] = {}
+        self._closed = False
+        self._goaway = False
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_send.setblocking(False)
+
+        config = h2.config.H2Configuration(client_side=True, header_encoding=None)
+        self._conn = h2.connection.H2Connection(config=config)
+        self._conn.local_settings = h2.settings.Settings(
+            client=True,
+            initial_values={
+                h2.settings.SettingCodes.ENABLE_PUSH: 0,
+                h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: _STREAM_WINDOW_SIZE,
+            },
+        )
+        with self._lock:
+            self._conn.initiate_connection()
+            self._conn.increment_flow_control_window(_CONNECTION_WINDOW_SIZE - self._conn.inbound_flow_control_window)
+
+        self._thread = NamedThread(target=self._run, name="HTTP2Connection", daemon=True)
+        self._thread.start()
+
+    @property
+    def available(self) -> bool:
+        """Whether a new stream can be opened on this connection"""
+
+        with self._lock:
+            highest_stream_id = self._conn.highest_outbound_stream_id or 0
+            return (
+                not self._closed
+                and not self._goaway
+                and len(self._streams) < self._conn.remote_settings.max_concurrent_streams
+                and highest_stream_id < _MAX_STREAM_ID - 2
+            )
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def usable(self) -> bool:
+        """Whether the connection hasn't been closed and whether the server hasn't sent a GOAWAY frame"""
+
+        return not self._closed and not self._goaway
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._conn.close_connection()
+            except h2.exceptions.H2Error:  # pragma: no cover
+                pass
+            self._fail(ConnectionError("HTTP/2 connection was closed"))
+        self._wakeup()
+        if self._thread is not current_thread():
+            self._thread.join(_CLOSE_TIMEOUT * 2)
+
+    def _wakeup(self) -> None:
+        # let the I/O thread send the connection's pending data
+        try:
+            self._wakeup_send.send(b"\x00")
+        except OSError:
+            # the socket buffer is full, so the I/O thread will wake up anyway, or the connection is already closed
+            pass
+
+    def _fail(self, error: Exception, refused: bool = False) -> None:
+        # called while holding the lock
+        self._closed = True
+        for stream in self._streams.values():
+            if stream.error is None:
+                # streams without a response may be retried on a new connection
+                stream.error = error if stream.headers is not None else HTTP2StreamNotProcessed(str(error), refused=refused)
+        self._streams.clear()
+        self._cond.notify_all()
+
+    def _run(self) -> None:
+        sock = self.sock
+        selector = selectors.DefaultSelector()
+        outgoing = b""
+        try:
+            sock.setblocking(False)
+            selector.register(sock, selectors.EVENT_READ)
+            selector.register(self._wakeup_recv, selectors.EVENT_READ)
+            while True:
+                with self._lock:
+                    if self._closed:
+                        outgoing += self._conn.data_to_send()
+                        break
+                    if not outgoing:
+                        outgoing = self._conn.data_to_send()
+
+                selector.modify(sock, selectors.EVENT_READ | (selectors.EVENT_WRITE if outgoing else 0))
+                # data of the TLS layer which has already been read from the socket doesn't make it readable again
+                pending = sock.pending() if isinstance(sock, ssl.SSLSocket) else 0
+                ready = {key.fileobj: mask for key, mask in selector.select(0 if pending else None)}
+
+                if ready.get(self._wakeup_recv):
+                    self._wakeup_recv.recv(4096)
+
+                if outgoing and (ready.get(sock, 0) & selectors.EVENT_WRITE):
+                    # a non-blocking TLS write must be retried with the same data, so don't append data in between
+                    with suppress(ssl.SSLWantReadError, ssl.SSLWantWriteError, BlockingIOError):
+                        outgoing = outgoing[sock.send(outgoing) :]
+
+                if pending or (ready.get(sock, 0) & selectors.EVENT_READ):
+                    try:
+                        data = sock.recv(65535)
+                    except (ssl.SSLWantReadError, ssl.SSLWantWriteError, BlockingIOError):
+                        continue
+                    if not data:
+                        with self._lock:
+                            # the server has closed the idle connection, or it has sent a GOAWAY frame before
+                            self._fail(ConnectionError("HTTP/2 connection was closed by the server"))
+                        break
+                    with self._lock:
+                        for event in self._conn.receive_data(data):
+                            self._handle_event(event)
+                        self._cond.notify_all()
+        except (OSError, ValueError, h2.exceptions.H2Error) as err:
+            with self._lock:
+                self._fail(ConnectionError(f"HTTP/2 connection error: {err}"))
+        finally:
+            selector.close()
+            # try sending the GOAWAY frame of a closed connection
+            with suppress(OSError, ValueError):
+                if outgoing:
+                    sock.settimeout(_CLOSE_TIMEOUT)
+                    sock.sendall(outgoing)
+            sock.close()
+            self._wakeup_recv.close()
+            self._wakeup_send.close()
+
+    def request(self, method: str, authority: str, path: str, headers: list[tuple[bytes, bytes]], body: bytes | None):
+        """
+        Open a new stream and send the request headers and body
+        """
+
+        with self._lock:
+            if not self.usable:
+                raise HTTP2StreamNotProcessed("HTTP/2 connection was closed", refused=True)
+
+            stream_id = self._conn.get_next_available_stream_id()
+            stream = self._streams[stream_id] = _HTTP2Stream(stream_id)
+
+            request_headers = [
+                (b":method", method.encode()),
+                (b":authority", authority.encode()),
+                (b":scheme", b"https"),
+                (b":path", path.encode()),
+                *headers,
+            ]
+            try:
+                self._conn.send_headers(stream_id, request_headers, end_stream=not body)
+                if body:
+                    max_size = self._conn.max_outbound_frame_size
+                    for offset in range(0, len(body), max_size):
+                        end_stream = offset + max_size >= len(body)
+                        self._conn.send_data(stream_id, body[offset : offset + max_size], end_stream=end_stream)
+            except h2.exceptions.H2Error as err:
+                self._fail(ConnectionError(f"HTTP/2 connection error: {err}"))
+                raise ConnectionError(f"HTTP/2 connection error: {err}") from err
+
+        self._wakeup()
+
+        return stream
+
+    def can_send(self, size: int) -> bool:
+        """Whether a request body of the given size can be sent without having to wait for flow control window updates"""
+
+        with self._lock:
+            return size <= min(self._conn.outbound_flow_control_window, self._conn.remote_settings.initial_window_size)
+
+    def reset(self, stream: _HTTP2Stream) -> None:
+        """
+        Reset the stream if it hasn't ended yet, and acknowledge its buffered data which won't be read anymore
+        """
+
+        with self._lock:
+            size = sum(len(chunk) for chunk in stream.chunks)
+            stream.chunks.clear()
+            send = self._acknowledge(stream, size, flush=True)
+            if not self._closed and self._streams.pop(stream.stream_id, None) is not None:
+                try:
+                    self._conn.reset_stream(stream.stream_id, error_code=h2.errors.ErrorCodes.CANCEL)
+                    send = True
+                except h2.exceptions.H2Error:  # pragma: no cover
+                    pass
+        if send:
+            self._wakeup()
+
+    def _acknowledge(self, stream: _HTTP2Stream, size: int, flush: bool = False) -> bool:
+        # called while holding the lock
+        # h2 only sends WINDOW_UPDATE frames once half of the window has been processed, so batch the acknowledgements
+        stream.consumed += size
+        if not stream.consumed or (not flush and stream.consumed < _STREAM_WINDOW_SIZE // 2) or self._closed:
+            return False
+        size, stream.consumed = stream.consumed, 0
+        try:
+            self._conn.acknowledge_received_data(size, stream.stream_id)
+        except h2.exceptions.H2Error:  # pragma: no cover
+            return False
+
+        return True
+
+    def get_response(self, stream: _HTTP2Stream, timeout: float | None) -> list[tuple[bytes, bytes]]:
+        """
+        Wait for the response headers of a stream
+        """
+
+        self._wait(stream, lambda: stream.headers is not None, timeout)
+        if stream.headers is None:
+            raise ConnectionError("HTTP/2 stream has ended without a response")
+
+        return stream.headers
+
+    def read(self, stream: _HTTP2Stream, size: int, timeout: float | None) -> bytes:
+        """
+        Read up to size bytes of the response body of a stream, or an empty bytes object if the stream has ended
+        """
+
+        self._wait(stream, lambda: bool(stream.chunks), timeout)
+        with self._lock:
+            if not stream.chunks:
+                return b""
+            chunk = stream.chunks[0]
+            if len(chunk) <= size:
+                stream.chunks.pop(0)
+            else:
+                stream.chunks[0] = chunk[size:]
+                chunk = chunk[:size]
+            # let the server send more data once it has been read
+            send = self._acknowledge(stream, len(chunk))
+        if send:
+            self._wakeup()
+
+        return chunk
+
+    def _wait(self, stream: _HTTP2Stream, predicate: Callable[[], bool], timeout: float | None) -> None:
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._cond:
+            while not predicate() and not stream.ended:
+                if stream.error is not None:
+                    raise stream.error
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("HTTP/2 stream read timed out")
+                self._cond.wait(remaining)
+
+    def _handle_event(self, event: h2.events.Event) -> None:
+        if isinstance(event, h2.events.DataReceived):
+            if (stream := self._streams.get(event.stream_id)) is None:
+                # data of reset streams won't be read
+                self._conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                return
+            stream.chunks.append(event.data)
+            # padding won't be read either
+            if padding := event.flow_controlled_length - len(event.data):
+                self._conn.acknowledge_received_data(padding, event.stream_id)
+            return
+
+        if isinstance(event, h2.events.ConnectionTerminated):
+            self._goaway = True
+            last_stream_id = event.last_stream_id or 0
+            for stream_id, stream in list(self._streams.items()):
+                if stream_id > last_stream_id:
+                    stream.error = HTTP2StreamNotProcessed(
+                        f"HTTP/2 stream was refused ({event.error_code!r})",
+                        refused=True,
+                    )
+                    self._streams.pop(stream_id)
+            return
+
+        if isinstance(event, h2.events.PushedStreamReceived):  # pragma: no cover
+            self._conn.reset_stream(event.pushed_stream_id, error_code=h2.errors.ErrorCodes.REFUSED_STREAM)
+            return
+
+        stream_id = getattr(event, "stream_id", None)
+        if stream_id is None or (stream := self._streams.get(stream_id)) is None:
+            return
+
+        if isinstance(event, h2.events.ResponseReceived):
+            stream.headers = event.headers
+        elif isinstance(event, h2.events.StreamEnded):
+            stream.ended = True
+            self._streams.pop(stream_id)
+        elif isinstance(event, h2.events.StreamReset):
+            stream.error = ConnectionError(f"HTTP/2 stream was reset ({event.error_code!r})")
+            self._streams.pop(stream_id)
+
+
+class _HTTP2ResponseBody(io.RawIOBase):
+    def __init__(self, connection: HTTP2Connection, stream: _HTTP2Stream, timeout: float | None) -> None:
+        super().__init__()
+        self._connection = connection
+        self._stream = stream
+        self._timeout = timeout
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.closed:
+            return 0
+        data = self._connection.read(self._stream, len(buffer), self._timeout)
+        if not data:
+            self.close()
+            return 0
+        size = len(data)
+        buffer[:size] = data
+
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._connection.reset(self._stream)
+        super().close()
+
+
+class _HTTP2OriginalResponse:
+    # the minimal interface of http.client.HTTPResponse which is used by urllib3 and requests (cookie extraction)
+    def __init__(self, method: str, msg: HTTPMessage, body: _HTTP2ResponseBody) -> None:
+        self._method = method
+        self.msg = msg
+        self._body = body
+
+    def close(self) -> None:
+        self._body.close()
+
+    def isclosed(self) -> bool:
+        return self._body.closed
+
+
+class HTTP2Adapter(SSLContextAdapter):
+    """
+    Transport adapter which sends HTTPS requests via multiplexed HTTP/2 connections, with a fallback to HTTP/1.1.
+
+    Requires the optional h2 dependency.
+    """
+
+    def __init__(self, *args, disable_dh: bool = False, **kwargs) -> None:
+        if h2 is None:  # pragma: no cover
+            raise ImportError("HTTP/2 support requires the h2 package")
+
+        self.disable_dh = disable_dh
+        super().__init__(*args, **kwargs)
+
+        self._connections: dict[tuple[str, int, Any], HTTP2Connection] = {}
+        self._connect_locks: dict[tuple[str, int, Any], Lock] = {}
+        self._http11_origins: set[tuple[str, int]] = set()
+        self._connections_lock = Lock()
+        self._http2_ssl_contexts: dict[Any, ssl.SSLContext] = {}
+
+    @property
+    def ssl_context_key(self) -> Hashable | None:
+        # subclasses may configure the SSLContext differently
+        return (HTTP2Adapter, self.disable_dh) if type(self) is HTTP2Adapter else None
+
+    def get_ssl_context(self) -> ssl.SSLContext:
+        ctx = super().get_ssl_context()
+        if self.disable_dh:
+            ciphers = ":".join(cipher["name"] for cipher in ctx.get_ciphers())
+            ciphers += ":!DH"
+            ctx.set_ciphers(ciphers)
+
+        return ctx
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+        super().close()
+
+    def send(self, request: PreparedRequest, stream=False, timeout=None, verify=True, cert=None, proxies=None) -> Response:
+        url = request.url or ""
+        urlp = urlparse(url)
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        if (
+            urlp.scheme != "https"
+            or not urlp.hostname
+            or cert
+            or select_proxy(url, proxies)
+            or (body is not None and not isinstance(body, bytes))
+        ):
+            return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        host, port = urlp.hostname, urlp.port or 443
+        if (host, port) in self._http11_origins:
+            return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        connect_timeout, read_timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+
+        headers = [
+            (name.lower().encode(), value.encode() if isinstance(value, str) else value)
+            for name, value in request.headers.items()
+            if name.lower().encode() not in _CONNECTION_HEADERS
+        ]
+        authority = urlp.netloc.rsplit("@", 1)[-1]
+        path = request.path_url
+        method = request.method or "GET"
+
+        # retry once on a new connection if the server has closed an idle connection or sent a GOAWAY frame
+        for retry in (True, False):
+            try:
+                connection = self._get_connection(host, port, verify, connect_timeout)
+            except HTTP2NotNegotiated:
+                log.debug(f"HTTP/2 not supported by {host}:{port}, falling back to HTTP/1.1")
+                return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+            except ssl.SSLError as err:
+                raise SSLError(err, request=request) from err
+            except TimeoutError as err:
+                raise ConnectTimeout(err, request=request) from err
+            except OSError as err:
+                raise RequestsConnectionError(err, request=request) from err
+
+            if connection is None or (body and not connection.can_send(len(body))):
+                return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+            try:
+                h2_stream = connection.request(method, authority, path, headers, body)
+                response_headers = connection.get_response(h2_stream, read_timeout)
+            except HTTP2StreamNotProcessed as err:
+                if retry and (err.refused or method.upper() in Retry.DEFAULT_ALLOWED_METHODS):
+                    log.debug(f"Retrying HTTP/2 request on a new connection: {err}")
+                    continue
+                raise RequestsConnectionError(err, request=request) from err
+            except TimeoutError as err:
+                raise ReadTimeout(err, request=request) from err
+            except OSError as err:
+                raise RequestsConnectionError(err, request=request) from err
+
+            raw = self._build_raw_response(request, connection, h2_stream, response_headers, read_timeout)
+
+            return self.build_response(request, raw)
+
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _get_usable_connection(self, key: tuple[str, int, Any]) -> HTTP2Connection | None:
+        # called while holding the connections lock
+        connection = self._connections.get(key)
+        if connection is not None and not connection.usable:
+            del self._connections[key]
+            return None
+
+        return connection
+
+    def _get_connection(self, host: str, port: int, verify: Any, timeout: float | None) -> HTTP2Connection | None:
+        key = host, port, verify
+        with self._connections_lock:
+            if (connection := self._get_usable_connection(key)) is not None:
+                # if all streams are in use, fall back to HTTP/1.1
+                return connection if connection.available else None
+            connect_lock = self._connect_locks.setdefault(key, Lock())
+
+        # connect without holding the connections lock, so that slow or unreachable origins don't block other origins,
+        # and let concurrent requests to the same origin wait for the pending connection
+        with connect_lock:
+            with self._connections_lock:
+                if (connection := self._get_usable_connection(key)) is not None:
+                    return connection if connection.available else None
+            if (host, port) in self._http11_origins:
+                raise HTTP2NotNegotiated()
+
+            try:
+                connection = self._connect(host, port, verify, timeout)
+            except HTTP2NotNegotiated:
+                self._http11_origins.add((host, port))
+                raise
+            with self._connections_lock:
+                self._connections[key] = connection
+
+            return connection
+
+    def _get_http2_ssl_context(self, verify: Any) -> ssl.SSLContext:
+        with self._connections_lock:
+            return self._create_http2_ssl_context(verify)
+
+    def _create_http2_ssl_context(self, verify: Any) -> ssl.SSLContext:
+        key = verify if isinstance(verify, str) else bool(verify)
+        if (ctx := self._http2_ssl_contexts.get(key)) is not None:
+            return ctx
+
+        ctx = self.get_ssl_context()
+        ctx.set_alpn_protocols(["h2", "http/1.1"])
+        if not verify:
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+        else:
+            ctx.check_hostname = True
+            ctx.verify_mode = ssl.CERT_REQUIRED
+            ca_certs = verify if isinstance(verify, str) else extract_zipped_paths(DEFAULT_CA_BUNDLE_PATH)
+            if Path(ca_certs).is_dir():
+                ctx.load_verify_locations(capath=ca_certs)
+            else:
+                ctx.load_verify_locations(cafile=ca_certs)
+        if self.tls_session_cache is not None:
+            self.tls_session_cache.attach(ctx)
+        self._http2_ssl_contexts[key] = ctx
+
+        return ctx
+
+    def _connect(self, host: str, port: int, verify: Any, timeout: float | None) -> HTTP2Connection:
+        ctx = self._get_http2_ssl_context(verify)
+
+        pool_kw = self.poolmanager.connection_pool_kw
+        connector = self.connector
+        create_connection = (
+            connector.create_connection
+            if connector is not None and connector.active
+            else urllib3_util_connection.create_connection
+        )
+        sock = create_connection(
+            (host, port),
+            timeout=timeout,
+            source_address=pool_kw.get("source_address"),
+            socket_options=pool_kw.get("socket_options") or HTTPConnection.default_socket_options,
+        )
+        try:
+            tls_sock = ctx.wrap_socket(sock, server_hostname=host)
+        except BaseException:
+            sock.close()
+            raise
+
+        if tls_sock.selected_alpn_protocol() != "h2":
+            tls_sock.close()
+            raise HTTP2NotNegotiated()
+
+        return HTTP2Connection(tls_sock)
+
+    @staticmethod
+    def _build_raw_response(
+        request: PreparedRequest,
+        connection: HTTP2Connection,
+        h2_stream: _HTTP2Stream,
+        response_headers: list[tuple[bytes, bytes]],
+        timeout: float | None,
+    ) -> urllib3.HTTPResponse:
+        status = 0
+        headers = urllib3.HTTPHeaderDict()
+        msg = HTTPMessage()
+        for name, value in response_headers:
+            if name == b":status":
+                status = int(value)
+            elif not name.startswith(b":"):
+                name_str, value_str = name.decode("latin-1"), value.decode("latin-1")
+                headers.add(name_str, value_str)
+                msg[name_str] = value_str
+
+        body = _HTTP2ResponseBody(connection, h2_stream, timeout)
+
+        return urllib3.HTTPResponse(
+            body=body,
+            headers=headers,
+            status=status,
+            version=20,
+            version_string="HTTP/2",
+            preload_content=False,
+            decode_content=False,
+            original_response=_HTTP2OriginalResponse(request.method or "GET", msg, body),  # type: ignore[arg-type]
+            request_method=request.method,
+            request_url=request.url,
+        )
+
+
+__all__ = ["HTTP2Adapter", "HTTP2Connection", "HTTP2StreamNotProcessed"]
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import base64
+import re
+from email.utils import parsedate_to_datetime
+from time import time
+from typing import TYPE_CHECKING, Any
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from streamlink.cache import Cache
+from streamlink.logger import getLogger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from requests import PreparedRequest
+
+
+log = getLogger(__name__)
+
+_re_cache_control = re.compile(r"""\s*([\w-]+)\s*(?:=\s*(?:"([^"]*)"|([^,\s]*)))?\s*(?:,|$)""")
+
+# headers of a 304 response which must not replace the headers of the stored response
+_NOT_MODIFIED_IGNORED_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "content-range"}
+
+
+def parse_cache_control(value: str) -> dict[str, str | None]:
+    return {
+        match[1].lower(): match[2] if match[2] is not None else (match[3] or None)
+        for match in _re_cache_control.finditer(value)
+        if match[1]
+    }
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+class CachedResponse:
+    """
+    A stored response and its request's header values selected by the response's ``Vary`` header
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        reason: str,
+        url: str,
+        headers: Mapping[str, str],
+        content: bytes,
+        stored: float,
+        vary: Mapping[str, str | None],
+    ) -> None:
+        self.status_code = status_code
+        self.reason = reason
+        self.url = url
+        self.headers: CaseInsensitiveDict[str] = CaseInsensitiveDict(headers)
+        self.content = content
+        self.stored = stored
+        self.vary = dict(vary)
+
+    @classmethod
+    def from_response(cls, res: Response) -> CachedResponse:
+        vary = {}
+        for name in res.headers.get("Vary", "").split(","):
+            if name := name.strip().lower():
+                vary[name] = res.request.headers.get(name) if res.request is not None else None
+
+        return cls(
+            status_code=res.status_code,
+            reason=res.reason,
+            url=res.url,
+            headers=res.headers,
+            content=res.content,
+            stored=time(),
+            vary=vary,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedResponse:
+        return cls(
+            status_code=data["status_code"],
+            reason=data["reason"],
+            url=data["url"],
+            headers=data["headers"],
+            content=base64.b64decode(data["content"]),
+            stored=data["stored"],
+            vary=data["vary"],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(
+            status_code=self.status_code,
+            reason=self.reason,
+            url=self.url,
+            headers=dict(self.headers),
+            content=base64.b64encode(self.content).decode("ascii"),
+            stored=self.stored,
+            vary=self.vary,
+        )
+
+    @property
+    def cache_control(self) -> dict[str, str | None]:
+        return parse_cache_control(self.headers.get("Cache-Control", ""))
+
+    @property
+    def validators(self) -> dict[str, str]:
+        validators = {}
+        if etag := self.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := self.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+
+        return validators
+
+    @property
+    def freshness_lifetime(self) -> float:
+        cache_control = self.cache_control
+        if "no-cache" in cache_control:
+            return 0.0
+        if (max_age := cache_control.get("max-age")) is not None:
+            try:
+                return max(0.0, float(max_age))
+            except ValueError:
+                return 0.0
+        expires = _parse_http_date(self.headers.get("Expires"))
+        if expires is not None:
+            date = _parse_http_date(self.headers.get("Date")) or self.stored
+            return max(0.0, expires - date)
+
+        return 0.0
+
+    @property
+    def age(self) -> float:
+        try:
+            age = max(0.0, float(self.headers.get("Age", 0)))
+        except ValueError:
+            age = 0.0
+
+        return age + max(0.0, time() - self.stored)
+
+    def is_fresh(self) -> bool:
+        return self.age < self.freshness_lifetime
+
+    def matches(self, request: PreparedRequest) -> bool:
+        return all(request.headers.get(name) == value for name, value in self.vary.items())
+
+    def update(self, res: Response) -> None:
+        """
+        Update the stored response with the headers of a ``304 Not Modified`` response
+        """
+
+        for name, value in res.headers.items():
+            if name.lower() not in _NOT_MODIFIED_IGNORED_HEADERS:
+                self.headers[name] = value
+        self.headers.pop("Age", None)
+        self.stored = time()
+
+    def to_response(self, request: PreparedRequest) -> Response:
+        res = Response()
+        res.status_code = self.status_code
+        res.reason = self.reason
+        res.url = self.url
+        res.headers = CaseInsensitiveDict(self.headers)
+        res.encoding = get_encoding_from_headers(res.headers)
+        res.request = request
+        res._content = self.content
+        res._content_consumed = True
+
+        return res
+
+
+class HTTPCache:
+    """
+    A private HTTP response cache for GET requests, following the caching rules of RFC 9111.
+
+    Fresh responses get returned without sending a request, stale responses with validators (``ETag``,
+    ``Last-Modified``) get revalidated with a conditional request, and ``304 Not Modified`` responses
+    get turned into the stored response. Responses get kept in memory and in a JSON file in the cache directory.
+    """
+
+    #: Cache file name, relative to the cache directory
+    FILENAME = "http-cache.json"
+    #: Maximum size of response bodies which get stored
+    MAX_CONTENT_SIZE = 1024 * 512
+    #: Time in seconds for which stale responses with validators are kept for revalidation
+    REVALIDATION_TIME = 60 * 60 * 24
+
+    def __init__(self, filename: str = FILENAME, disabled: bool = False) -> None:
+        """
+        :param filename: The cache file name, relative to the cache directory
+        :param disabled: Only keep responses in memory and don't read or write the cache file
+        """
+
+        self._cache = Cache(filename, disabled=disabled)
+
+    @staticmethod
+    def _key(request: PreparedRequest) -> str:
+        return f"{request.method} {request.url}"
+
+    @staticmethod
+    def is_cacheable_request(request: PreparedRequest) -> bool:
+        if request.method != "GET":
+            return False
+        cache_control = parse_cache_control(request.headers.get("Cache-Control", ""))
+
+        return "no-store" not in cache_control
+
+    def lookup(self, request: PreparedRequest) -> CachedResponse | None:
+        data = self._cache.get(self._key(request))
+        if data is None:
+            return None
+        try:
+            cached = CachedResponse.from_dict(data)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        return cached if cached.matches(request) else None
+
+    def store(self, request: PreparedRequest, res: Response) -> CachedResponse | None:
+        if res.status_code != 200:
+            return None
+        cache_control = parse_cache_control(res.headers.get("Cache-Control", ""))
+        if "no-store" in cache_control or res.headers.get("Vary", "").strip() == "*":
+            return None
+
+        cached = CachedResponse.from_response(res)
+        freshness_lifetime = cached.freshness_lifetime
+        if not cached.validators and freshness_lifetime <= 0:
+            return None
+        if len(cached.content) > self.MAX_CONTENT_SIZE:
+            return None
+
+        self._set(request, cached, freshness_lifetime)
+
+        return cached
+
+    def revalidated(self, request: PreparedRequest, cached: CachedResponse, res: Response) -> CachedResponse:
+        cached.update(res)
+        self._set(request, cached, cached.freshness_lifetime)
+
+        return cached
+
+    def _set(self, request: PreparedRequest, cached: CachedResponse, freshness_lifetime: float) -> None:
+        expires = max(freshness_lifetime, self.REVALIDATION_TIME if cached.validators else 0.0)
+        self._cache.set(self._key(request), cached.to_dict(), expires=expires)
+
+    def send(self, request: PreparedRequest, send: Any, **kwargs) -> Response:
+        """
+        Send a request through the cache
+
+        :param request: The prepared request
+        :param send: The function which sends the request, e.g. :meth:`requests.Session.send`
+        :param kwargs: Keyword arguments of the send function
+        """
+
+        if not self.is_cacheable_request(request):
+            return send(request, **kwargs)
+
+        cached = self.lookup(request)
+        if cached is not None:
+            if cached.is_fresh():
+                log.trace(f"Using cached response: {request.url}")
+                return cached.to_response(request)
+            for name, value in cached.validators.items():
+                request.headers.setdefault(name, value)
+
+        res = send(request, **kwargs)
+
+        if cached is not None and res.status_code == 304:
+            log.trace(f"Revalidated cached response: {request.url}")
+            res.close()
+            return self.revalidated(request, cached, res).to_response(request)
+
+        self.store(request, res)
+
+        return res
+
+
+__all__ = ["CachedResponse", "HTTPCache"]
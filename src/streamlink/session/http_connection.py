@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import errno
+import os
+import selectors
+import socket
+from ipaddress import ip_address
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any
+
+import urllib3.util.connection as urllib3_util_connection
+from urllib3.exceptions import LocationParseError
+from urllib3.util.timeout import _DEFAULT_TIMEOUT  # noqa: PLC2701
+
+from streamlink.session.http_timings import current_timings
+
+
+if TYPE_CHECKING:
+    from typing import TypeAlias
+
+    _TYPE_ADDRINFO: TypeAlias = tuple[socket.AddressFamily, socket.SocketKind, int, str, tuple[Any, ...]]
+    _TYPE_SOCKET_OPTION: TypeAlias = tuple[int, int, int | bytes]
+
+
+#: The recommended "Connection Attempt Delay" of RFC 8305
+HAPPY_EYEBALLS_DELAY = 0.25
+
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, getattr(errno, "WSAEWOULDBLOCK", 10035)}
+
+
+class DNSCache:
+    """
+    A thread-safe cache of resolved addresses.
+
+    The system resolver doesn't expose the TTL values of DNS records, so cached entries expire after a fixed amount of time.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._cache: dict[tuple[str, int, int, int], tuple[float, list[_TYPE_ADDRINFO]]] = {}
+        self._lock = Lock()
+
+    def getaddrinfo(self, host: str, port: int, family: int = 0, type: int = 0) -> list[_TYPE_ADDRINFO]:  # noqa: A002
+        key = host, port, family, type
+        now = monotonic()
+        with self._lock:
+            if (entry := self._cache.get(key)) and entry[0] > now:
+                return list(entry[1])
+
+        addrinfo = socket.getaddrinfo(host, port, family, type)
+        with self._lock:
+            self._cache[key] = now + self.ttl, addrinfo
+
+        return list(addrinfo)
+
+    def invalidate(self, host: str) -> None:
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == host]:
+                del self._cache[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class Connector:
+    """
+    A replacement for urllib3's ``create_connection()`` function, with an optional DNS cache
+    and optional RFC 8305 style connection attempts ("Happy Eyeballs").
+
+    The address family restrictions of urllib3's ``allowed_gai_family()`` are respected,
+    as well as the source address and socket options set by the connection pools.
+
+    Each :class:`HTTPSession <streamlink.session.http.HTTPSession>` has its own connector, which gets used
+    by the connections of its mounted adapters.
+    """
+
+    def __init__(self, dns_cache: DNSCache | None = None, happy_eyeballs_delay: float | None = None) -> None:
+        """
+        :param dns_cache: Optional DNS cache
+        :param happy_eyeballs_delay: Delay in seconds between concurrent connection attempts,
+                                     or ``None`` for sequential connection attempts
+        """
+
+        self.dns_cache = dns_cache
+        self.happy_eyeballs_delay = happy_eyeballs_delay
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether connections need to be created by the connector instead of urllib3's ``create_connection()`` function,
+        because the DNS cache or Happy Eyeballs are enabled, or because timings of the current thread are being collected
+        """
+
+        return self.dns_cache is not None or self.happy_eyeballs_delay is not None or current_timings() is not None
+
+    def getaddrinfo(self, host: str, port: int, family: int) -> list[_TYPE_ADDRINFO]:
+        timings = current_timings()
+        start = perf_counter()
+        try:
+            if self.dns_cache is not None:
+                return self.dns_cache.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+
+            return socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+        finally:
+            if timings is not None:
+                timings.add("dns", perf_counter() - start)
+
+    def create_connection(
+        self,
+        address: tuple[str, int],
+        timeout: Any = _DEFAULT_TIMEOUT,
+        source_address: tuple[str, int] | None = None,
+        socket_options: list[_TYPE_SOCKET_OPTION] | None = None,
+    ) -> socket.socket:
+        host, port = address
+        if host.startswith("["):
+            host = host.strip("[]")
+
+        try:
+            host.encode("idna")
+        except UnicodeError:
+            raise LocationParseError(f"'{host}', label empty or too long") from None
+
+        family = urllib3_util_connection.allowed_gai_family()  # type: ignore[attr-defined, ty:unresolved-attribute]
+        addrinfo = self.getaddrinfo(host, port, family)
+        addrinfo = self._filter_source_address_family(addrinfo, source_address)
+        if timeout is _DEFAULT_TIMEOUT:
+            timeout = socket.getdefaulttimeout()
+
+        try:
+            if self.happy_eyeballs_delay is None or len(addrinfo) < 2:
+                return self._connect_sequential(addrinfo, timeout, source_address, socket_options)
+
+            return self._connect_concurrent(addrinfo, timeout, source_address, socket_options, self.happy_eyeballs_delay)
+        except OSError:
+            # resolved addresses might be outdated
+            if self.dns_cache is not None:
+                self.dns_cache.invalidate(host)
+            raise
+
+    @staticmethod
+    def _filter_source_address_family(
+        addrinfo: list[_TYPE_ADDRINFO],
+        source_address: tuple[str, int] | None,
+    ) -> list[_TYPE_ADDRINFO]:
+        if not source_address:
+            return addrinfo
+        try:
+            version = ip_address(source_address[0]).version
+        except ValueError:
+            return addrinfo
+        family = socket.AF_INET if version == 4 else socket.AF_INET6
+
+        return [item for item in addrinfo if item[0] == family]
+
+    @staticmethod
+    def _interleave(addrinfo: list[_TYPE_ADDRINFO]) -> list[_TYPE_ADDRINFO]:
+        # RFC 8305, section 4: alternate between address families, starting with the family of the first address
+        if not addrinfo:
+            return []
+        first_family = addrinfo[0][0]
+        primary = [item for item in addrinfo if item[0] == first_family]
+        secondary = [item for item in addrinfo if item[0] != first_family]
+        result = []
+        for idx in range(max(len(primary), len(secondary))):
+            if idx < len(primary):
+                result.append(primary[idx])
+            if idx < len(secondary):
+                result.append(secondary[idx])
+
+        return result
+
+    @staticmethod
+    def _create_socket(
+        item: _TYPE_ADDRINFO,
+        source_address: tuple[str, int] | None,
+        socket_options: list[_TYPE_SOCKET_OPTION] | None,
+    ) -> socket.socket:
+        af, socktype, proto, _canonname, _sa = item
+        sock = socket.socket(af, socktype, proto)
+        try:
+            # set the options via urllib3, so that streamlink's filtering of incompatible options applies
+            urllib3_util_connection._set_socket_options(sock, socket_options)  # type: ignore[attr-defined]
+            if source_address:
+                sock.bind(source_address)
+        except BaseException:
+            sock.close()
+            raise
+
+        return sock
+
+    def _connect_sequential(
+        self,
+        addrinfo: list[_TYPE_ADDRINFO],
+        timeout: float | None,
+        source_address: tuple[str, int] | None,
+        socket_options: list[_TYPE_SOCKET_OPTION] | None,
+    ) -> socket.socket:
+        err: OSError | None = None
+        for item in addrinfo:
+            sock = None
+            try:
+                sock = self._create_socket(item, source_address, socket_options)
+                sock.settimeout(timeout)
+                sock.connect(item[4])
+                return sock
+            except OSError as err_:
+                err = err_
+                if sock is not None:
+                    sock.close()
+
+        raise err if err is not None else OSError("getaddrinfo returns an empty list")
+
+    def _connect_concurrent(
+        self,
+        addrinfo: list[_TYPE_ADDRINFO],
+        timeout: float | None,
+        source_address: tuple[str, int] | None,
+        socket_options: list[_TYPE_SOCKET_OPTION] | None,
+        delay: float,
+    ) -> socket.socket:
+        queue = self._interleave(addrinfo)
+        deadline = None if timeout is None else monotonic() + timeout
+        selector = selectors.DefaultSelector()
+        pending: set[socket.socket] = set()
+        err: OSError | None = None
+        next_attempt = monotonic()
+
+        try:
+            while queue or pending:
+                now = monotonic()
+                if deadline is not None and now >= deadline:
+                    raise TimeoutError("timed out")
+
+                # start the next connection attempt after the delay, or immediately if all other attempts have failed
+                if queue and (now >= next_attempt or not pending):
+                    item = queue.pop(0)
+                    next_attempt = now + delay
+                    try:
+                        sock = self._create_socket(item, source_address, socket_options)
+                    except OSError as err_:
+                        err = err_
+                        continue
+                    sock.setblocking(False)
+                    code = sock.connect_ex(item[4])
+                    if code == 0:
+                        sock.settimeout(timeout)
+                        return sock
+                    if code not in _CONNECT_IN_PROGRESS:
+                        err = OSError(code, os.strerror(code))
+                        sock.close()
+                        continue
+                    pending.add(sock)
+                    selector.register(sock, selectors.EVENT_WRITE)
+                    continue
+
+                wait = [value for value in (next_attempt if queue else None, deadline) if value is not None]
+                for key, _events in selector.select(max(0.0, min(wait) - now) if wait else None):
+                    sock = key.fileobj  # type: ignore[assignment]
+                    selector.unregister(sock)
+                    pending.discard(sock)
+                    code = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if code == 0:
+                        sock.settimeout(timeout)
+                        return sock
+                    err = OSError(code, os.strerror(code))
+                    sock.close()
+                    next_attempt = monotonic()
+        finally:
+            for sock in pending:
+                sock.close()
+            selector.close()
+
+        raise err if err is not None else OSError("getaddrinfo returns an empty list")
+
+
+__all__ = ["HAPPY_EYEBALLS_DELAY", "Connector", "DNSCache"]
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+
+from streamlink.logger import getLogger
+
+
+if TYPE_CHECKING:
+    from requests import Response
+
+
+log = getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised by :meth:`RetryCoordinator.acquire` when requests to a host are currently not allowed"""
+
+    def __init__(self, host: str, remaining: float) -> None:
+        super().__init__(f"Circuit open for {host}, retrying in {remaining:.1f}s")
+        self.host = host
+        self.remaining = remaining
+
+
+class _HostState:
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened = 0
+        self.open_until = 0.0
+        self.probe_since: float | None = None
+
+
+class RetryCoordinator:
+    """
+    Coordinates request retries of all threads of an :class:`HTTPSession <streamlink.session.http.HTTPSession>` per host.
+    The circuit breaker only applies to requests which have set the ``circuit_breaker`` keyword, e.g. segment fetches,
+    so that polling a host which isn't available yet is still possible.
+
+    After :attr:`FAILURE_THRESHOLD` consecutive failed requests (connection errors, timeouts, HTTP status 429 and 5xx),
+    the host's circuit gets opened and further requests fail immediately, until the hold time has passed.
+    The hold time doubles each time the circuit gets re-opened, and a ``Retry-After`` response header extends it.
+    After the hold time, a single probe request is let through, which either closes the circuit again or re-opens it.
+    """
+
+    #: Number of consecutive failures after which the circuit of a host gets opened
+    FAILURE_THRESHOLD: int = 5
+    #: Time in seconds for which the circuit stays open initially
+    HOLD_TIME: float = 5.0
+    #: Maximum time in seconds for which the circuit stays open
+    HOLD_TIME_MAX: float = 60.0
+    #: Time in seconds after which another probe request is let through if the previous one didn't report back
+    PROBE_TIMEOUT: float = 30.0
+    #: Maximum number of seconds of a ``Retry-After`` response header that get honored
+    RETRY_AFTER_MAX: float = 60.0
+
+    def __init__(self) -> None:
+        self._hosts: dict[str, _HostState] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        urlp = urlparse(url)
+        return f"{urlp.scheme}://{urlp.netloc}"
+
+    @staticmethod
+    def is_failure(err: Exception) -> bool:
+        return isinstance(err, (RequestsConnectionError, Timeout))
+
+    @staticmethod
+    def is_failure_status(status_code: int) -> bool:
+        return status_code == 429 or status_code >= 500
+
+    @classmethod
+    def parse_retry_after(cls, res: Response) -> float | None:
+        """
+        Parse the ``Retry-After`` header of 429 and 503 responses, either in seconds or as an HTTP date
+        """
+
+        if res.status_code not in (429, 503) or not (value := res.headers.get("Retry-After", "").strip()):
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+
+        return min(cls.RETRY_AFTER_MAX, max(0.0, seconds))
+
+    def acquire(self, url: str) -> None:
+        """
+        Check whether a request to the URL's host is allowed
+
+        :raises CircuitOpenError: If the host's circuit is open, or if a probe request is already in progress
+        """
+
+        key = self._key(url)
+        with self._lock:
+            state = self._hosts.get(key)
+            if state is None or state.failures < self.FAILURE_THRESHOLD:
+                return
+            now = monotonic()
+            if now < state.open_until:
+                raise CircuitOpenError(key, state.open_until - now)
+            if state.probe_since is not None and now - state.probe_since < self.PROBE_TIMEOUT:
+                raise CircuitOpenError(key, 0.0)
+            state.probe_since = now
+
+    def success(self, url: str) -> None:
+        with self._lock:
+            if (state := self._hosts.pop(self._key(url), None)) and state.failures >= self.FAILURE_THRESHOLD:
+                log.debug(f"Closing circuit for {self._key(url)}")
+
+    def release(self, url: str) -> None:
+        """
+        Release a probe request without a result, e.g. when the request failed for reasons unrelated to the host
+        """
+
+        with self._lock:
+            if state := self._hosts.get(self._key(url)):
+                state.probe_since = None
+
+    def failure(self, url: str, retry_after: float | None = None) -> None:
+        key = self._key(url)
+        with self._lock:
+            state = self._hosts.setdefault(key, _HostState())
+            state.failures += 1
+            state.probe_since = None
+            if state.failures < self.FAILURE_THRESHOLD:
+                return
+            state.opened += 1
+            hold_time = min(self.HOLD_TIME_MAX, self.HOLD_TIME * 2 ** (state.opened - 1))
+            if retry_after is not None:
+                hold_time = max(hold_time, retry_after)
+            state.open_until = monotonic() + hold_time
+            log.warning(f"Opening circuit for {key} for {hold_time:.1f}s after {state.failures} consecutive failures")
+
+    def report_error(self, url: str, err: Exception) -> None:
+        if self.is_failure(err):
+            self.failure(url)
+        else:
+            self.release(url)
+
+    def report_status(self, url: str, failed: bool, retry_after: float | None = None) -> None:
+        if failed:
+            self.failure(url, retry_after)
+        else:
+            self.success(url)
+
+    @staticmethod
+    def backoff(retries: int, retry_backoff: float, retry_max_backoff: float, jitter: float) -> float:
+        """
+        Exponential backoff time, randomly reduced by up to the ``jitter`` fraction, so that retries of concurrent
+        requests don't get sent all at once
+        """
+
+        delay = min(retry_max_backoff, retry_backoff * (2 ** (retries - 1)))
+
+        return delay * (1.0 - jitter * random.random())
+
+
+__all__ = ["CircuitOpenError", "RetryCoordinator"]
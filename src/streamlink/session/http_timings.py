@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import json
+import socket
+import sys
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from threading import local
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+
+from streamlink.logger import getLogger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from streamlink.session.http_connection import Connector
+
+
+log = getLogger(__name__)
+
+_local = local()
+
+
+@dataclass
+class HTTPTimings:
+    """
+    Durations in seconds of the phases of an HTTP request, or ``None`` if a phase didn't happen.
+
+    The ``dns``, ``connect`` and ``tls`` phases only happen when a new connection gets established,
+    and ``dns`` is part of ``connect`` if resolving the address name couldn't be timed separately.
+    ``ttfb`` is the time between sending the request and receiving the response headers, and ``transfer``
+    is the time it took to receive the response body, which is unavailable for streamed responses.
+    Redirects add up the connection phases of each request.
+    """
+
+    method: str
+    url: str
+    dns: float | None = None
+    connect: float | None = None
+    tls: float | None = None
+    ttfb: float | None = None
+    transfer: float | None = None
+    total: float | None = None
+    #: Whether an existing keep-alive connection was reused
+    reused: bool = True
+    status_code: int | None = None
+    error: str | None = None
+
+    _start: float = field(default_factory=perf_counter, repr=False)
+    _request_sent: float | None = field(default=None, repr=False)
+    _headers_received: float | None = field(default=None, repr=False)
+
+    def add(self, phase: str, duration: float) -> None:
+        setattr(self, phase, (getattr(self, phase) or 0.0) + max(0.0, duration))
+
+    def finish(self, status_code: int | None = None, error: Exception | None = None, stream: bool = False) -> None:
+        now = perf_counter()
+        self.total = now - self._start
+        self.status_code = status_code
+        if error is not None:
+            self.error = str(error)
+        if self._headers_received is not None and not stream:
+            self.transfer = now - self._headers_received
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key: value for key, value in asdict(self).items() if not key.startswith("_")}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+
+def current_timings() -> HTTPTimings | None:
+    """Get the :class:`HTTPTimings` which are currently being collected by the calling thread"""
+
+    return getattr(_local, "timings", None)
+
+
+@contextmanager
+def collect_timings(timings: HTTPTimings | None) -> Iterator[HTTPTimings | None]:
+    """Collect the timings of all HTTP connections and requests of the calling thread in the given object"""
+
+    previous = current_timings()
+    _local.timings = timings
+    try:
+        yield timings
+    finally:
+        _local.timings = previous
+
+
+def log_timings(timings: HTTPTimings) -> None:
+    """A timings hook which logs the timings as JSON on the debug log level"""
+
+    log.debug(f"HTTP timings: {timings.to_json()}")
+
+
+class _TimingsConnectionMixin:
+    def __init__(self, *args, connector: Connector | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        #: The Connector of the HTTPSession, which creates the connection's socket if it's active
+        self.connector = connector
+
+    def _new_conn(self):
+        timings = current_timings()
+        if timings is None:
+            return self._create_conn()
+
+        timings.reused = False
+        dns = timings.dns or 0.0
+        start = perf_counter()
+        try:
+            return self._create_conn()
+        finally:
+            # the DNS resolution time gets set by the session's Connector
+            timings.add("connect", perf_counter() - start - ((timings.dns or 0.0) - dns))
+
+    def _create_conn(self) -> socket.socket:
+        connector = self.connector
+        if connector is None or not connector.active:
+            return super()._new_conn()  # type: ignore[misc]
+
+        # same as urllib3.connection.HTTPConnection._new_conn(), but with the connector of the HTTPSession
+        try:
+            sock = connector.create_connection(
+                (self._dns_host, self.port),  # type: ignore[attr-defined]
+                self.timeout,  # type: ignore[attr-defined]
+                source_address=self.source_address,  # type: ignore[attr-defined]
+                socket_options=self.socket_options,  # type: ignore[attr-defined]
+            )
+        except socket.gaierror as err:
+            raise NameResolutionError(self.host, self, err) from err  # type: ignore[attr-defined, arg-type]
+        except TimeoutError as err:
+            raise ConnectTimeoutError(
+                self,
+                f"Connection to {self.host} timed out. (connect timeout={self.timeout})",  # type: ignore[attr-defined]
+            ) from err
+        except OSError as err:
+            raise NewConnectionError(self, f"Failed to establish a new connection: {err}") from err  # type: ignore[arg-type]
+
+        sys.audit("http.client.connect", self, self.host, self.port)  # type: ignore[attr-defined]
+
+        return sock
+
+    def connect(self):
+        timings = current_timings()
+        if timings is None or not isinstance(self, HTTPSConnection):
+            return super().connect()  # type: ignore[misc]
+
+        before = (timings.dns or 0.0) + (timings.connect or 0.0)
+        start = perf_counter()
+        try:
+            return super().connect()  # type: ignore[misc]
+        finally:
+            after = (timings.dns or 0.0) + (timings.connect or 0.0)
+            timings.add("tls", perf_counter() - start - (after - before))
+
+    def request(self, *args, **kwargs):
+        result = super().request(*args, **kwargs)  # type: ignore[misc]
+        if timings := current_timings():
+            timings._request_sent = perf_counter()
+
+        return result
+
+    def getresponse(self, *args, **kwargs):
+        response = super().getresponse(*args, **kwargs)  # type: ignore[misc]
+        if (timings := current_timings()) and timings._request_sent is not None:
+            timings._headers_received = perf_counter()
+            timings.ttfb = timings._headers_received - timings._request_sent
+
+        return response
+
+
+class TimingsHTTPConnection(_TimingsConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimingsHTTPSConnection(_TimingsConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimingsHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimingsHTTPConnection
+
+
+class TimingsHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimingsHTTPSConnection
+
+
+#: Connection pool classes of a :class:`urllib3.PoolManager` which record timings
+POOL_CLASSES_BY_SCHEME = {
+    "http": TimingsHTTPConnectionPool,
+    "https": TimingsHTTPSConnectionPool,
+}
+
+
+def get_pool_classes_by_scheme(connector: Connector) -> dict[str, Callable[..., HTTPConnectionPool]]:
+    """
+    Get the connection pool classes of a :class:`urllib3.PoolManager`, whose connections record timings
+    and get created by the given :class:`Connector <streamlink.session.http_connection.Connector>`
+    """
+
+    return {scheme: partial(pool_cls, connector=connector) for scheme, pool_cls in POOL_CLASSES_BY_SCHEME.items()}
+
+
+__all__ = [
+    "POOL_CLASSES_BY_SCHEME",
+    "HTTPTimings",
+    "collect_timings",
+    "current_timings",
+    "get_pool_classes_by_scheme",
+    "log_timings",
+]
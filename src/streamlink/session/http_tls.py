@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import ssl
+from collections import OrderedDict
+from threading import Lock, local
+from weakref import WeakKeyDictionary
+
+from streamlink.logger import getLogger
+
+
+log = getLogger(__name__)
+
+_local = local()
+
+
+class TLSSessionCache:
+    """
+    Keeps the client-side TLS sessions of connections established via attached :class:`ssl.SSLContext` objects
+    and resumes them on new connections to the same host and port, which saves a full TLS handshake.
+
+    TLS sessions are tied to the SSLContext which created them, so sessions get stored per context.
+    Also counts the number of completed handshakes and how many of them were resumed.
+    """
+
+    #: Maximum number of stored TLS sessions per SSLContext
+    MAX_SESSIONS: int = 256
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._sessions: WeakKeyDictionary[ssl.SSLContext, OrderedDict[tuple[str, int], ssl.SSLSession]] = WeakKeyDictionary()
+        #: Number of completed TLS handshakes
+        self.handshakes: int = 0
+        #: Number of completed TLS handshakes which resumed a previous TLS session
+        self.resumed: int = 0
+
+    @property
+    def resumption_rate(self) -> float:
+        """The fraction of TLS handshakes which resumed a previous TLS session"""
+
+        return self.resumed / self.handshakes if self.handshakes else 0.0
+
+    def attach(self, context: ssl.SSLContext) -> ssl.SSLContext:
+        """
+        Make the sockets of the given SSLContext store and resume TLS sessions of this cache
+        """
+
+        context.sslsocket_class = ResumptionSSLSocket
+        context.tls_session_cache = self  # type: ignore[attr-defined]
+
+        return context
+
+    def get(self, context: ssl.SSLContext, key: tuple[str, int]) -> ssl.SSLSession | None:
+        with self._lock:
+            if (sessions := self._sessions.get(context)) is None or (session := sessions.get(key)) is None:
+                return None
+            sessions.move_to_end(key)
+
+            return session
+
+    def store(self, sock: ResumptionSSLSocket) -> None:
+        key = sock.tls_session_key
+        if key is None:
+            return
+        try:
+            session = sock.session
+        except (AttributeError, ValueError):  # pragma: no cover
+            return
+        if session is None or not session.has_ticket and not session.id:
+            return
+
+        with self._lock:
+            sessions = self._sessions.setdefault(sock.context, OrderedDict())
+            sessions[key] = session
+            sessions.move_to_end(key)
+            while len(sessions) > self.MAX_SESSIONS:
+                sessions.popitem(last=False)
+
+    def handshake_done(self, sock: ResumptionSSLSocket) -> None:
+        resumed = sock.session_reused
+        with self._lock:
+            self.handshakes += 1
+            if resumed:
+                self.resumed += 1
+        if sock.tls_session_key is not None:
+            host, port = sock.tls_session_key
+            log.trace(f"TLS handshake with {host}:{port} ({'resumed' if resumed else 'full'})")
+        self.store(sock)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+
+class ResumptionSSLSocket(ssl.SSLSocket):
+    """
+    :class:`ssl.SSLSocket` which resumes the stored TLS session of its host and port on the client side,
+    and which stores its own TLS session after the handshake and before closing,
+    so that session tickets which were received after the handshake get stored as well.
+    """
+
+    tls_session_key: tuple[str, int] | None = None
+
+    @classmethod
+    def _create(cls, *args, **kwargs):
+        context = kwargs.get("context")
+        cache: TLSSessionCache | None = getattr(context, "tls_session_cache", None)
+        hostname = kwargs.get("server_hostname")
+        key: tuple[str, int] | None = None
+        if cache is not None and context is not None and hostname and not kwargs.get("server_side"):
+            try:
+                sock = kwargs["sock"] if "sock" in kwargs else args[0]
+                key = hostname, int(sock.getpeername()[1])
+            except (KeyError, IndexError, OSError, TypeError, ValueError):
+                key = None
+            if key is not None and kwargs.get("session") is None:
+                kwargs["session"] = cache.get(context, key)
+
+        # the key needs to be known by the handshake, which gets done while creating the socket
+        _local.key = key
+        try:
+            sslsock = super()._create(*args, **kwargs)
+        finally:
+            _local.key = None
+        sslsock.tls_session_key = key
+
+        return sslsock
+
+    def do_handshake(self, *args, **kwargs) -> None:
+        if self.tls_session_key is None:
+            self.tls_session_key = getattr(_local, "key", None)
+        super().do_handshake(*args, **kwargs)
+        if (cache := getattr(self.context, "tls_session_cache", None)) is not None:
+            cache.handshake_done(self)
+
+    def close(self) -> None:
+        if (cache := getattr(self.context, "tls_session_cache", None)) is not None and self._sslobj is not None:
+            cache.store(self)
+        super().close()
+
+
+__all__ = ["ResumptionSSLSocket", "TLSSessionCache"]
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, ClassVar
 
 from streamlink.exceptions import StreamlinkDeprecationWarning
 from streamlink.options import Options
+from streamlink.session.http_timings import log_timings
 from streamlink.utils.url import update_scheme
 
 
@@ -59,7 +60,8 @@ class StreamlinkOptions(Options):
         * - no-plugin-cache
           - ``bool``
           - ``False``
-          - Disable the plugin key-value store
+          - Disable the plugin key-value store. When set on initialization of the session,
+            the validated data of built-in plugins doesn't get cached either.
         * - locale
           - ``str``
           - *system locale*
@@ -77,6 +79,20 @@ class StreamlinkOptions(Options):
           - ``bool``
           - ``False``
           - Resolve address names to IPv6 only, overrides ``ipv4``
+        * - dns-cache-ttl
+          - ``float``
+          - ``0.0``
+          - Cache resolved address names for the given amount of seconds, ``0.0`` disables the cache
+        * - resolve-url-cache-ttl
+          - ``float``
+          - ``0.0``
+          - Cache the plugins and final URLs of input URLs which needed to be resolved by following HTTP redirects
+            for the given amount of seconds, ``0.0`` disables the cache. Entries get stored in the cache directory,
+            unless ``no-plugin-cache`` is set.
+        * - happy-eyeballs
+          - ``bool``
+          - ``False``
+          - Race delayed connection attempts to all resolved addresses, alternating between IPv6 and IPv4 (RFC 8305)
         * - http-proxy
           - ``str | None``
           - ``None``
@@ -117,6 +133,22 @@ class StreamlinkOptions(Options):
           - ``bool``
           - ``False``
           - Disable TLS/SSL Diffie-Hellman key exchange
+        * - http-http2
+          - ``bool``
+          - ``False``
+          - Send HTTPS requests via multiplexed HTTP/2 connections if supported by the server,
+            with a fallback to HTTP/1.1. Requires the optional ``h2`` dependency.
+        * - http-cache
+          - ``bool``
+          - ``False``
+          - Cache responses of requests which have set the ``cache`` keyword, like HLS multivariant playlists
+            and DASH manifests, according to their caching headers. Responses get stored in the cache directory,
+            unless ``no-plugin-cache`` is set.
+        * - http-timings
+          - ``bool``
+          - ``False``
+          - Log the DNS, connect, TLS, time-to-first-byte and transfer durations of each HTTP request as JSON
+            on the debug log level
         * - http-ssl-cert
           - ``str | tuple | None``
           - ``None``
@@ -153,6 +185,11 @@ class StreamlinkOptions(Options):
           - ``float``
           - ``3``
           - Multiplication factor of the deadline for new segments to be queued
+        * - stream-bandwidth-cache
+          - ``bool``
+          - ``False``
+          - Store the session's download bandwidth estimate of segmented streams in the cache directory
+            and start subsequent sessions with the stored estimate, unless ``no-plugin-cache`` is set
         * - stream-timeout
           - ``float``
           - ``60.0``
@@ -217,6 +254,10 @@ class StreamlinkOptions(Options):
           - ``int``
           - ``3``
           - Max number of DASH manifest reload attempts before giving up
+        * - dash-segment-spread
+          - ``bool``
+          - ``False``
+          - Spread parallel DASH segment downloads across all healthy redundant content locations (``BaseURL``)
         * - ffmpeg-ffmpeg
           - ``str | None``
           - ``None``
@@ -300,6 +341,9 @@ class StreamlinkOptions(Options):
             "interface": None,
             "ipv4": False,
             "ipv6": False,
+            "dns-cache-ttl": 0.0,
+            "resolve-url-cache-ttl": 0.0,
+            "happy-eyeballs": False,
             "ringbuffer-size": 1024 * 1024 * 16,  # 16 MB
             "mux-subtitles": False,
             "stream-segment-attempts": 3,
@@ -319,6 +363,7 @@ class StreamlinkOptions(Options):
             "hls-segment-key-uri": None,
             "hls-audio-select": [],
             "dash-manifest-reload-attempts": 3,
+            "dash-segment-spread": False,
             "ffmpeg-ffmpeg": None,
             "ffmpeg-no-validation": False,
             "ffmpeg-validation-timeout": 4.0,
@@ -391,6 +436,18 @@ class StreamlinkOptions(Options):
                 self.set_explicit("ipv4", False)
                 self.set_explicit("ipv6", False)
 
+    def _set_dns_cache_ttl(self, key, value):
+        self.session.http.set_dns_cache(ttl=float(value or 0.0))
+        self.set_explicit(key, float(value or 0.0))
+
+    def _set_resolve_url_cache_ttl(self, key, value):
+        self.session.resolved_urls.configure(ttl=float(value or 0.0), disabled_file=bool(self.get("no-plugin-cache")))
+        self.set_explicit(key, float(value or 0.0))
+
+    def _set_happy_eyeballs(self, key, value):
+        self.session.http.set_happy_eyeballs(enable=bool(value))
+        self.set_explicit(key, bool(value))
+
     def _set_http_proxy(self, key, value):
         self.session.http.proxies["http"] \
             = self.session.http.proxies["https"] \
@@ -408,6 +465,24 @@ class StreamlinkOptions(Options):
         self.session.http.disable_dh(disable=bool(value))
         self.set_explicit(key, value)
 
+    def _set_http_http2(self, key, value):
+        self.session.http.enable_http2(enable=bool(value))
+        self.set_explicit(key, value)
+
+    def _set_http_timings(self, key, value):
+        self.session.http.remove_timings_hook(log_timings)
+        if value:
+            self.session.http.add_timings_hook(log_timings)
+        self.set_explicit(key, value)
+
+    def _set_stream_bandwidth_cache(self, key, value):
+        self.session.bandwidth.persist(enable=bool(value), disabled=bool(self.get("no-plugin-cache")))
+        self.set_explicit(key, value)
+
+    def _set_http_cache(self, key, value):
+        self.session.http.enable_response_cache(enable=bool(value), disabled_file=bool(self.get("no-plugin-cache")))
+        self.set_explicit(key, value)
+
     @staticmethod
     def _factory_set_http_attr_key_equals_value(delimiter: str) -> Callable[[StreamlinkOptions, str, Any], None]:
         def inner(self: StreamlinkOptions, key: str, value: Any) -> None:
@@ -457,6 +532,9 @@ class StreamlinkOptions(Options):
         "interface": _set_interface,
         "ipv4": _set_ipv4_ipv6,
         "ipv6": _set_ipv4_ipv6,
+        "dns-cache-ttl": _set_dns_cache_ttl,
+        "resolve-url-cache-ttl": _set_resolve_url_cache_ttl,
+        "happy-eyeballs": _set_happy_eyeballs,
         "http-proxy": _set_http_proxy,
         "https-proxy": _set_http_proxy,
         "http-cookies-files": _set_http_cookies_files,
@@ -464,10 +542,14 @@ class StreamlinkOptions(Options):
         "http-headers": _factory_set_http_attr_key_equals_value(";"),
         "http-query-params": _factory_set_http_attr_key_equals_value("&"),
         "http-disable-dh": _set_http_disable_dh,
+        "http-http2": _set_http_http2,
+        "http-cache": _set_http_cache,
+        "http-timings": _set_http_timings,
         "http-ssl-cert": _set_http_attr,
         "http-ssl-verify": _set_http_attr,
         "http-trust-env": _set_http_attr,
         "http-timeout": _set_http_attr,
+        "stream-bandwidth-cache": _set_stream_bandwidth_cache,
         "hls-duration": _factory_set_deprecated("stream-segmented-duration", float),
         "hls-segment-queue-threshold": _factory_set_deprecated("stream-segmented-queue-deadline", float),
     }
@@ -11,11 +11,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Literal, TypeAlias, TypedDict, cast
 
 import streamlink.plugins
+from streamlink._version import __version__
+from streamlink.cache import Cache
 from streamlink.logger import getLogger
 from streamlink.options import Argument, Arguments
 
 # noinspection PyProtectedMember
 from streamlink.plugin.plugin import _PLUGINARGUMENT_TYPE_REGISTRY, NO_PRIORITY, NORMAL_PRIORITY, Matcher, Matchers, Plugin
+from streamlink.session.plugins_index import PluginMatcherIndex
 from streamlink.utils.module import exec_module, get_finder
 
 
@@ -37,6 +40,9 @@ _PLUGINSDATA_PATH = _PLUGINS_PATH / "_plugins.json"
 _PLUGINSDATA_PACKAGENAME = "streamlink"
 # The `parts` value of the plugins JSON file contained in the package's `RECORD` metadata file
 _PLUGINSDATA_PACKAGEPATH = "streamlink", "plugins", "_plugins.json"
+# Cache file name and key of the validated plugins data, which gets reused if the plugins JSON file hasn't changed
+_PLUGINSDATA_CACHE_FILENAME = "plugins.json"
+_PLUGINSDATA_CACHE_KEY = "data"
 
 
 class StreamlinkPlugins:
@@ -54,7 +60,7 @@ class StreamlinkPlugins:
     always have a higher priority than built-in plugins.
     """
 
-    def __init__(self, builtin: bool = True, lazy: bool = True):
+    def __init__(self, builtin: bool = True, lazy: bool = True, cache: bool = True):
         # Loaded plugins
         self._plugins: dict[str, type[Plugin]] = {}
 
@@ -62,9 +68,14 @@ class StreamlinkPlugins:
         self._matchers: dict[str, Matchers] = {}
         self._arguments: dict[str, Arguments] = {}
 
+        # Index of all available matchers, rebuilt when the available matchers change
+        self._index: PluginMatcherIndex | None = None
+        self._index_key: tuple[int, int, int] = (0, 0, 0)
+        self._index_version = 0
+
         # Attempt to load built-in plugins lazily first
         if builtin and lazy:
-            data = StreamlinkPluginsData.load()
+            data = StreamlinkPluginsData.load(cache=cache)
             if data:
                 self._matchers, self._arguments = data
             else:
@@ -81,10 +92,12 @@ class StreamlinkPlugins:
     def __setitem__(self, key: str, value: type[Plugin]) -> None:
         """Add/override a plugin class by name"""
         self._plugins[key] = value
+        self._index_version += 1
 
     def __delitem__(self, key: str) -> None:
         """Remove a loaded plugin by name"""
         self._plugins.pop(key, None)
+        self._index_version += 1
 
     def __contains__(self, item: str) -> bool:
         """Check if a plugin is loaded"""
@@ -112,10 +125,12 @@ class StreamlinkPlugins:
     def update(self, plugins: Mapping[str, type[Plugin]]):
         """Add/override loaded plugins"""
         self._plugins.update(plugins)
+        self._index_version += 1
 
     def clear(self):
         """Remove all loaded plugins from the session"""
         self._plugins.clear()
+        self._index_version += 1
 
     def iter_arguments(self) -> Iterator[tuple[str, Arguments]]:
         """Iterate through all plugins and their :class:`Arguments <streamlink.options.Arguments>`"""
@@ -143,16 +158,26 @@ class StreamlinkPlugins:
             if matchers and name not in self._plugins
         )  # fmt: skip
 
+    def get_index(self) -> PluginMatcherIndex:
+        """Get the :class:`PluginMatcherIndex` of all available matchers"""
+        # also check the number of plugins, in case the mappings were modified directly
+        key = self._index_version, len(self._plugins), len(self._matchers)
+        if self._index is None or key != self._index_key:
+            self._index = PluginMatcherIndex(self.iter_matchers())
+            self._index_key = key
+
+        return self._index
+
     def match_url(self, url: str) -> tuple[str, type[Plugin]] | None:
         """Find a matching plugin by URL and load plugins which haven't been loaded yet"""
         match: str | None = None
         priority: int = NO_PRIORITY
 
-        for name, matchers in self.iter_matchers():
-            for matcher in matchers:
-                if matcher.priority > priority and matcher.pattern.match(url) is not None:
-                    match = name
-                    priority = matcher.priority
+        # only check the matchers which can match the URL, in the same order as iter_matchers()
+        for name, matcher in self.get_index().iter_candidates(url):
+            if matcher.priority > priority and matcher.pattern.match(url) is not None:
+                match = name
+                priority = matcher.priority
 
         if match is None:
             return None
@@ -165,6 +190,8 @@ class StreamlinkPlugins:
             if not lookup:
                 return None
             self._plugins[match] = lookup[1]
+            # loaded plugins come first when iterating matchers
+            self._index_version += 1
 
         return match, self._plugins[match]
 
@@ -244,19 +271,104 @@ class _TPluginData(TypedDict):
     arguments: list[_TPluginArgumentData]
 
 
+class _LazyPattern:
+    """
+    A regex pattern which only gets compiled when it's used for the first time.
+
+    The ``pattern`` and ``flags`` attributes are available without compiling,
+    so matchers can get indexed without having to compile all plugin matcher patterns on session initialization.
+    """
+
+    __slots__ = ("_compiled", "flags", "pattern")
+
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        if not isinstance(pattern, str) or not isinstance(flags, int):
+            raise TypeError("Invalid pattern or flags")
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled: re.Pattern[str] | None = None
+
+    def compile(self) -> re.Pattern[str]:
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern, self.flags)
+
+        return self._compiled
+
+    def match(self, string: str, *args) -> re.Match[str] | None:
+        return self.compile().match(string, *args)
+
+    def __getattr__(self, item: str):
+        return getattr(self.compile(), item)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _LazyPattern):
+            other = other.compile()
+        if not isinstance(other, re.Pattern):
+            return NotImplemented
+
+        return self.compile() == other
+
+    def __hash__(self) -> int:
+        return hash((self.pattern, self.flags))
+
+    def __repr__(self) -> str:
+        return repr(self.compile())
+
+
 class StreamlinkPluginsData:
     @classmethod
-    def load(cls) -> tuple[dict[str, Matchers], dict[str, Arguments]] | None:
+    def load(cls, cache: bool = True) -> tuple[dict[str, Matchers], dict[str, Arguments]] | None:
         # specific errors get logged, others are ignored intentionally
         with suppress(Exception):
-            content = _PLUGINSDATA_PATH.read_bytes()
+            key = cls._get_cache_key()
+
+            # only open the cache database while loading the plugins data, and not at all if caching is disabled
+            plugins_cache = Cache(_PLUGINSDATA_CACHE_FILENAME) if cache else None
+            try:
+                data = cls._load_cache(plugins_cache, key) if plugins_cache else None
+                if data is not None:
+                    return cls._build(data)
+
+                content = _PLUGINSDATA_PATH.read_bytes()
 
-            cls._validate(content)
+                cls._validate(content)
 
-            return cls._parse(content)
+                data = cls._parse(content)
+                res = cls._build(data)
+                if plugins_cache:
+                    cls._save_cache(plugins_cache, key, data)
+
+                return res
+            finally:
+                if plugins_cache:
+                    plugins_cache.close()
 
         return None
 
+    @staticmethod
+    def _get_cache_key() -> dict[str, str | int]:
+        # the validated data gets invalidated when the plugins JSON file or Streamlink's version changes
+        stat = _PLUGINSDATA_PATH.stat()
+
+        return {
+            "version": __version__,
+            "path": str(_PLUGINSDATA_PATH),
+            "size": int(stat.st_size),
+            "mtime": int(stat.st_mtime_ns),
+        }
+
+    @staticmethod
+    def _load_cache(cache: Cache, key: dict[str, str | int]) -> dict[str, _TPluginData] | None:
+        cached = cache.get(_PLUGINSDATA_CACHE_KEY)
+        if not isinstance(cached, dict) or cached.get("key") != key or not isinstance(cached.get("data"), dict):
+            return None
+
+        return cached["data"]
+
+    @staticmethod
+    def _save_cache(cache: Cache, key: dict[str, str | int], data: dict[str, _TPluginData]) -> None:
+        cache.set(_PLUGINSDATA_CACHE_KEY, {"key": key, "data": data})
+
     @staticmethod
     def _validate(content: bytes) -> None:
         # find plugins JSON checksum in package metadata
@@ -278,11 +390,14 @@ class StreamlinkPluginsData:
             log.error("Plugins data checksum mismatch, falling back to loading all plugins")
             raise Exception
 
-    @classmethod
-    def _parse(cls, content: bytes) -> tuple[dict[str, Matchers], dict[str, Arguments]]:
+    @staticmethod
+    def _parse(content: bytes) -> dict[str, _TPluginData]:
         content = _RE_STRIP_JSON_COMMENTS.sub(b"", content)
-        data: dict[str, _TPluginData] = json.loads(content)
 
+        return json.loads(content)
+
+    @classmethod
+    def _build(cls, data: dict[str, _TPluginData]) -> tuple[dict[str, Matchers], dict[str, Arguments]]:
         try:
             matchers = cls._build_matchers(data)
         except Exception:
@@ -313,7 +428,7 @@ class StreamlinkPluginsData:
     @staticmethod
     def _build_matcher(data: _TPluginMatcherData) -> Matcher:
         return Matcher(
-            pattern=re.compile(data.get("pattern"), data.get("flags") or 0),
+            pattern=cast("re.Pattern[str]", _LazyPattern(data.get("pattern"), data.get("flags") or 0)),
             priority=data.get("priority") or NORMAL_PRIORITY,
             name=data.get("name"),
         )
@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    import sre_constants  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from streamlink.plugin.plugin import Matcher, Matchers
+
+
+_LITERAL = sre_constants.LITERAL
+_NOT_LITERAL = sre_constants.NOT_LITERAL
+_IN = sre_constants.IN
+_ANY = sre_constants.ANY
+_AT = sre_constants.AT
+_BRANCH = sre_constants.BRANCH
+_SUBPATTERN = sre_constants.SUBPATTERN
+_REPEATS = frozenset(
+    op
+    for op in (
+        sre_constants.MAX_REPEAT,
+        sre_constants.MIN_REPEAT,
+        getattr(sre_constants, "POSSESSIVE_REPEAT", None),
+    )
+    if op is not None
+)
+_ATOMIC_GROUP = getattr(sre_constants, "ATOMIC_GROUP", None)
+_ZERO_WIDTH = frozenset((_AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT))
+_AT_ENDS = frozenset((sre_constants.AT_END, sre_constants.AT_END_STRING))
+
+# characters which terminate the host part of a URL, or which can be matched by the `$` anchor
+_HOST_DELIMITERS = "/?#:\n"
+_HOST_TERMINATORS = frozenset(map(ord, "/?#:"))
+_SCHEME_SEPARATOR = [(_LITERAL, ord(":")), (_LITERAL, ord("/")), (_LITERAL, ord("/"))]
+_DOT = ord(".")
+
+_RE_HOST_END = re.compile(r"[/?#:\n]")
+_RE_NAMED_GROUP = re.compile(r"(?<!\\)\(\?P<\w+>")
+
+_SCOPED_FLAGS = (
+    (re.ASCII, "a"),
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+# The max number of literal host suffixes of a single matcher
+_MAX_EXPANSIONS = 32
+
+
+def _in_matches(items: Sequence[tuple[Any, Any]], char: str) -> bool:
+    negate = False
+    result = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is _LITERAL:
+            result = result or av == ord(char)
+        elif op is sre_constants.RANGE:
+            result = result or av[0] <= ord(char) <= av[1]
+        elif op is sre_constants.CATEGORY:
+            if av is sre_constants.CATEGORY_DIGIT:
+                result = result or char.isdigit()
+            elif av is sre_constants.CATEGORY_SPACE:
+                result = result or char.isspace()
+            elif av is sre_constants.CATEGORY_WORD:
+                result = result or char.isalnum() or char == "_"
+            elif av is sre_constants.CATEGORY_NOT_DIGIT:
+                result = result or not char.isdigit()
+            elif av is sre_constants.CATEGORY_NOT_SPACE:
+                result = result or not char.isspace()
+            elif av is sre_constants.CATEGORY_NOT_WORD:
+                result = result or not (char.isalnum() or char == "_")
+            else:  # pragma: no cover
+                return True
+        else:  # pragma: no cover
+            return True
+
+    return result is not negate
+
+
+def _can_match(items: Sequence[tuple[Any, Any]], chars: str) -> bool:
+    """Whether the parsed sequence can consume any of the given characters (conservatively)"""
+    for op, av in items:
+        if op is _LITERAL:
+            if chr(av) in chars:
+                return True
+        elif op is _IN:
+            if any(_in_matches(av, char) for char in chars):
+                return True
+        elif op is _SUBPATTERN:
+            if _can_match(av[-1], chars):
+                return True
+        elif op is _BRANCH:
+            if any(_can_match(alt, chars) for alt in av[1]):
+                return True
+        elif op in _REPEATS:
+            if av[1] > 0 and _can_match(av[2], chars):
+                return True
+        elif op is _ATOMIC_GROUP:
+            if _can_match(av, chars):
+                return True
+        elif op not in _ZERO_WIDTH:
+            return True
+
+    return False
+
+
+def _can_be_empty(op: Any, av: Any) -> bool:
+    if op in (_LITERAL, _NOT_LITERAL, _IN, _ANY):
+        return False
+    if op is _SUBPATTERN:
+        return all(_can_be_empty(*item) for item in av[-1])
+    if op is _BRANCH:
+        return any(all(_can_be_empty(*item) for item in alt) for alt in av[1])
+    if op in _REPEATS:
+        return av[0] == 0 or all(_can_be_empty(*item) for item in av[2])
+
+    return True
+
+
+def _ends_with_dot(items: Sequence[tuple[Any, Any]]) -> bool:
+    """Whether every non-empty match of the parsed sequence ends with a dot"""
+    if not items:
+        return True
+
+    op, av = items[-1]
+    if op is _LITERAL:
+        last = av == _DOT
+    elif op is _SUBPATTERN:
+        last = _ends_with_dot(av[-1])
+    elif op is _BRANCH:
+        last = all(_ends_with_dot(alt) for alt in av[1])
+    elif op in _REPEATS:
+        last = _ends_with_dot(av[2])
+    else:
+        last = op in _ZERO_WIDTH
+
+    return last and (not _can_be_empty(op, av) or _ends_with_dot(items[:-1]))
+
+
+def _expand(items: Sequence[tuple[Any, Any]]) -> set[str] | None:
+    """All strings which can get matched by the parsed sequence, or None if there are too many of them"""
+    result = {""}
+    for op, av in items:
+        expanded = _expand_item(op, av)
+        if expanded is None:
+            return None
+        result = {prefix + suffix for prefix in result for suffix in expanded}
+        if len(result) > _MAX_EXPANSIONS:
+            return None
+
+    return result
+
+
+def _expand_item(op: Any, av: Any) -> set[str] | None:
+    if op is _LITERAL:
+        return {chr(av)}
+    if op is _SUBPATTERN:
+        return _expand(av[-1])
+    if op is _BRANCH:
+        result: set[str] = set()
+        for alt in av[1]:
+            expanded = _expand(alt)
+            if expanded is None:
+                return None
+            result |= expanded
+        return result
+    if op in _REPEATS and av[1] <= 1:
+        body = _expand(av[2])
+        if body is None:
+            return None
+        return body | {""} if av[0] == 0 else body
+    # zero-width assertions add constraints, which don't matter here
+    if op in _ZERO_WIDTH:
+        return {""}
+
+    return None
+
+
+def _flatten(items: Iterable[tuple[Any, Any]]) -> list[tuple[Any, Any]]:
+    # capturing and non-capturing groups without scoped flags don't change what a sequence can match
+    result: list[tuple[Any, Any]] = []
+    for op, av in items:
+        if op is _SUBPATTERN and not av[1] and not av[2]:
+            result.extend(_flatten(av[-1]))
+        else:
+            result.append((op, av))
+
+    return result
+
+
+@lru_cache(maxsize=1024)
+def get_host_keys(pattern: re.Pattern[str]) -> frozenset[str] | None:
+    """
+    Extract the literal host suffixes from a URL pattern.
+
+    Every URL matched by the pattern has a host which either equals one of the returned keys,
+    or which ends with a dot followed by one of the returned keys.
+    If that can't be determined, ``None`` gets returned.
+    """
+
+    try:
+        items = _flatten(sre_parse.parse(pattern.pattern, pattern.flags))
+    except Exception:  # pragma: no cover
+        return None
+
+    # the scheme can't contain a colon, so the host starts after the URL's first colon and two slashes
+    for idx in range(len(items) - 2):
+        if items[idx : idx + 3] == _SCHEME_SEPARATOR:
+            break
+    else:
+        return None
+    if _can_match(items[:idx], ":"):
+        return None
+
+    # the host ends with a literal delimiter or the end of the input
+    host: list[tuple[Any, Any]] = []
+    for op, av in items[idx + 3 :]:
+        if op is _LITERAL and av in _HOST_TERMINATORS or op is _AT and av in _AT_ENDS:
+            break
+        host.append((op, av))
+    else:
+        return None
+    if not host or _can_match(host, _HOST_DELIMITERS):
+        return None
+
+    # find the longest tail of the host which only matches a few literal strings
+    pos = len(host)
+    suffixes: set[str] = {""}
+    while pos > 0:
+        expanded = _expand_item(*host[pos - 1])
+        if expanded is None:
+            break
+        candidates = {prefix + suffix for prefix in expanded for suffix in suffixes}
+        if len(candidates) > _MAX_EXPANSIONS:
+            break
+        suffixes = candidates
+        pos -= 1
+
+    at_label_start = _ends_with_dot(host[:pos])
+    keys: set[str] = set()
+    for suffix in suffixes:
+        if suffix.startswith("."):
+            key = suffix[1:]
+        elif at_label_start:
+            key = suffix
+        elif "." in suffix:
+            key = suffix.split(".", 1)[1]
+        else:
+            return None
+        if not key:
+            return None
+        keys.add(key.casefold())
+
+    return frozenset(keys)
+
+
+@lru_cache(maxsize=1024)
+def _get_fragment(pattern: re.Pattern[str]) -> str | None:
+    flags = pattern.flags & ~re.UNICODE
+    letters = ""
+    for flag, letter in _SCOPED_FLAGS:
+        if flags & flag:
+            letters += letter
+            flags &= ~flag
+    if flags:
+        return None
+
+    # named groups can't be part of multiple alternatives, and group references would change
+    if _RE_NAMED_GROUP.search(pattern.pattern):
+        source = _RE_NAMED_GROUP.sub("(?:", pattern.pattern)
+    else:
+        source = pattern.pattern
+    if "(?P=" in source or "(?(" in source or re.search(r"\\\d", source):
+        return None
+
+    fragment = f"(?{letters}:{source}\n)" if pattern.flags & re.VERBOSE else f"(?{letters}:{source})"
+    try:
+        re.compile(fragment)
+    except re.error:
+        return None
+
+    return fragment
+
+
+def get_url_host(url: str) -> str | None:
+    idx = url.find(":")
+    if idx < 0 or url[idx + 1 : idx + 3] != "//":
+        return None
+    start = idx + 3
+    end = _RE_HOST_END.search(url, start)
+
+    return url[start : end.start() if end else len(url)].casefold()
+
+
+class PluginMatcherIndex:
+    """
+    An index of plugin matchers, for finding the matchers which can match a specific URL
+    without having to run every single matcher pattern.
+
+    Matchers with literal hostnames get bucketed by the hostnames' suffixes.
+    The remaining matchers get checked by a single combined regex first.
+    Candidate matchers are returned in the same order as they were added to the index,
+    so that the matcher priorities get resolved the same way as when iterating all matchers.
+    """
+
+    def __init__(self, matchers: Iterable[tuple[str, Matchers]]) -> None:
+        self._entries: list[tuple[str, Matcher]] = []
+        self._hosts: dict[str, list[int]] = {}
+        self._fallback: list[int] = []
+        self._unfiltered: list[int] = []
+
+        fragments: list[str] = []
+        for name, plugin_matchers in matchers:
+            for matcher in plugin_matchers:
+                idx = len(self._entries)
+                self._entries.append((name, matcher))
+                if (keys := get_host_keys(matcher.pattern)) is not None:
+                    for key in keys:
+                        self._hosts.setdefault(key, []).append(idx)
+                elif (fragment := _get_fragment(matcher.pattern)) is not None:
+                    self._fallback.append(idx)
+                    fragments.append(fragment)
+                else:
+                    self._unfiltered.append(idx)
+
+        self._fallback_pattern: re.Pattern[str] | None = None
+        if fragments:
+            try:
+                self._fallback_pattern = re.compile("|".join(fragments))
+            except re.error:  # pragma: no cover
+                self._unfiltered = sorted(self._unfiltered + self._fallback)
+                self._fallback = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def iter_candidates(self, url: str) -> Iterator[tuple[str, Matcher]]:
+        """Iterate through the plugin names and matchers which can match the given URL, in their original order"""
+        indices: set[int] = set(self._unfiltered)
+
+        if (host := get_url_host(url)) is not None:
+            hosts = self._hosts
+            if (bucket := hosts.get(host)) is not None:
+                indices.update(bucket)
+            pos = host.find(".")
+            while pos >= 0:
+                if (bucket := hosts.get(host[pos + 1 :])) is not None:
+                    indices.update(bucket)
+                pos = host.find(".", pos + 1)
+
+        if self._fallback_pattern is not None and self._fallback_pattern.match(url) is not None:
+            indices.update(self._fallback)
+
+        entries = self._entries
+        for idx in sorted(indices):
+            yield entries[idx]
+
+
+__all__ = ["PluginMatcherIndex", "get_host_keys", "get_url_host"]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from threading import Lock
+
+from streamlink.cache import Cache
+
+
+class ResolvedURLCache:
+    """
+    A persistent cache of redirect resolutions, which maps input URLs to plugin names and resolved URLs.
+
+    Entries get stored in the cache directory and expire after the configured TTL.
+    """
+
+    FILENAME = "resolved-urls.json"
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._cache: Cache | None = None
+        self._ttl = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache is not None
+
+    def configure(self, ttl: float = 0.0, disabled_file: bool = False) -> None:
+        """
+        Enable or disable the cache.
+
+        :param ttl: The number of seconds until cached entries expire, with ``0.0`` disabling the cache
+        :param disabled_file: Don't read from or write to the cache file, and only keep entries in memory
+        """
+
+        with self._lock:
+            self._ttl = max(0.0, float(ttl))
+            self._cache = Cache(self.FILENAME, disabled=disabled_file) if self._ttl > 0.0 else None
+
+    def get(self, url: str) -> tuple[str, str] | None:
+        """
+        Look up the plugin name and resolved URL of an input URL.
+        """
+
+        cache = self._cache
+        if cache is None:
+            return None
+
+        data = cache.get(url)
+        if not isinstance(data, dict):
+            return None
+        pluginname, resolved_url = data.get("plugin"), data.get("url")
+        if not isinstance(pluginname, str) or not isinstance(resolved_url, str):
+            return None
+
+        return pluginname, resolved_url
+
+    def set(self, url: str, pluginname: str, resolved_url: str) -> None:
+        """
+        Store the plugin name and resolved URL of an input URL.
+        """
+
+        cache = self._cache
+        if cache is None:
+            return
+
+        cache.set(url, {"plugin": pluginname, "url": resolved_url}, expires=self._ttl)
+
+
+__all__ = ["ResolvedURLCache"]
@@ -1,26 +1,37 @@
 from __future__ import annotations
 
 import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TypeAlias
+from urllib.parse import urlsplit
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
 import streamlink.compat  # noqa: F401
 from streamlink import __version__
 from streamlink.exceptions import NoPluginError, PluginError, StreamlinkDeprecationWarning
 from streamlink.logger import getLogger
+from streamlink.session.bandwidth import BandwidthEstimator
 from streamlink.session.http import HTTPSession
 from streamlink.session.options import StreamlinkOptions
 from streamlink.session.plugins import StreamlinkPlugins
+from streamlink.session.resolve_cache import ResolvedURLCache
+from streamlink.utils.cache import LRUCache
 from streamlink.utils.l10n import Localization
 from streamlink.utils.url import update_scheme
 
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Iterator, Mapping
 
     from streamlink.options import Options
     from streamlink.plugin.plugin import Plugin
 
+    _TResolvedURL: TypeAlias = tuple[str, type[Plugin], str]
+
 
 log = getLogger(".".join(__name__.split(".")[:-1]))
 
@@ -48,6 +59,12 @@ class Streamlink:
         #: Used for any kind of HTTP request made by plugin and stream implementations.
         self.http: HTTPSession = HTTPSession()
 
+        #: Download throughput and latency estimate of this session, fed by segmented streams.
+        self.bandwidth: BandwidthEstimator = BandwidthEstimator()
+
+        #: Persistent cache of redirect resolutions, see the ``resolve-url-cache-ttl`` option.
+        self.resolved_urls: ResolvedURLCache = ResolvedURLCache()
+
         #: Options of this session instance.
         #: :class:`StreamlinkOptions <streamlink.session.options.StreamlinkOptions>` is a subclass
         #: of :class:`Options <streamlink.options.Options>` with special getter/setter mappings.
@@ -56,7 +73,11 @@ class Streamlink:
             self.options.update(options)
 
         #: Plugins of this session instance.
-        self.plugins: StreamlinkPlugins = StreamlinkPlugins(builtin=plugins_builtin, lazy=plugins_lazy)
+        self.plugins: StreamlinkPlugins = StreamlinkPlugins(
+            builtin=plugins_builtin,
+            lazy=plugins_lazy,
+            cache=not self.options.get("no-plugin-cache"),
+        )
 
     def set_option(self, key: str, value: Any) -> None:
         """
@@ -109,21 +130,122 @@ class Streamlink:
             return resolved[0], resolved[1], url
 
         if follow_redirect:
+            if cached := self._get_cached_redirect(url):
+                return cached
+
             # Attempt to handle a redirect URL
             try:
-                res = self.http.head(url, allow_redirects=True, acceptable_status=[501])
-
-                # Fall back to GET request if server doesn't handle HEAD.
-                if res.status_code == 501:
-                    res = self.http.get(url, stream=True)
-
-                if res.url != url:
-                    return self.resolve_url(res.url, follow_redirect=follow_redirect)
+                redirect_url = self._get_redirect_url(url)
+                if redirect_url != url:
+                    resolved = self.resolve_url(redirect_url, follow_redirect=follow_redirect)
+                    self.resolved_urls.set(url, resolved[0], resolved[2])
+                    return resolved
             except PluginError:
                 pass
 
         raise NoPluginError
 
+    def _get_cached_redirect(self, url: str) -> _TResolvedURL | None:
+        if not (cached := self.resolved_urls.get(url)):
+            return None
+
+        # the available plugins can be different from when the entry was stored, so match the resolved URL again
+        pluginname, resolved_url = cached
+        if not (resolved := self.plugins.match_url(resolved_url)) or resolved[0] != pluginname:
+            return None
+
+        return resolved[0], resolved[1], resolved_url
+
+    def _get_redirect_url(self, url: str) -> str:
+        res = self.http.head(url, allow_redirects=True, acceptable_status=[501])
+
+        # Fall back to GET request if server doesn't handle HEAD.
+        if res.status_code == 501:
+            res = self.http.get(url, stream=True)
+            res.close()
+
+        return res.url
+
+    def resolve_urls(
+        self,
+        urls: Iterable[str],
+        follow_redirect: bool = True,
+        max_workers: int = 8,
+    ) -> Iterator[tuple[str, _TResolvedURL | None]]:
+        """
+        Attempts to find plugins for multiple URLs.
+
+        URLs which can be matched directly get resolved immediately. Redirects of the remaining URLs get looked up
+        concurrently by a bounded thread pool. Identical URLs of the recent input only get looked up once,
+        and once a host can't be connected to, other URLs of the same host don't get looked up anymore.
+
+        The input gets consumed lazily, so this can be used for streaming large lists of URLs.
+
+        :param urls: URLs to match against loaded plugins
+        :param follow_redirect: follow redirects
+        :param max_workers: max number of concurrent redirect lookups
+        :return: An iterator of tuples of the input URL and the :meth:`resolve_url` result, or ``None``
+                 if no plugin was found, in the same order as the input
+        """
+
+        # keep only the lookups of recent URLs, so that memory doesn't grow with the input
+        lookups: LRUCache[str, Future[_TResolvedURL | None]] = LRUCache(max_workers * 64)
+        unreachable: set[str] = set()
+        unreachable_lock = Lock()
+        pending: deque[tuple[str, Future[_TResolvedURL | None] | _TResolvedURL | None]] = deque()
+
+        def lookup(url: str) -> _TResolvedURL | None:
+            if cached := self._get_cached_redirect(url):
+                return cached
+            host = urlsplit(url).hostname or ""
+            with unreachable_lock:
+                if host in unreachable:
+                    return None
+            try:
+                redirect_url = self._get_redirect_url(url)
+            except PluginError as err:
+                if isinstance(getattr(err, "err", None), RequestsConnectionError):
+                    with unreachable_lock:
+                        unreachable.add(host)
+                return None
+            if redirect_url == url:
+                return None
+            # the redirect chain has already been followed
+            try:
+                resolved = self.resolve_url(redirect_url, follow_redirect=False)
+            except NoPluginError:
+                return None
+            self.resolved_urls.set(url, resolved[0], resolved[2])
+            return resolved
+
+        def result(item: tuple[str, Future[_TResolvedURL | None] | _TResolvedURL | None]) -> tuple[str, _TResolvedURL | None]:
+            url, value = item
+            return url, value.result() if isinstance(value, Future) else value
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="resolve_urls") as executor:
+            try:
+                for url in urls:
+                    normalized = update_scheme("https://", url, force=False)
+                    value: Future[_TResolvedURL | None] | _TResolvedURL | None
+                    try:
+                        value = self.resolve_url(normalized, follow_redirect=False)
+                    except NoPluginError:
+                        value = None
+                        if follow_redirect:
+                            value = lookups.get(normalized)
+                            if value is None:
+                                value = executor.submit(lookup, normalized)
+                                lookups.set(normalized, value)
+
+                    pending.append((url, value))
+                    while len(pending) > max_workers * 4:
+                        yield result(pending.popleft())
+
+                while pending:
+                    yield result(pending.popleft())
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def resolve_url_no_redirect(self, url: str) -> tuple[str, type[Plugin], str]:
         """
         Attempts to find a plugin that can use this URL.
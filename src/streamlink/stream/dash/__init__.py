@@ -1,3 +1,12 @@
-from streamlink.stream.dash.dash import DASHStream, DASHStreamReader, DASHStreamWorker, DASHStreamWriter
+from streamlink.stream.dash.dash import (
+    AdaptiveDASHStream,
+    AdaptiveDASHStreamReader,
+    AdaptiveDASHStreamWorker,
+    AdaptiveDASHStreamWriter,
+    DASHStream,
+    DASHStreamReader,
+    DASHStreamWorker,
+    DASHStreamWriter,
+)
 from streamlink.stream.dash.manifest import MPD, MPDParsingError
 from streamlink.stream.dash.segment import DASHSegment
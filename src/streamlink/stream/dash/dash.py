@@ -1,23 +1,28 @@
 from __future__ import annotations
 
-import copy
 import itertools
 from collections import defaultdict
+from concurrent.futures import Future
 from contextlib import contextmanager, suppress
+from threading import Lock
 from time import time
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from requests import Response
+from requests.exceptions import ChunkedEncodingError, ConnectionError, ContentDecodingError  # noqa: A004
 
 from streamlink.exceptions import PluginError, StreamError
 from streamlink.logger import getLogger
+from streamlink.session.http import HTTPRequestTemplate
 from streamlink.stream.dash.manifest import MPD, freeze_timeline
 from streamlink.stream.dash.segment import DASHSegment
 from streamlink.stream.ffmpegmux import FFMPEGMuxer
-from streamlink.stream.segmented import SegmentedStreamReader, SegmentedStreamWorker, SegmentedStreamWriter
+from streamlink.stream.segmented import LocationSelector, SegmentedStreamReader, SegmentedStreamWorker, SegmentedStreamWriter
 from streamlink.stream.stream import Stream
+from streamlink.stream.wrappers import iter_response_body
 from streamlink.utils.l10n import Language
 from streamlink.utils.parse import parse_xml
+from streamlink.utils.thread import Scheduler
 from streamlink.utils.times import now
 
 
@@ -27,6 +32,8 @@ if TYPE_CHECKING:
 
     from streamlink.session import Streamlink
     from streamlink.stream.dash.manifest import Representation
+    from streamlink.stream.segmented.segmented import TResultFuture
+    from streamlink.utils.thread import ScheduledCall
 
 
 log = getLogger(".".join(__name__.split(".")[:-1]))
@@ -38,41 +45,136 @@ class DASHStreamWriter(SegmentedStreamWriter[DASHSegment, Response]):
     reader: DASHStreamReader
     stream: DASHStream
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.request_template = HTTPRequestTemplate(self.session.http, **self.stream.args)
+        self.locations = LocationSelector(spread=self.session.options.get("dash-segment-spread"))
+        self.scheduler = Scheduler.shared()
+        self._scheduled: dict[ScheduledCall, TResultFuture] = {}
+        self._scheduled_lock = Lock()
+
+    def close(self) -> None:
+        if self.closed:  # pragma: no cover
+            return
+
+        with self._scheduled_lock:
+            scheduled_calls = list(self._scheduled.items())
+            self._scheduled.clear()
+        for scheduled, future in scheduled_calls:
+            scheduled.cancel()
+            future.cancel()
+
+        super().close()
+
+    def put(self, segment: DASHSegment | None) -> None:
+        """
+        Adds a segment to the write queue and submits it to the download pool once it's available.
+        Segments which are not yet available get scheduled, so the download pool's threads don't have to wait.
+        """
+
+        if self.closed:  # pragma: no cover
+            return
+
+        if segment is None:
+            self.queue(None, None)
+            return
+
+        available_in = segment.available_in
+        if available_in <= 0:
+            future = self.executor.submit(self.fetch, segment)
+        else:
+            log.debug(f"{self.reader.mime_type} segment {segment.name}: waiting {available_in:.01f}s ({segment.availability})")
+            future = Future()
+            with self._scheduled_lock:
+                scheduled = self.scheduler.schedule(available_in, self._submit, segment, future)
+                self._scheduled[scheduled] = future
+            future.add_done_callback(lambda _: self._unschedule(scheduled))
+
+        self.queue(segment, future)
+
+    def _unschedule(self, scheduled: ScheduledCall) -> None:
+        with self._scheduled_lock:
+            self._scheduled.pop(scheduled, None)
+
+    def _submit(self, segment: DASHSegment, future: TResultFuture) -> None:
+        """
+        Called by the scheduler once the segment is available: submit the fetch call to the download pool
+        and propagate its result to the queued future.
+        """
+
+        if self.closed or not future.set_running_or_notify_cancel():
+            log.debug(f"{self.reader.mime_type} segment {segment.name}: cancelled")
+            return
+
+        def done(fetched: TResultFuture) -> None:
+            if fetched.cancelled():
+                future.set_result(None)
+            elif (exception := fetched.exception()) is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(fetched.result())
+
+        try:
+            self.executor.submit(self.fetch, segment).add_done_callback(done)
+        except RuntimeError:
+            # executor was shut down
+            future.set_result(None)
+
     def fetch(self, segment: DASHSegment):
         if self.closed:
             return
 
-        name = segment.name
-        available_in = segment.available_in
-        if available_in > 0:
-            log.debug(f"{self.reader.mime_type} segment {name}: waiting {available_in:.01f}s ({segment.availability})")
-            if not self.wait(available_in):
-                log.debug(f"{self.reader.mime_type} segment {name}: cancelled")
-                return
-        log.debug(f"{self.reader.mime_type} segment {name}: downloading ({segment.availability})")
+        log.debug(f"{self.reader.mime_type} segment {segment.name}: downloading ({segment.availability})")
 
-        request_args = copy.deepcopy(self.reader.stream.args)
-        headers = request_args.pop("headers", {})
+        return self._fetch(segment)
 
+    def _fetch(self, segment: DASHSegment) -> Response | None:
+        headers = {}
         if segment.byterange:
             start, length = segment.byterange
             end = str(start + length - 1) if length else ""
             headers["Range"] = f"bytes={start}-{end}"
 
-        try:
-            return self.session.http.get(
-                segment.uri,
-                timeout=self.timeout,
-                exception=StreamError,
-                headers=headers,
-                retries=self.retries,
-                **request_args,
-            )
-        except StreamError as err:
-            log.error(f"{self.reader.mime_type} segment {name}: failed ({err})")
+        uris = self.locations.rank([segment.uri, *segment.alternate_uris])
+        for idx, uri in enumerate(uris, start=1):
+            last = idx == len(uris)
+            try:
+                result = self.session.http.get(
+                    uri,
+                    timeout=self.timeout,
+                    exception=StreamError,
+                    headers=headers,
+                    # only retry on the last location and fail over to the next location immediately otherwise
+                    retries=self.retries if last else 0,
+                    # spread the retries of concurrent segment downloads
+                    retry_jitter=0.2,
+                    template=self.request_template,
+                    circuit_breaker=True,
+                    # read the body separately, so that only the download time of the successful request gets measured
+                    stream=True,
+                )
+                start = time()
+                try:
+                    size = len(result.content)
+                finally:
+                    result.close()
+                elapsed = time() - start
+            except (StreamError, ChunkedEncodingError, ContentDecodingError, ConnectionError) as err:
+                self.locations.failure(uri)
+                if last:
+                    log.error(f"{self.reader.mime_type} segment {segment.name}: failed ({err})")
+                else:
+                    log.warning(f"{self.reader.mime_type} segment {segment.name}: failed ({err}), trying next location")
+            else:
+                self.locations.success(uri)
+                if not segment.init:
+                    # time to the response headers, plus the time of reading the body
+                    latency = result.elapsed.total_seconds()
+                    self.update_bandwidth(size, latency + elapsed, latency)
+                return result
 
     def write(self, segment: DASHSegment, result: Response, *data):
-        for chunk in result.iter_content(self.WRITE_CHUNK_SIZE):
+        for chunk in iter_response_body(result, read_size_min=self.WRITE_CHUNK_SIZE):
             if self.closed:
                 log.warning(f"{self.reader.mime_type} segment {segment.name}: aborted")
                 return
@@ -110,8 +212,17 @@ class DASHStreamWorker(SegmentedStreamWorker[DASHSegment, Response]):
 
     def iter_segments(self):
         init = True
+        ident = self.reader.ident
+        # sync initial timeline generation between audio and video threads
+        timestamp: datetime | None = self.reader.timestamp
         back_off_factor = 1
         while not self.closed:
+            # the representation can change on period transitions while reloading the manifest
+            if self.reader.ident != ident:
+                ident = self.reader.ident
+                init = True
+                timestamp = None
+
             # find the representation by ID
             representation = self.mpd.get_representation(self.reader.ident)
 
@@ -131,17 +242,46 @@ class DASHStreamWorker(SegmentedStreamWorker[DASHSegment, Response]):
                     continue
 
                 queued = False
-                iter_segments = representation.segments(
-                    sequence=self.sequence,
-                    init=init,
-                    # sync initial timeline generation between audio and video threads
-                    timestamp=self.reader.timestamp if init else None,
-                )
-                for segment in iter_segments:
-                    if init and not segment.init:
-                        self.sequence = segment.num
-                        init = False
-                    queued |= yield segment
+                # segments with lower numbers have already been queued before switching to a different representation
+                skip_sequence = -1
+                while representation:
+                    selected: Representation | None = None
+                    iter_segments = representation.segments(
+                        sequence=self.sequence,
+                        init=init,
+                        timestamp=timestamp if init else None,
+                    )
+                    for segment in iter_segments:
+                        if init and not segment.init:
+                            if segment.num < skip_sequence:
+                                continue
+                            self.sequence = segment.num
+                            init = False
+                        queued |= yield segment
+
+                        # switch representations at segment boundaries
+                        if not segment.init and (selected := self.select_representation(representation)) is not representation:
+                            break
+
+                    if selected is not None and selected is not representation:
+                        # continue the segment timeline of the previous representation
+                        self.mpd.timelines[selected.ident] = self.mpd.timelines[representation.ident]
+                        self.switch_representation(representation, selected)
+                        representation = selected
+                        skip_sequence = self.sequence
+                    elif representation.has_period_ended():
+                        # continue with the next period of dynamic manifests once the current period has ended,
+                        # without having to wait for the next manifest reload
+                        representation = self.next_period_representation(representation)
+                        skip_sequence = -1
+                    else:
+                        # the remaining segments of the current period get added on the next manifest reloads
+                        representation = None
+
+                    if representation:
+                        ident = representation.ident
+                        init = True
+                        timestamp = None
 
                 # close worker if type is not dynamic (all segments were put into writer queue)
                 if self.mpd.type != "dynamic":
@@ -157,6 +297,43 @@ class DASHStreamWorker(SegmentedStreamWorker[DASHSegment, Response]):
                 else:
                     back_off_factor = 1
 
+    def next_period_representation(self, representation: Representation, mpd: MPD | None = None) -> Representation | None:
+        """
+        Find the equivalent representation of the period following the period of the current representation
+        in dynamic manifests, and switch the reader to that representation.
+        """
+
+        mpd = mpd or self.mpd
+        if mpd.type != "dynamic":
+            return None
+
+        next_period = mpd.get_next_period(representation.period)
+        if not next_period:
+            return None
+
+        next_representation = next_period.get_equivalent_representation(representation)
+        if not next_representation:
+            log.warning(f"Failed to find equivalent DASH representation of {representation.ident!r} in the next period")
+            return None
+
+        self.switch_representation(representation, next_representation)
+        self.sequence = -1
+
+        return next_representation
+
+    def select_representation(self, representation: Representation) -> Representation:
+        """
+        Select the representation of the next segments. Called at each segment boundary.
+        Can be overridden by subclasses which switch representations during playback.
+        """
+
+        return representation
+
+    def switch_representation(self, representation: Representation, new_representation: Representation) -> None:
+        log.info(f"Switching DASH representation: {representation.ident!r} -> {new_representation.ident!r}")
+        self.reader.ident = new_representation.ident
+        self.reader.mime_type = new_representation.mimeType
+
     def reload(self):
         if self.closed:
             return
@@ -179,6 +356,12 @@ class DASHStreamWorker(SegmentedStreamWorker[DASHSegment, Response]):
 
         new_rep = new_mpd.get_representation(self.reader.ident)
         if not new_rep:
+            # the current period might have been removed from the manifest
+            current_rep = self.mpd.get_representation(self.reader.ident)
+            if current_rep and (new_rep := self.next_period_representation(current_rep, new_mpd)):
+                self.mpd = new_mpd
+                return True
+
             log.error(f"Failed to find matching DASH representation: {self.reader.ident!r}")
             self.close()
             return False
@@ -219,6 +402,7 @@ class DASHStream(Stream):
     """
 
     __shortname__ = "dash"
+    __reader__: ClassVar[type[DASHStreamReader]] = DASHStreamReader
 
     def __init__(
         self,
@@ -274,7 +458,7 @@ class DASHStream(Stream):
 
         retries = session.options.get("dash-manifest-reload-attempts")
         args = session.http.valid_request_args(**request_args)
-        res = session.http.get(url_or_manifest, retries=retries, **args)
+        res = session.http.get(url_or_manifest, retries=retries, cache=True, **args)
         manifest: str = res.text
         url: str = res.url
 
@@ -387,7 +571,7 @@ class DASHStream(Stream):
             if not vid and not aud:
                 continue
 
-            stream = DASHStream(session, mpd, vid, aud, **kwargs)
+            stream = cls(session, mpd, vid, aud, **kwargs)
             stream_name = []
 
             if vid:
@@ -432,11 +616,11 @@ class DASHStream(Stream):
         timestamp = now()
 
         if rep_video:
-            video = DASHStreamReader(self, rep_video, timestamp, name="video")
+            video = self.__reader__(self, rep_video, timestamp, name="video")
             log.debug("Opening DASH reader for: %r - %s", rep_video.ident, rep_video.mimeType)
 
         if rep_audio:
-            audio = DASHStreamReader(self, rep_audio, timestamp, name="audio")
+            audio = self.__reader__(self, rep_audio, timestamp, name="audio")
             log.debug("Opening DASH reader for: %r - %s", rep_audio.ident, rep_audio.mimeType)
 
         if video and audio and FFMPEGMuxer.is_usable(self.session):
@@ -449,3 +633,110 @@ class DASHStream(Stream):
         elif audio:
             audio.open()
             return audio
+
+
+class AdaptiveDASHStreamWriter(DASHStreamWriter):
+    reader: AdaptiveDASHStreamReader
+    stream: AdaptiveDASHStream
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._throughput_lock = Lock()
+        # start with the session's estimate, e.g. of previous streams or loaded from the cache
+        self.throughput: float | None = self.session.bandwidth.bandwidth
+
+    def update_bandwidth(self, size: int, elapsed: float, latency: float | None = None) -> None:
+        super().update_bandwidth(size, elapsed, latency)
+        self.update_throughput(size, elapsed)
+
+    def update_throughput(self, size: int, elapsed: float) -> None:
+        """
+        Update the exponentially weighted moving average of the segment download throughput (in kbit/s)
+        """
+
+        if elapsed <= 0.0:
+            return
+
+        throughput = size * 8 / 1000 / elapsed
+        with self._throughput_lock:
+            if self.throughput is None:
+                self.throughput = throughput
+            else:
+                weight = self.stream.THROUGHPUT_WEIGHT
+                self.throughput = weight * throughput + (1.0 - weight) * self.throughput
+
+
+class AdaptiveDASHStreamWorker(DASHStreamWorker):
+    reader: AdaptiveDASHStreamReader
+    writer: AdaptiveDASHStreamWriter
+    stream: AdaptiveDASHStream
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._segments_since_switch = 0
+
+    def select_representation(self, representation: Representation) -> Representation:
+        self._segments_since_switch += 1
+        throughput = self.writer.throughput
+        if throughput is None or self._segments_since_switch < self.stream.SWITCH_INTERVAL:
+            return representation
+
+        available = throughput * self.stream.BANDWIDTH_FACTOR
+        candidates = sorted(
+            (rep for rep in representation.parent.representations if rep.bandwidth <= self.reader.max_bandwidth),
+            key=lambda rep: rep.bandwidth,
+        )
+        if not candidates:  # pragma: no cover
+            return representation
+
+        selected = candidates[0]
+        for candidate in candidates:
+            if candidate.bandwidth <= available:
+                selected = candidate
+
+        if selected.ident == representation.ident:
+            return representation
+
+        log.debug(
+            ", ".join([
+                f"{self.reader.mime_type} throughput: {throughput:.0f}k",
+                f"bandwidth: {representation.bandwidth:.0f}k -> {selected.bandwidth:.0f}k",
+            ]),
+        )
+        self._segments_since_switch = 0
+
+        return selected
+
+
+class AdaptiveDASHStreamReader(DASHStreamReader):
+    __worker__ = AdaptiveDASHStreamWorker
+    __writer__ = AdaptiveDASHStreamWriter
+
+    worker: AdaptiveDASHStreamWorker
+    writer: AdaptiveDASHStreamWriter
+    stream: AdaptiveDASHStream
+
+    def __init__(self, stream: AdaptiveDASHStream, representation: Representation, *args, **kwargs):
+        super().__init__(stream, representation, *args, **kwargs)
+        self.max_bandwidth = representation.bandwidth
+
+
+class AdaptiveDASHStream(DASHStream):
+    """
+    MPEG-DASH stream which switches between the representations of the selected video and audio adaptation sets
+    at segment boundaries, depending on the download throughput of previous segments.
+
+    The bandwidth of the selected representations defines the upper limit.
+    After switching representations, the initialization segment of the new representation gets written first.
+    """
+
+    __reader__ = AdaptiveDASHStreamReader
+
+    THROUGHPUT_WEIGHT: ClassVar[float] = 0.3
+    """Weight of each new segment's throughput in the moving average of the download throughput"""
+
+    BANDWIDTH_FACTOR: ClassVar[float] = 0.8
+    """Fraction of the download throughput which the bandwidth of a representation may use"""
+
+    SWITCH_INTERVAL: ClassVar[int] = 3
+    """Minimum number of segments between switching representations"""
@@ -19,7 +19,7 @@ from streamlink.utils.url import is_insecure_scheme
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from datetime import datetime
 
     # noinspection PyProtectedMember
@@ -139,6 +139,7 @@ class MPDNode:
 
     parent: MPDNode
     _base_url: str
+    _base_urls: list[str]
     baseURLs: list[BaseURL]
 
     def __init__(self, node: _Element, root: MPD, parent: MPDNode, **kwargs) -> None:
@@ -146,6 +147,7 @@ class MPDNode:
         self.root = root
         self.parent = parent
         self._base_url = kwargs.get("base_url", "")
+        self._base_urls = kwargs.get("base_urls") or []
         self.attributes: set[str] = set()
         if self.__tag__ and self.node.tag.lower() != self.__tag__.lower():
             raise MPDParsingError(f"Root tag did not match the expected tag: {self.__tag__}")
@@ -248,7 +250,7 @@ class MPDNode:
             raise MPDParsingError(f"Expected to find {self.__tag__}/{cls.__tag__} required [{minimum}..{maximum or 'unbound'})")
 
         return [
-            cls(child, root=self.root, parent=self, i=i, base_url=self.base_url, **kwargs)
+            cls(child, root=self.root, parent=self, i=i, base_url=self.base_url, base_urls=self.base_urls, **kwargs)
             for i, child in enumerate(children)
         ]  # fmt: skip
 
@@ -297,6 +299,31 @@ class MPDNode:
 
         return self._base_url
 
+    @property
+    def base_urls(self) -> list[str]:
+        """
+        All resolved base URLs of redundant content locations, with the primary base URL first.
+        Alternative base URLs with insecure schemes are ignored.
+        """
+
+        parents = self._base_urls or [self._base_url]
+        others = [base_url.url for base_url in getattr(self, "baseURLs", None) or [] if base_url.url]
+        if not others:
+            return parents
+
+        primary = self.base_url
+        base_urls = [primary]
+        for parent in parents:
+            base_scheme = urlparse(parent).scheme
+            for other in others:
+                if is_insecure_scheme(base_scheme, urlparse(other).scheme):
+                    continue
+                url = urljoin(parent, other)
+                if url not in base_urls:
+                    base_urls.append(url)
+
+        return base_urls
+
 
 class MPD(MPDNode):
     """
@@ -411,6 +438,20 @@ class MPD(MPDNode):
                         continue
                     return representation
 
+    def get_next_period(self, period: Period) -> Period | None:
+        """
+        Find the Period which follows the given Period, which can also be a Period of a previously parsed manifest.
+        Periods are matched by identity or by their id attribute, with a fallback to their availability start time.
+        """
+        current = period if period in self.periods else self.periods_map.get(period.id) if period.id is not None else None
+        if current is not None:
+            idx = self.periods.index(current) + 1
+            return self.periods[idx] if idx < len(self.periods) else None
+
+        for item in self.periods:
+            if item.availabilityStartTime > period.availabilityStartTime:
+                return item
+
 
 class ProgramInformation(MPDNode):
     __tag__ = "ProgramInformation"
@@ -467,6 +508,51 @@ class Period(MPDNode):
         self.eventStream = self.children(EventStream)
         self.subset = self.children(Subset)
 
+    @property
+    def availabilityEndTime(self) -> datetime | None:
+        """
+        The end of a dynamic Period, as defined by the start of the next Period or by its own duration
+        """
+        if self.root.type != "dynamic":
+            return None
+
+        next_period = self.root.get_next_period(self)
+        if next_period is not None:
+            return next_period.availabilityStartTime
+        if self.duration:
+            return self.availabilityStartTime + self.duration
+
+        return None
+
+    def get_equivalent_representation(self, representation: Representation) -> Representation | None:
+        """
+        Find the Representation of this Period which best matches a Representation of a different Period.
+        Candidates must have the same content type and are ranked by their language, codec, MIME type,
+        video height and bandwidth.
+        """
+        content_type = representation.mimeType.split("/")[0]
+        codec = (representation.codecs or "").split(".")[0]
+
+        candidates = [
+            rep
+            for aset in self.adaptationSets
+            for rep in aset.representations
+            if rep.mimeType.split("/")[0] == content_type
+        ]  # fmt: skip
+        if not candidates:
+            return None
+
+        def rank(rep: Representation) -> tuple[bool, bool, bool, int, float]:
+            return (
+                rep.lang != representation.lang,
+                (rep.codecs or "").split(".")[0] != codec,
+                rep.mimeType != representation.mimeType,
+                abs((rep.height or 0) - (representation.height or 0)),
+                abs(rep.bandwidth - representation.bandwidth),
+            )
+
+        return min(candidates, key=rank)
+
 
 class AssetIdentifier(MPDNode):
     __tag__ = "AssetIdentifier"
@@ -616,6 +702,20 @@ class Representation(_RepresentationBaseType):
     def bandwidth_rounded(self) -> float:
         return round(self.bandwidth, 1 - int(math.log10(self.bandwidth)))
 
+    def has_period_ended(self) -> bool:
+        """
+        Whether all segments of the Period of a dynamic manifest have been generated, so that the next Period can follow.
+
+        Segment timelines can list the next Period before their segments reach the end of the current Period,
+        as their remaining segments only get added on subsequent manifest reloads.
+        """
+
+        segmentTemplate = self.segmentTemplate or self.walk_back_get_attr("segmentTemplate")
+        if not segmentTemplate or not segmentTemplate.segmentTimeline:
+            return True
+
+        return segmentTemplate.has_timeline_ended(self.ident)
+
     def segments(
         self,
         sequence: int = -1,
@@ -640,10 +740,12 @@ class Representation(_RepresentationBaseType):
         segmentList = self.segmentList or self.walk_back_get_attr("segmentList")
         segmentTemplate = self.segmentTemplate or self.walk_back_get_attr("segmentTemplate")
 
+        segments: Iterable[DASHSegment]
         if segmentTemplate:
-            yield from segmentTemplate.segments(
+            segments = segmentTemplate.segments(
                 self.ident,
                 self.base_url,
+                sequence=sequence,
                 init=init,
                 timestamp=timestamp,
                 RepresentationID=self.id,
@@ -651,20 +753,35 @@ class Representation(_RepresentationBaseType):
                 **kwargs,
             )
         elif segmentList:
-            yield from segmentList.segments(
+            segments = segmentList.segments(
                 sequence=sequence,
                 init=init,
             )
         else:
-            yield DASHSegment(
-                num=sequence,
-                init=False,
-                discontinuity=False,
-                uri=self.base_url,
-                duration=self.period.duration.total_seconds() or self.root.mediaPresentationDuration.total_seconds(),
-                available_at=self.period.availabilityStartTime,
-                byterange=None,
-            )
+            segments = [
+                DASHSegment(
+                    num=sequence,
+                    init=False,
+                    discontinuity=False,
+                    uri=self.base_url,
+                    duration=self.period.duration.total_seconds() or self.root.mediaPresentationDuration.total_seconds(),
+                    available_at=self.period.availabilityStartTime,
+                    byterange=None,
+                ),
+            ]
+
+        base_urls = self.base_urls
+        if len(base_urls) < 2:
+            yield from segments
+            return
+
+        # resolve the segment URLs relative to the primary base URL's path against the alternative base URLs
+        primary = urljoin(base_urls[0], ".")
+        for segment in segments:
+            if segment.uri.startswith(primary):
+                path = segment.uri[len(primary) :]
+                segment.alternate_uris = tuple(urljoin(base_url, path) for base_url in base_urls[1:])
+            yield segment
 
 
 class SubRepresentation(_RepresentationBaseType):
@@ -850,6 +967,7 @@ class SegmentTemplate(_MultipleSegmentBaseType):
         self,
         ident: TTimelineIdent,
         base_url: str,
+        sequence: int = -1,
         init: bool = True,
         timestamp: datetime | None = None,
         **kwargs,
@@ -866,7 +984,13 @@ class SegmentTemplate(_MultipleSegmentBaseType):
                     available_at=self.period.availabilityStartTime,
                     byterange=None,
                 )
-        for media_url, num, duration, available_at in self.format_media(ident, base_url, timestamp=timestamp, **kwargs):
+        for media_url, num, duration, available_at in self.format_media(
+            ident,
+            base_url,
+            sequence=sequence,
+            timestamp=timestamp,
+            **kwargs,
+        ):
             yield DASHSegment(
                 num=num,
                 init=False,
@@ -877,7 +1001,7 @@ class SegmentTemplate(_MultipleSegmentBaseType):
                 byterange=None,
             )
 
-    def segment_numbers(self, timestamp: datetime | None = None) -> Iterator[tuple[int, datetime]]:
+    def segment_numbers(self, timestamp: datetime | None = None, sequence: int = -1) -> Iterator[tuple[int, datetime]]:
         """
         yield the segment number and when it will be available.
 
@@ -888,6 +1012,8 @@ class SegmentTemplate(_MultipleSegmentBaseType):
 
         In the case of dynamic streams, the segments should appear at the specified time.
         In the simplest case, the segment number is based on the time since the availabilityStartTime.
+        Segment numbers of dynamic streams continue after the given sequence number when re-generating them,
+        and Periods with a known end only consist of a limited number of segments.
         """
 
         if not self.duration_seconds:  # pragma: no cover
@@ -912,8 +1038,16 @@ class SegmentTemplate(_MultipleSegmentBaseType):
 
             # Segment number
             seconds_offset = (since_start - suggested_delay - buffer_time).total_seconds()
-            number_offset = max(0, int(seconds_offset / self.duration_seconds))
-            number_iter = count(self.startNumber + number_offset)
+            number_offset = max(0, int(seconds_offset / self.duration_seconds), sequence - self.startNumber)
+            period_end = self.period.availabilityEndTime
+            if period_end is not None:
+                period_duration = (period_end - self.period.availabilityStartTime).total_seconds()
+                number_iter = range(
+                    self.startNumber + number_offset,
+                    self.startNumber + math.ceil(period_duration / self.duration_seconds),
+                )
+            else:
+                number_iter = count(self.startNumber + number_offset)
 
             # Segment availability time
             available_offset = timedelta(seconds=number_offset * self.duration_seconds)
@@ -976,6 +1110,29 @@ class SegmentTemplate(_MultipleSegmentBaseType):
                 self.root.timelines[ident] = segment.t
                 yield number, segment, available_at
 
+    def has_timeline_ended(self, ident: TTimelineIdent) -> bool:
+        """
+        Whether the last generated segment of the timeline reaches the end of the Period,
+        or whether the end of the Period has passed a while ago without the remaining segments getting added.
+        """
+
+        period_end = self.period.availabilityEndTime
+        if period_end is None or not self.segmentTimeline:
+            return False
+
+        segments = list(self.segmentTimeline.segments)
+        time = self.root.timelines.get(ident, -1)
+        if last := next((segment for segment in reversed(segments) if segment.t == time), None):
+            end = timedelta(seconds=(last.t + last.d) / self.timescale) - self.presentationTimeOffset
+            # allow for rounding errors of the segment durations
+            tolerance = timedelta(seconds=last.d / self.timescale / 2)
+            if self.period.availabilityStartTime + end >= period_end - tolerance:
+                return True
+
+        max_duration = timedelta(seconds=max((segment.d for segment in segments), default=0) / self.timescale)
+
+        return now() >= period_end + self.root.minimumUpdatePeriod + max_duration
+
     def format_initialization(self, base_url: str, **kwargs) -> str | None:
         if self.fmt_initialization is not None:  # pragma: no branch
             return self.make_url(base_url, self.fmt_initialization(**kwargs))
@@ -984,6 +1141,7 @@ class SegmentTemplate(_MultipleSegmentBaseType):
         self,
         ident: TTimelineIdent,
         base_url: str,
+        sequence: int = -1,
         timestamp: datetime | None = None,
         **kwargs,
     ) -> Iterator[tuple[str, int, float, datetime]]:
@@ -993,7 +1151,7 @@ class SegmentTemplate(_MultipleSegmentBaseType):
         if not self.segmentTimeline:
             log.debug("Generating segment numbers for %s playlist: %r", self.root.type, ident)
             duration = self.duration_seconds
-            for number, available_at in self.segment_numbers(timestamp=timestamp):
+            for number, available_at in self.segment_numbers(timestamp=timestamp, sequence=sequence):
                 url = self.make_url(base_url, self.fmt_media(Number=number, **kwargs))
                 yield url, number, duration, available_at
         else:
@@ -5,6 +5,7 @@ import re
 import struct
 import warnings
 from datetime import timedelta
+from time import time
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar
 from urllib.parse import urlparse
 
@@ -13,14 +14,15 @@ from requests.exceptions import ChunkedEncodingError, ConnectionError, ContentDe
 
 from streamlink.exceptions import StreamError, StreamlinkDeprecationWarning
 from streamlink.logger import getLogger
+from streamlink.session.http import HTTPRequestTemplate
 from streamlink.stream.ffmpegmux import FFMPEGMuxer, MuxedStream
 from streamlink.stream.filtered import FilteredStream
 from streamlink.stream.hls.m3u8 import M3U8Parser, parse_m3u8
 from streamlink.stream.hls.segment import HLSSegment, StreamInfo
 from streamlink.stream.http import HTTPStream
 from streamlink.stream.segmented import SegmentedStreamReader, SegmentedStreamWorker, SegmentedStreamWriter
+from streamlink.stream.wrappers import iter_response_body
 from streamlink.utils.cache import LRUCache
-from streamlink.utils.crypto import AES, unpad
 from streamlink.utils.formatter import Formatter
 from streamlink.utils.l10n import Language
 from streamlink.utils.times import now
@@ -74,6 +76,7 @@ class ByteRangeOffset:
 
 
 class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
+    # initial read size of streamed segment data, which grows while reads return the whole read size
     WRITE_CHUNK_SIZE = 8192
 
     reader: HLSStreamReader
@@ -97,6 +100,8 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
             self.ignore_names = re.compile(segments, re.IGNORECASE)
         self.passthrough_encrypted = options.get("stream-passthrough-encrypted")
 
+        self.request_template = HTTPRequestTemplate(self.session.http, **self.reader.request_params)
+
     @staticmethod
     def num_to_iv(n: int) -> bytes:
         return struct.pack(">8xq", n)
@@ -127,7 +132,7 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
                     key_uri,
                     exception=StreamError,
                     retries=self.retries,
-                    **self.reader.request_params,
+                    template=self.request_template,
                 )
             except StreamError as err:
                 # FIXME: fix HTTPSession.request()
@@ -145,12 +150,17 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
         # Pad IV if needed
         iv = b"\x00" * (16 - len(iv)) + iv
 
+        # import pycryptodome only if it's needed
+        from streamlink.utils.crypto import AES  # noqa: PLC0415
+
         return AES.new(self.key_data, AES.MODE_CBC, iv)
 
     def create_request_params(self, num: int, segment: HLSSegment | Map, is_map: bool):
-        request_params = dict(self.reader.request_params)
-        headers = request_params.pop("headers", {})
+        """
+        Create the per-segment request params which get added to the writer's request template.
+        """
 
+        headers = {}
         if segment.byterange:
             if is_map:
                 bytes_start, bytes_end = self.byterange.uncached(segment.byterange)
@@ -158,9 +168,7 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
                 bytes_start, bytes_end = self.byterange.cached(num, segment.byterange)
             headers["Range"] = f"bytes={bytes_start}-{bytes_end}"
 
-        request_params["headers"] = headers
-
-        return request_params
+        return dict(headers=headers)
 
     def put(self, segment: HLSSegment | None):
         if self.closed:
@@ -189,13 +197,30 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
 
     def fetch(self, segment: HLSSegment) -> Response | None:
         try:
-            return self._fetch(
+            result = self._fetch(
                 segment.uri,
-                stream=self.stream_data,
+                # read the body separately, so that only the download time of the successful request gets measured
+                stream=True,
                 **self.create_request_params(segment.num, segment, False),
             )
-        except StreamError as err:
+            # the download time of streamed segment data is unknown
+            if result is None or self.stream_data:
+                return result
+            start = time()
+            try:
+                size = len(result.content)
+            finally:
+                result.close()
+            elapsed = time() - start
+        except (StreamError, ChunkedEncodingError, ContentDecodingError, ConnectionError) as err:
             log.error(f"Failed to fetch segment {segment.num}: {err}")
+            return None
+
+        # time to the response headers, plus the time of reading the body
+        latency = result.elapsed.total_seconds()
+        self.update_bandwidth(size, latency + elapsed, latency)
+
+        return result
 
     def fetch_map(self, segment: HLSSegment) -> Response | None:
         segment_map: Map = segment.map  # type: ignore[assignment, ty:invalid-assignment]  # map is not None
@@ -216,7 +241,11 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
             url,
             timeout=self.timeout,
             retries=self.retries,
+            # spread the retries of concurrent segment downloads
+            retry_jitter=0.2,
             exception=StreamError,
+            template=self.request_template,
+            circuit_breaker=True,
             **request_params,
         )
 
@@ -270,6 +299,8 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
                 self.close()
                 return
 
+            from streamlink.utils.crypto import AES, unpad  # noqa: PLC0415
+
             try:
                 # Unlike plaintext segments, encrypted segments can't be written to the buffer in small chunks
                 # because of the byte padding at the end of the decrypted data, which means that decrypting in
@@ -288,7 +319,7 @@ class HLSStreamWriter(SegmentedStreamWriter[HLSSegment, Response]):
 
         else:
             try:
-                for chunk in result.iter_content(self.WRITE_CHUNK_SIZE):
+                for chunk in iter_response_body(result, read_size_min=self.WRITE_CHUNK_SIZE):
                     self.reader.buffer.write(chunk)
             except (ChunkedEncodingError, ContentDecodingError, ConnectionError) as err:
                 log.error(f"Download of segment {segment.num} failed: {err}")
@@ -682,7 +713,7 @@ class HLSStream(HTTPStream):
 
     @classmethod
     def _fetch_playlist(cls, session: Streamlink, url: str, **request_args) -> Response:
-        res = session.http.get(url, exception=OSError, **request_args)
+        res = session.http.get(url, exception=OSError, cache=True, **request_args)
         res.encoding = "utf-8"
 
         return res
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from streamlink.exceptions import StreamError
 from streamlink.stream.stream import Stream
-from streamlink.stream.wrappers import StreamIOIterWrapper, StreamIOThreadWrapper
+from streamlink.stream.wrappers import StreamIOIterWrapper, StreamIOThreadWrapper, iter_response_body
 
 
 if TYPE_CHECKING:
@@ -73,7 +73,7 @@ class HTTPStream(Stream):
             **reqargs,
         )
 
-        fd = StreamIOIterWrapper(res.iter_content(8192))
+        fd = StreamIOIterWrapper(iter_response_body(res))
         if self.buffered:
             fd = StreamIOThreadWrapper(self.session, fd, timeout=timeout)
 
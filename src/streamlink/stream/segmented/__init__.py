@@ -1,2 +1,3 @@
+from streamlink.stream.segmented.failover import LocationSelector
 from streamlink.stream.segmented.segment import Segment
 from streamlink.stream.segmented.segmented import SegmentedStreamReader, SegmentedStreamWorker, SegmentedStreamWriter
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from itertools import count
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class _LocationHealth:
+    def __init__(self) -> None:
+        self.failures = 0
+        self.blocked_until = 0.0
+
+
+class LocationSelector:
+    """
+    Keeps track of the health of redundant segment locations, e.g. multiple CDNs serving the same content.
+
+    Locations are identified by the scheme and network location of their URLs.
+    Failed locations get put on hold for an exponentially increasing amount of time and get ranked last,
+    so that they'll only be used again as a last resort, or after they've recovered.
+    """
+
+    #: Time in seconds for which a location gets ranked last after its first failure
+    HOLD_TIME: float = 5.0
+    #: Maximum time in seconds for which a location gets ranked last after consecutive failures
+    HOLD_TIME_MAX: float = 120.0
+
+    def __init__(self, spread: bool = False) -> None:
+        """
+        :param spread: Rotate the order of healthy locations on each call of :meth:`rank`,
+                       so that parallel segment fetches get spread across all healthy locations
+        """
+
+        self.spread = spread
+        self._health: dict[str, _LocationHealth] = {}
+        self._counter = count()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(uri: str) -> str:
+        urlp = urlparse(uri)
+        return f"{urlp.scheme}://{urlp.netloc}"
+
+    def rank(self, uris: Sequence[str]) -> list[str]:
+        """
+        Sort URLs of redundant locations by their health, keeping the given order for healthy locations
+
+        :param uris: The URLs of the same resource on different locations, ordered by preference
+        :return: A new list of URLs, with the preferred location first
+        """
+
+        if len(uris) < 2:
+            return list(uris)
+
+        now = monotonic()
+        healthy: list[str] = []
+        unhealthy: list[tuple[float, int, str]] = []
+        with self._lock:
+            for idx, uri in enumerate(uris):
+                health = self._health.get(self._key(uri))
+                if health is None or health.blocked_until <= now:
+                    healthy.append(uri)
+                else:
+                    unhealthy.append((health.blocked_until, idx, uri))
+
+            if self.spread and len(healthy) > 1:
+                offset = next(self._counter) % len(healthy)
+                healthy = healthy[offset:] + healthy[:offset]
+
+        return healthy + [uri for *_, uri in sorted(unhealthy)]
+
+    def failure(self, uri: str) -> None:
+        """
+        Put the location of the URL on hold
+        """
+
+        with self._lock:
+            health = self._health.setdefault(self._key(uri), _LocationHealth())
+            health.failures += 1
+            hold_time = min(self.HOLD_TIME_MAX, self.HOLD_TIME * 2 ** (health.failures - 1))
+            health.blocked_until = monotonic() + hold_time
+
+    def success(self, uri: str) -> None:
+        """
+        Reset the health of the URL's location
+        """
+
+        with self._lock:
+            self._health.pop(self._key(uri), None)
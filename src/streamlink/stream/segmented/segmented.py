@@ -79,6 +79,13 @@ class SegmentedStreamWriter(AwaitableMixin, NamedThread, Generic[TSegment, TResu
 
         self.executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix=f"{self.name}-executor")
         self._queue: queue.Queue[TQueueItem | None] = queue.Queue(size)
+        self._reserved_connections = 0
+
+    def start(self) -> None:
+        # reserve keep-alive connections for the download pool's threads and the worker thread
+        self._reserved_connections = self.threads + 1
+        self.session.http.reserve_connections(self._reserved_connections)
+        super().start()
 
     def close(self) -> None:
         """
@@ -96,6 +103,10 @@ class SegmentedStreamWriter(AwaitableMixin, NamedThread, Generic[TSegment, TResu
         self.reader.close()
         self.executor.shutdown(wait=True, cancel_futures=True)
 
+        if self._reserved_connections:
+            self.session.http.release_connections(self._reserved_connections)
+            self._reserved_connections = 0
+
     def put(self, segment: TSegment | None) -> None:
         """
         Adds a segment to the download pool and write queue.
@@ -141,6 +152,13 @@ class SegmentedStreamWriter(AwaitableMixin, NamedThread, Generic[TSegment, TResu
         Should be overridden by the inheriting class.
         """
 
+    def update_bandwidth(self, size: int, elapsed: float, latency: float | None = None) -> None:
+        """
+        Adds the size, download time and latency of a fetched segment to the session's bandwidth estimate.
+        """
+
+        self.session.bandwidth.update(size, elapsed, latency)
+
     def write(self, segment: TSegment, result: TResult, *data) -> None:
         """
         Writes a segment to the buffer.
@@ -1,9 +1,81 @@
+from __future__ import annotations
+
 import io
 from threading import Thread
+from typing import TYPE_CHECKING
+
+from requests.exceptions import ChunkedEncodingError, ConnectionError, ContentDecodingError, SSLError  # noqa: A004
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError, SSLError as Urllib3SSLError
+from urllib3.response import HTTPResponse
 
 from streamlink.buffers import Buffer, RingBuffer
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from requests import Response
+
+
+#: Initial read size of :func:`iter_response_body`
+READ_SIZE_MIN = 1024 * 64
+#: Maximum read size of :func:`iter_response_body`
+READ_SIZE_MAX = 1024 * 1024
+
+
+def iter_response_body(
+    res: Response,
+    read_size_min: int = READ_SIZE_MIN,
+    read_size_max: int = READ_SIZE_MAX,
+) -> Iterator[bytes | memoryview]:
+    """
+    Iterate over the body of an HTTP response with large read sizes.
+
+    The content of responses which have already been downloaded gets yielded as memoryview slices of the content.
+    Bodies of streamed responses get read via urllib3's :meth:`HTTPResponse.read1() <urllib3.response.HTTPResponse.read1>`,
+    with a read size that grows from ``read_size_min`` to ``read_size_max`` while the reads return the whole read size.
+    Each read only returns the data which is already available, so that slow live streams don't wait for the whole read size.
+    Everything else, e.g. responses of urllib3 versions without ``read1()``, falls back to
+    :meth:`requests.Response.iter_content`.
+
+    :param res: The response
+    :param read_size_min: The initial read size
+    :param read_size_max: The maximum read size
+    """
+
+    if res._content_consumed:
+        content = memoryview(res.content or b"")
+        for offset in range(0, len(content), read_size_max):
+            yield content[offset : offset + read_size_max]
+        return
+
+    raw = res.raw
+    # HTTPResponse.read1() was added in urllib3 2.3.0
+    if not isinstance(raw, HTTPResponse) or not hasattr(raw, "read1"):
+        yield from res.iter_content(read_size_min)
+        return
+
+    # raise the same exceptions as requests.Response.iter_content()
+    try:
+        size = read_size_min
+        while chunk := raw.read1(size, decode_content=True):
+            yield chunk
+
+            # increase the read size while the reads return the whole read size
+            if len(chunk) == size and size < read_size_max:
+                size = min(size * 2, read_size_max)
+    except ProtocolError as err:
+        raise ChunkedEncodingError(err) from err
+    except DecodeError as err:  # pragma: no cover
+        raise ContentDecodingError(err) from err
+    except ReadTimeoutError as err:
+        raise ConnectionError(err) from err
+    except Urllib3SSLError as err:  # pragma: no cover
+        raise SSLError(err) from err
+    finally:
+        res._content_consumed = True
+
+
 class StreamIOWrapper(io.IOBase):
     """Wraps file-like objects that are not inheriting from IOBase"""
 
@@ -107,4 +179,4 @@ class StreamIOThreadWrapper(io.IOBase):
             self.filler.join()
 
 
-__all__ = ["StreamIOWrapper", "StreamIOIterWrapper", "StreamIOThreadWrapper"]
+__all__ = ["StreamIOWrapper", "StreamIOIterWrapper", "StreamIOThreadWrapper", "iter_response_body"]
@@ -0,0 +1,108 @@
+"""
+JSON (de)serialization via the fastest available backend.
+
+If installed, the ujson library is used, otherwise the stdlib's :mod:`json` module.
+Any data which the optional backend fails to (de)serialize, e.g. non-UTF-8 encoded bytes or ``NaN`` literals,
+gets (de)serialized by the :mod:`json` module instead, so that results and errors are the same.
+
+The orjson library is faster, but it deserializes integers which exceed 64 bits as floats,
+so it needs to be selected explicitly via :func:`use_backend`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None  # type: ignore[assignment]
+
+
+def _stdlib_dumps(obj: Any, sort_keys: bool = False) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def _orjson_dumps(obj: Any, sort_keys: bool = False) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode("utf-8")
+
+
+def _ujson_dumps(obj: Any, sort_keys: bool = False) -> str:
+    return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False, sort_keys=sort_keys)
+
+
+_BACKENDS = {
+    "orjson": (orjson.loads, _orjson_dumps) if orjson else None,
+    "ujson": (ujson.loads, _ujson_dumps) if ujson else None,
+    "json": (json.loads, _stdlib_dumps),
+}
+
+#: The name of the selected JSON backend
+BACKEND: str = "ujson" if _BACKENDS["ujson"] is not None else "json"
+
+_loads, _dumps = _BACKENDS[BACKEND]  # type: ignore[misc]
+
+
+def use_backend(name: str) -> None:
+    """
+    Select the JSON backend.
+
+    :param name: ``"orjson"``, ``"ujson"`` or ``"json"``
+    :raise ValueError: If the backend is unknown or not installed
+    """
+
+    global BACKEND, _loads, _dumps  # noqa: PLW0603
+
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"JSON backend is not available: {name}")
+
+    BACKEND = name
+    _loads, _dumps = backend
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """
+    Deserialize JSON data from a string or from UTF-8, UTF-16 or UTF-32 encoded bytes.
+
+    :param data: The JSON data
+    :raise json.JSONDecodeError: If the data is invalid
+    :return: The deserialized Python object
+    """
+
+    if _loads is not json.loads:
+        try:
+            return _loads(data)
+        except Exception:
+            pass
+
+    return json.loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """
+    Serialize a Python object to a compact JSON string without ASCII escape sequences.
+
+    :param obj: The Python object
+    :param sort_keys: Whether to sort the keys of dictionaries
+    :raise TypeError: If the object is not JSON serializable
+    :return: The JSON string
+    """
+
+    if _dumps is not _stdlib_dumps:
+        try:
+            return _dumps(obj, sort_keys=sort_keys)
+        except Exception:
+            pass
+
+    return _stdlib_dumps(obj, sort_keys=sort_keys)
+
+
+__all__ = ["BACKEND", "dumps", "loads", "use_backend"]
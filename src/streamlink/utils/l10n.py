@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import locale
+from functools import lru_cache
 from warnings import catch_warnings
 
-from pycountry import countries, languages
-
 from streamlink.logger import getLogger
 
 
@@ -26,19 +25,9 @@ class Country:
     @classmethod
     def get(cls, country):
         try:
-            c = countries.lookup(country)
-
-            # changed in pycountry 23.12.11: a UserWarning is emitted when the official_name is missing
-            with catch_warnings(record=True):
-                official_name = getattr(c, "official_name", c.name)
-
-            return Country(
-                c.alpha_2,
-                c.alpha_3,
-                c.numeric,
-                c.name,
-                official_name=official_name,
-            )
+            if not isinstance(country, str):
+                raise LookupError(country)
+            return _get_country(country)
         except LookupError as err:
             raise LookupError(f"Invalid country code: {country}") from err
 
@@ -67,21 +56,9 @@ class Language:
     @classmethod
     def get(cls, language):
         try:
-            lang = (
-                languages.get(alpha_2=language)
-                or languages.get(alpha_3=language)
-                or languages.get(bibliographic=language)
-                or languages.get(name=language)
-            )
-            if not lang:
-                raise KeyError(language)
-            return Language(
-                # some languages don't have an alpha_2 code
-                getattr(lang, "alpha_2", ""),
-                lang.alpha_3,
-                lang.name,
-                getattr(lang, "bibliographic", ""),
-            )
+            if not isinstance(language, str):
+                raise LookupError(language)
+            return _get_language(language)
         except LookupError as err:
             raise LookupError(f"Invalid language code: {language}") from err
 
@@ -100,6 +77,60 @@ class Language:
         return f"Language({alpha2!r}, {alpha3!r}, {name!r}, {bibliographic=!r})"
 
 
+@lru_cache(maxsize=1024)
+def _get_country(country: str) -> Country:
+    # look up the pre-built table first, and import pycountry only if the country code can't be resolved
+    from streamlink.utils.l10n_data import COUNTRIES, COUNTRIES_INDEX  # noqa: PLC0415
+
+    if (idx := COUNTRIES_INDEX.get(country.lower())) is not None:
+        alpha2, alpha3, numeric, name, official_name = COUNTRIES[idx]
+        return Country(alpha2, alpha3, numeric, name, official_name=official_name)
+
+    from pycountry import countries  # noqa: PLC0415
+
+    c = countries.lookup(country)
+
+    # changed in pycountry 23.12.11: a UserWarning is emitted when the official_name is missing
+    with catch_warnings(record=True):
+        official_name = getattr(c, "official_name", c.name)
+
+    return Country(
+        c.alpha_2,
+        c.alpha_3,
+        c.numeric,
+        c.name,
+        official_name=official_name,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _get_language(language: str) -> Language:
+    # look up the pre-built table first, and import pycountry only if the language code can't be resolved
+    from streamlink.utils.l10n_data import LANGUAGES, LANGUAGES_INDEX  # noqa: PLC0415
+
+    if (idx := LANGUAGES_INDEX.get(language.lower())) is not None:
+        return Language(*LANGUAGES[idx])
+
+    from pycountry import languages  # noqa: PLC0415
+
+    lang = (
+        languages.get(alpha_2=language)
+        or languages.get(alpha_3=language)
+        or languages.get(bibliographic=language)
+        or languages.get(name=language)
+    )
+    if not lang:
+        raise KeyError(language)
+
+    return Language(
+        # some languages don't have an alpha_2 code
+        getattr(lang, "alpha_2", ""),
+        lang.alpha_3,
+        lang.name,
+        getattr(lang, "bibliographic", ""),
+    )
+
+
 class Localization:
     def __init__(self, language_code=None):
         self._language_code = None
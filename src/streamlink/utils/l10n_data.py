@@ -0,0 +1,2192 @@
+# This file was generated by script/update-l10n-data.py from pycountry 26.2.16. Don't edit it manually.
+# Lookup keys are lower-case and map to the index of the resolved table record.
+# Keys which are not part of the lookup tables have to be resolved via pycountry.
+
+PYCOUNTRY_VERSION = "26.2.16"
+
+# alpha2, alpha3, numeric, name, official_name
+COUNTRIES: tuple[tuple[str, str, str, str, str], ...] = (
+    ("AW", "ABW", "533", "Aruba", "Aruba"),  # 0
+    ("AF", "AFG", "004", "Afghanistan", "Islamic Republic of Afghanistan"),  # 1
+    ("AO", "AGO", "024", "Angola", "Republic of Angola"),  # 2
+    ("AI", "AIA", "660", "Anguilla", "Anguilla"),  # 3
+    ("AX", "ALA", "248", "Åland Islands", "Åland Islands"),  # 4
+    ("AL", "ALB", "008", "Albania", "Republic of Albania"),  # 5
+    ("AD", "AND", "020", "Andorra", "Principality of Andorra"),  # 6
+    ("AE", "ARE", "784", "United Arab Emirates", "United Arab Emirates"),  # 7
+    ("AR", "ARG", "032", "Argentina", "Argentine Republic"),  # 8
+    ("AM", "ARM", "051", "Armenia", "Republic of Armenia"),  # 9
+    ("AS", "ASM", "016", "American Samoa", "American Samoa"),  # 10
+    ("AQ", "ATA", "010", "Antarctica", "Antarctica"),  # 11
+    ("TF", "ATF", "260", "French Southern Territories", "French Southern Territories"),  # 12
+    ("AG", "ATG", "028", "Antigua and Barbuda", "Antigua and Barbuda"),  # 13
+    ("AU", "AUS", "036", "Australia", "Australia"),  # 14
+    ("AT", "AUT", "040", "Austria", "Republic of Austria"),  # 15
+    ("AZ", "AZE", "031", "Azerbaijan", "Republic of Azerbaijan"),  # 16
+    ("BI", "BDI", "108", "Burundi", "Republic of Burundi"),  # 17
+    ("BE", "BEL", "056", "Belgium", "Kingdom of Belgium"),  # 18
+    ("BJ", "BEN", "204", "Benin", "Republic of Benin"),  # 19
+    ("BQ", "BES", "535", "Bonaire, Sint Eustatius and Saba", "Bonaire, Sint Eustatius and Saba"),  # 20
+    ("BF", "BFA", "854", "Burkina Faso", "Burkina Faso"),  # 21
+    ("BD", "BGD", "050", "Bangladesh", "People's Republic of Bangladesh"),  # 22
+    ("BG", "BGR", "100", "Bulgaria", "Republic of Bulgaria"),  # 23
+    ("BH", "BHR", "048", "Bahrain", "Kingdom of Bahrain"),  # 24
+    ("BS", "BHS", "044", "Bahamas", "Commonwealth of the Bahamas"),  # 25
+    ("BA", "BIH", "070", "Bosnia and Herzegovina", "Republic of Bosnia and Herzegovina"),  # 26
+    ("BL", "BLM", "652", "Saint Barthélemy", "Saint Barthélemy"),  # 27
+    ("BY", "BLR", "112", "Belarus", "Republic of Belarus"),  # 28
+    ("BZ", "BLZ", "084", "Belize", "Belize"),  # 29
+    ("BM", "BMU", "060", "Bermuda", "Bermuda"),  # 30
+    ("BO", "BOL", "068", "Bolivia, Plurinational State of", "Plurinational State of Bolivia"),  # 31
+    ("BR", "BRA", "076", "Brazil", "Federative Republic of Brazil"),  # 32
+    ("BB", "BRB", "052", "Barbados", "Barbados"),  # 33
+    ("BN", "BRN", "096", "Brunei Darussalam", "Brunei Darussalam"),  # 34
+    ("BT", "BTN", "064", "Bhutan", "Kingdom of Bhutan"),  # 35
+    ("BV", "BVT", "074", "Bouvet Island", "Bouvet Island"),  # 36
+    ("BW", "BWA", "072", "Botswana", "Republic of Botswana"),  # 37
+    ("CF", "CAF", "140", "Central African Republic", "Central African Republic"),  # 38
+    ("CA", "CAN", "124", "Canada", "Canada"),  # 39
+    ("CC", "CCK", "166", "Cocos (Keeling) Islands", "Cocos (Keeling) Islands"),  # 40
+    ("CH", "CHE", "756", "Switzerland", "Swiss Confederation"),  # 41
+    ("CL", "CHL", "152", "Chile", "Republic of Chile"),  # 42
+    ("CN", "CHN", "156", "China", "People's Republic of China"),  # 43
+    ("CI", "CIV", "384", "Côte d'Ivoire", "Republic of Côte d'Ivoire"),  # 44
+    ("CM", "CMR", "120", "Cameroon", "Republic of Cameroon"),  # 45
+    ("CD", "COD", "180", "Congo, The Democratic Republic of the", "Congo, The Democratic Republic of the"),  # 46
+    ("CG", "COG", "178", "Congo", "Republic of the Congo"),  # 47
+    ("CK", "COK", "184", "Cook Islands", "Cook Islands"),  # 48
+    ("CO", "COL", "170", "Colombia", "Republic of Colombia"),  # 49
+    ("KM", "COM", "174", "Comoros", "Union of the Comoros"),  # 50
+    ("CV", "CPV", "132", "Cabo Verde", "Republic of Cabo Verde"),  # 51
+    ("CR", "CRI", "188", "Costa Rica", "Republic of Costa Rica"),  # 52
+    ("CU", "CUB", "192", "Cuba", "Republic of Cuba"),  # 53
+    ("CW", "CUW", "531", "Curaçao", "Curaçao"),  # 54
+    ("CX", "CXR", "162", "Christmas Island", "Christmas Island"),  # 55
+    ("KY", "CYM", "136", "Cayman Islands", "Cayman Islands"),  # 56
+    ("CY", "CYP", "196", "Cyprus", "Republic of Cyprus"),  # 57
+    ("CZ", "CZE", "203", "Czechia", "Czech Republic"),  # 58
+    ("DE", "DEU", "276", "Germany", "Federal Republic of Germany"),  # 59
+    ("DJ", "DJI", "262", "Djibouti", "Republic of Djibouti"),  # 60
+    ("DM", "DMA", "212", "Dominica", "Commonwealth of Dominica"),  # 61
+    ("DK", "DNK", "208", "Denmark", "Kingdom of Denmark"),  # 62
+    ("DO", "DOM", "214", "Dominican Republic", "Dominican Republic"),  # 63
+    ("DZ", "DZA", "012", "Algeria", "People's Democratic Republic of Algeria"),  # 64
+    ("EC", "ECU", "218", "Ecuador", "Republic of Ecuador"),  # 65
+    ("EG", "EGY", "818", "Egypt", "Arab Republic of Egypt"),  # 66
+    ("ER", "ERI", "232", "Eritrea", "the State of Eritrea"),  # 67
+    ("EH", "ESH", "732", "Western Sahara", "Western Sahara"),  # 68
+    ("ES", "ESP", "724", "Spain", "Kingdom of Spain"),  # 69
+    ("EE", "EST", "233", "Estonia", "Republic of Estonia"),  # 70
+    ("ET", "ETH", "231", "Ethiopia", "Federal Democratic Republic of Ethiopia"),  # 71
+    ("FI", "FIN", "246", "Finland", "Republic of Finland"),  # 72
+    ("FJ", "FJI", "242", "Fiji", "Republic of Fiji"),  # 73
+    ("FK", "FLK", "238", "Falkland Islands (Malvinas)", "Falkland Islands (Malvinas)"),  # 74
+    ("FR", "FRA", "250", "France", "French Republic"),  # 75
+    ("FO", "FRO", "234", "Faroe Islands", "Faroe Islands"),  # 76
+    ("FM", "FSM", "583", "Micronesia, Federated States of", "Federated States of Micronesia"),  # 77
+    ("GA", "GAB", "266", "Gabon", "Gabonese Republic"),  # 78
+    ("GB", "GBR", "826", "United Kingdom", "United Kingdom of Great Britain and Northern Ireland"),  # 79
+    ("GE", "GEO", "268", "Georgia", "Georgia"),  # 80
+    ("GG", "GGY", "831", "Guernsey", "Guernsey"),  # 81
+    ("GH", "GHA", "288", "Ghana", "Republic of Ghana"),  # 82
+    ("GI", "GIB", "292", "Gibraltar", "Gibraltar"),  # 83
+    ("GN", "GIN", "324", "Guinea", "Republic of Guinea"),  # 84
+    ("GP", "GLP", "312", "Guadeloupe", "Guadeloupe"),  # 85
+    ("GM", "GMB", "270", "Gambia", "Republic of the Gambia"),  # 86
+    ("GW", "GNB", "624", "Guinea-Bissau", "Republic of Guinea-Bissau"),  # 87
+    ("GQ", "GNQ", "226", "Equatorial Guinea", "Republic of Equatorial Guinea"),  # 88
+    ("GR", "GRC", "300", "Greece", "Hellenic Republic"),  # 89
+    ("GD", "GRD", "308", "Grenada", "Grenada"),  # 90
+    ("GL", "GRL", "304", "Greenland", "Greenland"),  # 91
+    ("GT", "GTM", "320", "Guatemala", "Republic of Guatemala"),  # 92
+    ("GF", "GUF", "254", "French Guiana", "French Guiana"),  # 93
+    ("GU", "GUM", "316", "Guam", "Guam"),  # 94
+    ("GY", "GUY", "328", "Guyana", "Republic of Guyana"),  # 95
+    ("HK", "HKG", "344", "Hong Kong", "Hong Kong Special Administrative Region of China"),  # 96
+    ("HM", "HMD", "334", "Heard Island and McDonald Islands", "Heard Island and McDonald Islands"),  # 97
+    ("HN", "HND", "340", "Honduras", "Republic of Honduras"),  # 98
+    ("HR", "HRV", "191", "Croatia", "Republic of Croatia"),  # 99
+    ("HT", "HTI", "332", "Haiti", "Republic of Haiti"),  # 100
+    ("HU", "HUN", "348", "Hungary", "Hungary"),  # 101
+    ("ID", "IDN", "360", "Indonesia", "Republic of Indonesia"),  # 102
+    ("IM", "IMN", "833", "Isle of Man", "Isle of Man"),  # 103
+    ("IN", "IND", "356", "India", "Republic of India"),  # 104
+    ("IO", "IOT", "086", "British Indian Ocean Territory", "British Indian Ocean Territory"),  # 105
+    ("IE", "IRL", "372", "Ireland", "Ireland"),  # 106
+    ("IR", "IRN", "364", "Iran, Islamic Republic of", "Islamic Republic of Iran"),  # 107
+    ("IQ", "IRQ", "368", "Iraq", "Republic of Iraq"),  # 108
+    ("IS", "ISL", "352", "Iceland", "Republic of Iceland"),  # 109
+    ("IL", "ISR", "376", "Israel", "State of Israel"),  # 110
+    ("IT", "ITA", "380", "Italy", "Italian Republic"),  # 111
+    ("JM", "JAM", "388", "Jamaica", "Jamaica"),  # 112
+    ("JE", "JEY", "832", "Jersey", "Jersey"),  # 113
+    ("JO", "JOR", "400", "Jordan", "Hashemite Kingdom of Jordan"),  # 114
+    ("JP", "JPN", "392", "Japan", "Japan"),  # 115
+    ("KZ", "KAZ", "398", "Kazakhstan", "Republic of Kazakhstan"),  # 116
+    ("KE", "KEN", "404", "Kenya", "Republic of Kenya"),  # 117
+    ("KG", "KGZ", "417", "Kyrgyzstan", "Kyrgyz Republic"),  # 118
+    ("KH", "KHM", "116", "Cambodia", "Kingdom of Cambodia"),  # 119
+    ("KI", "KIR", "296", "Kiribati", "Republic of Kiribati"),  # 120
+    ("KN", "KNA", "659", "Saint Kitts and Nevis", "Saint Kitts and Nevis"),  # 121
+    ("KR", "KOR", "410", "Korea, Republic of", "Korea, Republic of"),  # 122
+    ("KW", "KWT", "414", "Kuwait", "State of Kuwait"),  # 123
+    ("LA", "LAO", "418", "Lao People's Democratic Republic", "Lao People's Democratic Republic"),  # 124
+    ("LB", "LBN", "422", "Lebanon", "Lebanese Republic"),  # 125
+    ("LR", "LBR", "430", "Liberia", "Republic of Liberia"),  # 126
+    ("LY", "LBY", "434", "Libya", "Libya"),  # 127
+    ("LC", "LCA", "662", "Saint Lucia", "Saint Lucia"),  # 128
+    ("LI", "LIE", "438", "Liechtenstein", "Principality of Liechtenstein"),  # 129
+    ("LK", "LKA", "144", "Sri Lanka", "Democratic Socialist Republic of Sri Lanka"),  # 130
+    ("LS", "LSO", "426", "Lesotho", "Kingdom of Lesotho"),  # 131
+    ("LT", "LTU", "440", "Lithuania", "Republic of Lithuania"),  # 132
+    ("LU", "LUX", "442", "Luxembourg", "Grand Duchy of Luxembourg"),  # 133
+    ("LV", "LVA", "428", "Latvia", "Republic of Latvia"),  # 134
+    ("MO", "MAC", "446", "Macao", "Macao Special Administrative Region of China"),  # 135
+    ("MF", "MAF", "663", "Saint Martin (French part)", "Saint Martin (French part)"),  # 136
+    ("MA", "MAR", "504", "Morocco", "Kingdom of Morocco"),  # 137
+    ("MC", "MCO", "492", "Monaco", "Principality of Monaco"),  # 138
+    ("MD", "MDA", "498", "Moldova, Republic of", "Republic of Moldova"),  # 139
+    ("MG", "MDG", "450", "Madagascar", "Republic of Madagascar"),  # 140
+    ("MV", "MDV", "462", "Maldives", "Republic of Maldives"),  # 141
+    ("MX", "MEX", "484", "Mexico", "United Mexican States"),  # 142
+    ("MH", "MHL", "584", "Marshall Islands", "Republic of the Marshall Islands"),  # 143
+    ("MK", "MKD", "807", "North Macedonia", "Republic of North Macedonia"),  # 144
+    ("ML", "MLI", "466", "Mali", "Republic of Mali"),  # 145
+    ("MT", "MLT", "470", "Malta", "Republic of Malta"),  # 146
+    ("MM", "MMR", "104", "Myanmar", "Republic of Myanmar"),  # 147
+    ("ME", "MNE", "499", "Montenegro", "Montenegro"),  # 148
+    ("MN", "MNG", "496", "Mongolia", "Mongolia"),  # 149
+    ("MP", "MNP", "580", "Northern Mariana Islands", "Commonwealth of the Northern Mariana Islands"),  # 150
+    ("MZ", "MOZ", "508", "Mozambique", "Republic of Mozambique"),  # 151
+    ("MR", "MRT", "478", "Mauritania", "Islamic Republic of Mauritania"),  # 152
+    ("MS", "MSR", "500", "Montserrat", "Montserrat"),  # 153
+    ("MQ", "MTQ", "474", "Martinique", "Martinique"),  # 154
+    ("MU", "MUS", "480", "Mauritius", "Republic of Mauritius"),  # 155
+    ("MW", "MWI", "454", "Malawi", "Republic of Malawi"),  # 156
+    ("MY", "MYS", "458", "Malaysia", "Malaysia"),  # 157
+    ("YT", "MYT", "175", "Mayotte", "Mayotte"),  # 158
+    ("NA", "NAM", "516", "Namibia", "Republic of Namibia"),  # 159
+    ("NC", "NCL", "540", "New Caledonia", "New Caledonia"),  # 160
+    ("NE", "NER", "562", "Niger", "Republic of the Niger"),  # 161
+    ("NF", "NFK", "574", "Norfolk Island", "Norfolk Island"),  # 162
+    ("NG", "NGA", "566", "Nigeria", "Federal Republic of Nigeria"),  # 163
+    ("NI", "NIC", "558", "Nicaragua", "Republic of Nicaragua"),  # 164
+    ("NU", "NIU", "570", "Niue", "Niue"),  # 165
+    ("NL", "NLD", "528", "Netherlands", "Kingdom of the Netherlands"),  # 166
+    ("NO", "NOR", "578", "Norway", "Kingdom of Norway"),  # 167
+    ("NP", "NPL", "524", "Nepal", "Federal Democratic Republic of Nepal"),  # 168
+    ("NR", "NRU", "520", "Nauru", "Republic of Nauru"),  # 169
+    ("NZ", "NZL", "554", "New Zealand", "New Zealand"),  # 170
+    ("OM", "OMN", "512", "Oman", "Sultanate of Oman"),  # 171
+    ("PK", "PAK", "586", "Pakistan", "Islamic Republic of Pakistan"),  # 172
+    ("PA", "PAN", "591", "Panama", "Republic of Panama"),  # 173
+    ("PN", "PCN", "612", "Pitcairn", "Pitcairn"),  # 174
+    ("PE", "PER", "604", "Peru", "Republic of Peru"),  # 175
+    ("PH", "PHL", "608", "Philippines", "Republic of the Philippines"),  # 176
+    ("PW", "PLW", "585", "Palau", "Republic of Palau"),  # 177
+    ("PG", "PNG", "598", "Papua New Guinea", "Independent State of Papua New Guinea"),  # 178
+    ("PL", "POL", "616", "Poland", "Republic of Poland"),  # 179
+    ("PR", "PRI", "630", "Puerto Rico", "Puerto Rico"),  # 180
+    ("KP", "PRK", "408", "Korea, Democratic People's Republic of", "Democratic People's Republic of Korea"),  # 181
+    ("PT", "PRT", "620", "Portugal", "Portuguese Republic"),  # 182
+    ("PY", "PRY", "600", "Paraguay", "Republic of Paraguay"),  # 183
+    ("PS", "PSE", "275", "Palestine, State of", "the State of Palestine"),  # 184
+    ("PF", "PYF", "258", "French Polynesia", "French Polynesia"),  # 185
+    ("QA", "QAT", "634", "Qatar", "State of Qatar"),  # 186
+    ("RE", "REU", "638", "Réunion", "Réunion"),  # 187
+    ("RO", "ROU", "642", "Romania", "Romania"),  # 188
+    ("RU", "RUS", "643", "Russian Federation", "Russian Federation"),  # 189
+    ("RW", "RWA", "646", "Rwanda", "Rwandese Republic"),  # 190
+    ("SA", "SAU", "682", "Saudi Arabia", "Kingdom of Saudi Arabia"),  # 191
+    ("SD", "SDN", "729", "Sudan", "Republic of the Sudan"),  # 192
+    ("SN", "SEN", "686", "Senegal", "Republic of Senegal"),  # 193
+    ("SG", "SGP", "702", "Singapore", "Republic of Singapore"),  # 194
+    ("GS", "SGS", "239", "South Georgia and the South Sandwich Islands", "South Georgia and the South Sandwich Islands"),  # 195
+    ("SH", "SHN", "654", "Saint Helena, Ascension and Tristan da Cunha", "Saint Helena, Ascension and Tristan da Cunha"),  # 196
+    ("SJ", "SJM", "744", "Svalbard and Jan Mayen", "Svalbard and Jan Mayen"),  # 197
+    ("SB", "SLB", "090", "Solomon Islands", "Solomon Islands"),  # 198
+    ("SL", "SLE", "694", "Sierra Leone", "Republic of Sierra Leone"),  # 199
+    ("SV", "SLV", "222", "El Salvador", "Republic of El Salvador"),  # 200
+    ("SM", "SMR", "674", "San Marino", "Republic of San Marino"),  # 201
+    ("SO", "SOM", "706", "Somalia", "Federal Republic of Somalia"),  # 202
+    ("PM", "SPM", "666", "Saint Pierre and Miquelon", "Saint Pierre and Miquelon"),  # 203
+    ("RS", "SRB", "688", "Serbia", "Republic of Serbia"),  # 204
+    ("SS", "SSD", "728", "South Sudan", "Republic of South Sudan"),  # 205
+    ("ST", "STP", "678", "Sao Tome and Principe", "Democratic Republic of Sao Tome and Principe"),  # 206
+    ("SR", "SUR", "740", "Suriname", "Republic of Suriname"),  # 207
+    ("SK", "SVK", "703", "Slovakia", "Slovak Republic"),  # 208
+    ("SI", "SVN", "705", "Slovenia", "Republic of Slovenia"),  # 209
+    ("SE", "SWE", "752", "Sweden", "Kingdom of Sweden"),  # 210
+    ("SZ", "SWZ", "748", "Eswatini", "Kingdom of Eswatini"),  # 211
+    ("SX", "SXM", "534", "Sint Maarten (Dutch part)", "Sint Maarten (Dutch part)"),  # 212
+    ("SC", "SYC", "690", "Seychelles", "Republic of Seychelles"),  # 213
+    ("SY", "SYR", "760", "Syrian Arab Republic", "Syrian Arab Republic"),  # 214
+    ("TC", "TCA", "796", "Turks and Caicos Islands", "Turks and Caicos Islands"),  # 215
+    ("TD", "TCD", "148", "Chad", "Republic of Chad"),  # 216
+    ("TG", "TGO", "768", "Togo", "Togolese Republic"),  # 217
+    ("TH", "THA", "764", "Thailand", "Kingdom of Thailand"),  # 218
+    ("TJ", "TJK", "762", "Tajikistan", "Republic of Tajikistan"),  # 219
+    ("TK", "TKL", "772", "Tokelau", "Tokelau"),  # 220
+    ("TM", "TKM", "795", "Turkmenistan", "Turkmenistan"),  # 221
+    ("TL", "TLS", "626", "Timor-Leste", "Democratic Republic of Timor-Leste"),  # 222
+    ("TO", "TON", "776", "Tonga", "Kingdom of Tonga"),  # 223
+    ("TT", "TTO", "780", "Trinidad and Tobago", "Republic of Trinidad and Tobago"),  # 224
+    ("TN", "TUN", "788", "Tunisia", "Republic of Tunisia"),  # 225
+    ("TR", "TUR", "792", "Türkiye", "Republic of Türkiye"),  # 226
+    ("TV", "TUV", "798", "Tuvalu", "Tuvalu"),  # 227
+    ("TW", "TWN", "158", "Taiwan, Province of China", "Taiwan, Province of China"),  # 228
+    ("TZ", "TZA", "834", "Tanzania, United Republic of", "United Republic of Tanzania"),  # 229
+    ("UG", "UGA", "800", "Uganda", "Republic of Uganda"),  # 230
+    ("UA", "UKR", "804", "Ukraine", "Ukraine"),  # 231
+    ("UM", "UMI", "581", "United States Minor Outlying Islands", "United States Minor Outlying Islands"),  # 232
+    ("UY", "URY", "858", "Uruguay", "Eastern Republic of Uruguay"),  # 233
+    ("US", "USA", "840", "United States", "United States of America"),  # 234
+    ("UZ", "UZB", "860", "Uzbekistan", "Republic of Uzbekistan"),  # 235
+    ("VA", "VAT", "336", "Holy See (Vatican City State)", "Holy See (Vatican City State)"),  # 236
+    ("VC", "VCT", "670", "Saint Vincent and the Grenadines", "Saint Vincent and the Grenadines"),  # 237
+    ("VE", "VEN", "862", "Venezuela, Bolivarian Republic of", "Bolivarian Republic of Venezuela"),  # 238
+    ("VG", "VGB", "092", "Virgin Islands, British", "British Virgin Islands"),  # 239
+    ("VI", "VIR", "850", "Virgin Islands, U.S.", "Virgin Islands of the United States"),  # 240
+    ("VN", "VNM", "704", "Viet Nam", "Socialist Republic of Viet Nam"),  # 241
+    ("VU", "VUT", "548", "Vanuatu", "Republic of Vanuatu"),  # 242
+    ("WF", "WLF", "876", "Wallis and Futuna", "Wallis and Futuna"),  # 243
+    ("WS", "WSM", "882", "Samoa", "Independent State of Samoa"),  # 244
+    ("YE", "YEM", "887", "Yemen", "Republic of Yemen"),  # 245
+    ("ZA", "ZAF", "710", "South Africa", "Republic of South Africa"),  # 246
+    ("ZM", "ZMB", "894", "Zambia", "Republic of Zambia"),  # 247
+    ("ZW", "ZWE", "716", "Zimbabwe", "Republic of Zimbabwe"),  # 248
+)
+
+COUNTRIES_INDEX: dict[str, int] = {
+    "004": 1,
+    "008": 5,
+    "010": 11,
+    "012": 64,
+    "016": 10,
+    "020": 6,
+    "024": 2,
+    "028": 13,
+    "031": 16,
+    "032": 8,
+    "036": 14,
+    "040": 15,
+    "044": 25,
+    "048": 24,
+    "050": 22,
+    "051": 9,
+    "052": 33,
+    "056": 18,
+    "060": 30,
+    "064": 35,
+    "068": 31,
+    "070": 26,
+    "072": 37,
+    "074": 36,
+    "076": 32,
+    "084": 29,
+    "086": 105,
+    "090": 198,
+    "092": 239,
+    "096": 34,
+    "100": 23,
+    "104": 147,
+    "108": 17,
+    "112": 28,
+    "116": 119,
+    "120": 45,
+    "124": 39,
+    "132": 51,
+    "136": 56,
+    "140": 38,
+    "144": 130,
+    "148": 216,
+    "152": 42,
+    "156": 43,
+    "158": 228,
+    "162": 55,
+    "166": 40,
+    "170": 49,
+    "174": 50,
+    "175": 158,
+    "178": 47,
+    "180": 46,
+    "184": 48,
+    "188": 52,
+    "191": 99,
+    "192": 53,
+    "196": 57,
+    "203": 58,
+    "204": 19,
+    "208": 62,
+    "212": 61,
+    "214": 63,
+    "218": 65,
+    "222": 200,
+    "226": 88,
+    "231": 71,
+    "232": 67,
+    "233": 70,
+    "234": 76,
+    "238": 74,
+    "239": 195,
+    "242": 73,
+    "246": 72,
+    "248": 4,
+    "250": 75,
+    "254": 93,
+    "258": 185,
+    "260": 12,
+    "262": 60,
+    "266": 78,
+    "268": 80,
+    "270": 86,
+    "275": 184,
+    "276": 59,
+    "288": 82,
+    "292": 83,
+    "296": 120,
+    "300": 89,
+    "304": 91,
+    "308": 90,
+    "312": 85,
+    "316": 94,
+    "320": 92,
+    "324": 84,
+    "328": 95,
+    "332": 100,
+    "334": 97,
+    "336": 236,
+    "340": 98,
+    "344": 96,
+    "348": 101,
+    "352": 109,
+    "356": 104,
+    "360": 102,
+    "364": 107,
+    "368": 108,
+    "372": 106,
+    "376": 110,
+    "380": 111,
+    "384": 44,
+    "388": 112,
+    "392": 115,
+    "398": 116,
+    "400": 114,
+    "404": 117,
+    "408": 181,
+    "410": 122,
+    "414": 123,
+    "417": 118,
+    "418": 124,
+    "422": 125,
+    "426": 131,
+    "428": 134,
+    "430": 126,
+    "434": 127,
+    "438": 129,
+    "440": 132,
+    "442": 133,
+    "446": 135,
+    "450": 140,
+    "454": 156,
+    "458": 157,
+    "462": 141,
+    "466": 145,
+    "470": 146,
+    "474": 154,
+    "478": 152,
+    "480": 155,
+    "484": 142,
+    "492": 138,
+    "496": 149,
+    "498": 139,
+    "499": 148,
+    "500": 153,
+    "504": 137,
+    "508": 151,
+    "512": 171,
+    "516": 159,
+    "520": 169,
+    "524": 168,
+    "528": 166,
+    "531": 54,
+    "533": 0,
+    "534": 212,
+    "535": 20,
+    "540": 160,
+    "548": 242,
+    "554": 170,
+    "558": 164,
+    "562": 161,
+    "566": 163,
+    "570": 165,
+    "574": 162,
+    "578": 167,
+    "580": 150,
+    "581": 232,
+    "583": 77,
+    "584": 143,
+    "585": 177,
+    "586": 172,
+    "591": 173,
+    "598": 178,
+    "600": 183,
+    "604": 175,
+    "608": 176,
+    "612": 174,
+    "616": 179,
+    "620": 182,
+    "624": 87,
+    "626": 222,
+    "630": 180,
+    "634": 186,
+    "638": 187,
+    "642": 188,
+    "643": 189,
+    "646": 190,
+    "652": 27,
+    "654": 196,
+    "659": 121,
+    "660": 3,
+    "662": 128,
+    "663": 136,
+    "666": 203,
+    "670": 237,
+    "674": 201,
+    "678": 206,
+    "682": 191,
+    "686": 193,
+    "688": 204,
+    "690": 213,
+    "694": 199,
+    "702": 194,
+    "703": 208,
+    "704": 241,
+    "705": 209,
+    "706": 202,
+    "710": 246,
+    "716": 248,
+    "724": 69,
+    "728": 205,
+    "729": 192,
+    "732": 68,
+    "740": 207,
+    "744": 197,
+    "748": 211,
+    "752": 210,
+    "756": 41,
+    "760": 214,
+    "762": 219,
+    "764": 218,
+    "768": 217,
+    "772": 220,
+    "776": 223,
+    "780": 224,
+    "784": 7,
+    "788": 225,
+    "792": 226,
+    "795": 221,
+    "796": 215,
+    "798": 227,
+    "800": 230,
+    "804": 231,
+    "807": 144,
+    "818": 66,
+    "826": 79,
+    "831": 81,
+    "832": 113,
+    "833": 103,
+    "834": 229,
+    "840": 234,
+    "850": 240,
+    "854": 21,
+    "858": 233,
+    "860": 235,
+    "862": 238,
+    "876": 243,
+    "882": 244,
+    "887": 245,
+    "894": 247,
+    "abw": 0,
+    "ad": 6,
+    "ae": 7,
+    "af": 1,
+    "afg": 1,
+    "afghanistan": 1,
+    "ag": 13,
+    "ago": 2,
+    "ai": 3,
+    "aia": 3,
+    "al": 5,
+    "ala": 4,
+    "alb": 5,
+    "albania": 5,
+    "algeria": 64,
+    "am": 9,
+    "american samoa": 10,
+    "and": 6,
+    "andorra": 6,
+    "angola": 2,
+    "anguilla": 3,
+    "antarctica": 11,
+    "antigua and barbuda": 13,
+    "ao": 2,
+    "aq": 11,
+    "ar": 8,
+    "arab republic of egypt": 66,
+    "are": 7,
+    "arg": 8,
+    "argentina": 8,
+    "argentine republic": 8,
+    "arm": 9,
+    "armenia": 9,
+    "aruba": 0,
+    "as": 10,
+    "asm": 10,
+    "at": 15,
+    "ata": 11,
+    "atf": 12,
+    "atg": 13,
+    "au": 14,
+    "aus": 14,
+    "australia": 14,
+    "austria": 15,
+    "aut": 15,
+    "aw": 0,
+    "ax": 4,
+    "az": 16,
+    "aze": 16,
+    "azerbaijan": 16,
+    "ba": 26,
+    "bahamas": 25,
+    "bahrain": 24,
+    "bangladesh": 22,
+    "barbados": 33,
+    "bb": 33,
+    "bd": 22,
+    "bdi": 17,
+    "be": 18,
+    "bel": 18,
+    "belarus": 28,
+    "belgium": 18,
+    "belize": 29,
+    "ben": 19,
+    "benin": 19,
+    "bermuda": 30,
+    "bes": 20,
+    "bf": 21,
+    "bfa": 21,
+    "bg": 23,
+    "bgd": 22,
+    "bgr": 23,
+    "bh": 24,
+    "bhr": 24,
+    "bhs": 25,
+    "bhutan": 35,
+    "bi": 17,
+    "bih": 26,
+    "bj": 19,
+    "bl": 27,
+    "blm": 27,
+    "blr": 28,
+    "blz": 29,
+    "bm": 30,
+    "bmu": 30,
+    "bn": 34,
+    "bo": 31,
+    "bol": 31,
+    "bolivarian republic of venezuela": 238,
+    "bolivia": 31,
+    "bolivia, plurinational state of": 31,
+    "bonaire, sint eustatius and saba": 20,
+    "bosnia and herzegovina": 26,
+    "botswana": 37,
+    "bouvet island": 36,
+    "bq": 20,
+    "br": 32,
+    "bra": 32,
+    "brazil": 32,
+    "brb": 33,
+    "british indian ocean territory": 105,
+    "british virgin islands": 239,
+    "brn": 34,
+    "brunei darussalam": 34,
+    "bs": 25,
+    "bt": 35,
+    "btn": 35,
+    "bulgaria": 23,
+    "burkina faso": 21,
+    "burundi": 17,
+    "bv": 36,
+    "bvt": 36,
+    "bw": 37,
+    "bwa": 37,
+    "by": 28,
+    "bz": 29,
+    "ca": 39,
+    "cabo verde": 51,
+    "caf": 38,
+    "cambodia": 119,
+    "cameroon": 45,
+    "can": 39,
+    "canada": 39,
+    "cayman islands": 56,
+    "cc": 40,
+    "cck": 40,
+    "cd": 46,
+    "central african republic": 38,
+    "cf": 38,
+    "cg": 47,
+    "ch": 41,
+    "chad": 216,
+    "che": 41,
+    "chile": 42,
+    "china": 43,
+    "chl": 42,
+    "chn": 43,
+    "christmas island": 55,
+    "ci": 44,
+    "civ": 44,
+    "ck": 48,
+    "cl": 42,
+    "cm": 45,
+    "cmr": 45,
+    "cn": 43,
+    "co": 49,
+    "cocos (keeling) islands": 40,
+    "cod": 46,
+    "cog": 47,
+    "cok": 48,
+    "col": 49,
+    "colombia": 49,
+    "com": 50,
+    "commonwealth of dominica": 61,
+    "commonwealth of the bahamas": 25,
+    "commonwealth of the northern mariana islands": 150,
+    "comoros": 50,
+    "congo": 47,
+    "congo, the democratic republic of the": 46,
+    "cook islands": 48,
+    "costa rica": 52,
+    "cpv": 51,
+    "cr": 52,
+    "cri": 52,
+    "croatia": 99,
+    "cu": 53,
+    "cub": 53,
+    "cuba": 53,
+    "curaçao": 54,
+    "cuw": 54,
+    "cv": 51,
+    "cw": 54,
+    "cx": 55,
+    "cxr": 55,
+    "cy": 57,
+    "cym": 56,
+    "cyp": 57,
+    "cyprus": 57,
+    "cz": 58,
+    "cze": 58,
+    "czech republic": 58,
+    "czechia": 58,
+    "côte d'ivoire": 44,
+    "de": 59,
+    "democratic people's republic of korea": 181,
+    "democratic republic of sao tome and principe": 206,
+    "democratic republic of timor-leste": 222,
+    "democratic socialist republic of sri lanka": 130,
+    "denmark": 62,
+    "deu": 59,
+    "dj": 60,
+    "dji": 60,
+    "djibouti": 60,
+    "dk": 62,
+    "dm": 61,
+    "dma": 61,
+    "dnk": 62,
+    "do": 63,
+    "dom": 63,
+    "dominica": 61,
+    "dominican republic": 63,
+    "dz": 64,
+    "dza": 64,
+    "eastern republic of uruguay": 233,
+    "ec": 65,
+    "ecu": 65,
+    "ecuador": 65,
+    "ee": 70,
+    "eg": 66,
+    "egy": 66,
+    "egypt": 66,
+    "eh": 68,
+    "el salvador": 200,
+    "equatorial guinea": 88,
+    "er": 67,
+    "eri": 67,
+    "eritrea": 67,
+    "es": 69,
+    "esh": 68,
+    "esp": 69,
+    "est": 70,
+    "estonia": 70,
+    "eswatini": 211,
+    "et": 71,
+    "eth": 71,
+    "ethiopia": 71,
+    "falkland islands (malvinas)": 74,
+    "faroe islands": 76,
+    "federal democratic republic of ethiopia": 71,
+    "federal democratic republic of nepal": 168,
+    "federal republic of germany": 59,
+    "federal republic of nigeria": 163,
+    "federal republic of somalia": 202,
+    "federated states of micronesia": 77,
+    "federative republic of brazil": 32,
+    "fi": 72,
+    "fiji": 73,
+    "fin": 72,
+    "finland": 72,
+    "fj": 73,
+    "fji": 73,
+    "fk": 74,
+    "flk": 74,
+    "fm": 77,
+    "fo": 76,
+    "fr": 75,
+    "fra": 75,
+    "france": 75,
+    "french guiana": 93,
+    "french polynesia": 185,
+    "french republic": 75,
+    "french southern territories": 12,
+    "fro": 76,
+    "fsm": 77,
+    "ga": 78,
+    "gab": 78,
+    "gabon": 78,
+    "gabonese republic": 78,
+    "gambia": 86,
+    "gb": 79,
+    "gbr": 79,
+    "gd": 90,
+    "ge": 80,
+    "geo": 80,
+    "georgia": 80,
+    "germany": 59,
+    "gf": 93,
+    "gg": 81,
+    "ggy": 81,
+    "gh": 82,
+    "gha": 82,
+    "ghana": 82,
+    "gi": 83,
+    "gib": 83,
+    "gibraltar": 83,
+    "gin": 84,
+    "gl": 91,
+    "glp": 85,
+    "gm": 86,
+    "gmb": 86,
+    "gn": 84,
+    "gnb": 87,
+    "gnq": 88,
+    "gp": 85,
+    "gq": 88,
+    "gr": 89,
+    "grand duchy of luxembourg": 133,
+    "grc": 89,
+    "grd": 90,
+    "greece": 89,
+    "greenland": 91,
+    "grenada": 90,
+    "grl": 91,
+    "gs": 195,
+    "gt": 92,
+    "gtm": 92,
+    "gu": 94,
+    "guadeloupe": 85,
+    "guam": 94,
+    "guatemala": 92,
+    "guernsey": 81,
+    "guf": 93,
+    "guinea": 84,
+    "guinea-bissau": 87,
+    "gum": 94,
+    "guy": 95,
+    "guyana": 95,
+    "gw": 87,
+    "gy": 95,
+    "haiti": 100,
+    "hashemite kingdom of jordan": 114,
+    "heard island and mcdonald islands": 97,
+    "hellenic republic": 89,
+    "hk": 96,
+    "hkg": 96,
+    "hm": 97,
+    "hmd": 97,
+    "hn": 98,
+    "hnd": 98,
+    "holy see (vatican city state)": 236,
+    "honduras": 98,
+    "hong kong": 96,
+    "hong kong special administrative region of china": 96,
+    "hr": 99,
+    "hrv": 99,
+    "ht": 100,
+    "hti": 100,
+    "hu": 101,
+    "hun": 101,
+    "hungary": 101,
+    "iceland": 109,
+    "id": 102,
+    "idn": 102,
+    "ie": 106,
+    "il": 110,
+    "im": 103,
+    "imn": 103,
+    "in": 104,
+    "ind": 104,
+    "independent state of papua new guinea": 178,
+    "independent state of samoa": 244,
+    "india": 104,
+    "indonesia": 102,
+    "io": 105,
+    "iot": 105,
+    "iq": 108,
+    "ir": 107,
+    "iran": 107,
+    "iran, islamic republic of": 107,
+    "iraq": 108,
+    "ireland": 106,
+    "irl": 106,
+    "irn": 107,
+    "irq": 108,
+    "is": 109,
+    "isl": 109,
+    "islamic republic of afghanistan": 1,
+    "islamic republic of iran": 107,
+    "islamic republic of mauritania": 152,
+    "islamic republic of pakistan": 172,
+    "isle of man": 103,
+    "isr": 110,
+    "israel": 110,
+    "it": 111,
+    "ita": 111,
+    "italian republic": 111,
+    "italy": 111,
+    "jam": 112,
+    "jamaica": 112,
+    "japan": 115,
+    "je": 113,
+    "jersey": 113,
+    "jey": 113,
+    "jm": 112,
+    "jo": 114,
+    "jor": 114,
+    "jordan": 114,
+    "jp": 115,
+    "jpn": 115,
+    "kaz": 116,
+    "kazakhstan": 116,
+    "ke": 117,
+    "ken": 117,
+    "kenya": 117,
+    "kg": 118,
+    "kgz": 118,
+    "kh": 119,
+    "khm": 119,
+    "ki": 120,
+    "kingdom of bahrain": 24,
+    "kingdom of belgium": 18,
+    "kingdom of bhutan": 35,
+    "kingdom of cambodia": 119,
+    "kingdom of denmark": 62,
+    "kingdom of eswatini": 211,
+    "kingdom of lesotho": 131,
+    "kingdom of morocco": 137,
+    "kingdom of norway": 167,
+    "kingdom of saudi arabia": 191,
+    "kingdom of spain": 69,
+    "kingdom of sweden": 210,
+    "kingdom of thailand": 218,
+    "kingdom of the netherlands": 166,
+    "kingdom of tonga": 223,
+    "kir": 120,
+    "kiribati": 120,
+    "km": 50,
+    "kn": 121,
+    "kna": 121,
+    "kor": 122,
+    "korea, democratic people's republic of": 181,
+    "korea, republic of": 122,
+    "kp": 181,
+    "kr": 122,
+    "kuwait": 123,
+    "kw": 123,
+    "kwt": 123,
+    "ky": 56,
+    "kyrgyz republic": 118,
+    "kyrgyzstan": 118,
+    "kz": 116,
+    "la": 124,
+    "lao": 124,
+    "lao people's democratic republic": 124,
+    "laos": 124,
+    "latvia": 134,
+    "lb": 125,
+    "lbn": 125,
+    "lbr": 126,
+    "lby": 127,
+    "lc": 128,
+    "lca": 128,
+    "lebanese republic": 125,
+    "lebanon": 125,
+    "lesotho": 131,
+    "li": 129,
+    "liberia": 126,
+    "libya": 127,
+    "lie": 129,
+    "liechtenstein": 129,
+    "lithuania": 132,
+    "lk": 130,
+    "lka": 130,
+    "lr": 126,
+    "ls": 131,
+    "lso": 131,
+    "lt": 132,
+    "ltu": 132,
+    "lu": 133,
+    "lux": 133,
+    "luxembourg": 133,
+    "lv": 134,
+    "lva": 134,
+    "ly": 127,
+    "ma": 137,
+    "mac": 135,
+    "macao": 135,
+    "macao special administrative region of china": 135,
+    "madagascar": 140,
+    "maf": 136,
+    "malawi": 156,
+    "malaysia": 157,
+    "maldives": 141,
+    "mali": 145,
+    "malta": 146,
+    "mar": 137,
+    "marshall islands": 143,
+    "martinique": 154,
+    "mauritania": 152,
+    "mauritius": 155,
+    "mayotte": 158,
+    "mc": 138,
+    "mco": 138,
+    "md": 139,
+    "mda": 139,
+    "mdg": 140,
+    "mdv": 141,
+    "me": 148,
+    "mex": 142,
+    "mexico": 142,
+    "mf": 136,
+    "mg": 140,
+    "mh": 143,
+    "mhl": 143,
+    "micronesia, federated states of": 77,
+    "mk": 144,
+    "mkd": 144,
+    "ml": 145,
+    "mli": 145,
+    "mlt": 146,
+    "mm": 147,
+    "mmr": 147,
+    "mn": 149,
+    "mne": 148,
+    "mng": 149,
+    "mnp": 150,
+    "mo": 135,
+    "moldova": 139,
+    "moldova, republic of": 139,
+    "monaco": 138,
+    "mongolia": 149,
+    "montenegro": 148,
+    "montserrat": 153,
+    "morocco": 137,
+    "moz": 151,
+    "mozambique": 151,
+    "mp": 150,
+    "mq": 154,
+    "mr": 152,
+    "mrt": 152,
+    "ms": 153,
+    "msr": 153,
+    "mt": 146,
+    "mtq": 154,
+    "mu": 155,
+    "mus": 155,
+    "mv": 141,
+    "mw": 156,
+    "mwi": 156,
+    "mx": 142,
+    "my": 157,
+    "myanmar": 147,
+    "mys": 157,
+    "myt": 158,
+    "mz": 151,
+    "na": 159,
+    "nam": 159,
+    "namibia": 159,
+    "nauru": 169,
+    "nc": 160,
+    "ncl": 160,
+    "ne": 161,
+    "nepal": 168,
+    "ner": 161,
+    "netherlands": 166,
+    "new caledonia": 160,
+    "new zealand": 170,
+    "nf": 162,
+    "nfk": 162,
+    "ng": 163,
+    "nga": 163,
+    "ni": 164,
+    "nic": 164,
+    "nicaragua": 164,
+    "niger": 161,
+    "nigeria": 163,
+    "niu": 165,
+    "niue": 165,
+    "nl": 166,
+    "nld": 166,
+    "no": 167,
+    "nor": 167,
+    "norfolk island": 162,
+    "north korea": 181,
+    "north macedonia": 144,
+    "northern mariana islands": 150,
+    "norway": 167,
+    "np": 168,
+    "npl": 168,
+    "nr": 169,
+    "nru": 169,
+    "nu": 165,
+    "nz": 170,
+    "nzl": 170,
+    "om": 171,
+    "oman": 171,
+    "omn": 171,
+    "pa": 173,
+    "pak": 172,
+    "pakistan": 172,
+    "palau": 177,
+    "palestine, state of": 184,
+    "pan": 173,
+    "panama": 173,
+    "papua new guinea": 178,
+    "paraguay": 183,
+    "pcn": 174,
+    "pe": 175,
+    "people's democratic republic of algeria": 64,
+    "people's republic of bangladesh": 22,
+    "people's republic of china": 43,
+    "per": 175,
+    "peru": 175,
+    "pf": 185,
+    "pg": 178,
+    "ph": 176,
+    "philippines": 176,
+    "phl": 176,
+    "pitcairn": 174,
+    "pk": 172,
+    "pl": 179,
+    "plurinational state of bolivia": 31,
+    "plw": 177,
+    "pm": 203,
+    "pn": 174,
+    "png": 178,
+    "pol": 179,
+    "poland": 179,
+    "portugal": 182,
+    "portuguese republic": 182,
+    "pr": 180,
+    "pri": 180,
+    "principality of andorra": 6,
+    "principality of liechtenstein": 129,
+    "principality of monaco": 138,
+    "prk": 181,
+    "prt": 182,
+    "pry": 183,
+    "ps": 184,
+    "pse": 184,
+    "pt": 182,
+    "puerto rico": 180,
+    "pw": 177,
+    "py": 183,
+    "pyf": 185,
+    "qa": 186,
+    "qat": 186,
+    "qatar": 186,
+    "re": 187,
+    "republic of albania": 5,
+    "republic of angola": 2,
+    "republic of armenia": 9,
+    "republic of austria": 15,
+    "republic of azerbaijan": 16,
+    "republic of belarus": 28,
+    "republic of benin": 19,
+    "republic of bosnia and herzegovina": 26,
+    "republic of botswana": 37,
+    "republic of bulgaria": 23,
+    "republic of burundi": 17,
+    "republic of cabo verde": 51,
+    "republic of cameroon": 45,
+    "republic of chad": 216,
+    "republic of chile": 42,
+    "republic of colombia": 49,
+    "republic of costa rica": 52,
+    "republic of croatia": 99,
+    "republic of cuba": 53,
+    "republic of cyprus": 57,
+    "republic of côte d'ivoire": 44,
+    "republic of djibouti": 60,
+    "republic of ecuador": 65,
+    "republic of el salvador": 200,
+    "republic of equatorial guinea": 88,
+    "republic of estonia": 70,
+    "republic of fiji": 73,
+    "republic of finland": 72,
+    "republic of ghana": 82,
+    "republic of guatemala": 92,
+    "republic of guinea": 84,
+    "republic of guinea-bissau": 87,
+    "republic of guyana": 95,
+    "republic of haiti": 100,
+    "republic of honduras": 98,
+    "republic of iceland": 109,
+    "republic of india": 104,
+    "republic of indonesia": 102,
+    "republic of iraq": 108,
+    "republic of kazakhstan": 116,
+    "republic of kenya": 117,
+    "republic of kiribati": 120,
+    "republic of latvia": 134,
+    "republic of liberia": 126,
+    "republic of lithuania": 132,
+    "republic of madagascar": 140,
+    "republic of malawi": 156,
+    "republic of maldives": 141,
+    "republic of mali": 145,
+    "republic of malta": 146,
+    "republic of mauritius": 155,
+    "republic of moldova": 139,
+    "republic of mozambique": 151,
+    "republic of myanmar": 147,
+    "republic of namibia": 159,
+    "republic of nauru": 169,
+    "republic of nicaragua": 164,
+    "republic of north macedonia": 144,
+    "republic of palau": 177,
+    "republic of panama": 173,
+    "republic of paraguay": 183,
+    "republic of peru": 175,
+    "republic of poland": 179,
+    "republic of san marino": 201,
+    "republic of senegal": 193,
+    "republic of serbia": 204,
+    "republic of seychelles": 213,
+    "republic of sierra leone": 199,
+    "republic of singapore": 194,
+    "republic of slovenia": 209,
+    "republic of south africa": 246,
+    "republic of south sudan": 205,
+    "republic of suriname": 207,
+    "republic of tajikistan": 219,
+    "republic of the congo": 47,
+    "republic of the gambia": 86,
+    "republic of the marshall islands": 143,
+    "republic of the niger": 161,
+    "republic of the philippines": 176,
+    "republic of the sudan": 192,
+    "republic of trinidad and tobago": 224,
+    "republic of tunisia": 225,
+    "republic of türkiye": 226,
+    "republic of uganda": 230,
+    "republic of uzbekistan": 235,
+    "republic of vanuatu": 242,
+    "republic of yemen": 245,
+    "republic of zambia": 247,
+    "republic of zimbabwe": 248,
+    "reu": 187,
+    "ro": 188,
+    "romania": 188,
+    "rou": 188,
+    "rs": 204,
+    "ru": 189,
+    "rus": 189,
+    "russian federation": 189,
+    "rw": 190,
+    "rwa": 190,
+    "rwanda": 190,
+    "rwandese republic": 190,
+    "réunion": 187,
+    "sa": 191,
+    "saint barthélemy": 27,
+    "saint helena, ascension and tristan da cunha": 196,
+    "saint kitts and nevis": 121,
+    "saint lucia": 128,
+    "saint martin (french part)": 136,
+    "saint pierre and miquelon": 203,
+    "saint vincent and the grenadines": 237,
+    "samoa": 244,
+    "san marino": 201,
+    "sao tome and principe": 206,
+    "sau": 191,
+    "saudi arabia": 191,
+    "sb": 198,
+    "sc": 213,
+    "sd": 192,
+    "sdn": 192,
+    "se": 210,
+    "sen": 193,
+    "senegal": 193,
+    "serbia": 204,
+    "seychelles": 213,
+    "sg": 194,
+    "sgp": 194,
+    "sgs": 195,
+    "sh": 196,
+    "shn": 196,
+    "si": 209,
+    "sierra leone": 199,
+    "singapore": 194,
+    "sint maarten (dutch part)": 212,
+    "sj": 197,
+    "sjm": 197,
+    "sk": 208,
+    "sl": 199,
+    "slb": 198,
+    "sle": 199,
+    "slovak republic": 208,
+    "slovakia": 208,
+    "slovenia": 209,
+    "slv": 200,
+    "sm": 201,
+    "smr": 201,
+    "sn": 193,
+    "so": 202,
+    "socialist republic of viet nam": 241,
+    "solomon islands": 198,
+    "som": 202,
+    "somalia": 202,
+    "south africa": 246,
+    "south georgia and the south sandwich islands": 195,
+    "south korea": 122,
+    "south sudan": 205,
+    "spain": 69,
+    "spm": 203,
+    "sr": 207,
+    "srb": 204,
+    "sri lanka": 130,
+    "ss": 205,
+    "ssd": 205,
+    "st": 206,
+    "state of israel": 110,
+    "state of kuwait": 123,
+    "state of qatar": 186,
+    "stp": 206,
+    "sudan": 192,
+    "sultanate of oman": 171,
+    "sur": 207,
+    "suriname": 207,
+    "sv": 200,
+    "svalbard and jan mayen": 197,
+    "svk": 208,
+    "svn": 209,
+    "swe": 210,
+    "sweden": 210,
+    "swiss confederation": 41,
+    "switzerland": 41,
+    "swz": 211,
+    "sx": 212,
+    "sxm": 212,
+    "sy": 214,
+    "syc": 213,
+    "syr": 214,
+    "syria": 214,
+    "syrian arab republic": 214,
+    "sz": 211,
+    "taiwan": 228,
+    "taiwan, province of china": 228,
+    "tajikistan": 219,
+    "tanzania": 229,
+    "tanzania, united republic of": 229,
+    "tc": 215,
+    "tca": 215,
+    "tcd": 216,
+    "td": 216,
+    "tf": 12,
+    "tg": 217,
+    "tgo": 217,
+    "th": 218,
+    "tha": 218,
+    "thailand": 218,
+    "the state of eritrea": 67,
+    "the state of palestine": 184,
+    "timor-leste": 222,
+    "tj": 219,
+    "tjk": 219,
+    "tk": 220,
+    "tkl": 220,
+    "tkm": 221,
+    "tl": 222,
+    "tls": 222,
+    "tm": 221,
+    "tn": 225,
+    "to": 223,
+    "togo": 217,
+    "togolese republic": 217,
+    "tokelau": 220,
+    "ton": 223,
+    "tonga": 223,
+    "tr": 226,
+    "trinidad and tobago": 224,
+    "tt": 224,
+    "tto": 224,
+    "tun": 225,
+    "tunisia": 225,
+    "tur": 226,
+    "turkmenistan": 221,
+    "turks and caicos islands": 215,
+    "tuv": 227,
+    "tuvalu": 227,
+    "tv": 227,
+    "tw": 228,
+    "twn": 228,
+    "tz": 229,
+    "tza": 229,
+    "türkiye": 226,
+    "ua": 231,
+    "ug": 230,
+    "uga": 230,
+    "uganda": 230,
+    "ukr": 231,
+    "ukraine": 231,
+    "um": 232,
+    "umi": 232,
+    "union of the comoros": 50,
+    "united arab emirates": 7,
+    "united kingdom": 79,
+    "united kingdom of great britain and northern ireland": 79,
+    "united mexican states": 142,
+    "united republic of tanzania": 229,
+    "united states": 234,
+    "united states minor outlying islands": 232,
+    "united states of america": 234,
+    "uruguay": 233,
+    "ury": 233,
+    "us": 234,
+    "usa": 234,
+    "uy": 233,
+    "uz": 235,
+    "uzb": 235,
+    "uzbekistan": 235,
+    "va": 236,
+    "vanuatu": 242,
+    "vat": 236,
+    "vc": 237,
+    "vct": 237,
+    "ve": 238,
+    "ven": 238,
+    "venezuela": 238,
+    "venezuela, bolivarian republic of": 238,
+    "vg": 239,
+    "vgb": 239,
+    "vi": 240,
+    "viet nam": 241,
+    "vietnam": 241,
+    "vir": 240,
+    "virgin islands of the united states": 240,
+    "virgin islands, british": 239,
+    "virgin islands, u.s.": 240,
+    "vn": 241,
+    "vnm": 241,
+    "vu": 242,
+    "vut": 242,
+    "wallis and futuna": 243,
+    "western sahara": 68,
+    "wf": 243,
+    "wlf": 243,
+    "ws": 244,
+    "wsm": 244,
+    "ye": 245,
+    "yem": 245,
+    "yemen": 245,
+    "yt": 158,
+    "za": 246,
+    "zaf": 246,
+    "zambia": 247,
+    "zimbabwe": 248,
+    "zm": 247,
+    "zmb": 247,
+    "zw": 248,
+    "zwe": 248,
+    "åland islands": 4,
+}
+
+# alpha2, alpha3, name, bibliographic
+LANGUAGES: tuple[tuple[str, str, str, str], ...] = (
+    ("aa", "aar", "Afar", ""),  # 0
+    ("ab", "abk", "Abkhazian", ""),  # 1
+    ("af", "afr", "Afrikaans", ""),  # 2
+    ("ak", "aka", "Akan", ""),  # 3
+    ("am", "amh", "Amharic", ""),  # 4
+    ("ar", "ara", "Arabic", ""),  # 5
+    ("an", "arg", "Aragonese", ""),  # 6
+    ("as", "asm", "Assamese", ""),  # 7
+    ("av", "ava", "Avaric", ""),  # 8
+    ("ae", "ave", "Avestan", ""),  # 9
+    ("ay", "aym", "Aymara", ""),  # 10
+    ("az", "aze", "Azerbaijani", ""),  # 11
+    ("ba", "bak", "Bashkir", ""),  # 12
+    ("bm", "bam", "Bambara", ""),  # 13
+    ("be", "bel", "Belarusian", ""),  # 14
+    ("bn", "ben", "Bengali", ""),  # 15
+    ("bi", "bis", "Bislama", ""),  # 16
+    ("bo", "bod", "Tibetan", "tib"),  # 17
+    ("bs", "bos", "Bosnian", ""),  # 18
+    ("br", "bre", "Breton", ""),  # 19
+    ("bg", "bul", "Bulgarian", ""),  # 20
+    ("ca", "cat", "Catalan", ""),  # 21
+    ("cs", "ces", "Czech", "cze"),  # 22
+    ("ch", "cha", "Chamorro", ""),  # 23
+    ("ce", "che", "Chechen", ""),  # 24
+    ("cu", "chu", "Church Slavic", ""),  # 25
+    ("cv", "chv", "Chuvash", ""),  # 26
+    ("kw", "cor", "Cornish", ""),  # 27
+    ("co", "cos", "Corsican", ""),  # 28
+    ("cr", "cre", "Cree", ""),  # 29
+    ("cy", "cym", "Welsh", "wel"),  # 30
+    ("da", "dan", "Danish", ""),  # 31
+    ("de", "deu", "German", "ger"),  # 32
+    ("dv", "div", "Divehi", ""),  # 33
+    ("dz", "dzo", "Dzongkha", ""),  # 34
+    ("el", "ell", "Modern Greek (1453-)", "gre"),  # 35
+    ("en", "eng", "English", ""),  # 36
+    ("eo", "epo", "Esperanto", ""),  # 37
+    ("et", "est", "Estonian", ""),  # 38
+    ("eu", "eus", "Basque", "baq"),  # 39
+    ("ee", "ewe", "Ewe", ""),  # 40
+    ("fo", "fao", "Faroese", ""),  # 41
+    ("fa", "fas", "Persian", "per"),  # 42
+    ("fj", "fij", "Fijian", ""),  # 43
+    ("fi", "fin", "Finnish", ""),  # 44
+    ("fr", "fra", "French", "fre"),  # 45
+    ("fy", "fry", "Western Frisian", ""),  # 46
+    ("ff", "ful", "Fulah", ""),  # 47
+    ("gd", "gla", "Scottish Gaelic", ""),  # 48
+    ("ga", "gle", "Irish", ""),  # 49
+    ("gl", "glg", "Galician", ""),  # 50
+    ("gv", "glv", "Manx", ""),  # 51
+    ("gn", "grn", "Guarani", ""),  # 52
+    ("gu", "guj", "Gujarati", ""),  # 53
+    ("ht", "hat", "Haitian", ""),  # 54
+    ("ha", "hau", "Hausa", ""),  # 55
+    ("sh", "hbs", "Serbo-Croatian", ""),  # 56
+    ("he", "heb", "Hebrew", ""),  # 57
+    ("hz", "her", "Herero", ""),  # 58
+    ("hi", "hin", "Hindi", ""),  # 59
+    ("ho", "hmo", "Hiri Motu", ""),  # 60
+    ("hr", "hrv", "Croatian", ""),  # 61
+    ("hu", "hun", "Hungarian", ""),  # 62
+    ("hy", "hye", "Armenian", "arm"),  # 63
+    ("ig", "ibo", "Igbo", ""),  # 64
+    ("io", "ido", "Ido", ""),  # 65
+    ("ii", "iii", "Sichuan Yi", ""),  # 66
+    ("iu", "iku", "Inuktitut", ""),  # 67
+    ("ie", "ile", "Interlingue", ""),  # 68
+    ("ia", "ina", "Interlingua (International Auxiliary Language Association)", ""),  # 69
+    ("id", "ind", "Indonesian", ""),  # 70
+    ("ik", "ipk", "Inupiaq", ""),  # 71
+    ("is", "isl", "Icelandic", "ice"),  # 72
+    ("it", "ita", "Italian", ""),  # 73
+    ("jv", "jav", "Javanese", ""),  # 74
+    ("ja", "jpn", "Japanese", ""),  # 75
+    ("kl", "kal", "Kalaallisut", ""),  # 76
+    ("kn", "kan", "Kannada", ""),  # 77
+    ("ks", "kas", "Kashmiri", ""),  # 78
+    ("ka", "kat", "Georgian", "geo"),  # 79
+    ("kr", "kau", "Kanuri", ""),  # 80
+    ("kk", "kaz", "Kazakh", ""),  # 81
+    ("km", "khm", "Khmer", ""),  # 82
+    ("ki", "kik", "Kikuyu", ""),  # 83
+    ("rw", "kin", "Kinyarwanda", ""),  # 84
+    ("ky", "kir", "Kirghiz", ""),  # 85
+    ("kv", "kom", "Komi", ""),  # 86
+    ("kg", "kon", "Kongo", ""),  # 87
+    ("ko", "kor", "Korean", ""),  # 88
+    ("kj", "kua", "Kuanyama", ""),  # 89
+    ("ku", "kur", "Kurdish", ""),  # 90
+    ("lo", "lao", "Lao", ""),  # 91
+    ("la", "lat", "Latin", ""),  # 92
+    ("lv", "lav", "Latvian", ""),  # 93
+    ("li", "lim", "Limburgan", ""),  # 94
+    ("ln", "lin", "Lingala", ""),  # 95
+    ("lt", "lit", "Lithuanian", ""),  # 96
+    ("lb", "ltz", "Luxembourgish", ""),  # 97
+    ("lu", "lub", "Luba-Katanga", ""),  # 98
+    ("lg", "lug", "Ganda", ""),  # 99
+    ("mh", "mah", "Marshallese", ""),  # 100
+    ("ml", "mal", "Malayalam", ""),  # 101
+    ("mr", "mar", "Marathi", ""),  # 102
+    ("mk", "mkd", "Macedonian", "mac"),  # 103
+    ("mg", "mlg", "Malagasy", ""),  # 104
+    ("mt", "mlt", "Maltese", ""),  # 105
+    ("mn", "mon", "Mongolian", ""),  # 106
+    ("mi", "mri", "Maori", "mao"),  # 107
+    ("ms", "msa", "Malay (macrolanguage)", "may"),  # 108
+    ("my", "mya", "Burmese", "bur"),  # 109
+    ("na", "nau", "Nauru", ""),  # 110
+    ("nv", "nav", "Navajo", ""),  # 111
+    ("nr", "nbl", "South Ndebele", ""),  # 112
+    ("nd", "nde", "North Ndebele", ""),  # 113
+    ("ng", "ndo", "Ndonga", ""),  # 114
+    ("ne", "nep", "Nepali (macrolanguage)", ""),  # 115
+    ("nl", "nld", "Dutch", "dut"),  # 116
+    ("nn", "nno", "Norwegian Nynorsk", ""),  # 117
+    ("nb", "nob", "Norwegian Bokmål", ""),  # 118
+    ("no", "nor", "Norwegian", ""),  # 119
+    ("ny", "nya", "Chichewa", ""),  # 120
+    ("oc", "oci", "Occitan (post 1500)", ""),  # 121
+    ("oj", "oji", "Ojibwa", ""),  # 122
+    ("or", "ori", "Oriya (macrolanguage)", ""),  # 123
+    ("om", "orm", "Oromo", ""),  # 124
+    ("os", "oss", "Ossetian", ""),  # 125
+    ("pa", "pan", "Panjabi", ""),  # 126
+    ("pi", "pli", "Pali", ""),  # 127
+    ("pl", "pol", "Polish", ""),  # 128
+    ("pt", "por", "Portuguese", ""),  # 129
+    ("ps", "pus", "Pushto", ""),  # 130
+    ("qu", "que", "Quechua", ""),  # 131
+    ("rm", "roh", "Romansh", ""),  # 132
+    ("ro", "ron", "Romanian", "rum"),  # 133
+    ("rn", "run", "Rundi", ""),  # 134
+    ("ru", "rus", "Russian", ""),  # 135
+    ("sg", "sag", "Sango", ""),  # 136
+    ("sa", "san", "Sanskrit", ""),  # 137
+    ("si", "sin", "Sinhala", ""),  # 138
+    ("sk", "slk", "Slovak", "slo"),  # 139
+    ("sl", "slv", "Slovenian", ""),  # 140
+    ("se", "sme", "Northern Sami", ""),  # 141
+    ("sm", "smo", "Samoan", ""),  # 142
+    ("sn", "sna", "Shona", ""),  # 143
+    ("sd", "snd", "Sindhi", ""),  # 144
+    ("so", "som", "Somali", ""),  # 145
+    ("st", "sot", "Southern Sotho", ""),  # 146
+    ("es", "spa", "Spanish", ""),  # 147
+    ("sq", "sqi", "Albanian", "alb"),  # 148
+    ("sc", "srd", "Sardinian", ""),  # 149
+    ("sr", "srp", "Serbian", ""),  # 150
+    ("ss", "ssw", "Swati", ""),  # 151
+    ("su", "sun", "Sundanese", ""),  # 152
+    ("sw", "swa", "Swahili (macrolanguage)", ""),  # 153
+    ("sv", "swe", "Swedish", ""),  # 154
+    ("ty", "tah", "Tahitian", ""),  # 155
+    ("ta", "tam", "Tamil", ""),  # 156
+    ("tt", "tat", "Tatar", ""),  # 157
+    ("te", "tel", "Telugu", ""),  # 158
+    ("tg", "tgk", "Tajik", ""),  # 159
+    ("tl", "tgl", "Tagalog", ""),  # 160
+    ("th", "tha", "Thai", ""),  # 161
+    ("ti", "tir", "Tigrinya", ""),  # 162
+    ("to", "ton", "Tonga (Tonga Islands)", ""),  # 163
+    ("tn", "tsn", "Tswana", ""),  # 164
+    ("ts", "tso", "Tsonga", ""),  # 165
+    ("tk", "tuk", "Turkmen", ""),  # 166
+    ("tr", "tur", "Turkish", ""),  # 167
+    ("tw", "twi", "Twi", ""),  # 168
+    ("ug", "uig", "Uighur", ""),  # 169
+    ("uk", "ukr", "Ukrainian", ""),  # 170
+    ("ur", "urd", "Urdu", ""),  # 171
+    ("uz", "uzb", "Uzbek", ""),  # 172
+    ("ve", "ven", "Venda", ""),  # 173
+    ("vi", "vie", "Vietnamese", ""),  # 174
+    ("vo", "vol", "Volapük", ""),  # 175
+    ("wa", "wln", "Walloon", ""),  # 176
+    ("wo", "wol", "Wolof", ""),  # 177
+    ("xh", "xho", "Xhosa", ""),  # 178
+    ("yi", "yid", "Yiddish", ""),  # 179
+    ("yo", "yor", "Yoruba", ""),  # 180
+    ("za", "zha", "Zhuang", ""),  # 181
+    ("zh", "zho", "Chinese", "chi"),  # 182
+    ("zu", "zul", "Zulu", ""),  # 183
+)
+
+LANGUAGES_INDEX: dict[str, int] = {
+    "aa": 0,
+    "aar": 0,
+    "ab": 1,
+    "abk": 1,
+    "abkhazian": 1,
+    "ae": 9,
+    "af": 2,
+    "afar": 0,
+    "afr": 2,
+    "afrikaans": 2,
+    "ak": 3,
+    "aka": 3,
+    "akan": 3,
+    "alb": 148,
+    "albanian": 148,
+    "am": 4,
+    "amh": 4,
+    "amharic": 4,
+    "an": 6,
+    "ar": 5,
+    "ara": 5,
+    "arabic": 5,
+    "aragonese": 6,
+    "arg": 6,
+    "arm": 63,
+    "armenian": 63,
+    "as": 7,
+    "asm": 7,
+    "assamese": 7,
+    "av": 8,
+    "ava": 8,
+    "avaric": 8,
+    "ave": 9,
+    "avestan": 9,
+    "ay": 10,
+    "aym": 10,
+    "aymara": 10,
+    "az": 11,
+    "aze": 11,
+    "azerbaijani": 11,
+    "ba": 12,
+    "bak": 12,
+    "bam": 13,
+    "bambara": 13,
+    "baq": 39,
+    "bashkir": 12,
+    "basque": 39,
+    "be": 14,
+    "bel": 14,
+    "belarusian": 14,
+    "ben": 15,
+    "bengali": 15,
+    "bg": 20,
+    "bi": 16,
+    "bis": 16,
+    "bislama": 16,
+    "bm": 13,
+    "bn": 15,
+    "bo": 17,
+    "bod": 17,
+    "bos": 18,
+    "bosnian": 18,
+    "br": 19,
+    "bre": 19,
+    "breton": 19,
+    "bs": 18,
+    "bul": 20,
+    "bulgarian": 20,
+    "bur": 109,
+    "burmese": 109,
+    "ca": 21,
+    "cat": 21,
+    "catalan": 21,
+    "ce": 24,
+    "ces": 22,
+    "ch": 23,
+    "cha": 23,
+    "chamorro": 23,
+    "che": 24,
+    "chechen": 24,
+    "chi": 182,
+    "chichewa": 120,
+    "chinese": 182,
+    "chu": 25,
+    "church slavic": 25,
+    "chuvash": 26,
+    "chv": 26,
+    "co": 28,
+    "cor": 27,
+    "cornish": 27,
+    "corsican": 28,
+    "cos": 28,
+    "cr": 29,
+    "cre": 29,
+    "cree": 29,
+    "croatian": 61,
+    "cs": 22,
+    "cu": 25,
+    "cv": 26,
+    "cy": 30,
+    "cym": 30,
+    "cze": 22,
+    "czech": 22,
+    "da": 31,
+    "dan": 31,
+    "danish": 31,
+    "de": 32,
+    "deu": 32,
+    "div": 33,
+    "divehi": 33,
+    "dut": 116,
+    "dutch": 116,
+    "dv": 33,
+    "dz": 34,
+    "dzo": 34,
+    "dzongkha": 34,
+    "ee": 40,
+    "el": 35,
+    "ell": 35,
+    "en": 36,
+    "eng": 36,
+    "english": 36,
+    "eo": 37,
+    "epo": 37,
+    "es": 147,
+    "esperanto": 37,
+    "est": 38,
+    "estonian": 38,
+    "et": 38,
+    "eu": 39,
+    "eus": 39,
+    "ewe": 40,
+    "fa": 42,
+    "fao": 41,
+    "faroese": 41,
+    "fas": 42,
+    "ff": 47,
+    "fi": 44,
+    "fij": 43,
+    "fijian": 43,
+    "fin": 44,
+    "finnish": 44,
+    "fj": 43,
+    "fo": 41,
+    "fr": 45,
+    "fra": 45,
+    "fre": 45,
+    "french": 45,
+    "fry": 46,
+    "ful": 47,
+    "fulah": 47,
+    "fy": 46,
+    "ga": 49,
+    "galician": 50,
+    "ganda": 99,
+    "gd": 48,
+    "geo": 79,
+    "georgian": 79,
+    "ger": 32,
+    "german": 32,
+    "gl": 50,
+    "gla": 48,
+    "gle": 49,
+    "glg": 50,
+    "glv": 51,
+    "gn": 52,
+    "gre": 35,
+    "grn": 52,
+    "gu": 53,
+    "guarani": 52,
+    "guj": 53,
+    "gujarati": 53,
+    "gv": 51,
+    "ha": 55,
+    "haitian": 54,
+    "hat": 54,
+    "hau": 55,
+    "hausa": 55,
+    "hbs": 56,
+    "he": 57,
+    "heb": 57,
+    "hebrew": 57,
+    "her": 58,
+    "herero": 58,
+    "hi": 59,
+    "hin": 59,
+    "hindi": 59,
+    "hiri motu": 60,
+    "hmo": 60,
+    "ho": 60,
+    "hr": 61,
+    "hrv": 61,
+    "ht": 54,
+    "hu": 62,
+    "hun": 62,
+    "hungarian": 62,
+    "hy": 63,
+    "hye": 63,
+    "hz": 58,
+    "ia": 69,
+    "ibo": 64,
+    "ice": 72,
+    "icelandic": 72,
+    "id": 70,
+    "ido": 65,
+    "ie": 68,
+    "ig": 64,
+    "igbo": 64,
+    "ii": 66,
+    "iii": 66,
+    "ik": 71,
+    "iku": 67,
+    "ile": 68,
+    "ina": 69,
+    "ind": 70,
+    "indonesian": 70,
+    "interlingua (international auxiliary language association)": 69,
+    "interlingue": 68,
+    "inuktitut": 67,
+    "inupiaq": 71,
+    "io": 65,
+    "ipk": 71,
+    "irish": 49,
+    "is": 72,
+    "isl": 72,
+    "it": 73,
+    "ita": 73,
+    "italian": 73,
+    "iu": 67,
+    "ja": 75,
+    "japanese": 75,
+    "jav": 74,
+    "javanese": 74,
+    "jpn": 75,
+    "jv": 74,
+    "ka": 79,
+    "kal": 76,
+    "kalaallisut": 76,
+    "kan": 77,
+    "kannada": 77,
+    "kanuri": 80,
+    "kas": 78,
+    "kashmiri": 78,
+    "kat": 79,
+    "kau": 80,
+    "kaz": 81,
+    "kazakh": 81,
+    "kg": 87,
+    "khm": 82,
+    "khmer": 82,
+    "ki": 83,
+    "kik": 83,
+    "kikuyu": 83,
+    "kin": 84,
+    "kinyarwanda": 84,
+    "kir": 85,
+    "kirghiz": 85,
+    "kj": 89,
+    "kk": 81,
+    "kl": 76,
+    "km": 82,
+    "kn": 77,
+    "ko": 88,
+    "kom": 86,
+    "komi": 86,
+    "kon": 87,
+    "kongo": 87,
+    "kor": 88,
+    "korean": 88,
+    "kr": 80,
+    "ks": 78,
+    "ku": 90,
+    "kua": 89,
+    "kuanyama": 89,
+    "kur": 90,
+    "kurdish": 90,
+    "kv": 86,
+    "kw": 27,
+    "ky": 85,
+    "la": 92,
+    "lao": 91,
+    "lat": 92,
+    "latin": 92,
+    "latvian": 93,
+    "lav": 93,
+    "lb": 97,
+    "lg": 99,
+    "li": 94,
+    "lim": 94,
+    "limburgan": 94,
+    "lin": 95,
+    "lingala": 95,
+    "lit": 96,
+    "lithuanian": 96,
+    "ln": 95,
+    "lo": 91,
+    "lt": 96,
+    "ltz": 97,
+    "lu": 98,
+    "lub": 98,
+    "luba-katanga": 98,
+    "lug": 99,
+    "luxembourgish": 97,
+    "lv": 93,
+    "mac": 103,
+    "macedonian": 103,
+    "mah": 100,
+    "mal": 101,
+    "malagasy": 104,
+    "malay (macrolanguage)": 108,
+    "malayalam": 101,
+    "maltese": 105,
+    "manx": 51,
+    "mao": 107,
+    "maori": 107,
+    "mar": 102,
+    "marathi": 102,
+    "marshallese": 100,
+    "may": 108,
+    "mg": 104,
+    "mh": 100,
+    "mi": 107,
+    "mk": 103,
+    "mkd": 103,
+    "ml": 101,
+    "mlg": 104,
+    "mlt": 105,
+    "mn": 106,
+    "modern greek (1453-)": 35,
+    "mon": 106,
+    "mongolian": 106,
+    "mr": 102,
+    "mri": 107,
+    "ms": 108,
+    "msa": 108,
+    "mt": 105,
+    "my": 109,
+    "mya": 109,
+    "na": 110,
+    "nau": 110,
+    "nauru": 110,
+    "nav": 111,
+    "navajo": 111,
+    "nb": 118,
+    "nbl": 112,
+    "nd": 113,
+    "nde": 113,
+    "ndo": 114,
+    "ndonga": 114,
+    "ne": 115,
+    "nep": 115,
+    "nepali (macrolanguage)": 115,
+    "ng": 114,
+    "nl": 116,
+    "nld": 116,
+    "nn": 117,
+    "nno": 117,
+    "no": 119,
+    "nob": 118,
+    "nor": 119,
+    "north ndebele": 113,
+    "northern sami": 141,
+    "norwegian": 119,
+    "norwegian bokmål": 118,
+    "norwegian nynorsk": 117,
+    "nr": 112,
+    "nv": 111,
+    "ny": 120,
+    "nya": 120,
+    "oc": 121,
+    "occitan (post 1500)": 121,
+    "oci": 121,
+    "oj": 122,
+    "oji": 122,
+    "ojibwa": 122,
+    "om": 124,
+    "or": 123,
+    "ori": 123,
+    "oriya (macrolanguage)": 123,
+    "orm": 124,
+    "oromo": 124,
+    "os": 125,
+    "oss": 125,
+    "ossetian": 125,
+    "pa": 126,
+    "pali": 127,
+    "pan": 126,
+    "panjabi": 126,
+    "per": 42,
+    "persian": 42,
+    "pi": 127,
+    "pl": 128,
+    "pli": 127,
+    "pol": 128,
+    "polish": 128,
+    "por": 129,
+    "portuguese": 129,
+    "ps": 130,
+    "pt": 129,
+    "pus": 130,
+    "pushto": 130,
+    "qu": 131,
+    "que": 131,
+    "quechua": 131,
+    "rm": 132,
+    "rn": 134,
+    "ro": 133,
+    "roh": 132,
+    "romanian": 133,
+    "romansh": 132,
+    "ron": 133,
+    "ru": 135,
+    "rum": 133,
+    "run": 134,
+    "rundi": 134,
+    "rus": 135,
+    "russian": 135,
+    "rw": 84,
+    "sa": 137,
+    "sag": 136,
+    "samoan": 142,
+    "san": 137,
+    "sango": 136,
+    "sanskrit": 137,
+    "sardinian": 149,
+    "sc": 149,
+    "scottish gaelic": 48,
+    "sd": 144,
+    "se": 141,
+    "serbian": 150,
+    "serbo-croatian": 56,
+    "sg": 136,
+    "sh": 56,
+    "shona": 143,
+    "si": 138,
+    "sichuan yi": 66,
+    "sin": 138,
+    "sindhi": 144,
+    "sinhala": 138,
+    "sk": 139,
+    "sl": 140,
+    "slk": 139,
+    "slo": 139,
+    "slovak": 139,
+    "slovenian": 140,
+    "slv": 140,
+    "sm": 142,
+    "sme": 141,
+    "smo": 142,
+    "sn": 143,
+    "sna": 143,
+    "snd": 144,
+    "so": 145,
+    "som": 145,
+    "somali": 145,
+    "sot": 146,
+    "south ndebele": 112,
+    "southern sotho": 146,
+    "spa": 147,
+    "spanish": 147,
+    "sq": 148,
+    "sqi": 148,
+    "sr": 150,
+    "srd": 149,
+    "srp": 150,
+    "ss": 151,
+    "ssw": 151,
+    "st": 146,
+    "su": 152,
+    "sun": 152,
+    "sundanese": 152,
+    "sv": 154,
+    "sw": 153,
+    "swa": 153,
+    "swahili (macrolanguage)": 153,
+    "swati": 151,
+    "swe": 154,
+    "swedish": 154,
+    "ta": 156,
+    "tagalog": 160,
+    "tah": 155,
+    "tahitian": 155,
+    "tajik": 159,
+    "tam": 156,
+    "tamil": 156,
+    "tat": 157,
+    "tatar": 157,
+    "te": 158,
+    "tel": 158,
+    "telugu": 158,
+    "tg": 159,
+    "tgk": 159,
+    "tgl": 160,
+    "th": 161,
+    "tha": 161,
+    "thai": 161,
+    "ti": 162,
+    "tib": 17,
+    "tibetan": 17,
+    "tigrinya": 162,
+    "tir": 162,
+    "tk": 166,
+    "tl": 160,
+    "tn": 164,
+    "to": 163,
+    "ton": 163,
+    "tonga (tonga islands)": 163,
+    "tr": 167,
+    "ts": 165,
+    "tsn": 164,
+    "tso": 165,
+    "tsonga": 165,
+    "tswana": 164,
+    "tt": 157,
+    "tuk": 166,
+    "tur": 167,
+    "turkish": 167,
+    "turkmen": 166,
+    "tw": 168,
+    "twi": 168,
+    "ty": 155,
+    "ug": 169,
+    "uig": 169,
+    "uighur": 169,
+    "uk": 170,
+    "ukr": 170,
+    "ukrainian": 170,
+    "ur": 171,
+    "urd": 171,
+    "urdu": 171,
+    "uz": 172,
+    "uzb": 172,
+    "uzbek": 172,
+    "ve": 173,
+    "ven": 173,
+    "venda": 173,
+    "vi": 174,
+    "vie": 174,
+    "vietnamese": 174,
+    "vo": 175,
+    "vol": 175,
+    "volapük": 175,
+    "wa": 176,
+    "walloon": 176,
+    "wel": 30,
+    "welsh": 30,
+    "western frisian": 46,
+    "wln": 176,
+    "wo": 177,
+    "wol": 177,
+    "wolof": 177,
+    "xh": 178,
+    "xho": 178,
+    "xhosa": 178,
+    "yi": 179,
+    "yid": 179,
+    "yiddish": 179,
+    "yo": 180,
+    "yor": 180,
+    "yoruba": 180,
+    "za": 181,
+    "zh": 182,
+    "zha": 181,
+    "zho": 182,
+    "zhuang": 181,
+    "zu": 183,
+    "zul": 183,
+    "zulu": 183,
+}
@@ -3,10 +3,9 @@ import re
 from typing import Any
 from urllib.parse import parse_qsl
 
-from lxml.etree import HTML, XML
-
 from streamlink.compat import detect_encoding
 from streamlink.exceptions import PluginError
+from streamlink.utils import json as jsonlib
 
 
 def _parse(parser, data, name, exception, schema, *args, **kwargs):
@@ -19,12 +18,20 @@ def _parse(parser, data, name, exception, schema, *args, **kwargs):
 
         raise exception(f"Unable to parse {name}: {err} ({snippet})")  # noqa: B904
 
+    return _validate(parsed, name, exception, schema)
+
+
+def _validate(parsed, name, exception, schema):
     if schema:
         parsed = schema.validate(parsed, name=name, exception=exception)
 
     return parsed
 
 
+def _get_json_parser(*args, **kwargs):
+    return json.loads if args or kwargs else jsonlib.loads
+
+
 def parse_json(
     data,
     name="JSON",
@@ -37,8 +44,11 @@ def parse_json(
 
     Provides these extra features:
      - Wraps errors in custom exception with a snippet of the data in the message
+     - Uses a faster JSON backend if one is installed and if no extra arguments are passed to json.loads
     """
-    return _parse(json.loads, data, name, exception, schema, *args, **kwargs)
+    parser = _get_json_parser(*args, **kwargs)
+
+    return _parse(parser, data, name, exception, schema, *args, **kwargs)
 
 
 def parse_html(
@@ -74,6 +84,9 @@ def parse_html(
 
         data = re.sub(r"^\s*<\?xml.+?\?>", "", data)
 
+    # import lxml only if it's needed
+    from lxml.etree import HTML  # noqa: PLC0415
+
     return _parse(HTML, data, name, exception, schema, *args, **kwargs)
 
 
@@ -101,6 +114,8 @@ def parse_xml(
     if invalid_char_entities:
         data = re.sub(rb"&(?!(?:#(?:[0-9]+|[Xx][0-9A-Fa-f]+)|[A-Za-z0-9]+);)", b"&amp;", data)
 
+    from lxml.etree import XML  # noqa: PLC0415
+
     return _parse(XML, data, name, exception, schema, *args, **kwargs)
 
 
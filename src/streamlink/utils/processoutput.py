@@ -7,12 +7,12 @@ from functools import partial
 from subprocess import PIPE
 from typing import TYPE_CHECKING, BinaryIO
 
-import trio
-
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Callable
 
+    import trio
+
 
 class ProcessOutput:
     _send_channel: trio.MemorySendChannel[bool]
@@ -29,13 +29,21 @@ class ProcessOutput:
         self.timeout = timeout
         self.wait_terminate = wait_terminate
         self.stdin = stdin
+
+        # import trio only if it's needed
+        import trio  # noqa: PLC0415
+
         self._send_channel, self._receive_channel = trio.open_memory_channel(1)
         self._receive_max_bytes: int | None = None
 
     def run(self) -> bool:  # pragma: no cover
+        import trio  # noqa: PLC0415
+
         return trio.run(self.arun)
 
     async def arun(self) -> bool:
+        import trio  # noqa: PLC0415
+
         with trio.move_on_after(self.timeout):
             async with trio.open_nursery() as nursery:
                 run_process = partial(
@@ -63,6 +71,8 @@ class ProcessOutput:
         return False
 
     async def _deliver_cancel(self, proc: trio.Process):
+        import trio  # noqa: PLC0415
+
         with suppress(OSError):
             proc.terminate()
             await trio.sleep(self.wait_terminate)
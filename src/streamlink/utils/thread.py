@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
 from itertools import count
-from threading import RLock, Thread
-from typing import TYPE_CHECKING
+from threading import Condition, RLock, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, ClassVar
+
+from streamlink.logger import getLogger
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
+
+
+log = getLogger(__name__)
 
 
 _threadname_lock = RLock()
@@ -25,3 +32,84 @@ class NamedThread(Thread):
             kwargs["name"] = f"{newname}-{next(_threadname_counters[newname])}"
 
         super().__init__(*args, **kwargs)
+
+
+class ScheduledCall:
+    def __init__(self, when: float, func: Callable, args: tuple) -> None:
+        self.when = when
+        self.func = func
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class Scheduler(NamedThread):
+    """
+    A daemon thread which calls functions at specific points in time, ordered by a heap queue.
+
+    Scheduled functions get called from the scheduler thread, so they must return quickly,
+    e.g. by submitting the actual work to an executor.
+    """
+
+    _shared: ClassVar[Scheduler | None] = None
+    _shared_lock: ClassVar[RLock] = RLock()
+
+    def __init__(self, name: str | None = None) -> None:
+        super().__init__(daemon=True, name=name)
+        self._condition = Condition()
+        self._heap: list[tuple[float, int, ScheduledCall]] = []
+        self._counter = count()
+
+    @classmethod
+    def shared(cls) -> Scheduler:
+        """
+        Get the shared scheduler instance, which gets started on first use
+        """
+
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                cls._shared.start()
+
+            return cls._shared
+
+    def schedule(self, delay: float, func: Callable, *args) -> ScheduledCall:
+        """
+        Call a function with the given arguments after a delay in seconds.
+
+        :return: The scheduled call, which can be cancelled
+        """
+
+        call = ScheduledCall(monotonic() + max(0.0, delay), func, args)
+        with self._condition:
+            heapq.heappush(self._heap, (call.when, next(self._counter), call))
+            self._condition.notify()
+
+        return call
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap:
+                    self._condition.wait()
+
+                when, _, call = self._heap[0]
+                delay = when - monotonic()
+                if delay > 0 and not call.cancelled:
+                    self._condition.wait(delay)
+                    continue
+
+                heapq.heappop(self._heap)
+
+            if call.cancelled:
+                continue
+
+            try:
+                call.func(*call.args)
+            except Exception:
+                log.exception(f"Error in scheduled call {call.func!r}")
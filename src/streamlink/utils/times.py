@@ -4,23 +4,43 @@ import re
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Generic, TypeVar
 
-from isodate import LOCAL, parse_datetime  # type: ignore[import]
-
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from datetime import tzinfo
 
+    from isodate import LOCAL, parse_datetime  # type: ignore[import]
+
 
 UTC = timezone.utc
 
+# isodate attributes which get imported on first access
+_ISODATE_ATTRS = ("LOCAL", "parse_datetime")
+
+
+def __getattr__(name: str):
+    if name in _ISODATE_ATTRS:
+        import isodate  # type: ignore[import]  # noqa: PLC0415
+
+        value = getattr(isodate, name)
+        globals()[name] = value
+
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _local() -> tzinfo:
+    # the LOCAL attribute can be set or overridden, so look it up in the module's globals first
+    return globals().get("LOCAL") or __getattr__("LOCAL")
+
 
 def now(tz: tzinfo = UTC) -> datetime:
     return datetime.now(tz=tz)
 
 
 def localnow() -> datetime:
-    return datetime.now(tz=LOCAL)
+    return datetime.now(tz=_local())
 
 
 def fromtimestamp(timestamp: float, tz: tzinfo = UTC) -> datetime:
@@ -28,7 +48,7 @@ def fromtimestamp(timestamp: float, tz: tzinfo = UTC) -> datetime:
 
 
 def fromlocaltimestamp(timestamp: float) -> datetime:
-    return datetime.fromtimestamp(timestamp, tz=LOCAL)
+    return datetime.fromtimestamp(timestamp, tz=_local())
 
 
 _THMS = TypeVar("_THMS", int, float)
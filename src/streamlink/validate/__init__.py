@@ -4,6 +4,7 @@
 from streamlink.validate._validate import (
     Schema,
     validate,
+    compile_schema as compile,
 )
 
 # noinspection PyPep8Naming,PyShadowingBuiltins
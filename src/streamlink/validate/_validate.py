@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from collections import abc
+from collections.abc import Callable
 from copy import copy, deepcopy
-from functools import singledispatch
+from functools import partial, singledispatch
 from re import Pattern
-from typing import Any
+from typing import Any, TypeAlias
 
 from lxml.etree import Element, iselement
 
@@ -32,12 +33,16 @@ class Schema(AllSchema):
 
     A wrapper for :class:`AllSchema <_schemas.AllSchema>` with a wrapper method for :func:`validate`
     which by default raises :class:`PluginError <streamlink.exceptions.PluginError>` on error.
+
+    The schema gets compiled via :func:`compile_schema` when validating the first value.
     """
 
+    _compiled: Callable[[Any], Any] | None = None
+
     # TODO: replace default PluginError exception
     def validate(self, value: Any, name: str = "result", exception: type[Exception] = PluginError) -> Any:
         try:
-            return validate(self, value)
+            return compile_schema(self)(value)
         except ValidationError as err:
             raise exception(f"Unable to validate {name}: {err}") from None
 
@@ -45,364 +50,526 @@ class Schema(AllSchema):
 # ----
 
 
+_TValidator: TypeAlias = Callable[[Any], Any]
+
+
 @singledispatch
 def validate(schema, value):
-    if schema != value:
-        raise ValidationError(
-            "{value} does not equal {expected}",
-            value=repr(value),
-            expected=repr(schema),
-            schema="equality",
-        )
+    return compile_schema(schema)(value)
 
-    return value
 
+def compile_schema(schema: Any) -> _TValidator:
+    """
+    Compile a schema into a validator function, which can be called with the value to validate.
+
+    The schema tree only gets traversed once, so validating values with the returned validator is faster
+    than calling :func:`validate` each time. Validation results and errors are the same.
+    The compiled validators of :class:`Schema` objects are cached, so schemas should not be modified afterwards.
+
+    :param schema: Any kind of validation schema
+    :return: A validator function
+    """
+
+    if isinstance(schema, Schema):
+        if schema._compiled is None:
+            schema._compiled = _compile(schema)
+        return schema._compiled
+
+    return _compile(schema)
+
+
+def _compile(schema: Any) -> _TValidator:
+    # schema types with a custom validate() implementation get validated by it
+    impl = validate.dispatch(type(schema))
+    if impl is not validate.dispatch(object):
+        return partial(impl, schema)
+
+    get_validator = _get_validator.dispatch(type(schema))
+    try:
+        return get_validator(schema)
+    except Exception:
+        # invalid schemas only fail when validating a value
+        return partial(_validate_invalid, get_validator, schema)
 
-@validate.register
-def _validate_type(schema: type, value):
-    if not isinstance(value, schema):
-        raise ValidationError(
-            "Type of {value} should be {expected}, but is {actual}",
-            value=repr(value),
-            expected=schema.__name__,
-            actual=type(value).__name__,
-            schema=type,
-        )
 
-    return value
+def _validate_invalid(get_validator: Callable[[Any], _TValidator], schema: Any, value: Any) -> Any:
+    return get_validator(schema)(value)
+
+
+# ----
+
+
+@singledispatch
+def _get_validator(schema) -> _TValidator:
+    def validator(value):
+        if schema != value:
+            raise ValidationError(
+                "{value} does not equal {expected}",
+                value=repr(value),
+                expected=repr(schema),
+                schema="equality",
+            )
+
+        return value
+
+    return validator
+
+
+@_get_validator.register
+def _validate_type(schema: type) -> _TValidator:
+    def validator(value):
+        if not isinstance(value, schema):
+            raise ValidationError(
+                "Type of {value} should be {expected}, but is {actual}",
+                value=repr(value),
+                expected=schema.__name__,
+                actual=type(value).__name__,
+                schema=type,
+            )
+
+        return value
+
+    return validator
 
 
 # singledispatch doesn't support typing.Union/types.UnionType on py<311, so keep each register() call for now
-@validate.register(list)
-@validate.register(tuple)
-@validate.register(set)
-@validate.register(frozenset)
-def _validate_sequence(schema: list | tuple | set | frozenset, value):
+@_get_validator.register(list)
+@_get_validator.register(tuple)
+@_get_validator.register(set)
+@_get_validator.register(frozenset)
+def _validate_sequence(schema: list | tuple | set | frozenset) -> _TValidator:
     cls = type(schema)
-    validate(cls, value)
-    any_schemas = AnySchema(*schema)
+    validate_type = compile_schema(cls)
+    validate_item = compile_schema(AnySchema(*schema))
+
+    def validator(value):
+        validate_type(value)
+        return cls(validate_item(v) for v in value)
 
-    return cls(validate(any_schemas, v) for v in value)
+    return validator
 
 
-@validate.register
-def _validate_dict(schema: dict, value):
+@_get_validator.register
+def _validate_dict(schema: dict) -> _TValidator:
     cls = type(schema)
-    validate(cls, value)
-    new = cls()
+    validate_type = compile_schema(cls)
 
+    entries = []
     for key, subschema in schema.items():
-        if isinstance(key, OptionalSchema):
-            if key.key not in value:
-                continue
+        is_optional = isinstance(key, OptionalSchema)
+        if is_optional:
             key = key.key
-
-        if type(key) in (type, AllSchema, AnySchema, TransformSchema, UnionSchema):
-            for subkey, subvalue in value.items():
-                try:
-                    newkey = validate(key, subkey)
-                except ValidationError as err:
-                    raise ValidationError("Unable to validate key", schema=dict) from err
-                try:
-                    newvalue = validate(subschema, subvalue)
-                except ValidationError as err:
-                    raise ValidationError("Unable to validate value", schema=dict) from err
-                new[newkey] = newvalue
+        validate_key = compile_schema(key) if type(key) in (type, AllSchema, AnySchema, TransformSchema, UnionSchema) else None
+        entries.append((key, is_optional, validate_key, compile_schema(subschema)))
+        # the remaining keys can't be reached
+        if validate_key is not None and not is_optional:
             break
 
-        if key not in value:
+    def validator(value):
+        validate_type(value)
+        new = cls()
+
+        for key, is_optional, validate_key, validate_value in entries:
+            if is_optional and key not in value:
+                continue
+
+            if validate_key is not None:
+                for subkey, subvalue in value.items():
+                    try:
+                        newkey = validate_key(subkey)
+                    except ValidationError as err:
+                        raise ValidationError("Unable to validate key", schema=dict) from err
+                    try:
+                        newvalue = validate_value(subvalue)
+                    except ValidationError as err:
+                        raise ValidationError("Unable to validate value", schema=dict) from err
+                    new[newkey] = newvalue
+                break
+
+            if key not in value:
+                raise ValidationError(
+                    "Key {key} not found in {value}",
+                    key=repr(key),
+                    value=repr(value),
+                    schema=dict,
+                )
+
+            try:
+                new[key] = validate_value(value[key])
+            except ValidationError as err:
+                raise ValidationError("Unable to validate value of key {key}", key=repr(key), schema=dict) from err
+
+        return new
+
+    return validator
+
+
+@_get_validator.register
+def _validate_callable(schema: abc.Callable) -> _TValidator:
+    def validator(value):
+        if not schema(value):
             raise ValidationError(
-                "Key {key} not found in {value}",
-                key=repr(key),
-                value=repr(value),
-                schema=dict,
+                "{callable} is not true",
+                callable=f"{getattr(schema, '__name__', schema.__class__.__name__)}({value!r})",
+                schema=abc.Callable,
             )
 
-        try:
-            new[key] = validate(subschema, value[key])
-        except ValidationError as err:
-            raise ValidationError("Unable to validate value of key {key}", key=repr(key), schema=dict) from err
+        return value
 
-    return new
+    return validator
 
 
-@validate.register
-def _validate_callable(schema: abc.Callable, value):
-    if not schema(value):
-        raise ValidationError(
-            "{callable} is not true",
-            callable=f"{getattr(schema, '__name__', schema.__class__.__name__)}({value!r})",
-            schema=abc.Callable,
-        )
+@_get_validator.register
+def _validate_pattern(schema: Pattern) -> _TValidator:
+    search = schema.search
 
-    return value
+    def validator(value):
+        if not isinstance(value, (str, bytes)):
+            raise ValidationError(
+                "Type of {value} should be str or bytes, but is {actual}",
+                value=repr(value),
+                actual=type(value).__name__,
+                schema=Pattern,
+            )
 
+        try:
+            result = search(value)
+        except TypeError as err:
+            raise ValidationError(err, schema=Pattern) from None
 
-@validate.register
-def _validate_pattern(schema: Pattern, value):
-    if not isinstance(value, (str, bytes)):
-        raise ValidationError(
-            "Type of {value} should be str or bytes, but is {actual}",
-            value=repr(value),
-            actual=type(value).__name__,
-            schema=Pattern,
-        )
+        return result
 
-    try:
-        result = schema.search(value)
-    except TypeError as err:
-        raise ValidationError(err, schema=Pattern) from None
+    return validator
 
-    return result
 
+@_get_validator.register
+def _validate_allschema(schema: AllSchema) -> _TValidator:
+    validators = tuple(compile_schema(subschema) for subschema in schema.schema)
+    if len(validators) == 1:
+        return validators[0]
 
-@validate.register
-def _validate_allschema(schema: AllSchema, value):
-    for subschema in schema.schema:
-        value = validate(subschema, value)
+    def validator(value):
+        for subvalidator in validators:
+            value = subvalidator(value)
 
-    return value
+        return value
 
+    return validator
 
-@validate.register
-def _validate_anyschema(schema: AnySchema, value):
-    errors = []
-    for subschema in schema.schema:
-        try:
-            return validate(subschema, value)
-        except ValidationError as err:
-            errors.append(err)
 
-    raise ValidationError(*errors, schema=AnySchema)
+@_get_validator.register
+def _validate_anyschema(schema: AnySchema) -> _TValidator:
+    validators = tuple(compile_schema(subschema) for subschema in schema.schema)
 
+    def validator(value):
+        errors = []
+        for subvalidator in validators:
+            try:
+                return subvalidator(value)
+            except ValidationError as err:
+                errors.append(err)
 
-@validate.register
-def _validate_noneorallschema(schema: NoneOrAllSchema, value):
-    if value is not None:
-        try:
-            for subschema in schema.schema:
-                value = validate(subschema, value)
-        except ValidationError as err:
-            raise ValidationError(err, schema=NoneOrAllSchema) from None
+        raise ValidationError(*errors, schema=AnySchema)
 
-    return value
+    return validator
 
 
-@validate.register
-def _validate_listschema(schema: ListSchema, value):
-    if not isinstance(value, list):
-        raise ValidationError(
-            "Type of {value} should be list, but is {actual}",
-            value=repr(value),
-            actual=type(value).__name__,
-            schema=ListSchema,
-        )
-    if len(value) != len(schema.schema):
-        raise ValidationError(
-            "Length of list ({length}) does not match expectation ({expected})",
-            length=len(value),
-            expected=len(schema.schema),
-            schema=ListSchema,
-        )
+@_get_validator.register
+def _validate_noneorallschema(schema: NoneOrAllSchema) -> _TValidator:
+    validators = tuple(compile_schema(subschema) for subschema in schema.schema)
 
-    new = []
-    errors = []
-    for k, v in enumerate(schema.schema):
-        try:
-            new.append(validate(v, value[k]))
-        except ValidationError as err:
-            errors.append(err)
+    def validator(value):
+        if value is not None:
+            try:
+                for subvalidator in validators:
+                    value = subvalidator(value)
+            except ValidationError as err:
+                raise ValidationError(err, schema=NoneOrAllSchema) from None
 
-    if errors:
-        raise ValidationError(*errors, schema=ListSchema)
+        return value
 
-    return new
+    return validator
 
 
-@validate.register
-def _validate_regexschema(schema: RegexSchema, value):
-    if not isinstance(value, (str, bytes)):
-        raise ValidationError(
-            "Type of {value} should be str or bytes, but is {actual}",
-            value=repr(value),
-            actual=type(value).__name__,
-            schema=RegexSchema,
-        )
+@_get_validator.register
+def _validate_listschema(schema: ListSchema) -> _TValidator:
+    validators = tuple(compile_schema(subschema) for subschema in schema.schema)
+    length = len(validators)
 
-    try:
-        result = getattr(schema.pattern, schema.method)(value)
-    except TypeError as err:
-        raise ValidationError(err, schema=RegexSchema) from None
+    def validator(value):
+        if not isinstance(value, list):
+            raise ValidationError(
+                "Type of {value} should be list, but is {actual}",
+                value=repr(value),
+                actual=type(value).__name__,
+                schema=ListSchema,
+            )
+        if len(value) != length:
+            raise ValidationError(
+                "Length of list ({length}) does not match expectation ({expected})",
+                length=len(value),
+                expected=length,
+                schema=ListSchema,
+            )
 
-    if result is None:
-        raise ValidationError(
-            "Pattern {pattern} did not match {value}",
-            pattern=repr(schema.pattern.pattern),
-            value=repr(value),
-            schema=RegexSchema,
-        )
+        new = []
+        errors = []
+        for subvalidator, item in zip(validators, value, strict=True):
+            try:
+                new.append(subvalidator(item))
+            except ValidationError as err:
+                errors.append(err)
 
-    return result
+        if errors:
+            raise ValidationError(*errors, schema=ListSchema)
 
+        return new
 
-@validate.register
-def _validate_transformschema(schema: TransformSchema, value):
-    validate(abc.Callable, schema.func)
-    return schema.func(value, *schema.args, **schema.kwargs)
+    return validator
 
 
-@validate.register
-def _validate_getitemschema(schema: GetItemSchema, value):
-    item = schema.item if type(schema.item) is tuple and not schema.strict else (schema.item,)
-    idx = 0
-    key = None
-    try:
-        for key in item:
-            if iselement(value):
-                value = value.attrib[key]
-            else:
-                value = value[key]
-            idx += 1
-        return value
-    except (KeyError, IndexError):
-        # only return default value on last item in nested lookup
-        if idx < len(item) - 1:
+@_get_validator.register
+def _validate_regexschema(schema: RegexSchema) -> _TValidator:
+    pattern = schema.pattern
+    method = getattr(pattern, schema.method)
+
+    def validator(value):
+        if not isinstance(value, (str, bytes)):
             raise ValidationError(
-                "Item {key} was not found in object {value}",
-                key=repr(key),
+                "Type of {value} should be str or bytes, but is {actual}",
                 value=repr(value),
-                schema=GetItemSchema,
-            ) from None
-        return schema.default
-    except (TypeError, AttributeError) as err:
-        raise ValidationError(
-            "Could not get key {key} from object {value}",
-            key=repr(key),
-            value=repr(value),
-            schema=GetItemSchema,
-        ) from err
-
+                actual=type(value).__name__,
+                schema=RegexSchema,
+            )
 
-@validate.register
-def _validate_attrschema(schema: AttrSchema, value):
-    new = copy(value)
+        try:
+            result = method(value)
+        except TypeError as err:
+            raise ValidationError(err, schema=RegexSchema) from None
 
-    for key, subschema in schema.schema.items():
-        if not hasattr(value, key):
+        if result is None:
             raise ValidationError(
-                "Attribute {key} not found on object {value}",
-                key=repr(key),
+                "Pattern {pattern} did not match {value}",
+                pattern=repr(pattern.pattern),
                 value=repr(value),
-                schema=AttrSchema,
+                schema=RegexSchema,
             )
 
+        return result
+
+    return validator
+
+
+@_get_validator.register
+def _validate_transformschema(schema: TransformSchema) -> _TValidator:
+    func = schema.func
+    args = schema.args
+    kwargs = schema.kwargs
+    validate(abc.Callable, func)
+
+    def validator(value):
+        return func(value, *args, **kwargs)
+
+    return validator
+
+
+@_get_validator.register
+def _validate_getitemschema(schema: GetItemSchema) -> _TValidator:
+    item = schema.item if type(schema.item) is tuple and not schema.strict else (schema.item,)
+    default = schema.default
+    last = len(item) - 1
+
+    def validator(value):
+        idx = 0
+        key = None
         try:
-            value = validate(subschema, getattr(value, key))
-        except ValidationError as err:
+            for key in item:
+                if iselement(value):
+                    value = value.attrib[key]
+                else:
+                    value = value[key]
+                idx += 1
+            return value
+        except (KeyError, IndexError):
+            # only return default value on last item in nested lookup
+            if idx < last:
+                raise ValidationError(
+                    "Item {key} was not found in object {value}",
+                    key=repr(key),
+                    value=repr(value),
+                    schema=GetItemSchema,
+                ) from None
+            return default
+        except (TypeError, AttributeError) as err:
             raise ValidationError(
-                "Could not validate attribute {key}",
+                "Could not get key {key} from object {value}",
                 key=repr(key),
-                schema=AttrSchema,
+                value=repr(value),
+                schema=GetItemSchema,
             ) from err
 
-        setattr(new, key, value)
+    return validator
 
-    return new
 
+@_get_validator.register
+def _validate_attrschema(schema: AttrSchema) -> _TValidator:
+    entries = tuple((key, compile_schema(subschema)) for key, subschema in schema.schema.items())
 
-@validate.register
-def _validate_xmlelementschema(schema: XmlElementSchema, value):
-    validate(iselement, value)
-    tag = value.tag
-    attrib = value.attrib
-    text = value.text
-    tail = value.tail
+    def validator(value):
+        new = copy(value)
 
-    if schema.tag is not None:
-        try:
-            tag = validate(schema.tag, value.tag)
-        except ValidationError as err:
-            raise ValidationError("Unable to validate XML tag", schema=XmlElementSchema) from err
+        for key, subvalidator in entries:
+            if not hasattr(value, key):
+                raise ValidationError(
+                    "Attribute {key} not found on object {value}",
+                    key=repr(key),
+                    value=repr(value),
+                    schema=AttrSchema,
+                )
 
-    if schema.attrib is not None:
-        try:
-            attrib = validate(schema.attrib, dict(value.attrib))
-        except ValidationError as err:
-            raise ValidationError("Unable to validate XML attributes", schema=XmlElementSchema) from err
+            try:
+                value = subvalidator(getattr(value, key))
+            except ValidationError as err:
+                raise ValidationError(
+                    "Could not validate attribute {key}",
+                    key=repr(key),
+                    schema=AttrSchema,
+                ) from err
 
-    if schema.text is not None:
-        try:
-            text = validate(schema.text, value.text)
-        except ValidationError as err:
-            raise ValidationError("Unable to validate XML text", schema=XmlElementSchema) from err
+            setattr(new, key, value)
 
-    if schema.tail is not None:
-        try:
-            tail = validate(schema.tail, value.tail)
-        except ValidationError as err:
-            raise ValidationError("Unable to validate XML tail", schema=XmlElementSchema) from err
+        return new
 
-    new = Element(tag, attrib)
-    new.text = text
-    new.tail = tail
-    for child in value:
-        new.append(deepcopy(child))
+    return validator
 
-    return new
 
+@_get_validator.register
+def _validate_xmlelementschema(schema: XmlElementSchema) -> _TValidator:
+    validate_element = compile_schema(iselement)
+    validate_tag = None if schema.tag is None else compile_schema(schema.tag)
+    validate_attrib = None if schema.attrib is None else compile_schema(schema.attrib)
+    validate_text = None if schema.text is None else compile_schema(schema.text)
+    validate_tail = None if schema.tail is None else compile_schema(schema.tail)
 
-@validate.register
-def _validate_uniongetschema(schema: UnionGetSchema, value):
-    return schema.seq(validate(getter, value) for getter in schema.getters)
+    def validator(value):
+        validate_element(value)
+        tag = value.tag
+        attrib = value.attrib
+        text = value.text
+        tail = value.tail
 
+        if validate_tag is not None:
+            try:
+                tag = validate_tag(value.tag)
+            except ValidationError as err:
+                raise ValidationError("Unable to validate XML tag", schema=XmlElementSchema) from err
 
-@validate.register
-def _validate_unionschema(schema: UnionSchema, value):
-    try:
-        return validate_union(schema.schema, value)
-    except ValidationError as err:
-        raise ValidationError("Could not validate union", schema=UnionSchema) from err
+        if validate_attrib is not None:
+            try:
+                attrib = validate_attrib(dict(value.attrib))
+            except ValidationError as err:
+                raise ValidationError("Unable to validate XML attributes", schema=XmlElementSchema) from err
+
+        if validate_text is not None:
+            try:
+                text = validate_text(value.text)
+            except ValidationError as err:
+                raise ValidationError("Unable to validate XML text", schema=XmlElementSchema) from err
+
+        if validate_tail is not None:
+            try:
+                tail = validate_tail(value.tail)
+            except ValidationError as err:
+                raise ValidationError("Unable to validate XML tail", schema=XmlElementSchema) from err
+
+        new = Element(tag, attrib)
+        new.text = text
+        new.tail = tail
+        for child in value:
+            new.append(deepcopy(child))
+
+        return new
+
+    return validator
+
+
+@_get_validator.register
+def _validate_uniongetschema(schema: UnionGetSchema) -> _TValidator:
+    seq = schema.seq
+    getters = tuple(compile_schema(getter) for getter in schema.getters)
+
+    def validator(value):
+        return seq(getter(value) for getter in getters)
+
+    return validator
+
+
+@_get_validator.register
+def _validate_unionschema(schema: UnionSchema) -> _TValidator:
+    validate_union = _get_union_validator(schema.schema)
+
+    def validator(value):
+        try:
+            return validate_union(value)
+        except ValidationError as err:
+            raise ValidationError("Could not validate union", schema=UnionSchema) from err
+
+    return validator
 
 
 # ----
 
 
-# noinspection PyUnusedLocal
 @singledispatch
-def validate_union(schema, value):
-    raise ValidationError(
-        "Invalid union type: {type}",
-        type=type(schema).__name__,
-    )
+def _get_union_validator(schema) -> _TValidator:
+    # noinspection PyUnusedLocal
+    def validator(value):
+        raise ValidationError(
+            "Invalid union type: {type}",
+            type=type(schema).__name__,
+        )
+
+    return validator
 
 
-@validate_union.register
-def _validate_union_dict(schema: dict, value):
-    new = type(schema)()
+@_get_union_validator.register
+def _validate_union_dict(schema: dict) -> _TValidator:
+    cls = type(schema)
+    entries = []
     for key, subschema in schema.items():
         is_optional = isinstance(key, OptionalSchema)
-        if is_optional:
-            key = key.key
+        entries.append((key.key if is_optional else key, is_optional, compile_schema(subschema)))
 
-        try:
-            new[key] = validate(subschema, value)
-        except ValidationError as err:
-            if is_optional:
-                continue
+    def validator(value):
+        new = cls()
+        for key, is_optional, subvalidator in entries:
+            try:
+                new[key] = subvalidator(value)
+            except ValidationError as err:
+                if is_optional:
+                    continue
 
-            raise ValidationError(
-                "Unable to validate union {key}",
-                key=repr(key),
-                schema=dict,
-            ) from err
+                raise ValidationError(
+                    "Unable to validate union {key}",
+                    key=repr(key),
+                    schema=dict,
+                ) from err
+
+        return new
 
-    return new
+    return validator
 
 
 # singledispatch doesn't support typing.Union/types.UnionType on py<311, so keep each register() call for now
-@validate_union.register(list)
-@validate_union.register(tuple)
-@validate_union.register(set)
-@validate_union.register(frozenset)
-def _validate_union_sequence(schemas: list | tuple | set | frozenset, value):
-    return type(schemas)(validate(schema, value) for schema in schemas)
+@_get_union_validator.register(list)
+@_get_union_validator.register(tuple)
+@_get_union_validator.register(set)
+@_get_union_validator.register(frozenset)
+def _validate_union_sequence(schemas: list | tuple | set | frozenset) -> _TValidator:
+    cls = type(schemas)
+    validators = tuple(compile_schema(schema) for schema in schemas)
+
+    def validator(value):
+        return cls(subvalidator(value) for subvalidator in validators)
+
+    return validator
@@ -11,6 +11,7 @@ import trio
 from trio_websocket import ConnectionClosed, connect_websocket_url
 
 from streamlink.logger import getLogger
+from streamlink.utils import json as jsonlib
 from streamlink.webbrowser.cdp.devtools.target import SessionID, attach_to_target, create_target
 from streamlink.webbrowser.cdp.devtools.util import CDPEvent, parse_json_event
 from streamlink.webbrowser.cdp.exceptions import CDPError
@@ -189,7 +190,7 @@ class CDPBase:
         if self.session_id:
             cmd_data["sessionId"] = self.session_id
 
-        message = json.dumps(cmd_data, separators=(",", ":"), sort_keys=True)
+        message = jsonlib.dumps(cmd_data, sort_keys=True)
         log.all("Sending message: %(message)s", dict(message=message))
         with trio.move_on_after(self.cmd_timeout if timeout is None else timeout) as cancel_scope:
             try:
@@ -351,7 +352,7 @@ class CDPConnection(CDPBase, trio.abc.AsyncResource):
                 break
 
             try:
-                data = json.loads(message)
+                data = jsonlib.loads(message)
             except json.JSONDecodeError as err:
                 raise CDPError(f"Received invalid CDP JSON data: {err}") from err
 
@@ -411,6 +411,10 @@ def build_parser():
 
             Status code is `0` on success, `1` on failure.
 
+            If URL is `-`, read URLs from stdin, one per line, and resolve them concurrently.
+            The results get written as JSON lines with the `url`, `plugin` and `resolved_url` keys,
+            in the same order as the input. Status code is `0` if all URLs can be handled, `1` otherwise.
+
             Useful for external scripting.
         """,
     )
@@ -430,6 +434,7 @@ def build_parser():
 
             If disabled, plugins won't be able to load or store data like cookies, authentication data, etc.
             The data which is loaded or stored depends on each plugin implementation.
+            The validated data of Streamlink's built-in plugins doesn't get cached either.
         """,
     )
     plugin.add_argument(
@@ -497,6 +502,40 @@ def build_parser():
             Resolve address names to IPv6 only. This option overrides --ipv4.
         """,
     )
+    network.add_argument(
+        "--dns-cache-ttl",
+        type=num(float, ge=0),
+        metavar="SECONDS",
+        help="""
+            Cache resolved address names for the given amount of seconds, instead of resolving them
+            on each new connection. Cached addresses get discarded if connecting to them fails.
+
+            Default is 0.0 (disabled).
+        """,
+    )
+    network.add_argument(
+        "--resolve-url-cache-ttl",
+        type=num(float, ge=0),
+        metavar="SECONDS",
+        help="""
+            Cache the plugin and the final URL of input URLs which don't match any plugin and which have to be
+            resolved by following HTTP redirects, for the given amount of seconds. This avoids the redirect
+            requests on subsequent runs. Cached entries get stored in the cache directory,
+            unless --no-plugin-cache is set.
+
+            Default is 0.0 (disabled).
+        """,
+    )
+    network.add_argument(
+        "--happy-eyeballs",
+        action="store_true",
+        default=None,
+        help="""
+            Race connection attempts to all resolved addresses of a host (RFC 8305), alternating between IPv6 and IPv4
+            and starting a new attempt every 250 milliseconds, instead of waiting for each address to time out one
+            after another. Respects --ipv4, --ipv6 and --interface.
+        """,
+    )
 
     player = parser.add_argument_group("Player options")
     player.add_argument(
@@ -1047,6 +1086,16 @@ def build_parser():
             By default, wait three times as long for new segments to be made available than the server's advertised time frame.
         """,
     )
+    transport.add_argument(
+        "--stream-bandwidth-cache",
+        action="store_true",
+        default=None,
+        help="""
+            Store the estimated download bandwidth of segmented streams in the cache directory,
+            so that subsequent runs can start with the bandwidth estimate of the previous run,
+            unless --no-plugin-cache is set.
+        """,
+    )
     transport.add_argument(
         "--stream-timeout",
         type=num(float, gt=0),
@@ -1231,6 +1280,18 @@ def build_parser():
         """,
     )
 
+    transport_dash.add_argument(
+        "--dash-segment-spread",
+        action="store_true",
+        default=None,
+        help="""
+            Spread parallel DASH segment downloads across all healthy content locations
+            if the manifest lists multiple redundant base URLs, e.g. of different CDNs.
+
+            Segment downloads always fail over to the next location on errors or timeouts, regardless of this option.
+        """,
+    )
+
     transport_ffmpeg.add_argument(
         "--ffmpeg-ffmpeg",
         metavar="FILENAME",
@@ -1434,6 +1495,42 @@ def build_parser():
             Use with caution, as it has TLS/SSL security implications.
         """,
     )
+    http.add_argument(
+        "--http-http2",
+        action="store_true",
+        default=None,
+        help="""
+            Send HTTPS requests via multiplexed HTTP/2 connections if supported by the server,
+            so that playlist reloads and parallel segment downloads can share a single connection per host.
+
+            Falls back to HTTP/1.1 if HTTP/2 is not supported by the server, or if a proxy or client certificate is used.
+
+            Requires the optional h2 dependency.
+        """,
+    )
+    http.add_argument(
+        "--http-cache",
+        action="store_true",
+        default=None,
+        help="""
+            Cache responses of HLS multivariant playlists, DASH manifests and other metadata requests
+            according to their Cache-Control, Expires, ETag and Last-Modified headers, and revalidate stale
+            responses using conditional requests.
+
+            Cached responses get stored in the cache directory, unless --no-plugin-cache is set.
+        """,
+    )
+    http.add_argument(
+        "--http-timings",
+        action="store_true",
+        default=None,
+        help="""
+            Log the durations of the DNS resolution, connection establishment, TLS handshake, time to first byte
+            and response body transfer of each HTTP request, as well as whether a connection was reused.
+
+            Timings get logged as JSON on the debug log level.
+        """,
+    )
     http.add_argument(
         "--http-ssl-cert",
         metavar="PEM_FILENAME",
@@ -1554,6 +1651,9 @@ _ARGUMENT_TO_SESSIONOPTION: list[tuple[str, str, Callable[[Any], Any] | type | N
     ("interface", "interface", None),
     ("ipv4", "ipv4", None),
     ("ipv6", "ipv6", None),
+    ("dns_cache_ttl", "dns-cache-ttl", None),
+    ("resolve_url_cache_ttl", "resolve-url-cache-ttl", None),
+    ("happy_eyeballs", "happy-eyeballs", None),
     # HTTP session arguments
     ("https_proxy", "https-proxy", None),
     ("http_proxy", "http-proxy", None),
@@ -1564,6 +1664,9 @@ _ARGUMENT_TO_SESSIONOPTION: list[tuple[str, str, Callable[[Any], Any] | type | N
     ("http_ignore_env", "http-trust-env", None),
     ("http_no_ssl_verify", "http-ssl-verify", None),
     ("http_disable_dh", "http-disable-dh", None),
+    ("http_http2", "http-http2", None),
+    ("http_cache", "http-cache", None),
+    ("http_timings", "http-timings", None),
     ("http_ssl_cert", "http-ssl-cert", None),
     ("http_ssl_cert_crt_key", "http-ssl-cert", tuple),
     ("http_timeout", "http-timeout", None),
@@ -1577,6 +1680,7 @@ _ARGUMENT_TO_SESSIONOPTION: list[tuple[str, str, Callable[[Any], Any] | type | N
     ("stream_segment_timeout", "stream-segment-timeout", None),
     ("stream_segmented_duration", "stream-segmented-duration", None),
     ("stream_segmented_queue_deadline", "stream-segmented-queue-deadline", None),
+    ("stream_bandwidth_cache", "stream-bandwidth-cache", None),
     ("stream_timeout", "stream-timeout", None),
     ("stream_passthrough_encrypted", "stream-passthrough-encrypted", None),
     ("hls_live_edge", "hls-live-edge", None),
@@ -1589,6 +1693,7 @@ _ARGUMENT_TO_SESSIONOPTION: list[tuple[str, str, Callable[[Any], Any] | type | N
     ("hls_segment_key_uri", "hls-segment-key-uri", None),
     ("hls_audio_select", "hls-audio-select", None),
     ("dash_manifest_reload_attempts", "dash-manifest-reload-attempts", None),
+    ("dash_segment_spread", "dash-segment-spread", None),
     ("ffmpeg_ffmpeg", "ffmpeg-ffmpeg", None),
     ("ffmpeg_no_validation", "ffmpeg-no-validation", None),
     ("ffmpeg_verbose", "ffmpeg-verbose", None),
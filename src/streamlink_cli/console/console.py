@@ -145,3 +145,14 @@ class ConsoleOutput:
         if self._file_output is not None:
             msg = dumps(out, cls=JSONEncoder, ensure_ascii=False, indent=2)
             self._write(self._file_output, f"{msg}\n")
+
+    def msg_json_line(self, **keywords: Any) -> None:
+        """Write a single line of compact JSON data, regardless of the JSON output mode"""
+        if self._console_output is not None:
+            ensure_ascii = self._console_output.encoding != "utf-8"
+            msg = dumps(keywords, cls=JSONEncoder, ensure_ascii=ensure_ascii, separators=(",", ":"))
+            self._write_console(f"{msg}\n")
+
+        if self._file_output is not None:
+            msg = dumps(keywords, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"))
+            self._write(self._file_output, f"{msg}\n")
@@ -17,11 +17,11 @@ from time import sleep
 from typing import TYPE_CHECKING, Any
 
 import streamlink.logger as logger
+import streamlink.utils.times as times
 from streamlink import NoPluginError, PluginError, StreamError, Streamlink, __version__ as streamlink_version
 from streamlink.exceptions import FatalPluginError, StreamlinkDeprecationWarning
 from streamlink.logger import getLogger
 from streamlink.utils.named_pipe import NamedPipe
-from streamlink.utils.times import LOCAL as LOCALTIMEZONE
 from streamlink_cli.argparser import (
     build_parser,
     setup_plugin_args,
@@ -79,7 +79,7 @@ def get_formatter(plugin: Plugin):
             "category": plugin.get_category,
             "game": plugin.get_category,
             "title": plugin.get_title,
-            "time": lambda: datetime.now(tz=LOCALTIMEZONE),
+            "time": lambda: datetime.now(tz=times.LOCAL),
         },
         {
             "time": lambda dt, fmt: dt.strftime(fmt),
@@ -711,6 +711,9 @@ def can_handle_url() -> int:
     url = args.can_handle_url or args.can_handle_url_no_redirect or ""
     follow_redirect = bool(args.can_handle_url)
 
+    if url == "-":
+        return can_handle_urls(follow_redirect)
+
     try:
         streamlink.resolve_url(url, follow_redirect=follow_redirect)
         return 0
@@ -720,6 +723,24 @@ def can_handle_url() -> int:
         return 128 + signal.SIGINT
 
 
+def can_handle_urls(follow_redirect: bool) -> int:
+    """Resolves URLs read from stdin, one per line, and outputs the results as JSON lines."""
+    exit_code = 0
+    urls = (url for line in sys.stdin if (url := line.strip()))
+
+    try:
+        for url, resolved in streamlink.resolve_urls(urls, follow_redirect=follow_redirect):
+            if resolved is None:
+                exit_code = 1
+                console.msg_json_line(url=url, plugin=None, resolved_url=None)
+            else:
+                console.msg_json_line(url=url, plugin=resolved[0], resolved_url=resolved[2])
+    except KeyboardInterrupt:
+        return 128 + signal.SIGINT
+
+    return exit_code
+
+
 def load_plugins(session: Streamlink, dirs: list[Path], showwarning: bool = True):
     """Attempts to load plugins from a list of directories."""
     for directory in dirs:
@@ -815,7 +836,11 @@ def setup_streamlink():
     """Creates the Streamlink session."""
     global streamlink
 
-    streamlink = Streamlink({"user-input-requester": ConsoleUserInputRequester(console)})
+    streamlink = Streamlink({
+        "user-input-requester": ConsoleUserInputRequester(console),
+        # the plugins data cache gets set up when initializing the session
+        "no-plugin-cache": bool(args.no_plugin_cache),
+    })
 
 
 def log_root_warning():
@@ -935,7 +960,7 @@ def setup_logger() -> None:
             datefmt = "%H:%M:%S"
 
     if file == "-":
-        filename = LOG_DIR / f"{datetime.now(tz=LOCALTIMEZONE)}.log"
+        filename = LOG_DIR / f"{datetime.now(tz=times.LOCAL)}.log"
     elif file:
         filename = Path(file).expanduser().resolve()
     else:
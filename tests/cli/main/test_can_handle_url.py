@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import re
 from typing import TYPE_CHECKING
 
@@ -84,3 +85,68 @@ def test_can_handle_url(requests_mock: rm.Mocker, session: Streamlink, argv: lis
     with pytest.raises(SystemExit) as exc_info:
         streamlink_cli.main.main()
     assert exc_info.value.code == exit_code
+
+
+@pytest.mark.parametrize(
+    ("argv", "stdin", "exit_code", "output"),
+    [
+        pytest.param(
+            ["--can-handle-url", "-"],
+            "http://exists\n\nhttp://exists-redirect\n",
+            0,
+            [
+                '{"url":"http://exists","plugin":"plugin","resolved_url":"http://exists"}',
+                '{"url":"http://exists-redirect","plugin":"plugin","resolved_url":"http://exists"}',
+            ],
+            id="all",
+        ),
+        pytest.param(
+            ["--can-handle-url", "-"],
+            "http://exists\nhttp://missing\n",
+            1,
+            [
+                '{"url":"http://exists","plugin":"plugin","resolved_url":"http://exists"}',
+                '{"url":"http://missing","plugin":null,"resolved_url":null}',
+            ],
+            id="missing",
+        ),
+        pytest.param(
+            ["--can-handle-url-no-redirect", "-"],
+            "http://exists\nhttp://exists-redirect\n",
+            1,
+            [
+                '{"url":"http://exists","plugin":"plugin","resolved_url":"http://exists"}',
+                '{"url":"http://exists-redirect","plugin":null,"resolved_url":null}',
+            ],
+            id="no-redirect",
+        ),
+        pytest.param(
+            ["--can-handle-url", "-"],
+            "http://aborted\n",
+            130,
+            [],
+            id="aborted",
+        ),
+    ],
+    indirect=["argv"],
+)
+def test_can_handle_url_stdin(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    requests_mock: rm.Mocker,
+    session: Streamlink,
+    argv: list,
+    stdin: str,
+    exit_code: int,
+    output: list[str],
+):
+    requests_mock.request(rm.ANY, "http://aborted", exc=KeyboardInterrupt)  # type: ignore[arg-type, ty:invalid-argument-type]
+    requests_mock.request(rm.ANY, "http://exists", content=b"")
+    requests_mock.request(rm.ANY, "http://exists-redirect", status_code=301, headers={"Location": "http://exists"})
+    requests_mock.request(rm.ANY, "http://missing", content=b"")
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+
+    with pytest.raises(SystemExit) as exc_info:
+        streamlink_cli.main.main()
+    assert exc_info.value.code == exit_code
+    assert capsys.readouterr().out.splitlines() == output
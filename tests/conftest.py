@@ -16,6 +16,7 @@ from streamlink.utils.thread import _threadname_counters  # noqa: PLC2701
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
+    from pathlib import Path
 
 
 _TEST_CONDITION_MARKERS: Mapping[str, tuple[bool, str] | Callable[[Any], tuple[bool, str]]] = {
@@ -92,6 +93,25 @@ def _check_test_condition(item: pytest.Item):  # pragma: no cover
 # ========================
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _cache_dir(tmp_path_factory: pytest.TempPathFactory):
+    """
+    Don't read from or write to the user's cache directory
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("streamlink.cache.CACHE_DIR", tmp_path_factory.mktemp("cache"))
+        yield
+
+
+@pytest.fixture()
+def cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """
+    An empty cache directory of the current test
+    """
+    monkeypatch.setattr("streamlink.cache.CACHE_DIR", tmp_path)
+    return tmp_path
+
+
 @pytest.fixture()
 def session(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
     options = getattr(request, "param", {})
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import unittest
-from contextlib import nullcontext
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, Mock, call, patch
@@ -20,6 +20,8 @@ from tests.resources import text
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     import requests_mock as rm
 
     from streamlink import Streamlink
@@ -1272,3 +1274,43 @@ class TestTwitchMetadata:
     @pytest.mark.parametrize(("mock_request_clip", "metadata"), [(False, "https://clips.twitch.tv/foo")], indirect=True)
     def test_metadata_clip_no_data(self, mock_request_clip, metadata):
         assert metadata == (None, None, None, None)
+
+
+class TestTwitchClientIntegrityToken:
+    @pytest.fixture()
+    def plugin(self, session: Streamlink, cache_dir: Path):
+        return Twitch(session, "https://twitch.tv/channelname", Options())
+
+    @pytest.fixture()
+    def acquire(self, monkeypatch: pytest.MonkeyPatch):
+        mock_acquire = Mock(return_value=("client-integrity-token", 9999999999.0))
+        monkeypatch.setattr("streamlink.plugins.twitch.TwitchClientIntegrity.acquire", mock_acquire)
+
+        return mock_acquire
+
+    def test_cached(self, plugin: Twitch, acquire: Mock):
+        plugin.cache.set("client-integrity", ["device-id", "cached-token"])
+        with patch.object(plugin.cache, "lock") as mock_lock:
+            assert plugin._client_integrity_token("channelname") == ("device-id", "cached-token")
+        # cache hits don't take the lock
+        assert mock_lock.call_count == 0
+        assert acquire.call_count == 0
+
+    def test_acquire(self, plugin: Twitch, acquire: Mock):
+        with patch.object(plugin.cache, "lock", wraps=plugin.cache.lock) as mock_lock:
+            device_id, token = plugin._client_integrity_token("channelname")  # type: ignore[misc]
+        assert token == "client-integrity-token"
+        assert mock_lock.call_args_list == [call("client-integrity")]
+        assert acquire.call_count == 1
+        assert plugin.cache.get("client-integrity") == [device_id, "client-integrity-token"]
+
+    def test_acquired_while_waiting(self, plugin: Twitch, acquire: Mock):
+        @contextmanager
+        def lock(key):
+            # another process stores its token while this one is waiting for the lock
+            plugin.cache.set(key, ["other-device-id", "other-token"])
+            yield True
+
+        with patch.object(plugin.cache, "lock", side_effect=lock):
+            assert plugin._client_integrity_token("channelname") == ("other-device-id", "other-token")
+        assert acquire.call_count == 0
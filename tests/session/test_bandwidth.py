@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import gc
+from unittest.mock import Mock, call
+
+import pytest
+
+from streamlink.session.bandwidth import BandwidthEstimator
+
+
+class TestBandwidthEstimator:
+    def test_update(self):
+        estimator = BandwidthEstimator()
+        assert estimator.bandwidth is None
+        assert estimator.latency is None
+        assert estimator.samples == 0
+
+        estimator.update(125_000, 0.0, 0.1)
+        assert estimator.bandwidth is None
+        assert estimator.samples == 0
+
+        estimator.update(125_000, 1.0, 0.1)
+        assert estimator.bandwidth == pytest.approx(1000.0)
+        assert estimator.latency == pytest.approx(0.1)
+        assert estimator.samples == 1
+
+        estimator.update(125_000, 0.5)
+        assert estimator.bandwidth == pytest.approx(1300.0)
+        assert estimator.latency == pytest.approx(0.1)
+        assert estimator.samples == 2
+
+        estimator.update(125_000, 0.5, 0.2)
+        assert estimator.latency == pytest.approx(0.13)
+
+        estimator.reset()
+        assert estimator.bandwidth is None
+        assert estimator.latency is None
+        assert estimator.samples == 0
+
+    @pytest.mark.parametrize(
+        ("data", "bandwidth", "latency"),
+        [
+            pytest.param(None, None, None, id="empty"),
+            pytest.param({"bandwidth": 2000.0, "latency": 0.1}, 2000.0, 0.1, id="stored"),
+            pytest.param({"bandwidth": 2000.0, "latency": None}, 2000.0, None, id="no-latency"),
+            pytest.param({"bandwidth": "foo"}, None, None, id="invalid"),
+            pytest.param({"latency": 0.1}, None, None, id="missing"),
+        ],
+    )
+    def test_persist_load(self, monkeypatch: pytest.MonkeyPatch, data, bandwidth, latency):
+        mock_cache = Mock()
+        mock_cache.return_value.get.return_value = data
+        monkeypatch.setattr("streamlink.session.bandwidth.Cache", mock_cache)
+
+        estimator = BandwidthEstimator()
+        estimator.persist()
+        assert mock_cache.call_args_list[0].args == ("bandwidth.json",)
+        assert estimator.bandwidth == bandwidth
+        assert estimator.latency == latency
+
+    def test_persist_store(self, monkeypatch: pytest.MonkeyPatch):
+        mock_cache = Mock()
+        mock_cache.return_value.get.return_value = {"bandwidth": 2000.0, "latency": 0.1}
+        monkeypatch.setattr("streamlink.session.bandwidth.Cache", mock_cache)
+        mock_monotonic = Mock(return_value=100.0)
+        monkeypatch.setattr("streamlink.session.bandwidth.monotonic", mock_monotonic)
+        mock_set = mock_cache.return_value.set
+
+        estimator = BandwidthEstimator()
+        estimator.update(125_000, 1.0)
+        assert estimator.bandwidth == pytest.approx(1000.0)
+
+        # doesn't override the estimate of the current session
+        estimator.persist()
+        assert mock_cache.call_args_list == [call("bandwidth.json", disabled=False)]
+        assert estimator.bandwidth == pytest.approx(1000.0)
+        assert not mock_set.called
+
+        # stores the first update immediately
+        estimator.update(125_000, 1.0, 0.2)
+        assert mock_set.call_args_list == [call("estimate", {"bandwidth": 1000.0, "latency": 0.2}, expires=86400)]
+
+        # throttles subsequent updates
+        mock_monotonic.return_value = 109.0
+        estimator.update(125_000, 0.5)
+        estimator.update(125_000, 0.5)
+        assert mock_set.call_count == 1
+        mock_monotonic.return_value = 110.0
+        estimator.update(125_000, 0.5)
+        assert mock_set.call_count == 2
+        assert mock_set.call_args.args[1] == {"bandwidth": pytest.approx(1657.0), "latency": 0.2}
+
+        # stores the pending estimate when flushing
+        mock_monotonic.return_value = 111.0
+        estimator.update(125_000, 0.5)
+        assert mock_set.call_count == 2
+        estimator.flush()
+        assert mock_set.call_count == 3
+        assert mock_set.call_args.args[1] == {"bandwidth": pytest.approx(1759.9), "latency": 0.2}
+        estimator.flush()
+        assert mock_set.call_count == 3
+
+        # stores the pending estimate when disabling persistence
+        estimator.update(125_000, 0.5)
+        estimator.persist(enable=False)
+        assert mock_set.call_count == 4
+        assert mock_set.call_args.args[1] == {"bandwidth": pytest.approx(1831.93), "latency": 0.2}
+
+        estimator.update(125_000, 1.0)
+        estimator.flush()
+        assert mock_set.call_count == 4
+
+    def test_persist_disabled(self, monkeypatch: pytest.MonkeyPatch):
+        mock_cache = Mock()
+        monkeypatch.setattr("streamlink.session.bandwidth.Cache", mock_cache)
+
+        estimator = BandwidthEstimator()
+        estimator.persist(disabled=True)
+        assert mock_cache.call_args_list == [call("bandwidth.json", disabled=True)]
+
+    def test_persist_finalize(self, monkeypatch: pytest.MonkeyPatch):
+        mock_cache = Mock()
+        mock_cache.return_value.get.return_value = None
+        monkeypatch.setattr("streamlink.session.bandwidth.Cache", mock_cache)
+        mock_set = mock_cache.return_value.set
+
+        estimator = BandwidthEstimator()
+        estimator.persist()
+        estimator.update(125_000, 1.0)
+        estimator.update(125_000, 0.5)
+        assert mock_set.call_count == 1
+
+        # stores the pending estimate when the estimator gets garbage-collected or on exit
+        del estimator
+        gc.collect()
+        assert mock_set.call_count == 2
+        assert mock_set.call_args.args[1] == {"bandwidth": pytest.approx(1300.0), "latency": None}
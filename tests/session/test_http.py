@@ -19,12 +19,15 @@ from urllib3.response import HTTPResponse
 
 from streamlink.exceptions import PluginError, StreamlinkDeprecationWarning
 from streamlink.session.http import (
+    ConnectionPoolStats,
+    HTTPRequestTemplate,
     HTTPSession,
     SSLContextAdapter,
     TLSNoDHAdapter,
     TLSSecLevel1Adapter,
     urllib3_set_socket_options,
 )
+from streamlink.session.http_connection import HAPPY_EYEBALLS_DELAY
 from streamlink.session.http_useragents import DEFAULT
 
 
@@ -35,6 +38,7 @@ if TYPE_CHECKING:
 
 
 _original_allowed_gai_family = urllib3.util.connection.allowed_gai_family  # type: ignore[attr-defined, ty:unresolved-attribute]
+_original_create_connection = urllib3.util.connection.create_connection
 
 
 class TestUrllib3Overrides:
@@ -198,6 +202,7 @@ class TestHTTPSession:
             ("utf-8-sig", None),
             # Override
             ("utf-8", "utf-8"),
+            ("utf-8-sig", "utf-8"),
             ("cp949", "cp949"),
         ],
     )
@@ -210,6 +215,41 @@ class TestHTTPSession:
 
         assert HTTPSession.json(res) == {"test": "Α and Ω"}  # noqa: RUF001
 
+    def test_json_utf8_invalid(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("requests.Response.content", PropertyMock(return_value=b'{"a":"\xff\xfe ok"}'))
+
+        res = requests.Response()
+        res.encoding = "utf-8"
+
+        assert HTTPSession.json(res) == {"a": "\ufffd\ufffd ok"}
+
+    def test_json_utf8_error(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("requests.Response.content", PropertyMock(return_value=b'{"a":"\xff"'))
+
+        res = requests.Response()
+        res.encoding = "utf-8"
+
+        # the error message of the decoded string value
+        with pytest.raises(PluginError) as cm:
+            HTTPSession.json(res)
+        assert str(cm.value) == "Unable to parse JSON: Expecting ',' delimiter: line 1 column 9 (char 8) ('{\"a\":\"\ufffd\"')"
+
+    def test_json_utf8_schema(self, monkeypatch: pytest.MonkeyPatch):
+        mock_content = PropertyMock(return_value=b'{"a":"b"}')
+        mock_text = PropertyMock(return_value='{"a":"b"}')
+        monkeypatch.setattr("requests.Response.content", mock_content)
+        monkeypatch.setattr("requests.Response.text", mock_text)
+        schema = Mock(validate=Mock(side_effect=PluginError("validation error")))
+
+        res = requests.Response()
+        res.encoding = "utf-8"
+
+        # schema validation errors are not caught, and the data doesn't get decoded and parsed again
+        with pytest.raises(PluginError, match=r"^validation error$"):
+            HTTPSession.json(res, schema=schema)
+        assert schema.validate.call_args_list == [call({"a": "b"}, name="JSON", exception=PluginError)]
+        assert mock_text.call_count == 0
+
     @pytest.mark.parametrize(
         ("content_type", "encoding", "content", "expected"),
         [
@@ -523,6 +563,49 @@ class TestHTTPSession:
         session.set_address_family(family=None)
         assert mock_urllib3_util_connection.allowed_gai_family is _original_allowed_gai_family
 
+    def test_set_dns_cache_and_happy_eyeballs(self):
+        session = HTTPSession()
+        connector = session._connector
+        assert connector.dns_cache is None
+        assert connector.happy_eyeballs_delay is None
+        assert not connector.active
+
+        session.set_dns_cache(ttl=60.0)
+        assert connector.dns_cache is not None
+        assert connector.dns_cache.ttl == 60.0  # noqa: RUF069
+        assert connector.happy_eyeballs_delay is None
+        assert connector.active
+
+        session.set_happy_eyeballs(enable=True)
+        assert connector.dns_cache is not None
+        assert connector.happy_eyeballs_delay == HAPPY_EYEBALLS_DELAY
+
+        session.set_dns_cache(ttl=None)
+        assert connector.dns_cache is None
+        assert connector.happy_eyeballs_delay == HAPPY_EYEBALLS_DELAY
+        assert connector.active
+
+        session.set_happy_eyeballs(enable=False)
+        assert connector.happy_eyeballs_delay is None
+        assert not connector.active
+        assert session._connector is connector
+        assert urllib3.util.connection.create_connection is _original_create_connection
+
+    def test_connector_per_session(self):
+        session_a = HTTPSession()
+        session_b = HTTPSession()
+        session_a.set_dns_cache(ttl=60.0)
+        session_a.set_happy_eyeballs(enable=True)
+
+        assert session_a._connector is not session_b._connector
+        assert session_b._connector.dns_cache is None
+        assert session_b._connector.happy_eyeballs_delay is None
+        assert urllib3.util.connection.create_connection is _original_create_connection
+
+        for session in session_a, session_b:
+            pool = session.adapters["https://"].poolmanager.connection_from_url("https://host/")
+            assert pool.conn_kw["connector"] is session._connector
+
     def test_disable_dh(self):
         session = HTTPSession()
 
@@ -542,6 +625,248 @@ class TestHTTPSession:
         assert session.adapters["https://"].poolmanager.connection_pool_kw.get("source_address") == ("0.0.0.0", 0)
 
 
+class TestHTTPRequestTemplate:
+    @pytest.fixture()
+    def httpsession(self) -> HTTPSession:
+        session = HTTPSession()
+        session.headers["User-Agent"] = "foo"
+        session.headers["Accept"] = "*/*"
+        session.params["session"] = "1"
+        session.cookies.set("session", "1", domain="host.local")
+
+        return session
+
+    def test_request(self, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        template = HTTPRequestTemplate(
+            httpsession,
+            method="POST",
+            url="http://ignored/",
+            headers={"Accept": None, "X-Foo": "bar"},
+            params={"param": "value"},
+            cookies={"cookie": "value"},
+            exception=ValueError,
+        )
+        mock = requests_mock.get(rm.ANY, text="data")
+
+        res = httpsession.get("http://host.local/path?q=1", template=template, headers={"Range": "bytes=0-9"})
+        assert res.text == "data"
+        res = httpsession.get("http://other.local/", template=template)
+        assert res.text == "data"
+
+        assert mock.call_count == 2
+        first, second = mock.request_history
+        assert first.method == "GET"
+        assert first.url == "http://host.local/path?q=1&session=1&param=value"
+        assert first.headers["User-Agent"] == "foo"
+        assert first.headers["X-Foo"] == "bar"
+        assert first.headers["Range"] == "bytes=0-9"
+        assert "Accept" not in first.headers
+        assert first.headers["Cookie"] == "session=1; cookie=value"
+        assert second.url == "http://other.local/?session=1&param=value"
+        assert "Range" not in second.headers
+        assert second.headers["Cookie"] == "cookie=value"
+
+    def test_session_cookies(self, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        template = HTTPRequestTemplate(httpsession)
+        mock = requests_mock.get(rm.ANY, text="data")
+
+        httpsession.cookies.set("new", "1", domain="host.local")
+        httpsession.get("http://host.local/", template=template)
+        assert mock.last_request.headers["Cookie"] == "session=1; new=1"
+
+    def test_retries_and_exception(self, monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        mock_sleep = Mock()
+        monkeypatch.setattr("streamlink.session.http.time.sleep", mock_sleep)
+        template = HTTPRequestTemplate(httpsession)
+        mock = requests_mock.get("http://host.local/", status_code=503)
+
+        with pytest.raises(PluginError, match=r"^Unable to open URL: http://host\.local/ \(503 Server Error: "):
+            httpsession.get("http://host.local/", template=template, retries=2)
+        assert mock.call_count == 3
+        assert mock_sleep.call_args_list == [call(0.3), call(0.6)]
+
+    def test_retry_jitter(self, monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        mock_sleep = Mock()
+        monkeypatch.setattr("streamlink.session.http.time.sleep", mock_sleep)
+        monkeypatch.setattr("streamlink.session.http_retry.random.random", Mock(side_effect=[1.0, 0.5]))
+        requests_mock.get("http://host.local/", status_code=503)
+
+        with pytest.raises(PluginError):
+            httpsession.get("http://host.local/", retries=2, retry_backoff=1.0, retry_jitter=0.5)
+        assert mock_sleep.call_args_list == [call(0.5), call(1.5)]
+
+    def test_retry_no_jitter(self, monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        mock_sleep = Mock()
+        mock_random = Mock(return_value=1.0)
+        monkeypatch.setattr("streamlink.session.http.time.sleep", mock_sleep)
+        monkeypatch.setattr("streamlink.session.http_retry.random.random", mock_random)
+        requests_mock.get("http://host.local/", status_code=503)
+
+        with pytest.raises(PluginError):
+            httpsession.get("http://host.local/", retries=2, retry_backoff=1.0)
+        assert mock_sleep.call_args_list == [call(1.0), call(2.0)]
+
+    def test_retry_after_max_backoff(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        requests_mock: rm.Mocker,
+        httpsession: HTTPSession,
+    ):
+        mock_sleep = Mock()
+        monkeypatch.setattr("streamlink.session.http.time.sleep", mock_sleep)
+        requests_mock.get("http://host.local/", [{"status_code": 429, "headers": {"Retry-After": "7"}}, {"text": "data"}])
+
+        assert httpsession.get("http://host.local/", retries=1, retry_max_backoff=5.0).text == "data"
+        assert mock_sleep.call_args_list == [call(5.0)]
+
+    @pytest.mark.parametrize(
+        ("status_code", "retry_after", "expected"),
+        [
+            pytest.param(503, "7", [call(7.0)], id="503-seconds"),
+            pytest.param(429, "7.5", [call(7.5)], id="429-seconds"),
+            pytest.param(429, "Sat, 01 Jan 2000 00:00:07 GMT", [call(7.0)], id="429-date"),
+            pytest.param(429, "0", [call(0.3)], id="backoff-longer"),
+            pytest.param(503, "3600", [call(10.0)], id="max-backoff"),
+            pytest.param(429, "invalid", [call(0.3)], id="invalid"),
+            pytest.param(500, "7", [call(0.3)], id="500-ignored"),
+        ],
+    )
+    def test_retry_after(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        requests_mock: rm.Mocker,
+        httpsession: HTTPSession,
+        status_code: int,
+        retry_after: str,
+        expected: list,
+    ):
+        mock_sleep = Mock()
+        monkeypatch.setattr("streamlink.session.http.time.sleep", mock_sleep)
+        requests_mock.get(
+            "http://host.local/",
+            [
+                {"status_code": status_code, "headers": {"Retry-After": retry_after}},
+                {"text": "data"},
+            ],
+        )
+
+        with freezegun.freeze_time("2000-01-01T00:00:00Z"):
+            assert httpsession.get("http://host.local/", retries=1).text == "data"
+        assert mock_sleep.call_args_list == expected
+
+    def test_circuit_breaker(self, monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        mock_sleep = Mock()
+        monkeypatch.setattr("streamlink.session.http.time.sleep", mock_sleep)
+        mock = requests_mock.get("http://host.local/", status_code=503)
+        mock_other = requests_mock.get("http://other.local/", text="other")
+
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            for _ in range(5):
+                with pytest.raises(PluginError, match=r"\(503 Server Error: "):
+                    httpsession.get("http://host.local/", circuit_breaker=True)
+            assert mock.call_count == 5
+
+            # fail immediately while the circuit is open
+            with pytest.raises(PluginError, match=r"\(Circuit open for http://host\.local, retrying in 5\.0s\)$"):
+                httpsession.get("http://host.local/foo", circuit_breaker=True)
+            assert mock.call_count == 5
+            assert httpsession.get("http://other.local/", circuit_breaker=True).text == "other"
+            assert mock_other.call_count == 1
+
+            # wait for the circuit's remaining hold time when retrying
+            frozen_time.tick(3)
+            mock_sleep.side_effect = frozen_time.tick
+            mock.reset()
+            requests_mock.get("http://host.local/", text="data")
+            assert httpsession.get("http://host.local/", retries=1, circuit_breaker=True).text == "data"
+            assert mock_sleep.call_args_list == [call(2.0)]
+
+    def test_circuit_breaker_disabled(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        requests_mock: rm.Mocker,
+        httpsession: HTTPSession,
+    ):
+        monkeypatch.setattr("streamlink.session.http.time.sleep", Mock())
+        mock = requests_mock.get("http://host.local/", exc=requests.ConnectionError("error"))
+
+        with pytest.raises(PluginError, match=r"\(error\)$"):
+            httpsession.get("http://host.local/", retries=9)
+        assert mock.call_count == 10
+
+    def test_environment_settings(self, monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        mock_merge_environment_settings = Mock(return_value={"proxies": {}, "stream": False, "verify": True, "cert": None})
+        monkeypatch.setattr(httpsession, "merge_environment_settings", mock_merge_environment_settings)
+        template = HTTPRequestTemplate(httpsession)
+        requests_mock.get(rm.ANY, text="data")
+
+        httpsession.get("http://host.local/a", template=template)
+        httpsession.get("http://host.local/b", template=template)
+        httpsession.get("http://host.local/c", template=template, stream=True)
+        httpsession.get("https://host.local/a", template=template)
+        assert mock_merge_environment_settings.call_args_list == [
+            call("http://host.local/a", httpsession.proxies, False, None, None),
+            call("http://host.local/c", httpsession.proxies, True, None, None),
+            call("https://host.local/a", httpsession.proxies, False, None, None),
+        ]
+
+
+class TestHTTPSessionConnectionPools:
+    def test_reserve_release(self):
+        session = HTTPSession()
+        adapter = session.adapters["https://"]
+        assert isinstance(adapter, HTTPAdapter)
+        pool = adapter.poolmanager.connection_from_url("https://host/")
+        assert session.pool_maxsize == 10
+        assert pool.pool.maxsize == 10
+        assert adapter.poolmanager.connection_pool_kw.get("maxsize", 10) == 10
+
+        session.reserve_connections(7)
+        session.reserve_connections(7)
+        assert session.pool_maxsize == 14
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 14
+        assert pool.pool.maxsize == 14
+        assert pool.pool.qsize() == 14
+        assert adapter.poolmanager.connection_from_url("https://other/").pool.maxsize == 14
+
+        # new adapters get resized on mount
+        new_adapter = HTTPAdapter()
+        session.mount("https://", new_adapter)
+        assert new_adapter.poolmanager.connection_pool_kw["maxsize"] == 14
+
+        # existing pools don't get shrunk
+        session.release_connections(7)
+        assert session.pool_maxsize == 10
+        assert new_adapter.poolmanager.connection_pool_kw["maxsize"] == 10
+        assert pool.pool.maxsize == 14
+
+        session.release_connections(100)
+        assert session.pool_maxsize == 10
+
+    def test_proxy_manager(self):
+        session = HTTPSession()
+        adapter = session.adapters["https://"]
+        assert isinstance(adapter, HTTPAdapter)
+        proxy_manager = adapter.proxy_manager_for("http://proxy:8080")
+
+        session.reserve_connections(20)
+        assert proxy_manager.connection_pool_kw["maxsize"] == 20
+
+    def test_pool_stats(self):
+        session = HTTPSession()
+        adapter = session.adapters["https://"]
+        assert isinstance(adapter, HTTPAdapter)
+        pool = adapter.poolmanager.connection_from_url("https://host/")
+        pool.num_connections = 2
+        pool.num_requests = 5
+
+        stats = session.get_pool_stats()
+        assert stats == [
+            ConnectionPoolStats(scheme="https", host="host", port=443, maxsize=10, connections=2, requests=5),
+        ]
+        assert stats[0].reused == 3
+
+
 class TestHTTPCookies:
     def test_invalid_file(self, tmp_path: Path):
         session = HTTPSession()
@@ -0,0 +1,379 @@
+from __future__ import annotations
+
+import socket
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from threading import Event, Thread
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from streamlink.exceptions import PluginError
+from streamlink.session.http import HTTPSession, TLSNoDHAdapter
+from tests.resources import __HERE__ as RESOURCES
+
+
+pytest.importorskip("h2")
+
+import h2.config
+import h2.connection
+import h2.errors
+import h2.events
+import h2.exceptions
+
+# noinspection PyProtectedMember
+from streamlink.session.http2 import _STREAM_WINDOW_SIZE, HTTP2Adapter, HTTP2Connection, HTTP2NotNegotiated  # noqa: PLC2701
+
+
+CERTFILE = str(RESOURCES / "tls" / "localhost.pem")
+
+
+_TResponses = dict[str, tuple[int, list[tuple[bytes, bytes]], bytes]]
+
+RESPONSES: _TResponses = {
+    "/small?foo=bar": (200, [(b"content-type", b"text/plain"), (b"set-cookie", b"foo=bar")], b"small"),
+    "/large": (200, [], b"x" * 100_000),
+    "/huge": (200, [], b"x" * _STREAM_WINDOW_SIZE * 4),
+    "/not-found": (404, [], b""),
+}
+
+
+class HTTP2Server(Thread):
+    def __init__(self, sock: socket.socket, responses: _TResponses, refuse: bool = False) -> None:
+        super().__init__(daemon=True)
+        self.sock = sock
+        self.responses = responses
+        self.refuse = refuse
+        self.requests: list[dict[bytes, bytes]] = []
+        # response data which can't be sent yet due to flow control, and the number of sent bytes of each stream
+        self.pending: dict[int, bytes] = {}
+        self.sent: dict[int, int] = {}
+        self.conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False, header_encoding=None))
+
+    def run(self) -> None:
+        self.conn.initiate_connection()
+        self.sock.sendall(self.conn.data_to_send())
+        with suppress(OSError):
+            while data := self.sock.recv(65535):
+                for event in self.conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        if self.refuse:
+                            # refuse all requests and close the connection
+                            self.conn.close_connection(last_stream_id=0)
+                            self.sock.sendall(self.conn.data_to_send())
+                            self.sock.close()
+                            return
+                        self.respond(event.stream_id, dict(event.headers))
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        self.send_pending()
+                    elif isinstance(event, h2.events.StreamReset):
+                        self.pending.pop(event.stream_id, None)
+                self.sock.sendall(self.conn.data_to_send())
+
+    def respond(self, stream_id: int, headers: dict[bytes, bytes]) -> None:
+        self.requests.append(headers)
+        path = headers[b":path"].decode()
+        if path not in self.responses:
+            self.conn.reset_stream(stream_id, error_code=h2.errors.ErrorCodes.INTERNAL_ERROR)
+            return
+
+        status, response_headers, body = self.responses[path]
+        self.conn.send_headers(stream_id, [(b":status", str(status).encode()), *response_headers], end_stream=not body)
+        self.sent[stream_id] = 0
+        if body:
+            self.pending[stream_id] = body
+            self.send_pending()
+
+    def send_pending(self) -> None:
+        for stream_id, body in list(self.pending.items()):
+            while body:
+                try:
+                    window = self.conn.local_flow_control_window(stream_id)
+                except h2.exceptions.StreamClosedError:
+                    body = b""
+                    break
+                size = min(window, self.conn.max_outbound_frame_size)
+                if size <= 0:
+                    break
+                self.conn.send_data(stream_id, body[:size], end_stream=size >= len(body))
+                self.sent[stream_id] += size
+                body = body[size:]
+            if body:
+                self.pending[stream_id] = body
+            else:
+                del self.pending[stream_id]
+
+
+@pytest.fixture()
+def server():
+    client_sock, server_sock = socket.socketpair()
+    server = HTTP2Server(server_sock, RESPONSES)
+    server.start()
+    with patch.object(HTTP2Adapter, "_connect", return_value=HTTP2Connection(client_sock)) as mock_connect:  # type: ignore[arg-type]
+        server.mock_connect = mock_connect
+        yield server
+    client_sock.close()
+    server_sock.close()
+
+
+class TLSHTTP2Server(Thread):
+    def __init__(self, refuse_first: bool = False) -> None:
+        super().__init__(daemon=True)
+        self.refuse_first = refuse_first
+        self.connections: list[HTTP2Server] = []
+        self.ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.ctx.load_cert_chain(CERTFILE)
+        self.ctx.set_alpn_protocols(["h2"])
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.url = f"https://127.0.0.1:{self.sock.getsockname()[1]}"
+
+    def run(self) -> None:
+        with suppress(OSError):
+            while True:
+                sock, _ = self.sock.accept()
+                tls_sock = self.ctx.wrap_socket(sock, server_side=True)
+                connection = HTTP2Server(tls_sock, RESPONSES, refuse=self.refuse_first and not self.connections)
+                self.connections.append(connection)
+                connection.start()
+
+    def close(self) -> None:
+        self.sock.close()
+        for connection in self.connections:
+            with suppress(OSError):
+                connection.sock.shutdown(socket.SHUT_RDWR)
+            connection.sock.close()
+
+
+@pytest.fixture()
+def tls_server(request: pytest.FixtureRequest):
+    server = TLSHTTP2Server(**getattr(request, "param", {}))
+    server.start()
+    yield server
+    server.close()
+
+
+@pytest.fixture()
+def tls_session():
+    session = HTTPSession()
+    session.trust_env = False
+    session.verify = CERTFILE
+    session.enable_http2()
+    yield session
+    session.close()
+
+
+@pytest.fixture()
+def session():
+    session = HTTPSession()
+    session.enable_http2()
+
+    return session
+
+
+class TestHTTP2Adapter:
+    def test_mount(self):
+        session = HTTPSession()
+        session.adapters["https://"].poolmanager.connection_pool_kw.update(source_address=("0.0.0.0", 0))
+
+        session.enable_http2()
+        adapter = session.adapters["https://"]
+        assert isinstance(adapter, HTTP2Adapter)
+        assert not adapter.disable_dh
+        assert adapter.poolmanager.connection_pool_kw.get("source_address") == ("0.0.0.0", 0)
+
+        session.disable_dh()
+        adapter = session.adapters["https://"]
+        assert isinstance(adapter, HTTP2Adapter)
+        assert adapter.disable_dh
+
+        session.enable_http2(False)
+        assert isinstance(session.adapters["https://"], TLSNoDHAdapter)
+
+    def test_ssl_context(self, session: HTTPSession):
+        adapter = session.adapters["https://"]
+        assert isinstance(adapter, HTTP2Adapter)
+        assert adapter.ssl_context_key == (HTTP2Adapter, False)
+        assert type("CustomAdapter", (HTTP2Adapter,), {})().ssl_context_key is None
+
+        ctx = adapter._get_http2_ssl_context(True)
+        assert adapter._get_http2_ssl_context(True) is ctx
+        assert adapter._get_http2_ssl_context(False) is not ctx
+        assert ctx.verify_mode == ssl.CERT_REQUIRED
+        assert ctx.tls_session_cache is session.tls_sessions
+
+    def test_mount_unsupported(self, caplog: pytest.LogCaptureFixture):
+        session = HTTPSession()
+        with patch("streamlink.session.http2.HTTP2Adapter", side_effect=ImportError("foo")):
+            session.enable_http2()
+        assert type(session.adapters["https://"]) is HTTPAdapter
+        assert [(record.levelname, record.message) for record in caplog.records] == [
+            ("warning", "HTTP/2 is not supported: foo"),
+        ]
+
+    def test_request(self, session: HTTPSession, server: HTTP2Server):
+        res = session.get("https://host/small", params={"foo": "bar"}, headers={"User-Agent": "baz"})
+        assert res.status_code == 200
+        assert res.raw.version_string == "HTTP/2"
+        assert res.text == "small"
+        assert res.headers["Content-Type"] == "text/plain"
+        assert session.cookies.get("foo") == "bar"
+
+        request = server.requests[0]
+        assert request[b":method"] == b"GET"
+        assert request[b":authority"] == b"host"
+        assert request[b":path"] == b"/small?foo=bar"
+        assert request[b"user-agent"] == b"baz"
+        assert b"connection" not in request
+        assert b"host" not in request
+
+    def test_status(self, session: HTTPSession, server: HTTP2Server):
+        with pytest.raises(PluginError, match=r"404 Client Error"):
+            session.get("https://host/not-found")
+
+    def test_stream_reset(self, session: HTTPSession, server: HTTP2Server):
+        with pytest.raises(PluginError, match=r"HTTP/2 stream was reset"):
+            session.get("https://host/unknown")
+
+    def test_multiplexing(self, session: HTTPSession, server: HTTP2Server):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: session.get("https://host/large").content, range(10)))
+
+        assert results == [b"x" * 100_000] * 10
+        assert server.mock_connect.call_count == 1
+        assert len(server.requests) == 10
+
+    def test_streamed_response(self, session: HTTPSession, server: HTTP2Server):
+        res = session.get("https://host/large", stream=True)
+        assert sum(len(chunk) for chunk in res.iter_content(8192)) == 100_000
+
+    def test_flow_control(self, session: HTTPSession, server: HTTP2Server):
+        res = session.get("https://host/huge", stream=True)
+        stream_id = next(iter(server.sent))
+
+        # the server can't send more data than the stream's window while nothing gets read
+        def window_exhausted():
+            return server.sent[stream_id] >= _STREAM_WINDOW_SIZE
+
+        deadline = time.monotonic() + 5
+        while not window_exhausted() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        assert server.sent[stream_id] == _STREAM_WINDOW_SIZE
+
+        # acknowledge the data once it has been read
+        assert sum(len(chunk) for chunk in res.iter_content(65536)) == _STREAM_WINDOW_SIZE * 4
+        assert server.sent[stream_id] == _STREAM_WINDOW_SIZE * 4
+
+    def test_flow_control_closed(self, session: HTTPSession, server: HTTP2Server):
+        # the buffered data of closed responses doesn't take up the connection's window
+        for _ in range(16):
+            res = session.get("https://host/huge", stream=True)
+            assert len(res.raw.read(1000)) == 1000
+            res.close()
+        assert session.get("https://host/large", timeout=5).content == b"x" * 100_000
+
+    @pytest.mark.parametrize(
+        ("url", "kwargs"),
+        [
+            pytest.param("http://host/", {}, id="http"),
+            pytest.param("https://host/", {"proxies": {"https": "http://proxy:8080"}}, id="proxy"),
+            pytest.param("https://host/", {"cert": "/path/to/cert.pem"}, id="cert"),
+        ],
+    )
+    def test_fallback(self, monkeypatch: pytest.MonkeyPatch, session: HTTPSession, url: str, kwargs: dict):
+        mock_send = Mock(side_effect=requests.exceptions.ConnectionError("fallback"))
+        monkeypatch.setattr("requests.adapters.HTTPAdapter.send", mock_send)
+        mock_connect = Mock()
+        monkeypatch.setattr(HTTP2Adapter, "_connect", mock_connect)
+
+        with pytest.raises(PluginError, match=r"fallback"):
+            session.get(url, **kwargs)
+        assert mock_send.call_count == 1
+        assert mock_connect.call_count == 0
+
+    def test_fallback_not_negotiated(self, monkeypatch: pytest.MonkeyPatch, session: HTTPSession):
+        mock_send = Mock(side_effect=requests.exceptions.ConnectionError("fallback"))
+        monkeypatch.setattr("requests.adapters.HTTPAdapter.send", mock_send)
+        mock_connect = Mock(side_effect=HTTP2NotNegotiated())
+        monkeypatch.setattr(HTTP2Adapter, "_connect", mock_connect)
+
+        for _ in range(2):
+            with pytest.raises(PluginError, match=r"fallback"):
+                session.get("https://host/")
+        assert mock_send.call_count == 2
+        assert mock_connect.call_count == 1
+
+    def test_connect_error(self, monkeypatch: pytest.MonkeyPatch, session: HTTPSession):
+        monkeypatch.setattr(HTTP2Adapter, "_connect", Mock(side_effect=TimeoutError("timeout")))
+
+        request = requests.Request("GET", "https://host/").prepare()
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            session.adapters["https://"].send(request)
+
+    def test_close(self, session: HTTPSession, server: HTTP2Server):
+        assert session.get("https://host/small?foo=bar").text == "small"
+        connection = server.mock_connect.return_value
+        assert not connection.closed
+
+        session.close()
+        assert connection.closed
+
+    def test_connect_other_origin(self, session: HTTPSession, server: HTTP2Server):
+        connection = server.mock_connect.return_value
+        connecting = Event()
+        connected = Event()
+
+        def connect(host, *_):
+            if host == "slow":
+                connecting.set()
+                assert connected.wait(5)
+            return connection
+
+        server.mock_connect.side_effect = connect
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(session.get, "https://slow/small?foo=bar")
+            assert connecting.wait(5)
+            # the pending connection of another origin doesn't block this request
+            assert session.get("https://host/small?foo=bar").text == "small"
+            connected.set()
+            assert future.result(5).text == "small"
+
+
+class TestHTTP2AdapterTLS:
+    def test_concurrent_streams(self, tls_session: HTTPSession, tls_server: TLSHTTP2Server):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: tls_session.get(f"{tls_server.url}/large").content, range(32)))
+
+        assert results == [b"x" * 100_000] * 32
+        assert len(tls_server.connections) == 1
+        assert len(tls_server.connections[0].requests) == 32
+
+    def test_streamed_responses(self, tls_session: HTTPSession, tls_server: TLSHTTP2Server):
+        responses = [tls_session.get(f"{tls_server.url}/large", stream=True) for _ in range(4)]
+        # read the bodies of the concurrent streams alternately
+        data = [b""] * 4
+        while any(len(body) < 100_000 for body in data):
+            for idx, res in enumerate(responses):
+                data[idx] += res.raw.read(10_000)
+
+        assert data == [b"x" * 100_000] * 4
+        assert len(tls_server.connections) == 1
+
+    @pytest.mark.parametrize("tls_server", [{"refuse_first": True}], indirect=True)
+    def test_retry_refused(self, tls_session: HTTPSession, tls_server: TLSHTTP2Server):
+        assert tls_session.get(f"{tls_server.url}/small?foo=bar").text == "small"
+        assert len(tls_server.connections) == 2
+        assert tls_server.connections[0].requests == []
+        assert len(tls_server.connections[1].requests) == 1
+
+    def test_retry_closed_idle(self, tls_session: HTTPSession, tls_server: TLSHTTP2Server):
+        assert tls_session.get(f"{tls_server.url}/small?foo=bar").text == "small"
+        tls_server.connections[0].sock.shutdown(socket.SHUT_RDWR)
+
+        assert tls_session.get(f"{tls_server.url}/small?foo=bar").text == "small"
+        assert len(tls_server.connections) == 2
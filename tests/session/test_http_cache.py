@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import freezegun
+import pytest
+import requests_mock as rm
+
+from streamlink.session.http import HTTPSession
+from streamlink.session.http_cache import CachedResponse, HTTPCache, parse_cache_control
+
+
+@pytest.fixture()
+def httpsession():
+    with freezegun.freeze_time("2000-01-01T00:00:00Z"):
+        session = HTTPSession()
+        session.enable_response_cache(disabled_file=True)
+        yield session
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param("", {}, id="empty"),
+        pytest.param("no-cache", {"no-cache": None}, id="no-value"),
+        pytest.param("Max-Age=60, private", {"max-age": "60", "private": None}, id="multiple"),
+        pytest.param('max-age="60" , no-cache="Set-Cookie"', {"max-age": "60", "no-cache": "Set-Cookie"}, id="quoted"),
+    ],
+)
+def test_parse_cache_control(value: str, expected: dict):
+    assert parse_cache_control(value) == expected
+
+
+class TestCachedResponse:
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            pytest.param({}, 0.0, id="no-headers"),
+            pytest.param({"Cache-Control": "max-age=60"}, 60.0, id="max-age"),
+            pytest.param({"Cache-Control": "max-age=foo"}, 0.0, id="max-age-invalid"),
+            pytest.param({"Cache-Control": "no-cache, max-age=60"}, 0.0, id="no-cache"),
+            pytest.param(
+                {"Date": "Sat, 01 Jan 2000 00:00:00 GMT", "Expires": "Sat, 01 Jan 2000 00:01:30 GMT"},
+                90.0,
+                id="expires",
+            ),
+            pytest.param({"Expires": "0"}, 0.0, id="expires-invalid"),
+        ],
+    )
+    def test_freshness_lifetime(self, headers: dict, expected: float):
+        cached = CachedResponse(200, "OK", "https://host/", headers, b"", 946684800.0, {})
+        assert cached.freshness_lifetime == pytest.approx(expected)
+
+    def test_serialization(self):
+        cached = CachedResponse(200, "OK", "https://host/", {"ETag": '"1"'}, b"\x00\xff", 123.0, {"accept": "*/*"})
+        data = cached.to_dict()
+        assert data["content"] == "AP8="
+        restored = CachedResponse.from_dict(data)
+        assert restored.to_dict() == data
+        assert restored.headers["etag"] == '"1"'
+
+
+class TestHTTPCache:
+    def test_fresh(self, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        mock = requests_mock.get(
+            "https://host/",
+            text="content",
+            headers={"Content-Type": "text/plain; charset=utf-8", "Cache-Control": "max-age=60"},
+        )
+
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            assert httpsession.get("https://host/", cache=True).text == "content"
+            assert mock.call_count == 1
+
+            frozen_time.tick(59)
+            res = httpsession.get("https://host/", cache=True)
+            assert mock.call_count == 1
+            assert res.status_code == 200
+            assert res.text == "content"
+            assert res.encoding == "utf-8"
+            assert res.url == "https://host/"
+
+            # requests without the cache keyword are unaffected
+            httpsession.get("https://host/")
+            assert mock.call_count == 2
+
+            frozen_time.tick(1)
+            httpsession.get("https://host/", cache=True)
+            assert mock.call_count == 3
+
+    def test_revalidate(self, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        mock = requests_mock.get(
+            "https://host/",
+            [
+                {"text": "content", "headers": {"ETag": '"abc"', "Last-Modified": "Fri, 31 Dec 1999 00:00:00 GMT"}},
+                {"status_code": 304, "headers": {"Cache-Control": "max-age=10"}},
+                {"text": "new content"},
+            ],
+        )
+
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            assert httpsession.get("https://host/", cache=True).text == "content"
+            assert "If-None-Match" not in mock.last_request.headers
+
+            res = httpsession.get("https://host/", cache=True)
+            assert res.status_code == 200
+            assert res.text == "content"
+            assert mock.call_count == 2
+            assert mock.last_request.headers["If-None-Match"] == '"abc"'
+            assert mock.last_request.headers["If-Modified-Since"] == "Fri, 31 Dec 1999 00:00:00 GMT"
+
+            # headers of the 304 response got stored
+            httpsession.get("https://host/", cache=True)
+            assert mock.call_count == 2
+
+            frozen_time.tick(10)
+            assert httpsession.get("https://host/", cache=True).text == "new content"
+            assert mock.call_count == 3
+
+    @pytest.mark.parametrize(
+        ("status_code", "headers"),
+        [
+            pytest.param(200, {}, id="no-freshness-no-validators"),
+            pytest.param(200, {"Cache-Control": "no-store, max-age=60"}, id="no-store"),
+            pytest.param(200, {"Cache-Control": "max-age=60", "Vary": "*"}, id="vary-any"),
+            pytest.param(404, {"Cache-Control": "max-age=60"}, id="status"),
+        ],
+    )
+    def test_not_stored(self, requests_mock: rm.Mocker, httpsession: HTTPSession, status_code: int, headers: dict):
+        mock = requests_mock.get("https://host/", status_code=status_code, headers=headers)
+        for _ in range(2):
+            httpsession.get("https://host/", cache=True, raise_for_status=False)
+        assert mock.call_count == 2
+
+    def test_not_stored_size(self, monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        monkeypatch.setattr(HTTPCache, "MAX_CONTENT_SIZE", 3)
+        mock = requests_mock.get("https://host/", text="content", headers={"Cache-Control": "max-age=60"})
+        for _ in range(2):
+            httpsession.get("https://host/", cache=True)
+        assert mock.call_count == 2
+
+    def test_vary(self, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        mock = requests_mock.get("https://host/", text="content", headers={"Cache-Control": "max-age=60", "Vary": "X-Foo"})
+        httpsession.get("https://host/", cache=True, headers={"X-Foo": "1"})
+        httpsession.get("https://host/", cache=True, headers={"X-Foo": "1"})
+        assert mock.call_count == 1
+        httpsession.get("https://host/", cache=True, headers={"X-Foo": "2"})
+        assert mock.call_count == 2
+
+    def test_params(self, requests_mock: rm.Mocker, httpsession: HTTPSession):
+        mock = requests_mock.get("https://host/", text="content", headers={"Cache-Control": "max-age=60"})
+        httpsession.params["session"] = "1"
+        httpsession.get("https://host/", cache=True, params={"foo": "bar"})
+        httpsession.get("https://host/", cache=True, params={"foo": "bar"})
+        assert mock.call_count == 1
+        assert mock.last_request.qs == {"foo": ["bar"], "session": ["1"]}
+        httpsession.get("https://host/", cache=True, params={"foo": "baz"})
+        assert mock.call_count == 2
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"method": "POST"}, id="post"),
+            pytest.param({"stream": True}, id="stream"),
+            pytest.param({"headers": {"Cache-Control": "no-store"}}, id="request-no-store"),
+        ],
+    )
+    def test_bypass(self, requests_mock: rm.Mocker, httpsession: HTTPSession, kwargs: dict):
+        mock = requests_mock.register_uri(rm.ANY, "https://host/", text="content", headers={"Cache-Control": "max-age=60"})
+        method = kwargs.pop("method", "GET")
+        for _ in range(2):
+            httpsession.request(method, "https://host/", cache=True, **kwargs)
+        assert mock.call_count == 2
+
+    def test_disabled(self, requests_mock: rm.Mocker):
+        session = HTTPSession()
+        mock = requests_mock.get("https://host/", text="content", headers={"Cache-Control": "max-age=60"})
+        for _ in range(2):
+            session.get("https://host/", cache=True)
+        assert mock.call_count == 2
+
+    def test_cache_file(self, monkeypatch: pytest.MonkeyPatch):
+        mock_cache = Mock()
+        monkeypatch.setattr("streamlink.session.http_cache.Cache", mock_cache)
+        HTTPCache()
+        HTTPCache(disabled=True)
+        assert [c.args for c in mock_cache.call_args_list] == [("http-cache.json",), ("http-cache.json",)]
+        assert [c.kwargs for c in mock_cache.call_args_list] == [{"disabled": False}, {"disabled": True}]
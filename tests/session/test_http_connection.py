@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import socket
+from unittest.mock import Mock, call
+
+import freezegun
+import pytest
+import urllib3.util.connection as urllib3_util_connection
+from urllib3.exceptions import LocationParseError
+
+from streamlink.session.http_connection import Connector, DNSCache
+
+
+def addrinfo(family: socket.AddressFamily, host: str, port: int):
+    sockaddr = (host, port) if family == socket.AF_INET else (host, port, 0, 0)
+    return family, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", sockaddr
+
+
+@pytest.fixture()
+def server():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(4)
+        yield sock
+
+
+@pytest.fixture()
+def refused_port():
+    # get an unused port and close its socket, so that connection attempts get refused
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture()
+def getaddrinfo(monkeypatch: pytest.MonkeyPatch):
+    mock = Mock(return_value=[])
+    monkeypatch.setattr("socket.getaddrinfo", mock)
+
+    return mock
+
+
+class TestDNSCache:
+    def test_cache(self, getaddrinfo: Mock):
+        getaddrinfo.return_value = [addrinfo(socket.AF_INET, "1.2.3.4", 80)]
+        cache = DNSCache(ttl=10.0)
+
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            assert cache.getaddrinfo("host", 80) == [addrinfo(socket.AF_INET, "1.2.3.4", 80)]
+            assert cache.getaddrinfo("host", 80) == [addrinfo(socket.AF_INET, "1.2.3.4", 80)]
+            assert getaddrinfo.call_args_list == [call("host", 80, 0, 0)]
+
+            cache.getaddrinfo("host", 443)
+            cache.getaddrinfo("host", 80, socket.AF_INET)
+            cache.getaddrinfo("other", 80)
+            assert len(getaddrinfo.call_args_list) == 4
+
+            frozen_time.tick(9)
+            cache.getaddrinfo("host", 80)
+            assert len(getaddrinfo.call_args_list) == 4
+
+            frozen_time.tick(1)
+            cache.getaddrinfo("host", 80)
+            assert len(getaddrinfo.call_args_list) == 5
+
+    def test_invalidate(self, getaddrinfo: Mock):
+        cache = DNSCache(ttl=10.0)
+        cache.getaddrinfo("host", 80)
+        cache.getaddrinfo("host", 443)
+        cache.getaddrinfo("other", 80)
+        assert len(getaddrinfo.call_args_list) == 3
+
+        cache.invalidate("host")
+        cache.getaddrinfo("host", 80)
+        cache.getaddrinfo("host", 443)
+        cache.getaddrinfo("other", 80)
+        assert len(getaddrinfo.call_args_list) == 5
+
+        cache.clear()
+        cache.getaddrinfo("other", 80)
+        assert len(getaddrinfo.call_args_list) == 6
+
+    def test_error(self, getaddrinfo: Mock):
+        getaddrinfo.side_effect = socket.gaierror("error")
+        cache = DNSCache(ttl=10.0)
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                cache.getaddrinfo("host", 80)
+        assert len(getaddrinfo.call_args_list) == 2
+
+
+class TestConnector:
+    def test_interleave(self):
+        v4 = [addrinfo(socket.AF_INET, f"1.1.1.{idx}", 80) for idx in range(3)]
+        v6 = [addrinfo(socket.AF_INET6, f"::{idx}", 80) for idx in range(2)]
+        assert Connector._interleave([*v6, *v4]) == [v6[0], v4[0], v6[1], v4[1], v4[2]]
+        assert Connector._interleave([*v4, *v6]) == [v4[0], v6[0], v4[1], v6[1], v4[2]]
+        assert Connector._interleave(v4) == v4
+        assert Connector._interleave([]) == []
+
+    @pytest.mark.parametrize(
+        ("source_address", "expected"),
+        [
+            pytest.param(None, [socket.AF_INET6, socket.AF_INET], id="no-source-address"),
+            pytest.param(("0.0.0.0", 0), [socket.AF_INET], id="ipv4"),
+            pytest.param(("::", 0), [socket.AF_INET6], id="ipv6"),
+        ],
+    )
+    def test_source_address_family(self, source_address: tuple[str, int] | None, expected: list[socket.AddressFamily]):
+        items = [addrinfo(socket.AF_INET6, "::1", 80), addrinfo(socket.AF_INET, "127.0.0.1", 80)]
+        assert [item[0] for item in Connector._filter_source_address_family(items, source_address)] == expected
+
+    def test_allowed_gai_family(self, monkeypatch: pytest.MonkeyPatch, getaddrinfo: Mock):
+        monkeypatch.setattr(urllib3_util_connection, "allowed_gai_family", lambda: socket.AF_INET6)
+        connector = Connector()
+        with pytest.raises(OSError, match=r"^getaddrinfo returns an empty list$"):
+            connector.create_connection(("[::1]", 80))
+        assert getaddrinfo.call_args_list == [call("::1", 80, socket.AF_INET6, socket.SOCK_STREAM)]
+
+    def test_invalid_host(self):
+        with pytest.raises(LocationParseError):
+            Connector().create_connection(("foo..bar", 80))
+
+    @pytest.mark.parametrize("happy_eyeballs_delay", [None, 0.25])
+    def test_connect(self, getaddrinfo: Mock, server: socket.socket, refused_port: int, happy_eyeballs_delay: float | None):
+        port = server.getsockname()[1]
+        getaddrinfo.return_value = [
+            addrinfo(socket.AF_INET, "127.0.0.1", refused_port),
+            addrinfo(socket.AF_INET, "127.0.0.1", port),
+        ]
+        connector = Connector(happy_eyeballs_delay=happy_eyeballs_delay)
+        with connector.create_connection(("localhost", 80), timeout=5.0) as sock:
+            assert sock.getpeername() == ("127.0.0.1", port)
+            assert sock.gettimeout() == 5.0  # noqa: RUF069
+
+    @pytest.mark.parametrize("happy_eyeballs_delay", [None, 0.25])
+    def test_connect_refused(self, getaddrinfo: Mock, refused_port: int, happy_eyeballs_delay: float | None):
+        getaddrinfo.return_value = [
+            addrinfo(socket.AF_INET, "127.0.0.1", refused_port),
+            addrinfo(socket.AF_INET, "127.0.0.1", refused_port),
+        ]
+        dns_cache = DNSCache(ttl=60.0)
+        connector = Connector(dns_cache=dns_cache, happy_eyeballs_delay=happy_eyeballs_delay)
+        with pytest.raises(ConnectionRefusedError):
+            connector.create_connection(("localhost", 80), timeout=5.0)
+        assert not dns_cache._cache
+
+    def test_connect_cached(self, getaddrinfo: Mock, server: socket.socket):
+        getaddrinfo.return_value = [addrinfo(socket.AF_INET, "127.0.0.1", server.getsockname()[1])]
+        connector = Connector(dns_cache=DNSCache(ttl=60.0), happy_eyeballs_delay=0.25)
+        for _ in range(2):
+            with connector.create_connection(("localhost", 80), timeout=5.0):
+                pass
+        assert getaddrinfo.call_count == 1
+
+    def test_socket_options(self, getaddrinfo: Mock, server: socket.socket):
+        getaddrinfo.return_value = [addrinfo(socket.AF_INET, "127.0.0.1", server.getsockname()[1])] * 2
+        connector = Connector(happy_eyeballs_delay=0.25)
+        with connector.create_connection(
+            ("localhost", 80),
+            timeout=5.0,
+            source_address=("127.0.0.1", 0),
+            socket_options=[(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+        ) as sock:
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+            assert sock.getsockname()[0] == "127.0.0.1"
+
+    def test_socket_options_filtered(self, getaddrinfo: Mock, server: socket.socket):
+        getaddrinfo.return_value = [addrinfo(socket.AF_INET, "127.0.0.1", server.getsockname()[1])]
+        connector = Connector(happy_eyeballs_delay=0.25)
+        # options of other address families, e.g. IP_BOUND_IF and IPV6_BOUND_IF on macOS, must not be set
+        with connector.create_connection(
+            ("localhost", 80),
+            timeout=5.0,
+            socket_options=[
+                (socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1),
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ],
+        ) as sock:
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
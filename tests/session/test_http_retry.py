@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import freezegun
+import pytest
+import requests
+
+from streamlink.session.http_retry import CircuitOpenError, RetryCoordinator
+
+
+URL = "https://host/path"
+
+
+@pytest.fixture()
+def coordinator():
+    return RetryCoordinator()
+
+
+def fail(coordinator: RetryCoordinator, num: int, retry_after: float | None = None) -> None:
+    for _ in range(num):
+        coordinator.acquire(URL)
+        coordinator.failure(URL, retry_after)
+
+
+class TestRetryCoordinator:
+    @pytest.mark.parametrize(
+        ("err", "expected"),
+        [
+            pytest.param(requests.ConnectionError(), True, id="ConnectionError"),
+            pytest.param(requests.Timeout(), True, id="Timeout"),
+            pytest.param(requests.exceptions.InvalidURL(), False, id="InvalidURL"),
+            pytest.param(ValueError(), False, id="ValueError"),
+        ],
+    )
+    def test_is_failure(self, err: Exception, expected: bool):
+        assert RetryCoordinator.is_failure(err) is expected
+
+    @pytest.mark.parametrize(
+        ("status_code", "expected"),
+        [(200, False), (404, False), (429, True), (500, True), (503, True)],
+    )
+    def test_is_failure_status(self, status_code: int, expected: bool):
+        assert RetryCoordinator.is_failure_status(status_code) is expected
+
+    def test_circuit(self, caplog: pytest.LogCaptureFixture, coordinator: RetryCoordinator):
+        caplog.set_level("debug", "streamlink")
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            fail(coordinator, 4)
+            coordinator.acquire(URL)
+            coordinator.failure(URL)
+
+            with pytest.raises(CircuitOpenError, match=r"^Circuit open for https://host, retrying in 5\.0s$"):
+                coordinator.acquire(URL)
+            # other hosts are unaffected
+            coordinator.acquire("https://other/")
+            coordinator.acquire("http://host/")
+
+            # the first request after the hold time is a probe, and other requests are rejected while it's in progress
+            frozen_time.tick(5)
+            coordinator.acquire(URL)
+            with pytest.raises(CircuitOpenError, match=r"retrying in 0\.0s$"):
+                coordinator.acquire(URL)
+
+            # a failed probe re-opens the circuit with a doubled hold time
+            coordinator.failure(URL)
+            with pytest.raises(CircuitOpenError, match=r"retrying in 10\.0s$"):
+                coordinator.acquire(URL)
+
+            # a successful probe closes the circuit
+            frozen_time.tick(10)
+            coordinator.acquire(URL)
+            coordinator.success(URL)
+            coordinator.acquire(URL)
+            coordinator.acquire(URL)
+
+        assert [(record.levelname, record.message) for record in caplog.records] == [
+            ("warning", "Opening circuit for https://host for 5.0s after 5 consecutive failures"),
+            ("warning", "Opening circuit for https://host for 10.0s after 6 consecutive failures"),
+            ("debug", "Closing circuit for https://host"),
+        ]
+
+    def test_success_resets_failures(self, coordinator: RetryCoordinator):
+        fail(coordinator, 4)
+        coordinator.success(URL)
+        fail(coordinator, 4)
+        coordinator.acquire(URL)
+
+    def test_hold_time_max(self, coordinator: RetryCoordinator):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            fail(coordinator, 5)
+            for hold_time in (10, 20, 40, 60, 60):
+                frozen_time.tick(60)
+                fail(coordinator, 1)
+                with pytest.raises(CircuitOpenError, match=rf"retrying in {hold_time}\.0s$"):
+                    coordinator.acquire(URL)
+
+    def test_hold_time_retry_after(self, coordinator: RetryCoordinator):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z"):
+            fail(coordinator, 5, retry_after=30.0)
+            with pytest.raises(CircuitOpenError, match=r"retrying in 30\.0s$"):
+                coordinator.acquire(URL)
+
+    def test_release_probe(self, coordinator: RetryCoordinator):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            fail(coordinator, 5)
+            frozen_time.tick(5)
+            coordinator.acquire(URL)
+            coordinator.release(URL)
+            coordinator.acquire(URL)
+
+    def test_probe_timeout(self, coordinator: RetryCoordinator):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            fail(coordinator, 5)
+            frozen_time.tick(5)
+            coordinator.acquire(URL)
+            frozen_time.tick(29)
+            with pytest.raises(CircuitOpenError):
+                coordinator.acquire(URL)
+            frozen_time.tick(1)
+            coordinator.acquire(URL)
+
+    @pytest.mark.parametrize(
+        ("status_code", "headers", "expected"),
+        [
+            pytest.param(503, {}, None, id="missing"),
+            pytest.param(503, {"Retry-After": "12"}, 12.0, id="seconds"),
+            pytest.param(503, {"Retry-After": "-1"}, 0.0, id="negative"),
+            pytest.param(503, {"Retry-After": "3600"}, 60.0, id="max"),
+            pytest.param(429, {"Retry-After": "Sat, 01 Jan 2000 00:00:30 GMT"}, 30.0, id="date"),
+            pytest.param(429, {"Retry-After": "Fri, 31 Dec 1999 23:59:00 GMT"}, 0.0, id="date-past"),
+            pytest.param(429, {"Retry-After": "foo"}, None, id="invalid"),
+            pytest.param(500, {"Retry-After": "12"}, None, id="status"),
+        ],
+    )
+    def test_parse_retry_after(self, status_code: int, headers: dict, expected: float | None):
+        res = requests.Response()
+        res.status_code = status_code
+        res.headers.update(headers)
+        with freezegun.freeze_time("2000-01-01T00:00:00Z"):
+            assert RetryCoordinator.parse_retry_after(res) == expected
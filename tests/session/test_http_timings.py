@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from streamlink.exceptions import PluginError
+from streamlink.session.http import HTTPSession
+from streamlink.session.http_connection import Connector
+from streamlink.session.http_timings import (
+    HTTPTimings,
+    TimingsHTTPConnectionPool,
+    TimingsHTTPSConnectionPool,
+    collect_timings,
+    current_timings,
+)
+
+
+if TYPE_CHECKING:
+    import requests_mock as rm
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"x" * 1024
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def httpsession():
+    session = HTTPSession()
+    yield session
+    session.close()
+
+
+def test_collect_timings():
+    assert current_timings() is None
+    outer = HTTPTimings(method="GET", url="https://host/")
+    inner = HTTPTimings(method="GET", url="https://host/")
+    with collect_timings(outer):
+        assert current_timings() is outer
+        with collect_timings(inner):
+            assert current_timings() is inner
+        assert current_timings() is outer
+    assert current_timings() is None
+
+
+def test_to_dict():
+    timings = HTTPTimings(method="GET", url="https://host/", connect=1.0)
+    timings.add("connect", 0.5)
+    timings.add("tls", -1.0)
+    data = timings.to_dict()
+    assert data == {
+        "method": "GET",
+        "url": "https://host/",
+        "dns": None,
+        "connect": 1.5,
+        "tls": 0.0,
+        "ttfb": None,
+        "transfer": None,
+        "total": None,
+        "reused": True,
+        "status_code": None,
+        "error": None,
+    }
+    assert json.loads(timings.to_json()) == data
+
+
+def test_pool_classes(httpsession: HTTPSession):
+    pool_cls = httpsession.adapters["https://"].poolmanager.pool_classes_by_scheme["https"]
+    assert pool_cls.func is TimingsHTTPSConnectionPool
+    assert pool_cls.keywords == {"connector": httpsession._connector}
+
+
+def test_pool_classes_custom(httpsession: HTTPSession):
+    class CustomHTTPSConnectionPool(HTTPSConnectionPool):
+        pass
+
+    adapter = HTTPAdapter()
+    adapter.poolmanager.pool_classes_by_scheme = {
+        "http": HTTPConnectionPool,
+        "https": CustomHTTPSConnectionPool,
+    }
+    httpsession.mount("https://foo/", adapter)
+    pool_classes_by_scheme = adapter.poolmanager.pool_classes_by_scheme
+    assert pool_classes_by_scheme["http"].func is TimingsHTTPConnectionPool
+    assert pool_classes_by_scheme["http"].keywords == {"connector": httpsession._connector}
+    assert pool_classes_by_scheme["https"] is CustomHTTPSConnectionPool
+
+
+def test_timings(httpsession: HTTPSession, server: str):
+    timings: list[HTTPTimings] = []
+    httpsession.add_timings_hook(timings.append)
+
+    assert httpsession.get(server).content == b"x" * 1024
+    assert httpsession.get(server).content == b"x" * 1024
+    assert httpsession.get(server, stream=True).status_code == 200
+
+    assert len(timings) == 3
+    first, second, third = timings
+    assert first.method == "GET"
+    assert first.url == server
+    assert first.status_code == 200
+    assert not first.reused
+    assert first.dns is not None
+    assert first.connect is not None
+    assert first.tls is None
+    assert first.ttfb is not None
+    assert first.transfer is not None
+    assert first.total is not None
+    assert first.total >= first.dns + first.connect + first.ttfb + first.transfer
+
+    assert second.reused
+    assert second.dns is None
+    assert second.connect is None
+    assert second.ttfb is not None
+    assert second.transfer is not None
+
+    assert third.ttfb is not None
+    assert third.transfer is None
+
+    httpsession.remove_timings_hook(timings.append)
+    httpsession.get(server)
+    assert len(timings) == 3
+
+
+def test_timings_error(monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker, httpsession: HTTPSession):
+    monkeypatch.setattr("streamlink.session.http.time.sleep", Mock())
+    requests_mock.get("http://host/", exc=OSError("failure"))
+    timings: list[HTTPTimings] = []
+    httpsession.add_timings_hook(timings.append)
+
+    with pytest.raises(PluginError):
+        httpsession.get("http://host/", retries=1)
+    assert [(item.status_code, item.error) for item in timings] == [(None, "failure"), (None, "failure")]
+
+
+def test_timings_hook_error(caplog: pytest.LogCaptureFixture, requests_mock: rm.Mocker, httpsession: HTTPSession):
+    requests_mock.get("http://host/", text="content")
+    httpsession.add_timings_hook(Mock(side_effect=ValueError("hook error")))
+    timings: list[HTTPTimings] = []
+    httpsession.add_timings_hook(timings.append)
+
+    assert httpsession.get("http://host/").text == "content"
+    assert len(timings) == 1
+    assert [(record.levelname, record.message) for record in caplog.records] == [
+        ("error", "Error in HTTP timings hook: hook error"),
+    ]
+
+
+def test_connector_per_session(monkeypatch: pytest.MonkeyPatch, httpsession: HTTPSession, server: str):
+    other = HTTPSession()
+    connectors: list[Connector] = []
+    create_connection = Connector.create_connection
+
+    def spy(self, *args, **kwargs):
+        connectors.append(self)
+        return create_connection(self, *args, **kwargs)
+
+    monkeypatch.setattr(Connector, "create_connection", spy)
+
+    try:
+        other.get(server)
+        assert connectors == []
+
+        httpsession.set_dns_cache(ttl=60.0)
+        other.get(server)
+        assert connectors == []
+
+        httpsession.get(server)
+        assert connectors == [httpsession._connector]
+    finally:
+        other.close()
+
+
+def test_timings_connector(httpsession: HTTPSession, server: str):
+    create_connection = urllib3.util.connection.create_connection
+    timings: list[HTTPTimings] = []
+    httpsession.add_timings_hook(timings.append)
+
+    assert httpsession.get(server).status_code == 200
+    assert urllib3.util.connection.create_connection is create_connection
+    assert len(timings) == 1
+    assert timings[0].dns is not None
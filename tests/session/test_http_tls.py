@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import ssl
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+from streamlink.session.http import HTTPSession, SSLContextAdapter, TLSNoDHAdapter, TLSSecLevel1Adapter
+from streamlink.session.http_tls import ResumptionSSLSocket, TLSSessionCache
+from tests.resources import __HERE__ as RESOURCES
+
+
+CERTFILE = str(RESOURCES / "tls" / "localhost.pem")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"content"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        # make the client open a new connection for each request
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ctx.load_cert_chain(CERTFILE)
+    server.socket = ctx.wrap_socket(server.socket, server_side=True)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"https://localhost:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def httpsession():
+    session = HTTPSession()
+    # don't let env vars override the CA bundle
+    session.trust_env = False
+    session.verify = CERTFILE
+    session.disable_dh()
+    yield session
+    session.close()
+
+
+class TestSharedSSLContext:
+    def test_same_adapter_type(self, httpsession: HTTPSession):
+        ssl_context = httpsession.adapters["https://"].poolmanager.connection_pool_kw["ssl_context"]
+        assert ssl_context.sslsocket_class is ResumptionSSLSocket
+        assert ssl_context.tls_session_cache is httpsession.tls_sessions
+
+        httpsession.disable_dh(False)
+        httpsession.disable_dh(True)
+        adapter = httpsession.adapters["https://"]
+        assert isinstance(adapter, TLSNoDHAdapter)
+        assert adapter.tls_session_cache is httpsession.tls_sessions
+        assert adapter.poolmanager.connection_pool_kw["ssl_context"] is ssl_context
+
+    def test_different_adapter_types(self, httpsession: HTTPSession):
+        ssl_context = httpsession.adapters["https://"].poolmanager.connection_pool_kw["ssl_context"]
+        httpsession.mount("https://foo/", TLSSecLevel1Adapter())
+        assert httpsession.adapters["https://foo/"].poolmanager.connection_pool_kw["ssl_context"] is not ssl_context
+
+    @pytest.mark.parametrize("adapter_class", [SSLContextAdapter, TLSNoDHAdapter, TLSSecLevel1Adapter])
+    def test_not_shared_by_default(self, httpsession: HTTPSession, adapter_class: type[SSLContextAdapter]):
+        class CustomAdapter(adapter_class):
+            def __init__(self, ciphers: str):
+                self.ciphers = ciphers
+                super().__init__()
+
+            def get_ssl_context(self):
+                ctx = super().get_ssl_context()
+                ctx.set_ciphers(self.ciphers)
+
+                return ctx
+
+        httpsession.mount("https://foo/", CustomAdapter("DEFAULT"))
+        httpsession.mount("https://bar/", CustomAdapter("DEFAULT:@SECLEVEL=1"))
+        ssl_context_foo = httpsession.adapters["https://foo/"].poolmanager.connection_pool_kw["ssl_context"]
+        ssl_context_bar = httpsession.adapters["https://bar/"].poolmanager.connection_pool_kw["ssl_context"]
+        assert ssl_context_foo is not ssl_context_bar
+        assert ssl_context_foo.tls_session_cache is httpsession.tls_sessions
+        assert ssl_context_bar.tls_session_cache is httpsession.tls_sessions
+
+    def test_unmounted(self):
+        adapter = SSLContextAdapter()
+        assert adapter.tls_session_cache is None
+        assert adapter.poolmanager.connection_pool_kw["ssl_context"].sslsocket_class is ssl.SSLSocket
+
+    def test_separate_sessions(self, httpsession: HTTPSession):
+        other = HTTPSession()
+        other.disable_dh()
+        assert other.tls_sessions is not httpsession.tls_sessions
+        assert (
+            other.adapters["https://"].poolmanager.connection_pool_kw["ssl_context"]
+            is not httpsession.adapters["https://"].poolmanager.connection_pool_kw["ssl_context"]
+        )
+
+
+class TestTLSSessionResumption:
+    def test_resumption(self, httpsession: HTTPSession, server: str):
+        assert httpsession.tls_sessions.resumption_rate == 0.0  # noqa: RUF069
+
+        for _ in range(3):
+            assert httpsession.get(server).text == "content"
+
+        assert httpsession.tls_sessions.handshakes == 3
+        assert httpsession.tls_sessions.resumed == 2
+        assert httpsession.tls_sessions.resumption_rate == pytest.approx(2 / 3)
+
+    def test_clear(self, httpsession: HTTPSession, server: str):
+        httpsession.get(server)
+        httpsession.tls_sessions.clear()
+        httpsession.get(server)
+
+        assert httpsession.tls_sessions.handshakes == 2
+        assert httpsession.tls_sessions.resumed == 0
+
+    def test_max_sessions(self, monkeypatch: pytest.MonkeyPatch, httpsession: HTTPSession, server: str):
+        monkeypatch.setattr(TLSSessionCache, "MAX_SESSIONS", 0)
+        httpsession.get(server)
+        httpsession.get(server)
+
+        assert httpsession.tls_sessions.handshakes == 2
+        assert httpsession.tls_sessions.resumed == 0
@@ -9,6 +9,7 @@ import pytest
 
 from streamlink.exceptions import StreamlinkDeprecationWarning
 from streamlink.session import Streamlink
+from streamlink.session.http_timings import log_timings
 from streamlink.session.options import StreamlinkOptions
 
 
@@ -166,6 +167,55 @@ def test_options_ipv4_ipv6(monkeypatch: pytest.MonkeyPatch, session: Streamlink)
     assert session.get_option("ipv6") is False
 
 
+def test_options_dns_cache_ttl(monkeypatch: pytest.MonkeyPatch, session: Streamlink):
+    mock = Mock()
+    monkeypatch.setattr(session.http, "set_dns_cache", mock)
+
+    assert session.get_option("dns-cache-ttl") == 0.0  # noqa: RUF069
+
+    session.set_option("dns-cache-ttl", 60)
+    assert mock.call_args_list.pop() == call(ttl=60.0)
+    assert session.get_option("dns-cache-ttl") == 60.0  # noqa: RUF069
+
+    session.set_option("dns-cache-ttl", None)
+    assert mock.call_args_list.pop() == call(ttl=0.0)
+    assert session.get_option("dns-cache-ttl") == 0.0  # noqa: RUF069
+
+
+def test_options_resolve_url_cache_ttl(monkeypatch: pytest.MonkeyPatch, session: Streamlink):
+    mock = Mock()
+    monkeypatch.setattr(session.resolved_urls, "configure", mock)
+
+    assert session.get_option("resolve-url-cache-ttl") == 0.0  # noqa: RUF069
+
+    session.set_option("resolve-url-cache-ttl", 3600)
+    assert mock.call_args_list.pop() == call(ttl=3600.0, disabled_file=False)
+    assert session.get_option("resolve-url-cache-ttl") == 3600.0  # noqa: RUF069
+
+    session.set_option("no-plugin-cache", True)
+    session.set_option("resolve-url-cache-ttl", 60)
+    assert mock.call_args_list.pop() == call(ttl=60.0, disabled_file=True)
+
+    session.set_option("resolve-url-cache-ttl", None)
+    assert mock.call_args_list.pop() == call(ttl=0.0, disabled_file=True)
+    assert session.get_option("resolve-url-cache-ttl") == 0.0  # noqa: RUF069
+
+
+def test_options_happy_eyeballs(monkeypatch: pytest.MonkeyPatch, session: Streamlink):
+    mock = Mock()
+    monkeypatch.setattr(session.http, "set_happy_eyeballs", mock)
+
+    assert not session.get_option("happy-eyeballs")
+
+    session.set_option("happy-eyeballs", True)
+    assert mock.call_args_list.pop() == call(enable=True)
+    assert session.get_option("happy-eyeballs")
+
+    session.set_option("happy-eyeballs", False)
+    assert mock.call_args_list.pop() == call(enable=False)
+    assert not session.get_option("happy-eyeballs")
+
+
 def test_options_http_disable_dh(monkeypatch: pytest.MonkeyPatch, session: Streamlink):
     mock = Mock()
     monkeypatch.setattr(session.http, "disable_dh", mock)
@@ -181,6 +231,76 @@ def test_options_http_disable_dh(monkeypatch: pytest.MonkeyPatch, session: Strea
     assert not session.get_option("http-disable-dh")
 
 
+def test_options_http_http2(monkeypatch: pytest.MonkeyPatch, session: Streamlink):
+    mock = Mock()
+    monkeypatch.setattr(session.http, "enable_http2", mock)
+
+    assert not session.get_option("http-http2")
+
+    session.set_option("http-http2", True)
+    assert mock.call_args_list.pop() == call(enable=True)
+    assert session.get_option("http-http2")
+
+    session.set_option("http-http2", False)
+    assert mock.call_args_list.pop() == call(enable=False)
+    assert not session.get_option("http-http2")
+
+
+@pytest.mark.parametrize("no_plugin_cache", [True, False])
+def test_options_http_cache(monkeypatch: pytest.MonkeyPatch, session: Streamlink, no_plugin_cache: bool):
+    mock = Mock()
+    monkeypatch.setattr(session.http, "enable_response_cache", mock)
+    session.set_option("no-plugin-cache", no_plugin_cache)
+
+    assert not session.get_option("http-cache")
+
+    session.set_option("http-cache", True)
+    assert mock.call_args_list.pop() == call(enable=True, disabled_file=no_plugin_cache)
+    assert session.get_option("http-cache")
+
+    session.set_option("http-cache", False)
+    assert mock.call_args_list.pop() == call(enable=False, disabled_file=no_plugin_cache)
+    assert not session.get_option("http-cache")
+
+
+def test_options_stream_bandwidth_cache(monkeypatch: pytest.MonkeyPatch, session: Streamlink):
+    mock = Mock()
+    monkeypatch.setattr(session.bandwidth, "persist", mock)
+
+    assert not session.get_option("stream-bandwidth-cache")
+
+    session.set_option("stream-bandwidth-cache", True)
+    assert mock.call_args_list.pop() == call(enable=True, disabled=False)
+    assert session.get_option("stream-bandwidth-cache")
+
+    session.set_option("stream-bandwidth-cache", False)
+    assert mock.call_args_list.pop() == call(enable=False, disabled=False)
+    assert not session.get_option("stream-bandwidth-cache")
+
+    session.set_option("no-plugin-cache", True)
+    session.set_option("stream-bandwidth-cache", True)
+    assert mock.call_args_list.pop() == call(enable=True, disabled=True)
+
+
+def test_options_http_timings(monkeypatch: pytest.MonkeyPatch, session: Streamlink):
+    mock_add = Mock()
+    mock_remove = Mock()
+    monkeypatch.setattr(session.http, "add_timings_hook", mock_add)
+    monkeypatch.setattr(session.http, "remove_timings_hook", mock_remove)
+
+    assert not session.get_option("http-timings")
+
+    session.set_option("http-timings", True)
+    assert mock_remove.call_args_list == [call(log_timings)]
+    assert mock_add.call_args_list == [call(log_timings)]
+    assert session.get_option("http-timings")
+
+    session.set_option("http-timings", False)
+    assert mock_remove.call_args_list == [call(log_timings), call(log_timings)]
+    assert mock_add.call_args_list == [call(log_timings)]
+    assert not session.get_option("http-timings")
+
+
 class TestOptionsHttpProxy:
     @pytest.fixture()
     def _no_deprecation(self, recwarn: pytest.WarningsRecorder):
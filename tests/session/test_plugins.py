@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import logging
 import re
 
 # noinspection PyProtectedMember
@@ -13,6 +14,7 @@ import pytest
 
 import streamlink.plugins
 import tests.plugin
+from streamlink.cache import Cache
 from streamlink.options import Argument, Arguments
 
 # noinspection PyProtectedMember
@@ -28,7 +30,9 @@ from streamlink.plugin.plugin import (
     pluginmatcher,
 )
 from streamlink.session import Streamlink
-from streamlink.session.plugins import StreamlinkPlugins
+
+# noinspection PyProtectedMember
+from streamlink.session.plugins import StreamlinkPlugins, StreamlinkPluginsData, _LazyPattern  # noqa: PLC2701
 from streamlink.utils.args import boolean, comma_list_filter
 from tests.plugin.testplugin import TestPlugin as _TestPlugin
 
@@ -208,6 +212,12 @@ class TestLoad:
 
 
 class TestLoadPluginsData:
+    @pytest.fixture()
+    def caplog(self, caplog: pytest.LogCaptureFixture) -> pytest.LogCaptureFixture:
+        # ignore the trace logs of the plugins data cache
+        caplog.set_level(logging.DEBUG, "streamlink.cache")
+        return caplog
+
     @pytest.fixture()
     def session(self, monkeypatch: pytest.MonkeyPatch, fake_plugin: type[Plugin], metadata_files: Mock):
         class MockStreamlinkPlugins(StreamlinkPlugins):
@@ -246,17 +256,29 @@ class TestLoadPluginsData:
 
         assert mock.call_args_list == [call("streamlink")]
 
-    @pytest.fixture()
-    def pluginsdata(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
-        data = getattr(request, "param", "{}")
+    @pytest.fixture(autouse=True)
+    def pluginsdata_cache(self, cache_dir: Path):
+        cache = Cache("plugins.json")
+        yield cache
+        cache.close()
 
+    @pytest.fixture()
+    def pluginsdata_path(self, monkeypatch: pytest.MonkeyPatch):
         mock = Mock()
         monkeypatch.setattr("streamlink.session.plugins._PLUGINSDATA_PATH", mock)
 
+        return mock
+
+    @pytest.fixture()
+    def pluginsdata(self, request: pytest.FixtureRequest, pluginsdata_path: Mock):
+        data = getattr(request, "param", "{}")
+
         if data is None:
-            mock.read_bytes.side_effect = FileNotFoundError
+            pluginsdata_path.stat.side_effect = FileNotFoundError
+            pluginsdata_path.read_bytes.side_effect = FileNotFoundError
         else:
-            mock.read_bytes.return_value = data.encode("utf-8")
+            pluginsdata_path.stat.return_value = Mock(st_size=len(data), st_mtime_ns=1)
+            pluginsdata_path.read_bytes.return_value = data.encode("utf-8")
 
         return data
 
@@ -531,6 +553,110 @@ class TestLoadPluginsData:
             ("streamlink.session", "error", "Error while loading pluginargument data from JSON"),
         ]
 
+    @pytest.mark.parametrize(
+        "pluginsdata",
+        [
+            pytest.param(
+                # language=json
+                """
+                    // comment
+                    {
+                        "testplugin": {
+                            "matchers": [{"pattern": "https?://foo\\\\.com/", "flags": 2}],
+                            "arguments": [{"name": "foo"}]
+                        }
+                    }
+                """,
+                id="pluginsdata",
+            ),
+        ],
+        indirect=True,
+    )
+    def test_cache(
+        self,
+        session: Streamlink,
+        metadata_files: Mock,
+        pluginsdata_path: Mock,
+        pluginsdata_cache: Cache,
+    ):
+        data = {"testplugin": {"matchers": [{"pattern": "https?://foo\\.com/", "flags": 2}], "arguments": [{"name": "foo"}]}}
+        cached = pluginsdata_cache.get("data")
+        assert cached["key"]["size"] == pluginsdata_path.stat.return_value.st_size
+        assert cached["key"]["mtime"] == 1
+        assert cached["data"] == data
+
+        # validated data gets reused: no metadata lookup, no reading and hashing of the plugins JSON file
+        pluginsdata_path.read_bytes.reset_mock()
+        loaded = StreamlinkPluginsData.load()
+        assert loaded is not None
+        assert loaded == (dict(session.plugins.iter_matchers()), dict(session.plugins.iter_arguments()))
+        assert pluginsdata_path.read_bytes.call_count == 0
+        assert metadata_files.call_count == 1
+
+        # modified plugins JSON file
+        metadata_files.reset_mock()
+        pluginsdata_path.stat.return_value.st_mtime_ns = 2
+        assert StreamlinkPluginsData.load() == loaded
+        assert pluginsdata_path.read_bytes.call_count == 1
+        assert pluginsdata_cache.get("data")["key"]["mtime"] == 2
+
+    @pytest.mark.parametrize(
+        "pluginsdata",
+        [pytest.param("""{"testplugin": {"matchers": [{"pattern": "foo"}]}}""", id="pluginsdata")],
+        indirect=True,
+    )
+    def test_cache_disabled(self, monkeypatch: pytest.MonkeyPatch, pluginsdata: str, cache_dir: Path):
+        mock_load = Mock(return_value=None)
+        monkeypatch.setattr("streamlink.session.plugins.StreamlinkPluginsData._load_cache", mock_load)
+
+        session = Streamlink({"no-plugin-cache": True}, plugins_builtin=True, plugins_lazy=True)
+        assert list(session.plugins._matchers) == ["testplugin"]
+        assert mock_load.call_count == 0
+        assert list(cache_dir.iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "pluginsdata",
+        [pytest.param("""{"testplugin": {"matchers": [{"pattern": "foo"}]}}""", id="pluginsdata")],
+        indirect=True,
+    )
+    def test_cache_invalid(self, session: Streamlink, metadata_files: Mock, pluginsdata_path: Mock, pluginsdata_cache: Cache):
+        pluginsdata_cache.set("data", "invalid")
+        metadata_files.reset_mock()
+        pluginsdata_path.read_bytes.reset_mock()
+        assert StreamlinkPluginsData.load() is not None
+        assert pluginsdata_path.read_bytes.call_count == 1
+        assert pluginsdata_cache.get("data")["data"] == {
+            "testplugin": {"matchers": [{"pattern": "foo"}]},
+        }
+
+    @pytest.mark.parametrize(
+        "pluginsdata",
+        [
+            pytest.param(
+                """{"testplugin": {"matchers": [{"pattern": "https?://foo\\\\.com/", "flags": 2}]}}""",
+                id="pluginsdata",
+            ),
+        ],
+        indirect=True,
+    )
+    def test_lazy_matcher_pattern(self, session: Streamlink, pluginsdata: str):
+        pattern = session.plugins._matchers["testplugin"][0].pattern
+        assert isinstance(pattern, _LazyPattern)
+        assert pattern.pattern == r"https?://foo\.com/"
+        assert pattern.flags == re.IGNORECASE
+        assert pattern._compiled is None
+
+        session.plugins.get_index()
+        assert pattern._compiled is None
+
+        assert pattern.match("https://FOO.com/") is not None
+        assert pattern._compiled == re.compile(r"https?://foo\.com/", re.IGNORECASE)
+        assert pattern.groupindex == {}
+        assert pattern == re.compile(r"https?://foo\.com/", re.IGNORECASE)
+
+        with pytest.raises(TypeError):
+            _LazyPattern({"invalid": "type"})  # type: ignore[arg-type]
+
 
 class TestMatchURL:
     def test_priority(self, session: Streamlink):
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import ast
+import pkgutil
+import re
+from pathlib import Path
+
+import pytest
+
+import streamlink.plugins
+import tests.plugins
+from streamlink.plugin.plugin import HIGH_PRIORITY, LOW_PRIORITY, NO_PRIORITY, NORMAL_PRIORITY, Matcher, Matchers
+from streamlink.session.plugins import StreamlinkPlugins
+from streamlink.session.plugins_index import PluginMatcherIndex, get_host_keys, get_url_host
+from streamlink.utils.module import exec_module
+from tests.plugins import generic_negative_matches
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        pytest.param(r"https?://(?:www\.)?twitch\.tv/", {"twitch.tv", "www.twitch.tv"}, id="optional-subdomain"),
+        pytest.param(r"https?://(?:[\w-]+\.)?twitch\.tv/", {"twitch.tv"}, id="any-subdomain"),
+        pytest.param(r"https?://(?:[\w-]+\.)*(?:foo|bar)\.com$", {"foo.com", "bar.com"}, id="alternation"),
+        pytest.param(r"https?://\w+\.tv/", {"tv"}, id="non-literal-label"),
+        pytest.param(r"https?://\w+tv\.com/", {"com"}, id="non-literal-label-prefix"),
+        pytest.param(r"https?://(?P<base>(?:WWW\.)?Foo\.com)(?:/.*)?$", None, id="unterminated-group"),
+        pytest.param(r"https?://(?:www\.)?foo\.com(?P<path>/.*)", {"foo.com", "www.foo.com"}, id="named-group"),
+        pytest.param(r"https?://(?:www\.)?FOO\.com/", {"foo.com", "www.foo.com"}, id="casefold"),
+        pytest.param(r"https?://(?:www\.)?foo\.com", None, id="no-terminator"),
+        pytest.param(r"https?://foo\w*/", None, id="no-label"),
+        pytest.param(r"https?://[^/]+\.foo\.com/", None, id="delimiter"),
+        pytest.param(r"https?://.+\.foo\.com/", None, id="any"),
+        pytest.param(r".*://foo\.com/", None, id="scheme-colon"),
+        pytest.param(r"foo\.com/", None, id="no-scheme"),
+    ],
+)
+def test_get_host_keys(pattern: str, expected: set[str] | None):
+    assert get_host_keys(re.compile(pattern)) == expected
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        pytest.param("https://www.Twitch.tv/foo", "www.twitch.tv", id="path"),
+        pytest.param("https://twitch.tv:443?foo", "twitch.tv", id="port"),
+        pytest.param("https://twitch.tv", "twitch.tv", id="end"),
+        pytest.param("hls://foo/bar", "foo", id="scheme"),
+        pytest.param("twitch.tv/foo", None, id="no-scheme"),
+        pytest.param("foo:bar", None, id="no-authority"),
+    ],
+)
+def test_get_url_host(url: str, expected: str | None):
+    assert get_url_host(url) == expected
+
+
+class TestPluginMatcherIndex:
+    def test_candidates(self):
+        twitch = Matcher(re.compile(r"https?://(?:www\.)?twitch\.tv/"), NORMAL_PRIORITY)
+        youtube = Matcher(re.compile(r"https?://(?:www\.)?youtube\.com/"), NORMAL_PRIORITY)
+        combined = Matcher(re.compile(r"https?://(?:www\.)?(?P<tld>example\.(?:com|net))"), NORMAL_PRIORITY)
+        unfiltered = Matcher(re.compile(r"(?P<a>\w+)://(?P=a)"), LOW_PRIORITY)
+        index = PluginMatcherIndex([
+            ("unfiltered", Matchers(unfiltered)),
+            ("twitch", Matchers(twitch)),
+            ("youtube", Matchers(youtube)),
+            ("combined", Matchers(combined)),
+        ])
+
+        assert len(index) == 4
+        assert list(index.iter_candidates("https://www.twitch.tv/foo")) == [("unfiltered", unfiltered), ("twitch", twitch)]
+        assert list(index.iter_candidates("https://m.youtube.com/foo")) == [("unfiltered", unfiltered), ("youtube", youtube)]
+        assert list(index.iter_candidates("https://example.net")) == [("unfiltered", unfiltered), ("combined", combined)]
+        assert list(index.iter_candidates("https://example.org")) == [("unfiltered", unfiltered)]
+
+    def test_match_url_priority(self):
+        plugins = StreamlinkPlugins(builtin=False)
+        low = type("Low", (), {"matchers": Matchers(Matcher(re.compile(r"https?://(?:\w+\.)?foo\.com/"), LOW_PRIORITY))})
+        high = type("High", (), {"matchers": Matchers(Matcher(re.compile(r"https?://www\.foo\.com/"), HIGH_PRIORITY))})
+        none = type("None", (), {"matchers": Matchers(Matcher(re.compile(r"https?://www\.foo\.com/"), NO_PRIORITY))})
+        plugins.update({"low": low, "high": high, "none": none})  # type: ignore[dict-item]
+
+        assert plugins.match_url("https://www.foo.com/") == ("high", high)
+        assert plugins.match_url("https://bar.foo.com/") == ("low", low)
+
+        del plugins["high"]
+        assert plugins.match_url("https://www.foo.com/") == ("low", low)
+
+
+def _iter_test_urls():
+    # don't import the plugin test modules, just read all URL strings from their source
+    for path in Path(tests.plugins.__path__[0]).glob("test_*.py"):
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and "://" in node.value:
+                yield node.value
+
+    yield from generic_negative_matches
+
+
+def test_builtin_plugins_same_result():
+    # don't override the already imported plugin modules
+    plugins = StreamlinkPlugins(builtin=False)
+    for module_info in pkgutil.iter_modules(streamlink.plugins.__path__):
+        if not module_info.name.startswith("common_"):
+            module = exec_module(module_info.module_finder, f"streamlink.plugins.{module_info.name}")  # type: ignore[arg-type]
+            plugins[module_info.name] = module.__plugin__
+    matchers = list(plugins.iter_matchers())
+
+    def match_linear(url: str) -> str | None:
+        match = None
+        priority = NO_PRIORITY
+        for name, plugin_matchers in matchers:
+            for matcher in plugin_matchers:
+                if matcher.priority > priority and matcher.pattern.match(url) is not None:
+                    match = name
+                    priority = matcher.priority
+        return match
+
+    urls = sorted(set(_iter_test_urls()))
+    assert len(urls) > 1000
+    for url in urls:
+        result = plugins.match_url(url)
+        assert (result[0] if result else None) == match_linear(url), url
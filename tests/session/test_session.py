@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from unittest.mock import Mock
 
 import pytest
+import requests
 
 import tests.plugin
 from streamlink.exceptions import NoPluginError, StreamlinkDeprecationWarning
@@ -143,6 +144,153 @@ class TestResolveURL:
         assert session.resolve_url("https://secure")[1] is PluginHttps
 
 
+class TestResolvedURLCache:
+    @pytest.fixture(autouse=True)
+    def _load_plugins(self, cache_dir: Path, session: Streamlink):
+        session.plugins.load_path(PATH_TESTPLUGINS)
+
+    @pytest.fixture()
+    def redirect(self, requests_mock: rm.Mocker):
+        requests_mock.head("http://test.se/channel", content=b"")
+        return requests_mock.head("http://redirect/", status_code=301, headers={"Location": "http://test.se/channel"})
+
+    def test_disabled(self, cache_dir: Path, redirect: rm.adapter._Matcher, session: Streamlink):
+        assert not session.resolved_urls.enabled
+        assert session.resolve_url("http://redirect")[2] == "http://test.se/channel"
+        session.resolve_url.cache_clear()
+        assert session.resolve_url("http://redirect")[2] == "http://test.se/channel"
+        assert redirect.call_count == 2
+        assert list(cache_dir.iterdir()) == []
+
+    def test_persistent(self, cache_dir: Path, redirect: rm.adapter._Matcher, session: Streamlink):
+        session.set_option("resolve-url-cache-ttl", 3600)
+        assert session.resolved_urls.enabled
+
+        plugin = session.plugins["testplugin"]
+        assert session.resolve_url("http://redirect") == ("testplugin", plugin, "http://test.se/channel")
+        assert session.resolve_url("http://test.se/channel") == ("testplugin", plugin, "http://test.se/channel")
+        assert redirect.call_count == 1
+
+        # a new session reads the cached resolution from the cache file and doesn't send any requests
+        session.resolve_url.cache_clear()
+        session.resolved_urls.configure(ttl=3600)
+        assert session.resolve_url("http://redirect") == ("testplugin", plugin, "http://test.se/channel")
+        assert redirect.call_count == 1
+        assert (cache_dir / "resolved-urls.sqlite3").exists()
+
+        # cached entries get ignored if their plugin doesn't match the resolved URL anymore
+        session.resolve_url.cache_clear()
+        del session.plugins["testplugin"]
+        with pytest.raises(NoPluginError):
+            session.resolve_url("http://redirect")
+        assert redirect.call_count == 2
+
+    def test_no_plugin_cache(self, cache_dir: Path, redirect: rm.adapter._Matcher, session: Streamlink):
+        session.set_option("no-plugin-cache", True)
+        session.set_option("resolve-url-cache-ttl", 3600)
+
+        assert session.resolve_url("http://redirect")[2] == "http://test.se/channel"
+        session.resolve_url.cache_clear()
+        assert session.resolve_url("http://redirect")[2] == "http://test.se/channel"
+        assert redirect.call_count == 1
+        assert list(cache_dir.iterdir()) == []
+
+    def test_expired(self, redirect: rm.adapter._Matcher, session: Streamlink):
+        session.set_option("resolve-url-cache-ttl", 3600)
+        session.resolved_urls._cache.set("http://redirect/", {"plugin": "testplugin", "url": "http://test.se/channel"}, -1)  # type: ignore[union-attr]
+
+        assert session.resolve_url("http://redirect")[2] == "http://test.se/channel"
+        assert redirect.call_count == 1
+
+    def test_resolve_urls(self, redirect: rm.adapter._Matcher, session: Streamlink):
+        session.set_option("resolve-url-cache-ttl", 3600)
+        plugin = session.plugins["testplugin"]
+
+        assert list(session.resolve_urls(["http://redirect/"])) == [
+            ("http://redirect/", ("testplugin", plugin, "http://test.se/channel")),
+        ]
+        assert list(session.resolve_urls(["http://redirect/"])) == [
+            ("http://redirect/", ("testplugin", plugin, "http://test.se/channel")),
+        ]
+        assert redirect.call_count == 1
+
+
+class TestResolveURLs:
+    @pytest.fixture(autouse=True)
+    def _load_plugins(self, session: Streamlink):
+        session.plugins.load_path(PATH_TESTPLUGINS)
+
+    def test_resolve_urls(self, requests_mock: rm.Mocker, session: Streamlink):
+        requests_mock.head("http://redirect", status_code=301, headers={"Location": "http://test.se/redirected"})
+        requests_mock.head("http://test.se/redirected", content=b"")
+        requests_mock.head("http://no-redirect", content=b"")
+
+        results = list(
+            session.resolve_urls([
+                "http://test.se/channel",
+                "http://redirect",
+                "http://no-redirect",
+                "http://redirect",
+                "test.se/other",
+            ]),
+        )
+        plugin = session.plugins["testplugin"]
+        assert results == [
+            ("http://test.se/channel", ("testplugin", plugin, "http://test.se/channel")),
+            ("http://redirect", ("testplugin", plugin, "http://test.se/redirected")),
+            ("http://no-redirect", None),
+            ("http://redirect", ("testplugin", plugin, "http://test.se/redirected")),
+            ("test.se/other", ("testplugin", plugin, "https://test.se/other")),
+        ]
+        # identical URLs only get looked up once
+        assert sorted((req.method, req.url) for req in requests_mock.request_history) == [
+            ("HEAD", "http://no-redirect/"),
+            ("HEAD", "http://redirect/"),
+            ("HEAD", "http://test.se/redirected"),
+        ]
+
+    def test_no_redirect(self, requests_mock: rm.Mocker, session: Streamlink):
+        results = list(session.resolve_urls(["http://test.se/channel", "http://redirect"], follow_redirect=False))
+        assert results == [
+            ("http://test.se/channel", ("testplugin", session.plugins["testplugin"], "http://test.se/channel")),
+            ("http://redirect", None),
+        ]
+        assert requests_mock.request_history == []
+
+    def test_unreachable_host(self, requests_mock: rm.Mocker, session: Streamlink):
+        requests_mock.head("http://unreachable/1", exc=requests.exceptions.ConnectionError)
+        requests_mock.head("http://unreachable/2", exc=requests.exceptions.ConnectionError)
+        requests_mock.head("http://reachable/", status_code=404)
+        urls = ["http://unreachable/1", "http://unreachable/2", "http://reachable/"]
+        results = list(session.resolve_urls(urls, max_workers=1))
+        assert results == [("http://unreachable/1", None), ("http://unreachable/2", None), ("http://reachable/", None)]
+        assert [req.url for req in requests_mock.request_history] == ["http://unreachable/1", "http://reachable/"]
+
+    def test_lookups_bounded(self, requests_mock: rm.Mocker, session: Streamlink):
+        mock = requests_mock.head(re.compile(r"^http://redirect/\d+$"), status_code=404)
+        urls = [f"http://redirect/{num}" for num in range(100)]
+        results = list(session.resolve_urls([*urls, "http://redirect/99", "http://redirect/0"], max_workers=1))
+        assert len(results) == 102
+        # only the lookups of the most recent URLs are kept
+        requested = [req.url for req in mock.request_history]
+        assert len(requested) == 101
+        assert requested.count("http://redirect/99") == 1
+        assert requested.count("http://redirect/0") == 2
+
+    def test_lazy_input(self, session: Streamlink):
+        consumed = []
+
+        def urls():
+            for num in range(100):
+                consumed.append(num)
+                yield f"http://test.se/{num}"
+
+        results = session.resolve_urls(urls(), follow_redirect=False, max_workers=1)
+        assert next(results)[0] == "http://test.se/0"
+        assert len(consumed) < 100
+        assert len(list(results)) == 99
+
+
 class TestStreams:
     @pytest.fixture(autouse=True)
     def _load_plugins(self, session: Streamlink):
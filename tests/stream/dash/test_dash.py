@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import Future
 from contextlib import nullcontext
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
-from unittest.mock import ANY, Mock, call
+from unittest.mock import ANY, Mock, call, patch
 
 import freezegun
 import pytest
 from lxml.etree import ParseError
+from requests.exceptions import ConnectTimeout
+from urllib3.exceptions import ProtocolError
 
 from streamlink.exceptions import PluginError
-from streamlink.stream.dash import MPD, DASHSegment, DASHStream, DASHStreamWorker, MPDParsingError
+from streamlink.stream.dash import (
+    MPD,
+    AdaptiveDASHStream,
+    AdaptiveDASHStreamWorker,
+    AdaptiveDASHStreamWriter,
+    DASHSegment,
+    DASHStream,
+    DASHStreamWorker,
+    DASHStreamWriter,
+    MPDParsingError,
+)
 from streamlink.stream.dash.dash import log
 from streamlink.utils.parse import parse_xml as original_parse_xml
 from tests.resources import text, xml
@@ -408,7 +424,7 @@ class TestDASHStreamOpen:
     @pytest.fixture()
     def reader(self, monkeypatch: pytest.MonkeyPatch):
         reader = Mock()
-        monkeypatch.setattr("streamlink.stream.dash.dash.DASHStreamReader", reader)
+        monkeypatch.setattr("streamlink.stream.dash.dash.DASHStream.__reader__", reader)
         return reader
 
     @pytest.fixture()
@@ -494,6 +510,7 @@ class TestDASHStreamWorker:
             minimumUpdatePeriod=Mock(total_seconds=Mock(return_value=0)),
             periods=[period],
             get_representation=Mock(return_value=representation),
+            get_next_period=Mock(return_value=None),
         )
 
     @pytest.fixture()
@@ -622,6 +639,131 @@ class TestDASHStreamWorker:
             ),
         ]
 
+    def test_dynamic_period_transition(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        timestamp: datetime,
+        reader: Mock,
+        worker: DASHStreamWorker,
+        representation: Mock,
+        segments: list[DASHSegment],
+        mpd: Mock,
+    ):
+        caplog.set_level("INFO", "streamlink")
+
+        mpd.dynamic = True
+        mpd.type = "dynamic"
+
+        next_segments = [
+            DASHSegment(uri="next_init_segment", num=-1, init=True, duration=0.0),
+            DASHSegment(uri="next_first_segment", num=10, duration=2.0),
+        ]
+        next_representation = Mock(ident=("2", None, "1"), mimeType="video/webm")
+        next_representation.segments.return_value = next_segments
+        next_period = Mock(get_equivalent_representation=Mock(return_value=next_representation))
+        mpd.get_next_period.side_effect = lambda period: next_period if period is representation.period else None
+
+        segment_iter = self._iter_segments(worker.iter_segments())
+
+        representation.segments.return_value = segments[:2]
+        assert self._next_segments(worker, segment_iter, 4) == [*segments[:2], *next_segments]
+        assert representation.segments.call_args_list == [call(sequence=-1, init=True, timestamp=timestamp)]
+        assert next_representation.segments.call_args_list == [call(sequence=-1, init=True, timestamp=None)]
+        assert next_period.get_equivalent_representation.call_args_list == [call(representation)]
+        assert reader.ident == ("2", None, "1")
+        assert reader.mime_type == "video/webm"
+        assert not worker.closed
+        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+            ("streamlink.stream.dash", "info", "Switching DASH representation: (None, None, '1') -> ('2', None, '1')"),
+        ]
+
+    def test_dynamic_reload_removed_period(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+        timestamp: datetime,
+        reader: Mock,
+        worker: DASHStreamWorker,
+        representation: Mock,
+        segments: list[DASHSegment],
+        mpd: Mock,
+    ):
+        caplog.set_level("INFO", "streamlink")
+
+        mpd.dynamic = True
+        mpd.type = "dynamic"
+
+        next_representation = Mock(
+            ident=("2", None, "1"),
+            mimeType="video/mp4",
+            period=Mock(duration=Mock(total_seconds=Mock(return_value=0))),
+        )
+        next_representation.segments.return_value = segments[3:]
+        next_period = Mock(get_equivalent_representation=Mock(return_value=next_representation))
+
+        new_mpd = Mock(
+            type="dynamic",
+            minimumUpdatePeriod=Mock(total_seconds=Mock(return_value=0)),
+            get_representation=Mock(side_effect=lambda ident: next_representation if ident == ("2", None, "1") else None),
+            get_next_period=Mock(side_effect=lambda period: next_period if period is representation.period else None),
+        )
+        monkeypatch.setattr("streamlink.stream.dash.dash.MPD", lambda *args, **kwargs: new_mpd)
+
+        segment_iter = self._iter_segments(worker.iter_segments())
+
+        representation.segments.return_value = segments[:2]
+        assert self._next_segments(worker, segment_iter, 2) == segments[:2]
+        assert self._next_segments(worker, segment_iter, 2) == segments[3:5]
+        assert representation.segments.call_args_list == [call(sequence=-1, init=True, timestamp=timestamp)]
+        assert next_representation.segments.call_args_list == [call(sequence=-1, init=True, timestamp=None)]
+        assert worker.mpd is new_mpd
+        assert reader.ident == ("2", None, "1")
+        assert not worker.closed
+        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+            ("streamlink.stream.dash", "info", "Switching DASH representation: (None, None, '1') -> ('2', None, '1')"),
+        ]
+
+    def test_dynamic_period_transition_timeline(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+        session: Streamlink,
+    ):
+        caplog.set_level("INFO", "streamlink")
+
+        with freezegun.freeze_time("2000-01-01T00:00:50Z"):
+            # the next period is listed before the segment timeline of the current period reaches its end
+            with xml("dash/test_dynamic_multi_period_timeline_p1.mpd") as mpd_xml:
+                mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+            with xml("dash/test_dynamic_multi_period_timeline_p2.mpd") as mpd_xml:
+                monkeypatch.setattr("streamlink.stream.dash.dash.MPD", lambda _node, **kwargs: MPD(mpd_xml, **kwargs))
+            monkeypatch.setattr(session.http, "request", Mock())
+            monkeypatch.setattr(session.http, "xml", Mock())
+
+            stream = DASHStream(session, mpd)
+            reader = Mock(session=session, stream=stream, ident=("program", "0", "video"), timestamp=None)
+            worker = DASHStreamWorker(reader)
+
+            segment_iter = self._iter_segments(worker.iter_segments())
+            # the remaining segments of the current period get added by the reloaded manifest
+            assert [segment.uri for segment in self._next_segments(worker, segment_iter, 16)] == [
+                "http://test/program-init.m4s",
+                *(f"http://test/program-{time}.m4s" for time in range(0, 60, 5)),
+                "http://test/ad-init.m4s",
+                "http://test/ad-0.m4s",
+                "http://test/ad-5.m4s",
+            ]
+
+        assert reader.ident == ("ad", "0", "video")
+        assert not worker.closed
+        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+            (
+                "streamlink.stream.dash",
+                "info",
+                "Switching DASH representation: ('program', '0', 'video') -> ('ad', '0', 'video')",
+            ),
+        ]
+
     def test_static(
         self,
         worker: DASHStreamWorker,
@@ -714,3 +856,304 @@ class TestDASHStreamWorker:
         assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
             ("streamlink.stream.segmented", "info", "Stopping stream early after 5.00s"),
         ]
+
+
+class TestDASHStreamWriter:
+    @pytest.fixture()
+    def scheduler(self, monkeypatch: pytest.MonkeyPatch):
+        scheduler = Mock()
+        monkeypatch.setattr("streamlink.stream.dash.dash.Scheduler.shared", Mock(return_value=scheduler))
+
+        return scheduler
+
+    @pytest.fixture()
+    def writer(self, session: Streamlink, scheduler: Mock):
+        reader = Mock(session=session, stream=DASHStream(session, Mock()), mime_type="video/mp4")
+        writer = DASHStreamWriter(reader)
+        writer.executor = Mock()
+        writer._queue_put = Mock()
+        yield writer
+        writer.close()
+
+    def test_put_available(self, timestamp: datetime, writer: DASHStreamWriter, scheduler: Mock):
+        segment = DASHSegment(uri="foo", num=1, duration=1.0, available_at=timestamp)
+        writer.put(segment)
+
+        assert writer.executor.submit.call_args_list == [call(writer.fetch, segment)]
+        assert scheduler.schedule.call_args_list == []
+        assert writer._queue_put.call_args_list == [call((segment, writer.executor.submit.return_value, ()))]
+
+    def test_put_scheduled(self, timestamp: datetime, writer: DASHStreamWriter, scheduler: Mock):
+        segment = DASHSegment(uri="foo", num=1, duration=1.0, available_at=timestamp + timedelta(seconds=5))
+        writer.put(segment)
+
+        assert writer.executor.submit.call_args_list == []
+        assert scheduler.schedule.call_args_list == [call(5.0, writer._submit, segment, ANY)]
+        future = scheduler.schedule.call_args_list[0].args[3]
+        assert writer._queue_put.call_args_list == [call((segment, future, ()))]
+        assert not future.done()
+        assert writer._scheduled == {scheduler.schedule.return_value: future}
+
+        fetched = Future()
+        writer.executor.submit.return_value = fetched
+        writer._submit(segment, future)
+        assert writer.executor.submit.call_args_list == [call(writer.fetch, segment)]
+        assert future.running()
+
+        fetched.set_result("data")
+        assert future.result() == "data"
+        assert writer._scheduled == {}
+
+    def test_put_scheduled_error(self, timestamp: datetime, writer: DASHStreamWriter, scheduler: Mock):
+        segment = DASHSegment(uri="foo", num=1, duration=1.0, available_at=timestamp + timedelta(seconds=5))
+        writer.put(segment)
+        future = scheduler.schedule.call_args_list[0].args[3]
+
+        fetched = Future()
+        writer.executor.submit.return_value = fetched
+        writer._submit(segment, future)
+        fetched.set_exception(ValueError("foo"))
+        with pytest.raises(ValueError, match=r"^foo$"):
+            future.result()
+
+    def test_fetch_failover(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        requests_mock: rm.Mocker,
+        timestamp: datetime,
+        writer: DASHStreamWriter,
+    ):
+        writer.retries = 2
+        mock_cdn1 = requests_mock.get("https://cdn1/segment", status_code=503)
+        mock_cdn2 = requests_mock.get("https://cdn2/segment", content=b"data")
+        segment = DASHSegment(uri="https://cdn1/segment", num=1, duration=1.0, alternate_uris=("https://cdn2/segment",))
+
+        result = writer._fetch(segment)
+        assert result is not None
+        assert result.content == b"data"
+        assert mock_cdn1.call_count == 1
+        assert mock_cdn2.call_count == 1
+        assert [(record.levelname, record.message) for record in caplog.records] == [
+            (
+                "warning",
+                "".join([
+                    "video/mp4 segment 1: failed (Unable to open URL: https://cdn1/segment ",
+                    "(503 Server Error: None for url: https://cdn1/segment)), trying next location",
+                ]),
+            ),
+        ]
+
+        # the failed location is ranked last on subsequent fetches
+        result = writer._fetch(segment)
+        assert result is not None
+        assert mock_cdn1.call_count == 1
+        assert mock_cdn2.call_count == 2
+
+    def test_fetch_bandwidth(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        requests_mock: rm.Mocker,
+        writer: DASHStreamWriter,
+    ):
+        monkeypatch.setattr("streamlink.stream.dash.dash.time", Mock(side_effect=[10.0, 10.5]))
+        writer.update_bandwidth = Mock()
+        writer.retries = 2
+        requests_mock.get("https://cdn1/segment", exc=ConnectTimeout)
+        requests_mock.get("https://cdn2/segment", content=b"data")
+        segment = DASHSegment(uri="https://cdn1/segment", num=1, duration=1.0, alternate_uris=("https://cdn2/segment",))
+
+        result = writer._fetch(segment)
+        assert result is not None
+        assert result.content == b"data"
+        # only the successful request gets timed: its time to the response headers, plus the time of reading its body
+        latency = result.elapsed.total_seconds()
+        assert writer.update_bandwidth.call_args_list == [call(4, latency + 0.5, latency)]
+
+    def test_fetch_body_error(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        requests_mock: rm.Mocker,
+        writer: DASHStreamWriter,
+    ):
+        class Body(BytesIO):
+            def read(self, *args, **kwargs):
+                raise ProtocolError("broken")
+
+        writer.update_bandwidth = Mock()
+        requests_mock.get("https://cdn1/segment", body=Body())
+        requests_mock.get("https://cdn2/segment", content=b"data")
+        segment = DASHSegment(uri="https://cdn1/segment", num=1, duration=1.0, alternate_uris=("https://cdn2/segment",))
+
+        result = writer._fetch(segment)
+        assert result is not None
+        assert result.content == b"data"
+        assert writer.update_bandwidth.call_count == 1
+        assert [(record.levelname, record.message) for record in caplog.records] == [
+            ("warning", "video/mp4 segment 1: failed (broken), trying next location"),
+        ]
+
+    def test_fetch_failover_all_failed(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        requests_mock: rm.Mocker,
+        writer: DASHStreamWriter,
+    ):
+        writer.retries = 2
+        mock_cdn1 = requests_mock.get("https://cdn1/segment", status_code=503)
+        mock_cdn2 = requests_mock.get("https://cdn2/segment", status_code=404)
+        segment = DASHSegment(uri="https://cdn1/segment", num=1, duration=1.0, alternate_uris=("https://cdn2/segment",))
+
+        with patch("streamlink.session.http.time.sleep"):
+            assert writer._fetch(segment) is None
+        assert mock_cdn1.call_count == 1
+        assert mock_cdn2.call_count == 3
+        assert [record.levelname for record in caplog.records] == ["warning", "error"]
+
+    def test_close(self, timestamp: datetime, writer: DASHStreamWriter, scheduler: Mock):
+        segment = DASHSegment(uri="foo", num=1, duration=1.0, available_at=timestamp + timedelta(seconds=5))
+        writer.put(segment)
+        future = scheduler.schedule.call_args_list[0].args[3]
+
+        writer.close()
+        assert scheduler.schedule.return_value.cancel.call_count == 1
+        assert future.cancelled()
+        assert writer._scheduled == {}
+
+        writer._submit(segment, future)
+        assert writer.executor.submit.call_args_list == []
+
+
+class TestAdaptiveDASHStream:
+    @pytest.fixture()
+    def representations(self) -> list[Mock]:
+        aset = SimpleNamespace(
+            representations=[
+                Mock(ident=(None, "0", "high"), mimeType="video/mp4", bandwidth=2000.0),
+                Mock(ident=(None, "0", "mid"), mimeType="video/mp4", bandwidth=1000.0),
+                Mock(ident=(None, "0", "low"), mimeType="video/mp4", bandwidth=500.0),
+            ],
+        )
+        for rep in aset.representations:
+            rep.parent = aset
+            name = rep.ident[2]
+            rep.segments.return_value = [
+                DASHSegment(uri=f"{name}_init", num=-1, init=True, duration=0.0),
+                *(DASHSegment(uri=f"{name}_{num}", num=num, duration=1.0) for num in range(6)),
+            ]
+
+        return aset.representations
+
+    @pytest.fixture()
+    def mpd(self, representations: list[Mock]) -> Mock:
+        idents = {rep.ident: rep for rep in representations}
+
+        return Mock(
+            type="static",
+            timelines=defaultdict(lambda: -1),
+            get_representation=Mock(side_effect=idents.get),
+            get_next_period=Mock(return_value=None),
+        )
+
+    @pytest.fixture()
+    def stream(self, session: Streamlink, mpd: Mock) -> AdaptiveDASHStream:
+        return AdaptiveDASHStream(session, mpd)
+
+    @pytest.fixture()
+    def reader(self, session: Streamlink, stream: AdaptiveDASHStream, timestamp: datetime, representations: list[Mock]):
+        reader = Mock(
+            session=session,
+            stream=stream,
+            ident=representations[1].ident,
+            mime_type="video/mp4",
+            timestamp=timestamp,
+            max_bandwidth=representations[1].bandwidth,
+        )
+        reader.writer.throughput = None
+
+        return reader
+
+    @pytest.fixture()
+    def worker(self, reader: Mock):
+        return AdaptiveDASHStreamWorker(reader)
+
+    def test_parse_manifest(self, session: Streamlink):
+        with text("dash/test_1.mpd") as mpd_txt:
+            streams = AdaptiveDASHStream.parse_manifest(session, mpd_txt.read())
+
+        assert streams
+        assert all(type(stream) is AdaptiveDASHStream for stream in streams.values())
+
+    def test_update_throughput(self, reader: Mock):
+        writer = AdaptiveDASHStreamWriter(reader)
+        assert writer.throughput is None
+
+        writer.update_throughput(125_000, 0.0)
+        assert writer.throughput is None
+        writer.update_throughput(125_000, 1.0)
+        assert writer.throughput == pytest.approx(1000.0)
+        writer.update_throughput(125_000, 0.5)
+        assert writer.throughput == pytest.approx(1300.0)
+
+    def test_update_bandwidth(self, session: Streamlink, reader: Mock):
+        session.bandwidth.update(125_000, 0.5)
+        writer = AdaptiveDASHStreamWriter(reader)
+        assert writer.throughput == pytest.approx(2000.0)
+
+        writer.update_bandwidth(125_000, 1.0, 0.1)
+        assert writer.throughput == pytest.approx(1700.0)
+        assert session.bandwidth.bandwidth == pytest.approx(1700.0)
+        assert session.bandwidth.latency == pytest.approx(0.1)
+        assert session.bandwidth.samples == 2
+
+    @pytest.mark.parametrize(
+        ("throughput", "expected"),
+        [
+            pytest.param(
+                None,
+                ["mid_init", "mid_0", "mid_1", "mid_2", "mid_3", "mid_4", "mid_5"],
+                id="no-throughput",
+            ),
+            pytest.param(
+                1300.0,
+                ["mid_init", "mid_0", "mid_1", "mid_2", "mid_3", "mid_4", "mid_5"],
+                id="current",
+            ),
+            pytest.param(
+                5000.0,
+                ["mid_init", "mid_0", "mid_1", "mid_2", "mid_3", "mid_4", "mid_5"],
+                id="max-bandwidth",
+            ),
+            pytest.param(
+                100.0,
+                ["mid_init", "mid_0", "mid_1", "mid_2", "low_init", "low_3", "low_4", "low_5"],
+                id="switch",
+            ),
+        ],
+    )
+    def test_select_representation(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        reader: Mock,
+        worker: AdaptiveDASHStreamWorker,
+        representations: list[Mock],
+        mpd: Mock,
+        throughput: float | None,
+        expected: list[str],
+    ):
+        caplog.set_level("INFO", "streamlink")
+        reader.writer.throughput = throughput
+        mpd.timelines[representations[1].ident] = 123
+
+        worker.run()
+
+        assert [call_arg.args[0].uri for call_arg in reader.writer.put.call_args_list[:-1]] == expected
+        assert reader.writer.put.call_args_list[-1] == call(None)
+        assert [record.message for record in caplog.records if record.levelname == "warning"] == []
+        if expected[-1].startswith("low"):
+            assert representations[2].segments.call_args_list == [call(sequence=3, init=True, timestamp=None)]
+            assert mpd.timelines[representations[2].ident] == 123
+            assert reader.ident == representations[2].ident
+        else:
+            assert representations[2].segments.call_args_list == []
+            assert reader.ident == representations[1].ident
+        assert representations[0].segments.call_args_list == []
@@ -700,6 +700,48 @@ class TestMPDParser:
             ],
         ]
 
+    def test_baseurl_redundant(self):
+        with xml("dash/test_baseurl_redundant.mpd") as mpd_xml:
+            mpd = MPD(mpd_xml, base_url="https://foo/", url="https://test/manifest.mpd")
+
+        representations = mpd.periods[0].adaptationSets[0].representations
+        assert [representation.base_urls for representation in representations] == [
+            ["https://cdn1/content/period/", "https://cdn2/content/period/"],
+            ["https://cdn1/content/period/representation/", "https://cdn2/content/period/representation/"],
+            ["https://other/"],
+        ]
+
+        segment_urls = [
+            [(segment.uri, segment.alternate_uris) for segment in itertools.islice(representation.segments(), 2)]
+            for representation in representations
+        ]
+        assert segment_urls == [
+            [
+                (
+                    "https://cdn1/content/period/init_video_5000kbps.m4s",
+                    ("https://cdn2/content/period/init_video_5000kbps.m4s",),
+                ),
+                (
+                    "https://cdn1/content/period/media_video_5000kbps-1.m4s",
+                    ("https://cdn2/content/period/media_video_5000kbps-1.m4s",),
+                ),
+            ],
+            [
+                (
+                    "https://cdn1/content/period/representation/init_video_9000kbps.m4s",
+                    ("https://cdn2/content/period/representation/init_video_9000kbps.m4s",),
+                ),
+                (
+                    "https://cdn1/content/period/representation/media_video_9000kbps-1.m4s",
+                    ("https://cdn2/content/period/representation/media_video_9000kbps-1.m4s",),
+                ),
+            ],
+            [
+                ("https://other/init_video_1000kbps.m4s", ()),
+                ("https://other/media_video_1000kbps-1.m4s", ()),
+            ],
+        ]
+
     @pytest.mark.parametrize(
         ("base_url", "node_base_url", "raises"),
         [
@@ -877,3 +919,126 @@ class TestMPDParser:
         assert getattr(mpd.get_representation(("period-0", "0", "audio2")), "mimeType", None) == "audio/mp4"
         assert getattr(mpd.get_representation(("period-0", None, "video1")), "mimeType", None) == "video/mp4"
         assert getattr(mpd.get_representation(("period-0", None, "video2")), "mimeType", None) == "video/mp4"
+
+    def test_multi_period(self):
+        with xml("dash/test_dynamic_multi_period.mpd") as mpd_xml:
+            mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+        with xml("dash/test_dynamic_multi_period.mpd") as mpd_xml:
+            mpd_reloaded = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+
+        program, ad, continued = mpd.periods
+
+        assert mpd.get_next_period(program) is ad
+        assert mpd.get_next_period(ad) is continued
+        assert mpd.get_next_period(continued) is None
+        assert mpd.get_next_period(mpd_reloaded.periods[0]) is ad
+        assert mpd.get_next_period(mpd_reloaded.periods[2]) is None
+
+        removed = Mock(id="removed", availabilityStartTime=datetime.datetime(2000, 1, 1, 0, 1, 15, tzinfo=UTC))
+        assert mpd.get_next_period(removed) is continued
+
+        assert [period.availabilityEndTime for period in mpd.periods] == [
+            datetime.datetime(2000, 1, 1, 0, 1, 0, tzinfo=UTC),
+            datetime.datetime(2000, 1, 1, 0, 1, 30, tzinfo=UTC),
+            datetime.datetime(2000, 1, 1, 0, 1, 50, tzinfo=UTC),
+        ]
+
+    def test_multi_period_timeline_ended(self):
+        ident = ("program", "0", "video")
+        with freeze_time("2000-01-01T00:00:50Z"):
+            with xml("dash/test_dynamic_multi_period_timeline_p1.mpd") as mpd_xml:
+                mpd_p1 = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+            representation = mpd_p1.get_representation(ident)
+            assert representation
+            assert representation.has_period_ended() is False
+            assert [segment.num for segment in representation.segments(init=False)] == list(range(1, 10))
+            # the segment timeline of the current period hasn't reached the start of the next period yet
+            assert representation.has_period_ended() is False
+
+            with xml("dash/test_dynamic_multi_period_timeline_p2.mpd") as mpd_xml:
+                mpd_p2 = MPD(mpd_xml, base_url=mpd_p1.base_url, url=mpd_p1.url, timelines=mpd_p1.timelines)
+            representation = mpd_p2.get_representation(ident)
+            assert representation
+            assert [segment.num for segment in representation.segments(init=False)] == [10, 11, 12]
+            assert representation.has_period_ended() is True
+
+        # the remaining segments didn't get added long after the end of the period
+        with freeze_time("2000-01-01T00:01:14Z"):
+            assert mpd_p1.get_representation(ident).has_period_ended() is False  # type: ignore[union-attr]
+        with freeze_time("2000-01-01T00:01:15Z"):
+            assert mpd_p1.get_representation(ident).has_period_ended() is True  # type: ignore[union-attr]
+
+    def test_multi_period_number_ended(self):
+        with xml("dash/test_dynamic_multi_period.mpd") as mpd_xml:
+            mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+        representation = mpd.get_representation(("program", "0", "video-720"))
+        assert representation
+        assert representation.has_period_ended() is True
+
+    @pytest.mark.parametrize(
+        ("ident", "period", "expected"),
+        [
+            pytest.param(("program", "0", "video-720"), 1, ("ad", "2", "ad-720"), id="video-height"),
+            pytest.param(("program", "0", "video-360"), 1, ("ad", "2", "ad-360"), id="video-codec"),
+            pytest.param(("program", "1", "audio"), 1, ("ad", "1", "ad-audio-en"), id="audio-lang"),
+            pytest.param(("program", "0", "video-360"), 2, ("continued", "0", "video-720"), id="single-candidate"),
+            pytest.param(("program", "1", "audio"), 2, None, id="no-candidate"),
+        ],
+    )
+    def test_multi_period_equivalent_representation(self, ident: tuple, period: int, expected: tuple | None):
+        with xml("dash/test_dynamic_multi_period.mpd") as mpd_xml:
+            mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+
+        representation = mpd.get_representation(ident)
+        assert representation
+        equivalent = mpd.periods[period].get_equivalent_representation(representation)
+        assert getattr(equivalent, "ident", None) == expected
+
+    @pytest.mark.parametrize(
+        ("ident", "time", "sequence", "expected"),
+        [
+            pytest.param(
+                ("program", "0", "video-720"),
+                "2000-01-01T00:01:00Z",
+                -1,
+                [
+                    ("http://test/program-720-init.m4s", datetime.datetime(2000, 1, 1, 0, 0, 0, tzinfo=UTC)),
+                    ("http://test/program-720-10.m4s", datetime.datetime(2000, 1, 1, 0, 0, 45, tzinfo=UTC)),
+                    ("http://test/program-720-11.m4s", datetime.datetime(2000, 1, 1, 0, 0, 50, tzinfo=UTC)),
+                    ("http://test/program-720-12.m4s", datetime.datetime(2000, 1, 1, 0, 0, 55, tzinfo=UTC)),
+                ],
+                id="next-period",
+            ),
+            pytest.param(
+                ("program", "0", "video-720"),
+                "2000-01-01T00:01:00Z",
+                12,
+                [
+                    ("http://test/program-720-init.m4s", datetime.datetime(2000, 1, 1, 0, 0, 0, tzinfo=UTC)),
+                    ("http://test/program-720-12.m4s", datetime.datetime(2000, 1, 1, 0, 0, 55, tzinfo=UTC)),
+                ],
+                id="next-period-sequence",
+            ),
+            pytest.param(
+                ("continued", "0", "video-720"),
+                "2000-01-01T00:01:40Z",
+                -1,
+                [
+                    ("http://test/continued-720-init.m4s", datetime.datetime(2000, 1, 1, 0, 1, 30, tzinfo=UTC)),
+                    ("http://test/continued-720-1.m4s", datetime.datetime(2000, 1, 1, 0, 1, 30, tzinfo=UTC)),
+                    ("http://test/continued-720-2.m4s", datetime.datetime(2000, 1, 1, 0, 1, 35, tzinfo=UTC)),
+                    ("http://test/continued-720-3.m4s", datetime.datetime(2000, 1, 1, 0, 1, 40, tzinfo=UTC)),
+                    ("http://test/continued-720-4.m4s", datetime.datetime(2000, 1, 1, 0, 1, 45, tzinfo=UTC)),
+                ],
+                id="period-duration",
+            ),
+        ],
+    )
+    def test_multi_period_segments(self, ident: tuple, time: str, sequence: int, expected: list):
+        with xml("dash/test_dynamic_multi_period.mpd") as mpd_xml, freeze_time(time):
+            mpd = MPD(mpd_xml, base_url="http://test/", url="http://test/manifest.mpd")
+            representation = mpd.get_representation(ident)
+            assert representation
+            segments = [(segment.uri, segment.available_at) for segment in representation.segments(sequence=sequence)]
+
+        assert segments == expected
@@ -280,6 +280,18 @@ class TestHLSStream(TestMixinStreamHLS, unittest.TestCase):
 
         assert self.await_read(read_all=True) == self.content(segments), "Stream ends and read-all handshake doesn't time out"
 
+    @patch("streamlink.stream.hls.hls.time", Mock(side_effect=itertools.count(step=0.5)))
+    def test_bandwidth_estimate(self):
+        segments = self.subject([
+            Playlist(0, [Segment(0), Segment(1)], end=True),
+        ])
+
+        assert self.await_read(read_all=True) == self.content(segments)
+        assert self.session.bandwidth.samples == 2
+        # the download time also includes the short time to the response headers of the mocked requests
+        assert self.session.bandwidth.bandwidth == pytest.approx(len(segments[0].content) * 8 / 1000 / 0.5, rel=0.1)
+        assert self.session.bandwidth.bandwidth < len(segments[0].content) * 8 / 1000 / 0.5
+
     @patch("streamlink.stream.segmented.segmented.log")
     def test_duration(self, mock_log: Mock):
         segments = self.subject(
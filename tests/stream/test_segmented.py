@@ -1,7 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, call, patch
+
+import freezegun
 import pytest
 
+from streamlink.stream.segmented.failover import LocationSelector
 from streamlink.stream.segmented.segment import Segment
-from streamlink.stream.segmented.segmented import log
+from streamlink.stream.segmented.segmented import SegmentedStreamWriter, log
+
+
+if TYPE_CHECKING:
+    from streamlink import Streamlink
 
 
 def test_logger_name():
@@ -38,3 +49,66 @@ def test_logger_name():
 def test_segment_serialization(data: dict, expected: str):
     segment = Segment(**data)
     assert repr(segment) == expected
+
+
+class TestLocationSelector:
+    URIS = ["https://cdn1/segment", "https://cdn2/segment", "https://cdn3/segment"]
+
+    def test_rank_single(self):
+        selector = LocationSelector()
+        selector.failure("https://cdn1/segment")
+        assert selector.rank(["https://cdn1/segment"]) == ["https://cdn1/segment"]
+
+    def test_rank_failover(self):
+        selector = LocationSelector()
+        assert selector.rank(self.URIS) == self.URIS
+
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            selector.failure("https://cdn2/other")
+            frozen_time.tick(1)
+            selector.failure("https://cdn1/other")
+            assert selector.rank(self.URIS) == ["https://cdn3/segment", "https://cdn2/segment", "https://cdn1/segment"]
+
+            frozen_time.tick(LocationSelector.HOLD_TIME)
+            assert selector.rank(self.URIS) == self.URIS
+
+            # consecutive failures increase the hold time
+            selector.failure("https://cdn1/other")
+            frozen_time.tick(LocationSelector.HOLD_TIME)
+            assert selector.rank(self.URIS) == ["https://cdn2/segment", "https://cdn3/segment", "https://cdn1/segment"]
+
+            selector.success("https://cdn1/other")
+            assert selector.rank(self.URIS) == self.URIS
+
+    def test_rank_spread(self):
+        selector = LocationSelector(spread=True)
+        assert [selector.rank(self.URIS)[0] for _ in range(4)] == [
+            "https://cdn1/segment",
+            "https://cdn2/segment",
+            "https://cdn3/segment",
+            "https://cdn1/segment",
+        ]
+
+        selector.failure("https://cdn2/segment")
+        assert [selector.rank(self.URIS) for _ in range(2)] == [
+            ["https://cdn1/segment", "https://cdn3/segment", "https://cdn2/segment"],
+            ["https://cdn3/segment", "https://cdn1/segment", "https://cdn2/segment"],
+        ]
+
+
+def test_writer_reserve_connections(session: Streamlink):
+    session.set_option("stream-segment-threads", 3)
+    reader = Mock(session=session)
+    writer = SegmentedStreamWriter(reader)
+    writer.run = Mock()
+    assert session.http.pool_maxsize == 10
+
+    with patch.object(session.http, "reserve_connections", wraps=session.http.reserve_connections) as mock_reserve:
+        writer.start()
+        writer.join()
+    assert mock_reserve.call_args_list == [call(4)]
+
+    with patch.object(session.http, "release_connections", wraps=session.http.release_connections) as mock_release:
+        writer.close()
+        writer.close()
+    assert mock_release.call_args_list == [call(4)]
@@ -1,4 +1,18 @@
-from streamlink.stream.wrappers import StreamIOIterWrapper
+from __future__ import annotations
+
+import gzip
+import socket
+from threading import Event, Thread
+from typing import TYPE_CHECKING
+
+import pytest
+import requests
+
+from streamlink.stream.wrappers import StreamIOIterWrapper, iter_response_body
+
+
+if TYPE_CHECKING:
+    import requests_mock as rm
 
 
 class TestPluginStream:
@@ -16,3 +30,105 @@ class TestPluginStream:
         assert fd.read(4095) == b"2" * 4095
         assert fd.read(1536) == b"3" * 1536
         assert fd.read() == b"3" * 512
+
+
+class TestIterResponseBody:
+    @pytest.fixture()
+    def session(self):
+        with requests.Session() as session:
+            yield session
+
+    def test_consumed(self, requests_mock: rm.Mocker, session: requests.Session):
+        requests_mock.get("https://host/", content=b"0123456789")
+        res = session.get("https://host/")
+
+        chunks = list(iter_response_body(res, read_size_max=4))
+        assert all(isinstance(chunk, memoryview) for chunk in chunks)
+        assert [bytes(chunk) for chunk in chunks] == [b"0123", b"4567", b"89"]
+
+    def test_read1(self, requests_mock: rm.Mocker, session: requests.Session):
+        content = bytes(range(256)) * 64
+        requests_mock.get("https://host/", content=content)
+        res = session.get("https://host/", stream=True)
+
+        sizes = []
+        data = bytearray()
+        for chunk in iter_response_body(res, read_size_min=1024, read_size_max=4096):
+            sizes.append(len(chunk))
+            data += chunk
+        assert sizes == [1024, 2048, 4096, 4096, 4096, 1024]
+        assert data == content
+        assert res.raw.tell() == len(content)
+        with pytest.raises(RuntimeError):
+            _ = res.content
+
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        [
+            pytest.param(b"Content-Length: 4\r\n\r\n0123", b"0123", id="content-length"),
+            pytest.param(b"Transfer-Encoding: chunked\r\n\r\n2\r\n01\r\n2\r\n23\r\n0\r\n\r\n", b"0123", id="chunked"),
+            pytest.param(b"Content-Length: 8\r\n\r\n0123", None, id="incomplete"),
+        ],
+    )
+    def test_socket(self, session: requests.Session, response: bytes, expected: bytes | None):
+        server = socket.create_server(("127.0.0.1", 0))
+
+        def respond():
+            conn, _ = server.accept()
+            with conn:
+                conn.recv(65536)
+                conn.sendall(b"HTTP/1.1 200 OK\r\nConnection: close\r\n" + response)
+
+        thread = Thread(target=respond, daemon=True)
+        thread.start()
+        try:
+            res = session.get(f"http://127.0.0.1:{server.getsockname()[1]}/", stream=True)
+            if expected is None:
+                with pytest.raises(requests.exceptions.ChunkedEncodingError):
+                    list(iter_response_body(res))
+            else:
+                assert b"".join(bytes(chunk) for chunk in iter_response_body(res)) == expected
+        finally:
+            thread.join()
+            server.close()
+
+    def test_socket_partial(self, session: requests.Session):
+        server = socket.create_server(("127.0.0.1", 0))
+        received = Event()
+
+        def respond():
+            conn, _ = server.accept()
+            with conn:
+                conn.recv(65536)
+                conn.sendall(b"HTTP/1.1 200 OK\r\nConnection: close\r\nContent-Length: 8\r\n\r\n0123")
+                # only send the rest of the body after the first part has been yielded
+                received.wait(5)
+                conn.sendall(b"4567")
+
+        thread = Thread(target=respond, daemon=True)
+        thread.start()
+        try:
+            res = session.get(f"http://127.0.0.1:{server.getsockname()[1]}/", stream=True)
+            iterator = iter_response_body(res, read_size_min=1024)
+            assert bytes(next(iterator)) == b"0123"
+            received.set()
+            assert b"".join(bytes(chunk) for chunk in iterator) == b"4567"
+        finally:
+            received.set()
+            thread.join()
+            server.close()
+
+    def test_content_encoding(self, requests_mock: rm.Mocker, session: requests.Session):
+        requests_mock.get("https://host/", content=gzip.compress(b"content"), headers={"Content-Encoding": "gzip"})
+        res = session.get("https://host/", stream=True)
+
+        assert [bytes(chunk) for chunk in iter_response_body(res)] == [b"content"]
+
+    def test_iter_content(self, monkeypatch: pytest.MonkeyPatch, requests_mock: rm.Mocker, session: requests.Session):
+        requests_mock.get("https://host/", content=b"0123456789")
+        res = session.get("https://host/", stream=True)
+        # urllib3<2.3.0
+        monkeypatch.delattr("urllib3.response.HTTPResponse.read1")
+        monkeypatch.delattr("urllib3.response.BaseHTTPResponse.read1")
+
+        assert [bytes(chunk) for chunk in iter_response_body(res, read_size_min=4)] == [b"0123", b"4567", b"89"]
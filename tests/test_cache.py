@@ -1,24 +1,19 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+import subprocess
+import sys
 from datetime import datetime, timedelta, timezone
-from io import BytesIO, TextIOWrapper
-from json import JSONDecodeError
 from pathlib import Path
-from threading import Thread, Timer
-from typing import TYPE_CHECKING
+from threading import Event, Thread
+from time import sleep
 from unittest.mock import Mock
 
 import freezegun
 import pytest
 
-# noinspection PyProtectedMember
-from streamlink.cache import WRITE_DEBOUNCE_TIME, Cache
-from tests.testutils.handshake import Handshake
-
-
-if TYPE_CHECKING:
-    from collections.abc import Callable
+from streamlink.cache import Cache
 
 
 @pytest.fixture(autouse=True)
@@ -28,114 +23,60 @@ def caplog(caplog: pytest.LogCaptureFixture):
 
 
 @pytest.fixture()
-def mock_load(monkeypatch: pytest.MonkeyPatch):
-    mock = Mock()
-    monkeypatch.setattr("streamlink.cache.Cache._load", mock)
-    return mock
-
-
-@pytest.fixture()
-def mock_schedule_save(monkeypatch: pytest.MonkeyPatch):
-    mock = Mock()
-    monkeypatch.setattr("streamlink.cache.Cache._schedule_save", mock)
-    return mock
-
-
-@pytest.fixture()
-def mock_save(monkeypatch: pytest.MonkeyPatch):
-    mock = Mock()
-    monkeypatch.setattr("streamlink.cache.Cache._save", mock)
-    return mock
-
-
-@pytest.fixture()
-def no_io(mock_load: Mock, mock_schedule_save: Mock, mock_save: Mock):
-    return mock_load, mock_schedule_save, mock_save
-
-
-@pytest.fixture(autouse=True)
-def atexit(monkeypatch: pytest.MonkeyPatch):
-    stack = []
-
-    def register(func: Callable, *args, **kwargs) -> None:
-        stack.append((func, args, kwargs))
-
-    monkeypatch.setattr("streamlink.cache._atexit_register", register)
-
-    return stack
-
-
-@pytest.fixture(autouse=True)
-def mock_json_load(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
-    side_effect: Callable | Exception = getattr(request, "param", None) or json.load
-    mock = Mock(side_effect=side_effect)
-    monkeypatch.setattr("json.load", mock)
-    return mock
-
-
-@pytest.fixture(autouse=True)
-def cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
-    monkeypatch.setattr("streamlink.cache.CACHE_DIR", tmp_path)
-    return tmp_path
-
-
-# noinspection PyProtectedMember
-@pytest.fixture()
-def cache(request: pytest.FixtureRequest, cache_dir: Path, atexit: list):
+def cache(request: pytest.FixtureRequest, cache_dir: Path):
     param = getattr(request, "param", {})
     param.setdefault("filename", "cache.json")
 
     cache = Cache(**param)
     assert cache.filename == cache_dir / param["filename"]
-    assert cache._cache_orig == {}
-    assert cache._cache == {}
-    assert cache._cache_orig is not cache._cache
-    assert not cache._loaded
-    assert not cache._dirty
-    assert not cache._timer
-    assert atexit == [(cache._save, (), {})]
+    assert cache.database == cache_dir / Path(param["filename"]).with_suffix(".sqlite3")
+    assert cache._db is None
 
     yield cache
 
-    assert cache._cache_orig is not cache._cache
-    assert not cache._timer or not cache._timer.is_alive()
+    cache.close()
+
+
+def get_rows(cache: Cache) -> list[tuple[str, str, str, float]]:
+    with sqlite3.connect(cache.database) as db:
+        return db.execute("SELECT * FROM entries ORDER BY namespace, key").fetchall()
 
 
-@pytest.mark.usefixtures("no_io")
 @pytest.mark.parametrize(
-    "filename",
+    ("filename", "database"),
     [
-        pytest.param("foo", id="str"),
-        pytest.param(Path("foo"), id="Path"),
+        pytest.param("foo", "foo.sqlite3", id="str"),
+        pytest.param(Path("foo"), "foo.sqlite3", id="Path"),
+        pytest.param("foo.json", "foo.sqlite3", id="suffix"),
     ],
 )
-def test_pathlib_and_str(cache_dir: Path, filename: str | Path):
+def test_pathlib_and_str(cache_dir: Path, filename: str | Path, database: str):
     cache = Cache(filename)
     assert cache.filename == cache_dir / Path(filename)
+    assert cache.database == cache_dir / database
 
 
-@pytest.mark.usefixtures("no_io")
 class TestGetterSetter:
-    def test_get(self, cache: Cache, mock_schedule_save: Mock):
-        assert not mock_schedule_save.called
+    def test_get(self, cache: Cache):
         assert cache.get("missing-value") is None
         assert cache.get("missing-value", default="default") == "default"
-        assert not cache._dirty
-        assert mock_schedule_save.call_count == 2
 
     def test_set(self, cache: Cache):
         assert cache.get("value") is None
         cache.set("value", 1)
         assert cache.get("value") == 1
-        assert list(cache._cache.keys()) == ["value"]
-        assert cache._dirty
+        cache.set("value", {"foo": ["bar", None]})
+        assert cache.get("value") == {"foo": ["bar", None]}
 
-    def test_get_all(self, cache: Cache, mock_schedule_save: Mock):
-        assert not mock_schedule_save.called
-        cache.set("test1", 1)
+    def test_set_unserializable(self, cache: Cache):
+        with pytest.raises(TypeError):
+            cache.set("value", object())
+        assert cache.get("value") is None
+
+    def test_get_all(self, cache: Cache):
         cache.set("test2", 2)
+        cache.set("test1", 1)
         assert cache.get_all() == {"test1": 1, "test2": 2}
-        assert mock_schedule_save.call_count == 3
 
     def test_get_all_prune(self, cache: Cache):
         cache.set("test1", 1)
@@ -143,108 +84,47 @@ class TestGetterSetter:
         assert cache.get_all() == {"test1": 1}
 
 
-@pytest.mark.usefixtures("no_io")
-def test_atomicity(monkeypatch: pytest.MonkeyPatch, cache: Cache):
-    hs_contains = Handshake()  # block inner Cache.get()
-    hs_items = Handshake()  # block inner Cache.get_all()
-    hs_setitem = Handshake()  # block inner Cache.set()
-    hs_getter = Handshake()
-    hs_setter = Handshake()
-    hs_getall = Handshake()
-    result = None
-
-    class BlockingDict(dict):
-        def __contains__(self, key):
-            with hs_contains():
-                return super().__contains__(key)
-
-        def items(self):
-            with hs_items():
-                return super().items()
-
-        def __setitem__(self, *args, **kwargs):
-            with hs_setitem():
-                return super().__setitem__(*args, **kwargs)
-
-    monkeypatch.setattr(cache, "_prune", Mock())
-    monkeypatch.setattr(cache, "_cache", BlockingDict(foo={"value": "foo"}))
-
-    def getter_thread():
-        nonlocal result
-        with hs_getter():
-            result = cache.get("foo", "default")
-
-    def setter_thread():
-        with hs_setter():
-            cache.set("foo", "bar")
-
-    def getall_thread():
-        nonlocal result
-        with hs_getall():
-            result = cache.get_all()
-
-    t_getter = Thread(daemon=True, target=getter_thread)
-    t_setter = Thread(daemon=True, target=setter_thread)
-    t_getall = Thread(daemon=True, target=getall_thread)
-
-    t_getter.start()
-    assert hs_getter.wait_ready(timeout=1), "Getter thread is ready"
-    assert not hs_contains.wait_ready(timeout=0), "Getter thread had not yet reached inner get()"
+def test_threads(cache: Cache):
+    def setter(num: int):
+        for idx in range(50):
+            cache.set(f"{num}-{idx}", idx)
+            assert cache.get(f"{num}-{idx}") == idx
 
-    t_setter.start()
-    assert hs_setter.wait_ready(timeout=1), "Setter thread is ready"
-    assert not hs_setitem.wait_ready(timeout=0), "Setter thread has not yet reached inner set()"
+    threads = [Thread(daemon=True, target=setter, args=(num,)) for num in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
 
-    # 1. `result = cache.get("foo")`
-    hs_getter.go()  # Let getter thread make get() call
-    assert hs_contains.wait_ready(timeout=1), "Getter thread has reached inner get()"
+    assert cache.get_all() == {f"{num}-{idx}": idx for num in range(4) for idx in range(50)}
 
-    # 2. `cache.set("foo", "bar")` while get() hasn't finished yet
-    hs_setter.go()  # Let setter thread make set() call
-    assert not hs_setitem.wait_ready(timeout=0.05), "Setter thread won't reach inner set()"
 
-    assert result is None
-    assert hs_contains.step(timeout=1), "Let __contains__() return"
-    assert hs_getter.wait_done(timeout=1), "Wait for getter thread to finish"
-    assert result == "foo"
-
-    assert hs_setitem.wait_ready(timeout=1), "Setter thread has reached inner set() after get() completed"
-
-    t_getall.start()
-    assert hs_getall.wait_ready(timeout=1), "Getall thread is ready"
-    assert not hs_items.wait_ready(timeout=0), "Getall thread had not yet reached inner get_all()"
-
-    # 3. `result = cache.get_all()` while set() hasn't finished yet
-    hs_getall.go()  # Let getall thread make get_all() call
-    assert not hs_items.wait_ready(timeout=0.05), "Getall thread won't reach inner get_all()"
-
-    assert hs_setitem.step(timeout=1), "Let __setitem__() return"
-
-    assert hs_items.wait_ready(timeout=1), "Getall thread has reached inner get_all()"
-    assert hs_items.step(timeout=1), "Let items() return"
-    assert hs_getall.wait_done(timeout=1), "Wait for getall thread to finish"
-    assert result == {"foo": "bar"}
-
-
-@pytest.mark.usefixtures("no_io")
-class TestPrefix:
+class TestNamespace:
     @pytest.mark.parametrize("cache", [{"key_prefix": "test"}], indirect=["cache"])
     def test_key_prefix(self, cache: Cache):
         cache.set("key", 1)
         assert cache.get("key") == 1
-        assert "test:key" in cache._cache
-        assert cache._cache["test:key"]["value"] == 1
+        assert [row[:3] for row in get_rows(cache)] == [("test", "key", "1")]
 
-    def test_get_all_prefix(self, cache: Cache):
+    def test_get_all_namespace(self, cache: Cache):
         cache.set("test1", 1)
         cache.set("test2", 2)
         cache.key_prefix = "test"
         cache.set("test3", 3)
         cache.set("test4", 4)
         assert cache.get_all() == {"test3": 3, "test4": 4}
+        cache.key_prefix = ""
+        assert cache.get_all() == {"test1": 1, "test2": 2}
+
+    def test_separate_instances(self, cache: Cache):
+        other = Cache(cache.filename, key_prefix="other")
+        cache.set("key", "foo")
+        other.set("key", "bar")
+        assert cache.get("key") == "foo"
+        assert other.get("key") == "bar"
+        other.close()
 
 
-@pytest.mark.usefixtures("no_io")
 class TestExpiration:
     @pytest.mark.parametrize(
         ("expires", "expected"),
@@ -282,268 +162,243 @@ class TestExpiration:
             frozen_time.tick(timedelta(seconds=20))
             assert cache.get("key") is None
 
+    def test_prune(self, cache: Cache):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z") as frozen_time:
+            cache.set("foo", "foo", expires=10)
+            cache.set("bar", "bar", expires=20)
+            cache.set("baz", "baz", expires=30)
+            assert [row[1] for row in get_rows(cache)] == ["bar", "baz", "foo"]
 
-class TestScheduleSave:
-    def test_not_dirty(self, caplog: pytest.LogCaptureFixture, cache: Cache, mock_save: Mock):
-        assert not cache._dirty
-        cache._schedule_save()
-        assert not cache._timer
-        assert mock_save.call_count == 0
-        assert caplog.records == []
+            # expired entries get removed when setting new entries
+            frozen_time.tick(timedelta(seconds=20))
+            cache.set("qux", "qux")
+            assert [row[1] for row in get_rows(cache)] == ["baz", "qux"]
 
-    def test_cancel_timer(self, caplog: pytest.LogCaptureFixture, cache: Cache, mock_save: Mock):
-        assert not cache._dirty
-        cache._timer = Timer(WRITE_DEBOUNCE_TIME, mock_save)
-        cache._timer.daemon = True
-        cache._timer.start()
-        assert cache._timer.is_alive()
-        cache._schedule_save()
-        cache._timer.join(timeout=1)
-        assert not cache._timer.is_alive()
-        assert mock_save.call_count == 0
-        assert caplog.records == []
+            # entries get removed when they are set with an expiration time in the past
+            cache.set("qux", None, 0)
+            assert [row[1] for row in get_rows(cache)] == ["baz"]
 
-    def test_schedule_save(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-        caplog: pytest.LogCaptureFixture,
-        cache: Cache,
-        mock_save: Mock,
-    ):
-        cache._cache = {"key": {"value": "foo"}}
-        assert cache._dirty
-        assert not cache._timer
-
-        cache._schedule_save()
-        assert mock_save.call_count == 0
-        assert cache._timer
-        assert cache._timer.is_alive()
-
-        # Let the timer "expire" by monkeypatching the is_set() method and then setting the inner threading.Event flag.
-        # This depends on the implementation details of threading.Timer.
-        monkeypatch.setattr(cache._timer.finished, "is_set", lambda: False)
-        cache._timer.finished.set()  # same as cancel(), but is_set() will return False, so the callback will be executed
-        cache._timer.join(timeout=1)
-        assert not cache._timer.is_alive()
-        assert mock_save.call_count == 1
+
+class TestDatabase:
+    @pytest.mark.parametrize("cache", [{"filename": Path("foo") / "bar" / "cache.json"}], indirect=True)
+    def test_persistence(self, caplog: pytest.LogCaptureFixture, cache: Cache):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z"):
+            cache.set("foo", "🐻", expires=1)
+            assert cache.database.exists()
+            assert not cache.filename.exists()
+            assert get_rows(cache) == [("", "foo", '"\\ud83d\\udc3b"', 946684801.0)]
+
+            other = Cache(cache.filename)
+            assert other.get("foo") == "🐻"
+            other.set("bar", "bar")
+            assert cache.get("bar") == "bar"
+            other.close()
 
         assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
-            ("streamlink.cache", "trace", "Scheduling write to cache file: 3.0s"),
+            ("streamlink.cache", "trace", f"Opening cache database: {cache.database}"),
+            ("streamlink.cache", "trace", f"Opening cache database: {cache.database}"),
         ]
 
+    def test_close(self, cache: Cache):
+        cache.set("foo", "foo")
+        assert cache._db is not None
+        cache.close()
+        assert cache._db is None
+        assert cache.get("foo") == "foo"
+        assert cache._db is not None
 
-class TestIO:
-    @pytest.fixture()
-    def mock_cache_file(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
-        content: bytes | Exception = getattr(request, "param", None) or b"{}"
-        if not isinstance(content, bytes):
-            mock = Mock(side_effect=content)
-        else:
-            stream = TextIOWrapper(BytesIO(content), encoding="utf-8")
-            mock = Mock(return_value=stream)
-        monkeypatch.setattr("pathlib.Path.open", mock)
+    def test_open_failure(self, caplog: pytest.LogCaptureFixture, cache: Cache):
+        cache.database.write_bytes(b"invalid")
 
-        return mock
-
-    @pytest.mark.parametrize(
-        ("mock_cache_file", "mock_json_load", "log"),
-        [
-            pytest.param(
-                FileNotFoundError("File not found"),
-                None,
-                [],
-                id="file-not-found-error",
-            ),
-            pytest.param(
-                PermissionError("Permission denied"),
-                None,
-                [
-                    (
-                        "streamlink.cache",
-                        "warning",
-                        "Failed loading cache file, continuing without cache: Permission denied",
-                    ),
-                ],
-                id="os-error",
-            ),
-            pytest.param(
-                None,
-                JSONDecodeError("cache-file.json", "", 0),
-                [
-                    (
-                        "streamlink.cache",
-                        "warning",
-                        "Failed loading cache file, continuing without cache: cache-file.json: line 1 column 1 (char 0)",
-                    ),
-                ],
-                id="json-decode-error",
+        cache.set("foo", "foo")
+        assert cache.get("foo") == "foo"
+        assert cache.database.read_bytes() == b"invalid"
+        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+            ("streamlink.cache", "trace", f"Opening cache database: {cache.database}"),
+            (
+                "streamlink.cache",
+                "warning",
+                "Failed opening cache database, continuing without cache: file is not a database",
             ),
-        ],
-        indirect=["mock_cache_file", "mock_json_load"],
-    )
-    def test_load(self, caplog: pytest.LogCaptureFixture, cache: Cache, mock_cache_file: Mock, mock_json_load: Mock, log: list):
-        cache._load()
-        assert cache._loaded, "Failed load attempts also set the loaded state to True"
-        assert not cache._dirty
-        assert cache._cache == {}
+        ]
+
+    def test_write_failure(self, caplog: pytest.LogCaptureFixture, cache: Cache):
+        cache.set("foo", "foo")
+        with sqlite3.connect(cache.database) as db:
+            db.execute("DROP TABLE entries")
+        caplog.clear()
+
+        cache.set("foo", "bar")
+        assert cache.get("foo") is None
         assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
-            ("streamlink.cache", "trace", f"Loading cache file: {cache.filename}"),
-            *log,
+            ("streamlink.cache", "error", "Error while writing to cache database: no such table: entries"),
+            ("streamlink.cache", "error", "Error while reading from cache database: no such table: entries"),
         ]
-        assert mock_cache_file.call_count == 1
 
-        cache._load()
-        assert mock_cache_file.call_count == 1
+    def test_disabled(self, caplog: pytest.LogCaptureFixture, cache_dir: Path):
+        cache = Cache("cache.json", disabled=True)
+        assert cache.get("foo") is None
+        cache.set("foo", "bar")
+        assert cache.get("foo") == "bar"
 
-    @pytest.mark.usefixtures("mock_schedule_save", "mock_save")
-    @pytest.mark.parametrize(
-        ("mock_cache_file", "expected", "dirty"),
-        [
-            pytest.param(
-                b"""{"foo": {"value": "\\ud83d\\udc3b", "expires": 946684801}}""",
-                "🐻",
-                False,
-                id="load-no-expiration",
-            ),
-            pytest.param(
-                b"""{"foo": {"value": "\\ud83d\\udc3b", "expires": 946684800}}""",
-                None,
-                True,
-                id="load-with-expiration",
-            ),
-        ],
-        indirect=["mock_cache_file"],
-    )
-    def test_load_data(self, mock_cache_file: Mock, expected: str | None, dirty: bool):
-        with freezegun.freeze_time("2000-01-01T00:00:00Z"):
-            cache = Cache("mocked-io")
-            assert not cache._loaded
-            assert not cache._dirty
-            assert cache.get("foo") == expected
-            assert cache._loaded
-            assert cache._dirty is dirty
+        other = Cache("cache.json", disabled=True)
+        assert other.get("foo") is None
 
-    @pytest.mark.parametrize(
-        ("patch", "side_effect"),
-        [
-            pytest.param(
-                "pathlib.Path.mkdir",
-                PermissionError("Permission denied"),
-                id="pathlib-path-mkdir",
-            ),
-            pytest.param(
-                "tempfile.NamedTemporaryFile",
-                PermissionError("Permission denied"),
-                id="tempfile-namedtemporaryfile",
-            ),
-            pytest.param(
-                "json.dump",
-                ValueError(),
-                id="json-dump",
-            ),
-            pytest.param(
-                "shutil.move",
-                PermissionError("Permission denied"),
-                id="shutil-move",
-            ),
-        ],
-    )
-    def test_save_fail(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-        caplog: pytest.LogCaptureFixture,
-        cache: Cache,
-        patch: str,
-        side_effect: Exception,
-    ):
-        mock = Mock(side_effect=side_effect)
-        monkeypatch.setattr(patch, mock)
-
-        cache._cache_orig = {"foo": {"value": 1}}
-        cache._cache = {"foo": {"value": 2}}
-        assert cache._dirty
-
-        cache._save()
-        assert mock.call_count == 1
-        assert cache._dirty
-        assert cache._cache_orig == {"foo": {"value": 1}}
-        assert cache._cache == {"foo": {"value": 2}}
-        assert not cache.filename.exists()
-        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
-            ("streamlink.cache", "trace", f"Writing to cache file: {cache.filename}"),
-            ("streamlink.cache", "error", f"Error while writing to cache file: {side_effect}"),
+        cache.close()
+        other.close()
+        assert list(cache_dir.iterdir()) == []
+        assert caplog.records == []
+
+
+class TestMultipleProcesses:
+    def test_merge(self, cache: Cache):
+        code = ";".join([
+            "import sys",
+            "from pathlib import Path",
+            "import streamlink.cache",
+            "streamlink.cache.CACHE_DIR = Path(sys.argv[1])",
+            "cache = streamlink.cache.Cache('cache.json', key_prefix=sys.argv[2])",
+            "[cache.set(str(idx), idx) for idx in range(50)]",
+        ])
+        procs = [subprocess.Popen([sys.executable, "-c", code, str(cache.filename.parent), f"proc{num}"]) for num in range(4)]
+        assert [proc.wait(timeout=30) for proc in procs] == [0, 0, 0, 0]
+
+        for num in range(4):
+            cache.key_prefix = f"proc{num}"
+            assert cache.get_all() == {str(idx): idx for idx in range(50)}
+
+    def test_read_through(self, cache: Cache):
+        other = Cache(cache.filename)
+        assert cache.get("foo") is None
+        other.set("foo", "foo")
+        assert cache.get("foo") == "foo"
+        other.set("foo", None, 0)
+        assert cache.get("foo") is None
+        other.close()
+
+
+class TestLock:
+    def test_lock(self, caplog: pytest.LogCaptureFixture, cache: Cache):
+        other = Cache(cache.filename)
+        with cache.lock("key") as acquired:
+            assert acquired
+            with other.lock("key", timeout=0) as acquired_other:
+                assert not acquired_other
+            with other.lock("other-key", timeout=0) as acquired_other:
+                assert acquired_other
+            other.key_prefix = "namespace"
+            with other.lock("key", timeout=0) as acquired_other:
+                assert acquired_other
+            other.key_prefix = ""
+        with other.lock("key", timeout=0) as acquired_other:
+            assert acquired_other
+        other.close()
+
+        assert [
+            (record.name, record.levelname, record.message) for record in caplog.records if record.levelname != "trace"
+        ] == [
+            ("streamlink.cache", "warning", "Timeout while waiting for cache lock, continuing without it: key"),
         ]
 
-    @pytest.mark.parametrize("cache", [pytest.param({"filename": Path("foo") / "bar" / "cache.json"})], indirect=True)
-    def test_save_success(self, caplog: pytest.LogCaptureFixture, cache: Cache):
-        cache._loaded = True
-        cache._cache_orig = {"foo": {"value": "bear", "expires": 946684801}}
-        cache._cache = {"foo": {"value": "🐻", "expires": 946684801}}
-        assert cache._dirty
-
-        cache._save()
-        assert not cache._dirty
-        assert cache._cache_orig == {"foo": {"value": "🐻", "expires": 946684801}}
-        assert cache._cache == cache._cache_orig
-        assert cache._cache["foo"] is not cache._cache_orig["foo"]
-        assert cache.filename.exists()
-        assert (
-            cache.filename.read_text(encoding="utf-8")
-            == """{\n  "foo": {\n    "value": "\\ud83d\\udc3b",\n    "expires": 946684801\n  }\n}"""
-        )
+    def test_lease(self, cache: Cache):
+        with cache.lock("key", lease=-1) as acquired:
+            assert acquired
+            with cache.lock("key", timeout=0) as acquired_again:
+                assert acquired_again
+        assert get_rows(cache) == []
+
+    def test_wait(self, monkeypatch: pytest.MonkeyPatch, cache: Cache):
+        monkeypatch.setattr("streamlink.cache.LOCK_POLL_INTERVAL", 0.01)
+        other = Cache(cache.filename)
+        locked = Event()
+
+        def compute():
+            with other.lock("key"):
+                locked.set()
+                sleep(0.05)
+                other.set("key", "value")
+
+        thread = Thread(daemon=True, target=compute)
+        thread.start()
+        assert locked.wait(timeout=1)
+        with cache.lock("key") as acquired:
+            assert acquired
+            assert cache.get("key") == "value"
+        thread.join(timeout=1)
+        other.close()
+
+    def test_error(self, caplog: pytest.LogCaptureFixture, cache: Cache):
+        cache.set("foo", "foo")
+        with sqlite3.connect(cache.database) as db:
+            db.execute("DROP TABLE locks")
+        caplog.clear()
+
+        with cache.lock("key") as acquired:
+            assert not acquired
         assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
-            ("streamlink.cache", "trace", f"Writing to cache file: {cache.filename}"),
+            ("streamlink.cache", "error", "Error while acquiring cache lock: no such table: locks"),
         ]
-        with freezegun.freeze_time("2000-01-01T00:00:00Z"):
-            assert cache.get("foo") == "🐻"
 
-    def test_save_not_dirty(self, caplog: pytest.LogCaptureFixture, cache: Cache):
-        assert not cache._dirty
-        cache._save()
-        assert not cache.filename.exists()
-        assert caplog.records == []
 
-    def test_save_cancel_timer(self, cache: Cache):
-        callback = Mock()
-        cache._timer = Timer(10, callback)
-        cache._timer.daemon = True
-        cache._timer.start()
-        assert cache._timer.is_alive()
-        cache._save()
-        cache._timer.join(timeout=1)
-        assert not cache._timer.is_alive()
-        assert callback.call_count == 0
-        assert not cache.filename.exists()
+class TestMigration:
+    @pytest.fixture(autouse=True)
+    def legacy_file(self, cache_dir: Path) -> Path:
+        path = cache_dir / "cache.json"
+        path.write_text(
+            json.dumps({
+                "foo:key": {"value": "🐻", "expires": 946684801},
+                "foo:expired": {"value": "expired", "expires": 946684800},
+                "foo:invalid": {"expires": 946684801},
+                "bar:key": {"value": "bar", "expires": 946684801},
+                "key": {"value": "key", "expires": 946684801},
+            }),
+            encoding="utf-8",
+        )
+        return path
 
-    @pytest.mark.parametrize(
-        "mock_cache_file",
-        [
-            pytest.param(
-                b"""{"foo": {"value": "foo", "expires": 946684801}}""",
-                id="disabled",
-            ),
-        ],
-        indirect=True,
-    )
-    def test_disabled(self, caplog: pytest.LogCaptureFixture, mock_cache_file: Mock):
+    @pytest.mark.parametrize("cache", [{"key_prefix": "foo"}], indirect=True)
+    def test_migrate(self, caplog: pytest.LogCaptureFixture, legacy_file: Path, cache: Cache):
         with freezegun.freeze_time("2000-01-01T00:00:00Z"):
-            cache = Cache("mocked-io", disabled=True)
-            assert cache._disabled
-            assert cache._loaded
-            assert cache._cache == {}
-            assert cache._cache_orig == {}
-            assert mock_cache_file.call_args_list == []
+            assert cache.get_all() == {"key": "🐻"}
+            assert legacy_file.exists()
 
-            assert cache.get("foo") is None
-            assert not cache._dirty
+            # namespaces only get migrated once
+            cache.set("key", None, 0)
+            cache.close()
+            assert cache.get_all() == {}
 
-            cache.set("foo", "bar")
-            assert cache._dirty
-            assert cache._timer is None
+            cache.key_prefix = "bar"
+            assert cache.get_all() == {"key": "bar"}
+            cache.key_prefix = ""
+            assert cache.get_all() == {"bar:key": "bar", "foo:key": "🐻", "key": "key"}
 
-            assert cache.get("foo") == "bar"
+        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+            ("streamlink.cache", "trace", f"Opening cache database: {cache.database}"),
+            ("streamlink.cache", "debug", f"Migrating legacy cache file: {legacy_file}"),
+            ("streamlink.cache", "trace", f"Opening cache database: {cache.database}"),
+            ("streamlink.cache", "debug", f"Migrating legacy cache file: {legacy_file}"),
+            ("streamlink.cache", "debug", f"Migrating legacy cache file: {legacy_file}"),
+        ]
 
-            cache._save()
-            assert not cache.filename.exists()
+    @pytest.mark.parametrize("cache", [{"key_prefix": "foo"}], indirect=True)
+    def test_existing_entries(self, cache: Cache):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z"):
+            cache._migrated.add("foo")
+            cache.set("key", "new")
+            cache._migrated.clear()
+            assert cache.get_all() == {"key": "new"}
+
+    @pytest.mark.parametrize("cache", [{"key_prefix": "foo"}], indirect=True)
+    def test_invalid(self, caplog: pytest.LogCaptureFixture, legacy_file: Path, cache: Cache):
+        legacy_file.write_text("invalid", encoding="utf-8")
+        assert cache.get_all() == {}
+        assert [(record.name, record.levelname, record.message) for record in caplog.records] == [
+            ("streamlink.cache", "trace", f"Opening cache database: {cache.database}"),
+            ("streamlink.cache", "warning", "Failed migrating legacy cache file: Expecting value: line 1 column 1 (char 0)"),
+        ]
 
-        assert [(record.name, record.levelname, record.message) for record in caplog.records] == []
+    @pytest.mark.parametrize("cache", [{"key_prefix": "foo", "disabled": True}], indirect=True)
+    def test_disabled(self, caplog: pytest.LogCaptureFixture, cache: Cache):
+        with freezegun.freeze_time("2000-01-01T00:00:00Z"):
+            assert cache.get_all() == {}
+        assert caplog.records == []
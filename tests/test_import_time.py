@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+# Dependencies which only get imported by the code paths which need them
+DEFERRED = frozenset({
+    "Crypto",
+    "Cryptodome",
+    "isodate",
+    "lxml",
+    "pycountry",
+    "sqlite3",
+    "trio",
+    "websocket",
+})
+
+
+def get_import_times(code: str) -> dict[str, int]:
+    """Run code in a new Python process and return the cumulative import times of all modules (in microseconds)"""
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        pytest.param(
+            "import streamlink",
+            id="package",
+        ),
+        pytest.param(
+            "import streamlink.plugin",
+            id="plugin",
+        ),
+        pytest.param(
+            "import streamlink_cli.main",
+            id="cli",
+        ),
+        pytest.param(
+            ";".join([
+                "from streamlink.session import Streamlink",
+                "from streamlink.stream.http import HTTPStream",
+                "HTTPStream(Streamlink(plugins_builtin=False), 'https://localhost/')",
+            ]),
+            id="http-stream",
+        ),
+        pytest.param(
+            "from streamlink.utils.l10n import Localization; Localization('en_US').equivalent('eng', 'USA')",
+            id="localization",
+        ),
+    ],
+)
+def test_deferred_imports(code: str):
+    times = get_import_times(code)
+    assert "streamlink" in times
+
+    imported = {name.split(".")[0] for name in times}
+    assert imported & DEFERRED == set()
+
+
+def test_lazy_package_attributes():
+    times = get_import_times("import streamlink.exceptions")
+    assert "streamlink.session" not in times
+
+    times = get_import_times("from streamlink import Streamlink, streams")
+    assert "streamlink.session" in times
+    assert "streamlink.api" in times
+
+
+@pytest.mark.parametrize(
+    ("code", "module"),
+    [
+        pytest.param(
+            "from streamlink.utils.parse import parse_html; parse_html('<a/>')",
+            "lxml",
+            id="lxml",
+        ),
+        pytest.param(
+            "from streamlink.utils.l10n import Language; Language.get('des')",
+            "pycountry",
+            id="pycountry",
+        ),
+        pytest.param(
+            "from streamlink.utils.times import localnow; localnow()",
+            "isodate",
+            id="isodate",
+        ),
+        pytest.param(
+            "from streamlink.cache import Cache; Cache('cache.json', disabled=True).get('foo')",
+            "sqlite3",
+            id="sqlite3",
+        ),
+    ],
+)
+def test_import_on_demand(code: str, module: str):
+    assert module in get_import_times(code)
@@ -12,6 +12,15 @@ from streamlink.exceptions import PluginError
 from streamlink.validate._exception import ValidationError  # noqa: PLC2701
 
 
+@pytest.fixture(autouse=True, params=["validate", "compile"])
+def validate_impl(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """Run each test with the compiled schemas, which must have the same results and errors"""
+    if request.param == "compile":
+        monkeypatch.setattr(validate, "validate", lambda schema, value: validate.compile(schema)(value))
+
+    return request.param
+
+
 def assert_validationerror(exception: Exception, expected: str, regex: bool = False):
     exceptionstr = str(exception)
     expected = dedent(expected).strip("\n")
@@ -73,6 +82,43 @@ class TestSchema:
         )
 
 
+class TestCompile:
+    def test_validator(self):
+        validator = validate.compile({"foo": [int], validate.optional("bar"): str})
+        assert validator({"foo": [1, 2]}) == {"foo": [1, 2]}
+        assert validator({"foo": [], "bar": "bar"}) == {"foo": [], "bar": "bar"}
+        with pytest.raises(ValidationError):
+            validator({"foo": ["1"]})
+
+    def test_schema_cached(self):
+        schema = validate.Schema(str)
+        assert schema._compiled is None
+        validator = validate.compile(schema)
+        assert schema._compiled is validator
+        assert validate.compile(schema) is validator
+        assert schema.validate("foo") == "foo"
+        assert schema._compiled is validator
+
+    def test_nested_schema_cached(self):
+        inner = validate.Schema(int)
+        outer = validate.Schema([inner])
+        assert outer.validate([1]) == [1]
+        assert inner._compiled is not None
+
+    def test_unknown_schema(self):
+        class Custom:
+            pass
+
+        # noinspection PyProtectedMember
+        from streamlink.validate._validate import validate as validate_impl  # noqa: PLC0415, PLC2701
+
+        # schemas of types without a compiler get validated by their validate() implementation
+        custom = Custom()
+        validate_impl.register(Custom, lambda schema, value: (schema, value))
+        assert validate.compile(custom)("foo") == (custom, "foo")
+        assert validate.compile([custom])(["foo"]) == [(custom, "foo")]
+
+
 class TestEquality:
     def test_success(self):
         assert validate.validate("foo", "foo") == "foo"
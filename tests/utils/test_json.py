@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import streamlink.utils.json as jsonlib
+
+
+@pytest.fixture(autouse=True, params=["orjson", "ujson", "json"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    name = request.param
+    # noinspection PyProtectedMember
+    backend = jsonlib._BACKENDS[name]
+    if backend is None:
+        pytest.skip(f"{name} is not installed")
+
+    monkeypatch.setattr(jsonlib, "_loads", backend[0])
+    monkeypatch.setattr(jsonlib, "_dumps", backend[1])
+
+    return name
+
+
+class TestLoads:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param('{"foo": ["bar", 123, 1.5, true, false, null]}', id="str"),
+            pytest.param(b'{"foo": ["bar", 123, 1.5, true, false, null]}', id="bytes"),
+            pytest.param(bytearray(b'{"foo": ["bar", 123, 1.5, true, false, null]}'), id="bytearray"),
+        ],
+    )
+    def test_loads(self, data: str | bytes | bytearray):
+        assert jsonlib.loads(data) == {"foo": ["bar", 123, 1.5, True, False, None]}
+
+    @pytest.mark.parametrize(
+        "encoding",
+        ["utf-8", "utf-8-sig", "utf-16", "utf-16-le", "utf-16-be", "utf-32", "utf-32-le", "utf-32-be"],
+    )
+    def test_encoding(self, encoding: str):
+        assert jsonlib.loads('{"test": "Α and Ω"}'.encode(encoding)) == {"test": "Α and Ω"}  # noqa: RUF001
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            pytest.param("[NaN]", "[nan]", id="nan"),
+            pytest.param("[Infinity, -Infinity]", "[inf, -inf]", id="infinity"),
+            pytest.param('"\\ud800"', "'\\ud800'", id="lone-surrogate"),
+        ],
+    )
+    def test_stdlib_fallback(self, data: str, expected: str):
+        assert repr(jsonlib.loads(data)) == expected
+
+    def test_big_int(self, backend: str):
+        data = "[-9223372036854775809, 18446744073709551616]"
+        if backend == "orjson":
+            assert jsonlib.loads(data) == [float(-9223372036854775809), float(18446744073709551616)]
+        else:
+            assert jsonlib.loads(data) == [-9223372036854775809, 18446744073709551616]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param("", id="empty"),
+            pytest.param('{"foo": "bar"', id="incomplete"),
+            pytest.param("[1, 2]]", id="extra-data"),
+        ],
+    )
+    def test_error(self, data: str):
+        with pytest.raises(json.JSONDecodeError) as cm:
+            jsonlib.loads(data)
+        with pytest.raises(json.JSONDecodeError) as cm_stdlib:
+            json.loads(data)
+        assert str(cm.value) == str(cm_stdlib.value)
+
+
+class TestDumps:
+    def test_dumps(self):
+        assert jsonlib.dumps({"foo": ["bar", 123, 1.5, True, False, None]}) == '{"foo":["bar",123,1.5,true,false,null]}'
+
+    def test_sort_keys(self):
+        assert jsonlib.dumps({"b": 1, "a": {"d": 2, "c": 3}}) == '{"b":1,"a":{"d":2,"c":3}}'
+        assert jsonlib.dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True) == '{"a":{"c":3,"d":2},"b":1}'
+
+    def test_unicode(self):
+        assert jsonlib.dumps({"test": "Α and Ω / 🐍"}) == '{"test":"Α and Ω / 🐍"}'  # noqa: RUF001
+
+    def test_stdlib_fallback(self):
+        assert jsonlib.dumps({1: 123456789012345678901234567890}) == '{"1":123456789012345678901234567890}'
+
+    def test_error(self):
+        with pytest.raises(TypeError):
+            jsonlib.dumps(object())
+
+
+def test_backend():
+    # noinspection PyProtectedMember
+    backends = jsonlib._BACKENDS
+    # orjson doesn't get selected by default
+    assert jsonlib.BACKEND == ("ujson" if backends["ujson"] is not None else "json")
+
+
+@pytest.mark.parametrize("name", ["orjson", "ujson", "json"])
+def test_use_backend(monkeypatch: pytest.MonkeyPatch, name: str):
+    monkeypatch.setattr(jsonlib, "BACKEND", jsonlib.BACKEND)
+    monkeypatch.setattr(jsonlib, "_loads", jsonlib._loads)
+    monkeypatch.setattr(jsonlib, "_dumps", jsonlib._dumps)
+
+    # noinspection PyProtectedMember
+    backend = jsonlib._BACKENDS[name]
+    if backend is None:
+        with pytest.raises(ValueError, match=rf"^JSON backend is not available: {name}$"):
+            jsonlib.use_backend(name)
+        return
+
+    jsonlib.use_backend(name)
+    assert jsonlib.BACKEND == name
+    assert (jsonlib._loads, jsonlib._dumps) == backend
+
+
+def test_use_backend_unknown():
+    with pytest.raises(ValueError, match=r"^JSON backend is not available: foo$"):
+        jsonlib.use_backend("foo")
@@ -1,3 +1,4 @@
+import importlib.metadata
 from unittest.mock import Mock, patch
 
 import pytest
@@ -213,3 +214,77 @@ class TestLanguage:
         assert lang.alpha3 == "eng"
         assert lang.name == "English"
         assert lang.bibliographic == ""
+
+
+class TestLookupTables:
+    @pytest.fixture(autouse=True)
+    def _cache_clear(self):
+        l10n._get_country.cache_clear()
+        l10n._get_language.cache_clear()
+        yield
+        l10n._get_country.cache_clear()
+        l10n._get_language.cache_clear()
+
+    @pytest.fixture()
+    def pycountry(self, monkeypatch: pytest.MonkeyPatch):
+        import pycountry  # noqa: PLC0415
+
+        monkeypatch.setattr(pycountry.countries, "lookup", Mock(wraps=pycountry.countries.lookup))
+        monkeypatch.setattr(pycountry.languages, "get", Mock(wraps=pycountry.languages.get))
+
+        return pycountry
+
+    @pytest.mark.parametrize(
+        ("language", "country"),
+        [
+            ("en", "US"),
+            ("ENG", "usa"),
+            ("English", "United States"),
+            ("ger", "840"),
+        ],
+    )
+    def test_prebuilt(self, pycountry, language: str, country: str):
+        assert l10n.Language.get(language).alpha2 == {"ger": "de"}.get(language, "en")
+        assert l10n.Country.get(country).alpha2 == "US"
+        assert pycountry.languages.get.call_count == 0
+        assert pycountry.countries.lookup.call_count == 0
+
+    def test_fallback(self, pycountry):
+        assert l10n.Language.get("des").name == "Desano"
+        assert pycountry.languages.get.call_count > 0
+        assert l10n.Country.get("🇺🇸").alpha2 == "US"
+        assert pycountry.countries.lookup.call_count == 1
+
+        with pytest.raises(LookupError):
+            l10n.Language.get("invalid")
+        with pytest.raises(LookupError):
+            l10n.Country.get(["invalid"])
+
+    def test_memoized(self, pycountry):
+        assert l10n.Language.get("en") is l10n.Language.get("en")
+        assert l10n.Language.get("des") is l10n.Language.get("des")
+        assert l10n.Country.get("US") is l10n.Country.get("US")
+        assert pycountry.languages.get.call_count == 2
+
+    def test_consistency(self):
+        import pycountry  # noqa: PLC0415
+
+        from streamlink.utils import l10n_data  # noqa: PLC0415
+
+        if importlib.metadata.version("pycountry") != l10n_data.PYCOUNTRY_VERSION:
+            pytest.skip("Pre-built lookup tables were generated from a different pycountry version")
+
+        def lookup_language(value: str):
+            return (
+                pycountry.languages.get(alpha_2=value)
+                or pycountry.languages.get(alpha_3=value)
+                or pycountry.languages.get(bibliographic=value)
+                or pycountry.languages.get(name=value)
+            )
+
+        for key, idx in l10n_data.COUNTRIES_INDEX.items():
+            c = pycountry.countries.lookup(key)
+            assert l10n_data.COUNTRIES[idx][:4] == (c.alpha_2, c.alpha_3, c.numeric, c.name), key
+        for key, idx in l10n_data.LANGUAGES_INDEX.items():
+            lang = lookup_language(key)
+            assert l10n_data.LANGUAGES[idx][1] == lang.alpha_3, key
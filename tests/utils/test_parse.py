@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 import pytest
 from lxml.etree import Element
 
@@ -19,6 +21,10 @@ class TestUtilsParse:
         with pytest.raises(PluginError):
             parse_json("""{"test: 1}""" * 10)
 
+    def test_parse_json_args(self):
+        assert parse_json('{"test": 1.5}', parse_float=Decimal) == {"test": Decimal("1.5")}
+        assert parse_json("[NaN]", parse_constant=str) == ["NaN"]
+
     def test_parse_xml(self):
         expected = Element("test", {"foo": "bar"})
         actual = parse_xml("""<test foo="bar"/>""", ignore_ns=True)
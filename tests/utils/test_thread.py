@@ -1,4 +1,9 @@
-from streamlink.utils.thread import NamedThread
+from threading import Event
+from unittest.mock import Mock, patch
+
+import pytest
+
+from streamlink.utils.thread import NamedThread, Scheduler
 
 
 def test_named_thread():
@@ -18,3 +23,53 @@ def test_named_thread():
     assert One(name="bar").name == "One-bar-0"
     assert One(name="bar").name == "One-bar-1"
     assert One().name == "One-2"
+
+
+class TestScheduler:
+    @pytest.fixture()
+    def scheduler(self):
+        scheduler = Scheduler(name="test")
+        scheduler.start()
+
+        return scheduler
+
+    def test_order(self, scheduler: Scheduler):
+        calls = []
+        done = Event()
+
+        scheduler.schedule(0.2, calls.append, "c")
+        scheduler.schedule(0.2, done.set)
+        scheduler.schedule(0.1, calls.append, "b")
+        scheduler.schedule(0.0, calls.append, "a")
+
+        assert done.wait(5)
+        assert calls == ["a", "b", "c"]
+        assert len(scheduler) == 0
+
+    def test_cancel(self, scheduler: Scheduler):
+        calls = []
+        done = Event()
+
+        scheduled = scheduler.schedule(0.05, calls.append, "a")
+        scheduler.schedule(0.1, done.set)
+        scheduled.cancel()
+
+        assert done.wait(5)
+        assert calls == []
+
+    def test_exception(self, caplog: pytest.LogCaptureFixture, scheduler: Scheduler):
+        done = Event()
+
+        scheduler.schedule(0.0, Mock(side_effect=ValueError("foo")))
+        scheduler.schedule(0.0, done.set)
+
+        assert done.wait(5)
+        assert [(record.levelname, record.exc_info[0]) for record in caplog.records if record.exc_info] == [
+            ("error", ValueError),
+        ]
+
+    def test_shared(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(Scheduler, "_shared", None)
+        with patch.object(Scheduler, "start") as mock_start:
+            assert Scheduler.shared() is Scheduler.shared()
+        assert mock_start.call_count == 1